@@ -0,0 +1,299 @@
+"""
+Batch analysis API.
+
+Analyzes a whole project - 20 to 100 plan PDFs, one per floor and section -
+in one request. Files are sent as a multipart list and/or zip archives, or
+referenced by ``file_id``; they are analyzed concurrently (capped), results
+are streamed per file as they finish, and the stream ends with project
+totals per floor.
+
+Per-file results are the ones of ``/extraction/rooms`` and
+``/gewerke/doors/from-plan`` and share their result cache entries.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+from uuid import uuid4
+import asyncio
+import logging
+import time
+import zipfile
+
+from fastapi import APIRouter, File, HTTPException, Query, UploadFile
+from starlette.concurrency import run_in_threadpool
+
+from ..core.config import get_settings
+from ..services.admission import render_cost
+from ..services.batch_analysis import ProjectAggregate
+from ..services.plan_store import get_plan_store
+from ..services.upload_validation import UploadRejected, plan_upload_validator
+from .extraction import run_extract_rooms
+from .gewerke import run_doors_from_plan
+from .plan_files import PlanInput, acquire_plan_input, release_plan_input
+from .result_cache import cached_result
+from .streaming import StreamFormat, stream_events
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/batch", tags=["batch"])
+
+
+# A batch input: (name, pinned plan) or (name, error message)
+BatchInput = Tuple[str, Union[PlanInput, str]]
+
+
+# =============================================================================
+# Input Collection
+# =============================================================================
+
+def _is_zip(upload: UploadFile) -> bool:
+    return (upload.filename or "").lower().endswith(".zip")
+
+
+def _pdf_members(archive: zipfile.ZipFile) -> List[zipfile.ZipInfo]:
+    """PDF members of a zip archive (directories, macOS metadata and other files skipped)."""
+    return [
+        info for info in archive.infolist()
+        if not info.is_dir()
+        and info.filename.lower().endswith(".pdf")
+        and not info.filename.startswith("__MACOSX/")
+    ]
+
+
+def _count_inputs(files: List[UploadFile], file_ids: List[str]) -> int:
+    """
+    Number of files in a batch, counted before anything is stored.
+
+    Zip archives count with their PDF members (read from the central
+    directory only); an unreadable archive counts as one failed file.
+    """
+    count = len(file_ids)
+    for upload in files:
+        if not _is_zip(upload):
+            count += 1
+            continue
+        try:
+            with zipfile.ZipFile(upload.file) as archive:
+                count += len(_pdf_members(archive))
+        except zipfile.BadZipFile:
+            count += 1
+        upload.file.seek(0)
+    return count
+
+
+def _ingest_zip(upload: UploadFile) -> List[BatchInput]:
+    """Store and pin the PDFs of a zip archive."""
+    store = get_plan_store()
+    inputs: List[BatchInput] = []
+    try:
+        archive = zipfile.ZipFile(upload.file)
+    except zipfile.BadZipFile:
+        return [(upload.filename, f"Not a valid zip archive: {upload.filename}")]
+
+    with archive:
+        for info in _pdf_members(archive):
+            name = Path(info.filename).name
+            try:
+                with archive.open(info) as member:
+                    plan, _ = store.put(member, name, plan_upload_validator(name))
+            except (UploadRejected, zipfile.BadZipFile, RuntimeError) as e:
+                inputs.append((name, str(e)))
+                continue
+            if store.acquire(plan.file_id) is None:
+                inputs.append((name, f"Plan file not found: {plan.file_id}"))
+                continue
+            inputs.append((name, PlanInput(plan.file_id, plan.path, name)))
+    return inputs
+
+
+async def _collect_inputs(files: List[UploadFile], file_ids: List[str]) -> List[BatchInput]:
+    """Store and pin every input; invalid files become per-file errors."""
+    inputs: List[BatchInput] = []
+    for upload in files:
+        if _is_zip(upload):
+            inputs.extend(await run_in_threadpool(_ingest_zip, upload))
+            continue
+        try:
+            inputs.append((upload.filename, await acquire_plan_input(upload, None)))
+        except HTTPException as e:
+            inputs.append((upload.filename or "", str(e.detail)))
+
+    for file_id in file_ids:
+        try:
+            plan = await acquire_plan_input(None, file_id)
+            inputs.append((plan.filename, plan))
+        except HTTPException as e:
+            inputs.append((file_id, str(e.detail)))
+    return inputs
+
+
+def _release_inputs(inputs: List[BatchInput]) -> None:
+    for _, plan in inputs:
+        if isinstance(plan, PlanInput):
+            release_plan_input(plan)
+
+
+# =============================================================================
+# Per-File Analysis
+# =============================================================================
+
+async def _analyze_file(
+    plan: PlanInput,
+    aggregate: ProjectAggregate,
+    include_doors: bool,
+    door_params: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Rooms (and doors) of one plan, through the shared result cache."""
+    started = time.perf_counter()
+    rooms, rooms_source = await cached_result(
+        "extraction.rooms",
+        plan,
+        {"style": None, "pages": None},
+        lambda: run_extract_rooms(plan.path, plan.filename, None, None),
+    )
+
+    doors, doors_source = None, None
+    if include_doors:
+        doors, doors_source = await cached_result(
+            "gewerke.doors_from_plan",
+            plan,
+            door_params,
+            lambda: run_doors_from_plan(
+                plan.path,
+                plan.filename,
+                door_params["scale"],
+                door_params["page_number"],
+                door_params["use_yolo"],
+                door_params["use_vector"],
+                door_params["yolo_confidence"],
+            ),
+            cost=render_cost(pages=1, dpi=150, inference=door_params["use_yolo"]),
+        )
+
+    floor = aggregate.floor_of(plan.filename, rooms)
+    aggregate.add(plan.filename, floor, rooms, doors)
+    return {
+        "source_file": plan.filename,
+        "file_id": plan.file_id,
+        "floor": floor,
+        "rooms": rooms,
+        "doors": doors,
+        "cache": {"rooms": rooms_source, "doors": doors_source},
+        "processing_time_ms": int((time.perf_counter() - started) * 1000),
+    }
+
+
+# =============================================================================
+# API Endpoints
+# =============================================================================
+
+@router.post("/analyze")
+async def analyze_batch(
+    files: Optional[List[UploadFile]] = File(None, description="Plan PDFs and/or zip archives of PDFs"),
+    file_ids: Optional[str] = Query(
+        None, description="Comma-separated stored plan ids from POST /files"
+    ),
+    include_doors: bool = Query(True, description="Run door detection on every plan"),
+    scale: int = Query(100, gt=0, description="Scale denominator for door widths (e.g., 100 for 1:100)"),
+    page_number: int = Query(1, gt=0, description="Sheet of each PDF used for door detection"),
+    use_yolo: bool = Query(True, description="Use YOLO CV detection for doors"),
+    wall_height_m: float = Query(2.6, gt=0, description="Wall height for drywall totals"),
+    stream_format: StreamFormat = Query(
+        StreamFormat.NDJSON,
+        alias="format",
+        description="Stream format: ndjson (application/x-ndjson) or sse (text/event-stream)",
+    ),
+):
+    """
+    Analyze a project's plan set and stream results file by file.
+
+    Send the plans as a multipart list (`files`), as zip archives in
+    `files`, or as `file_ids` of stored plans - or any mix. Files are
+    analyzed concurrently (up to `batch_max_concurrency` at once) and
+    heavy work goes through admission control.
+
+    **Events (in order):**
+    - `start`: batch_id, files_total and the accepted file names
+    - `file` (one per file, in completion order): floor, the
+      `/extraction/rooms` and `/gewerke/doors/from-plan` results, or
+      `error` for files that could not be read or analyzed
+    - `project`: totals over all files - rooms and area by category, doors
+      by fire rating, drywall (room perimeters × wall height) - and the
+      same totals per floor (UG, EG, 1.OG, ..., DG)
+
+    Floors are read from file names ("..._EG.pdf", "2.OG") or from LeiQ
+    room numbers.
+    """
+    settings = get_settings()
+    ids = [i.strip() for i in (file_ids or "").split(",") if i.strip()]
+    if not files and not ids:
+        raise HTTPException(status_code=400, detail="Provide plan files, zip archives or file_ids")
+
+    # Rejected before anything is stored or pinned
+    count = await run_in_threadpool(_count_inputs, files or [], ids)
+    if count > settings.batch_max_files:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch has {count} files, the limit is {settings.batch_max_files}",
+        )
+
+    inputs = await _collect_inputs(files or [], ids)
+
+    batch_id = f"batch_{uuid4().hex[:12]}"
+    aggregate = ProjectAggregate(wall_height_m, include_doors)
+    door_params = {
+        "scale": scale,
+        "page_number": page_number,
+        "use_yolo": use_yolo,
+        "use_vector": True,
+        "yolo_confidence": 0.15,
+    }
+    limit = asyncio.Semaphore(max(1, settings.batch_max_concurrency))
+
+    async def run(plan: PlanInput) -> Dict[str, Any]:
+        async with limit:
+            try:
+                return await _analyze_file(plan, aggregate, include_doors, door_params)
+            except Exception as e:
+                logger.exception(f"Batch {batch_id}: {plan.filename} failed")
+                aggregate.add_failure()
+                return {"source_file": plan.filename, "file_id": plan.file_id, "error": str(e)}
+
+    async def events() -> AsyncIterator[tuple]:
+        plans = [plan for _, plan in inputs if isinstance(plan, PlanInput)]
+        yield "start", {
+            "batch_id": batch_id,
+            "started_at": datetime.utcnow().isoformat() + "Z",
+            "files_total": len(inputs),
+            "files": [name for name, _ in inputs],
+        }
+
+        files_done = 0
+        for name, error in inputs:
+            if isinstance(error, str):
+                files_done += 1
+                aggregate.add_failure()
+                yield "file", {
+                    "source_file": name,
+                    "error": error,
+                    "files_done": files_done,
+                    "files_total": len(inputs),
+                }
+
+        tasks = [asyncio.create_task(run(plan)) for plan in plans]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                files_done += 1
+                yield "file", {
+                    **await finished,
+                    "files_done": files_done,
+                    "files_total": len(inputs),
+                }
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        yield "project", {"batch_id": batch_id, **aggregate.to_dict()}
+
+    return stream_events(events(), stream_format, on_close=lambda: _release_inputs(inputs))
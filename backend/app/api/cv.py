@@ -13,10 +13,11 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, File, HTTPException, Query, UploadFile
+from fastapi import APIRouter, File, HTTPException, Query, Request, UploadFile
 from pydantic import BaseModel, Field
 
 from ..core.config import get_settings
+from ..services.admission import render_cost
 from ..services.input_router import (
     InputType,
     ProcessingPipeline,
@@ -35,6 +36,9 @@ from ..services.roboflow_service import (
     is_roboflow_available,
     run_inference_on_pdf_page,
 )
+from .job_queue import QueuedJobResponse, submit_upload_job
+from .plan_files import plan_input
+from .result_cache import cached_response
 
 
 router = APIRouter(prefix="/cv", tags=["computer-vision"])
@@ -65,6 +69,8 @@ class CVStatusResponse(BaseModel):
     models: Dict[str, str]
     yolo_available: bool
     opencv_installed: bool
+    roboflow_cache: Optional[Dict[str, Any]] = None
+    yolo_models: Optional[Dict[str, Any]] = None
 
 
 class RoomDetectionResponse(BaseModel):
@@ -122,11 +128,13 @@ async def get_cv_status():
     - Roboflow API (for scans/photos)
     - YOLO (for CAD PDFs)
     - OpenCV (for image processing)
+    - Roboflow response cache hit/miss statistics
+    - Resident YOLO models and their memory footprint
     """
     settings = get_settings()
     roboflow_status = get_roboflow_status(settings)
 
-    from ..services.cv_pipeline import is_yolo_available, CV2_AVAILABLE
+    from ..services.cv_pipeline import is_yolo_available, get_cv_pipeline_status, CV2_AVAILABLE
 
     return CVStatusResponse(
         roboflow_available=roboflow_status.client_available,
@@ -135,6 +143,8 @@ async def get_cv_status():
         models=roboflow_status.models,
         yolo_available=is_yolo_available(settings),
         opencv_installed=CV2_AVAILABLE,
+        roboflow_cache=roboflow_status.cache,
+        yolo_models=get_cv_pipeline_status(settings).model_registry,
     )
 
 
@@ -403,7 +413,9 @@ class ProductionDoorDetectionResponse(BaseModel):
 
 @router.post("/detect/doors/production", response_model=ProductionDoorDetectionResponse)
 async def detect_doors_production(
-    file: UploadFile = File(..., description="Floor plan PDF"),
+    request: Request,
+    file: Optional[UploadFile] = File(None, description="Floor plan PDF"),
+    file_id: Optional[str] = Query(None, description="Stored plan id from POST /files (instead of file)"),
     scale: int = Query(100, gt=0, description="Scale denominator (e.g., 100 for 1:100, 50 for 1:50)"),
     page_number: int = Query(1, gt=0, description="Page number for PDFs"),
     mode: str = Query(
@@ -441,66 +453,104 @@ async def detect_doors_production(
     - Door count with confidence scores
     - Door locations and estimated widths
     - Breakdown by width and type (narrow/standard/wide/double)
-    """
-    if not file.filename:
-        raise HTTPException(status_code=400, detail="No filename provided")
 
-    # Validate file type
-    suffix = Path(file.filename).suffix.lower()
-    if suffix != ".pdf":
-        raise HTTPException(
-            status_code=400,
-            detail="Only PDF files supported. Use /detect/doors for images.",
+    Responses are cached per plan, parameters and YOLO weights and carry an
+    `ETag` for `If-None-Match` revalidation. Under load, requests wait for
+    capacity and are rejected with 429 and `Retry-After`.
+    """
+    async with plan_input(file, file_id) as plan:
+        return await cached_response(
+            request,
+            "cv.doors_production",
+            plan,
+            {"scale": scale, "page_number": page_number, "mode": mode},
+            lambda: run_production_door_detection(plan.path, scale, page_number, mode),
+            cost=render_cost(pages=1, dpi=150, inference=True),
         )
 
-    temp_dir = tempfile.mkdtemp()
-    temp_path = Path(temp_dir) / file.filename
 
-    try:
-        with open(temp_path, "wb") as f:
-            shutil.copyfileobj(file.file, f)
+@router.post("/detect/doors/production/jobs", response_model=QueuedJobResponse, status_code=202)
+async def submit_doors_production_job(
+    file: Optional[UploadFile] = File(None, description="Floor plan PDF"),
+    file_id: Optional[str] = Query(None, description="Stored plan id from POST /files (instead of file)"),
+    scale: int = Query(100, gt=0, description="Scale denominator (e.g., 100 for 1:100, 50 for 1:50)"),
+    page_number: int = Query(1, gt=0, description="Page number for PDFs"),
+    mode: str = Query(
+        "balanced",
+        description="Detection mode: 'strict' (fewer FPs), 'balanced' (default), 'sensitive' (more detections)",
+    ),
+):
+    """
+    Queue production door detection as a background job.
 
-        # Map mode string to DetectionMode enum
-        from ..services.wall_opening_detector import detect_doors_yolo_primary, DetectionMode
-
-        mode_map = {
-            "strict": DetectionMode.STRICT,
-            "balanced": DetectionMode.BALANCED,
-            "sensitive": DetectionMode.SENSITIVE,
-        }
-        detection_mode = mode_map.get(mode.lower(), DetectionMode.BALANCED)
-
-        result = detect_doors_yolo_primary(
-            pdf_path=str(temp_path),
-            page_number=page_number,
-            scale=scale,
-            mode=detection_mode,
-            use_wall_opening_validation=False,  # YOLO is sufficient
-        )
+    Same parameters as `POST /detect/doors/production`; returns a job id
+    immediately. Poll `GET /jobs/queue/{job_id}` and fetch the
+    `ProductionDoorDetectionResponse` from `GET /jobs/queue/{job_id}/result`.
+    """
+    return await submit_upload_job(
+        "doors_production",
+        file,
+        {"scale": scale, "page_number": page_number, "mode": mode},
+        file_id=file_id,
+    )
 
-        # Convert result to response format
-        result_dict = result.to_dict()
-
-        # Group by type
-        by_type = {}
-        for door in result.doors:
-            door_type = door.metadata.get("door_type", "unknown")
-            by_type[door_type] = by_type.get(door_type, 0) + 1
-
-        return ProductionDoorDetectionResponse(
-            door_count=len(result.doors),
-            by_width=result_dict.get("by_width", {}),
-            by_type=by_type,
-            scale=f"1:{scale}",
-            detection_mode=detection_mode.value,
-            doors=[d.to_dict() for d in result.doors],
-            processing_time_ms=result.processing_time_ms,
-            detection_method="yolo_primary",
-            warnings=result.warnings,
-        )
 
-    finally:
-        shutil.rmtree(temp_dir, ignore_errors=True)
+def run_production_door_detection(
+    file_path: Path,
+    scale: int,
+    page_number: int,
+    mode: str,
+) -> ProductionDoorDetectionResponse:
+    """Run YOLO-primary door detection on a stored PDF."""
+    # Map mode string to DetectionMode enum
+    from ..services.wall_opening_detector import detect_doors_yolo_primary, DetectionMode
+
+    mode_map = {
+        "strict": DetectionMode.STRICT,
+        "balanced": DetectionMode.BALANCED,
+        "sensitive": DetectionMode.SENSITIVE,
+    }
+    detection_mode = mode_map.get(mode.lower(), DetectionMode.BALANCED)
+
+    result = detect_doors_yolo_primary(
+        pdf_path=str(file_path),
+        page_number=page_number,
+        scale=scale,
+        mode=detection_mode,
+        use_wall_opening_validation=False,  # YOLO is sufficient
+    )
+
+    # Convert result to response format
+    result_dict = result.to_dict()
+
+    # Group by type
+    by_type = {}
+    for door in result.doors:
+        door_type = door.metadata.get("door_type", "unknown")
+        by_type[door_type] = by_type.get(door_type, 0) + 1
+
+    return ProductionDoorDetectionResponse(
+        door_count=len(result.doors),
+        by_width=result_dict.get("by_width", {}),
+        by_type=by_type,
+        scale=f"1:{scale}",
+        detection_mode=detection_mode.value,
+        doors=[d.to_dict() for d in result.doors],
+        processing_time_ms=result.processing_time_ms,
+        detection_method="yolo_primary",
+        warnings=result.warnings,
+    )
+
+
+def doors_production_job(work_dir: Path, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Background job handler for production door detection."""
+    response = run_production_door_detection(
+        work_dir / params["input"],
+        params["scale"],
+        params["page_number"],
+        params["mode"],
+    )
+    return response.model_dump()
 
 
 @router.post("/analyze", response_model=FloorPlanAnalysisResponse)
@@ -10,14 +10,15 @@ Styles supported:
 - Omniturm (Highrise): NGF: pattern
 """
 
+import io
 import shutil
 import tempfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 from datetime import datetime
 
-from fastapi import APIRouter, File, HTTPException, Query, UploadFile
+from fastapi import APIRouter, File, HTTPException, Query, Request, UploadFile
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
@@ -26,7 +27,11 @@ from ..services.unified_extraction import (
     extract_room_areas,
     detect_blueprint_style,
     BlueprintStyle,
+    ExtractedRoom,
+    ExtractionResult,
     RoomCategory,
+    RoomExtractionStream,
+    get_extraction_cache,
 )
 from ..services.llm_interpretation import (
     interpret_extraction,
@@ -38,6 +43,10 @@ from ..services.excel_export import (
     export_to_csv,
     is_excel_available,
 )
+from .job_queue import QueuedJobResponse, submit_upload_job
+from .plan_files import plan_input
+from .result_cache import cached_response
+from .streaming import StreamFormat, open_plan_stream, parse_page_list, stream_events
 
 
 router = APIRouter(prefix="/extraction", tags=["extraction"])
@@ -90,6 +99,11 @@ class RoomExtractionResponse(BaseModel):
     summary: ExtractionSummaryResponse
     rooms: List[ExtractedRoomResponse]
     warnings: List[str]
+    recomputed_pages: List[int] = Field(default_factory=list, description="Pages extracted by this request")
+    reused_pages: List[int] = Field(
+        default_factory=list,
+        description="Unchanged pages (same content fingerprint) taken from earlier extractions",
+    )
 
 
 class StyleDetectionResponse(BaseModel):
@@ -134,7 +148,12 @@ async def health_check():
 
 @router.post("/rooms", response_model=RoomExtractionResponse)
 async def extract_rooms(
-    file: UploadFile = File(..., description="Floor plan PDF file"),
+    request: Request,
+    file: Optional[UploadFile] = File(None, description="Floor plan PDF file"),
+    file_id: Optional[str] = Query(
+        None,
+        description="Stored plan id from POST /files (instead of uploading file)",
+    ),
     style: Optional[str] = Query(
         None,
         description="Blueprint style (haardtring, leiq, omniturm). Auto-detected if not provided.",
@@ -167,110 +186,217 @@ async def extract_rooms(
        - Room numbers: `33_b6.12` or `BT1.EG.001`
        - Special: Reversed Schacht pattern
 
+    **Plan revisions:** Page results are cached by a fingerprint of each
+    page's content. Uploading a new revision only re-extracts the sheets
+    that changed; `recomputed_pages` and `reused_pages` report which.
+
+    **Stored plans:** Pass `file_id` from `POST /files` instead of
+    uploading the same plan again.
+
+    **Caching:** Responses are cached per plan and parameters and carry an
+    `ETag`; send it back as `If-None-Match` to get `304 Not Modified`.
+
     **Returns:**
     - Extracted rooms with areas and traceability
     - Summary with totals by category
     - Detected blueprint style
     - Any warnings encountered
     """
-    # Validate file type
-    if not file.filename:
-        raise HTTPException(status_code=400, detail="No filename provided")
-
-    if not file.filename.lower().endswith(".pdf"):
-        raise HTTPException(
-            status_code=400,
-            detail=f"File must be a PDF, got: {file.filename}",
+    page_list = parse_page_list(pages)
+    style_enum = _parse_style(style)
+
+    async with plan_input(file, file_id) as plan:
+        return await cached_response(
+            request,
+            "extraction.rooms",
+            plan,
+            {"style": style_enum.value if style_enum else None, "pages": page_list},
+            lambda: run_extract_rooms(plan.path, plan.filename, style_enum, page_list),
         )
 
-    # Parse pages parameter
-    page_list = None
-    if pages:
-        try:
-            page_list = [int(p.strip()) for p in pages.split(",")]
-        except ValueError:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid pages parameter: {pages}. Use comma-separated integers.",
-            )
 
-    # Parse style parameter
-    style_enum = None
-    if style:
-        try:
-            style_enum = BlueprintStyle(style.lower())
-        except ValueError:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid style: {style}. Use: haardtring, leiq, or omniturm.",
-            )
+def run_extract_rooms(
+    file_path: Path,
+    filename: str,
+    style: Optional[BlueprintStyle],
+    pages: Optional[List[int]],
+) -> RoomExtractionResponse:
+    """Extract room areas from a stored PDF."""
+    result = extract_room_areas(
+        pdf_path=file_path,
+        style=style,
+        pages=pages,
+        cache=get_extraction_cache(),
+    )
 
-    # Save uploaded file to temp location
-    temp_dir = tempfile.mkdtemp()
-    temp_path = Path(temp_dir) / file.filename
+    return RoomExtractionResponse.model_construct(
+        extraction_id=f"ext_{uuid4().hex[:12]}",
+        source_file=filename,
+        extracted_at=datetime.utcnow().isoformat() + "Z",
+        summary=_summary_response(result),
+        rooms=[_room_response(room) for room in result.rooms],
+        warnings=result.warnings,
+        recomputed_pages=result.recomputed_pages,
+        reused_pages=result.reused_pages,
+    )
 
-    try:
-        with open(temp_path, "wb") as f:
-            shutil.copyfileobj(file.file, f)
 
-        # Extract room areas
-        result = extract_room_areas(
-            pdf_path=temp_path,
-            style=style_enum,
-            pages=page_list,
-        )
+@router.post("/rooms/stream")
+async def extract_rooms_stream(
+    file: Optional[UploadFile] = File(None, description="Floor plan PDF file"),
+    file_id: Optional[str] = Query(
+        None,
+        description="Stored plan id from POST /files (instead of uploading file)",
+    ),
+    style: Optional[str] = Query(
+        None,
+        description="Blueprint style (haardtring, leiq, omniturm). Auto-detected if not provided.",
+    ),
+    pages: Optional[str] = Query(
+        None,
+        description="Comma-separated page numbers (0-indexed). Leave empty for all pages.",
+    ),
+    stream_format: StreamFormat = Query(
+        StreamFormat.NDJSON,
+        alias="format",
+        description="Stream format: ndjson (application/x-ndjson) or sse (text/event-stream)",
+    ),
+):
+    """
+    Stream room extraction page by page.
+
+    Same extraction as `/extraction/rooms`, but results are sent while the
+    PDF is processed instead of once at the end. Useful for large plan sets.
+
+    **Events (in order):**
+    - `start`: extraction_id, source_file, blueprint_style, page_count, pages_total
+    - `page` (one per requested page): page, rooms, page area/counted totals,
+      warnings, `reused` (unchanged page taken from the page cache), and
+      running `totals` over all pages so far
+    - `summary`: the `summary` block, warnings and recomputed/reused pages
+      of `/extraction/rooms` (rooms are not repeated)
+    - `error`: sent instead of `summary` if extraction fails mid-stream
+
+    NDJSON lines carry the event name in an `event` field; SSE uses the
+    `event:` field.
+    """
+    page_list = parse_page_list(pages)
+    style_enum = _parse_style(style)
+    cache = get_extraction_cache()
+
+    plan, stream, release = await open_plan_stream(
+        file,
+        file_id,
+        lambda path: RoomExtractionStream(path, style=style_enum, pages=page_list, cache=cache),
+    )
 
-        # Build response
-        rooms = []
-        for room in result.rooms:
-            rooms.append(ExtractedRoomResponse(
-                room_number=room.room_number,
-                room_name=room.room_name,
-                area_m2=room.area_m2,
-                counted_m2=room.counted_m2,
-                factor=room.factor,
-                page=room.page,
-                source_text=room.source_text,
-                category=room.category.value,
-                extraction_pattern=room.extraction_pattern,
-                bbox=room.bbox.to_dict() if room.bbox else None,
-                perimeter_m=room.perimeter_m,
-                height_m=room.height_m,
-                factor_source=room.factor_source,
-            ))
+    extraction_id = f"ext_{uuid4().hex[:12]}"
+
+    def events():
+        with stream:
+            yield "start", {
+                "extraction_id": extraction_id,
+                "source_file": plan.filename,
+                "blueprint_style": stream.blueprint_style.value,
+                "page_count": stream.page_count,
+                "pages_total": len(stream.pages),
+                "warnings": stream.warnings,
+            }
+
+            total_rooms = 0
+            total_area = 0.0
+            total_counted = 0.0
+            for pages_done, page in enumerate(stream, start=1):
+                total_rooms += len(page.rooms)
+                total_area += page.area_m2
+                total_counted += page.counted_m2
+                yield "page", {
+                    "page": page.page,
+                    "rooms": [_room_response(room).model_dump() for room in page.rooms],
+                    "area_m2": page.area_m2,
+                    "counted_m2": page.counted_m2,
+                    "warnings": page.warnings,
+                    "reused": page.reused,
+                    "pages_done": pages_done,
+                    "pages_total": len(stream.pages),
+                    "totals": {
+                        "rooms": total_rooms,
+                        "area_m2": round(total_area, 2),
+                        "counted_m2": round(total_counted, 2),
+                    },
+                }
+
+            result = stream.result()
+            yield "summary", {
+                "extraction_id": extraction_id,
+                "source_file": plan.filename,
+                "extracted_at": datetime.utcnow().isoformat() + "Z",
+                "summary": _summary_response(result).model_dump(),
+                "warnings": result.warnings,
+                "recomputed_pages": result.recomputed_pages,
+                "reused_pages": result.reused_pages,
+            }
+
+    return stream_events(events(), stream_format, on_close=release)
 
-        # Build category totals
-        category_totals = []
-        for cat, total in result.totals_by_category.items():
-            room_count = len([r for r in result.rooms if r.category.value == cat])
-            category_totals.append(CategoryTotalResponse(
-                category=cat,
-                area_m2=total,
-                room_count=room_count,
-            ))
 
-        # Build summary
-        summary = ExtractionSummaryResponse(
-            total_rooms=result.room_count,
-            total_area_m2=result.total_area_m2,
-            total_counted_m2=result.total_counted_m2,
-            blueprint_style=result.blueprint_style.value,
-            page_count=result.page_count,
-            by_category=category_totals,
-        )
+# =============================================================================
+# Request Parsing & Response Builders
+# =============================================================================
 
-        return RoomExtractionResponse(
-            extraction_id=f"ext_{uuid4().hex[:12]}",
-            source_file=file.filename,
-            extracted_at=datetime.utcnow().isoformat() + "Z",
-            summary=summary,
-            rooms=rooms,
-            warnings=result.warnings,
+
+def _parse_style(style: Optional[str]) -> Optional[BlueprintStyle]:
+    """Parse the ``style`` query parameter."""
+    if not style:
+        return None
+    try:
+        return BlueprintStyle(style.lower())
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid style: {style}. Use: haardtring, leiq, or omniturm.",
         )
 
-    finally:
-        # Cleanup temp files
-        shutil.rmtree(temp_dir, ignore_errors=True)
+
+def _room_response(room: ExtractedRoom) -> ExtractedRoomResponse:
+    # Built without validation: the extractor's dataclasses hold typed values,
+    # and validating thousands of rooms per plan set is a large part of a response
+    return ExtractedRoomResponse.model_construct(
+        room_number=room.room_number,
+        room_name=room.room_name,
+        area_m2=room.area_m2,
+        counted_m2=room.counted_m2,
+        factor=room.factor,
+        page=room.page,
+        source_text=room.source_text,
+        category=room.category.value,
+        extraction_pattern=room.extraction_pattern,
+        bbox=room.bbox.to_dict() if room.bbox else None,
+        perimeter_m=room.perimeter_m,
+        height_m=room.height_m,
+        factor_source=room.factor_source,
+    )
+
+
+def _summary_response(result: ExtractionResult) -> ExtractionSummaryResponse:
+    # Build category totals
+    category_totals = []
+    for cat, total in result.totals_by_category.items():
+        room_count = len([r for r in result.rooms if r.category.value == cat])
+        category_totals.append(CategoryTotalResponse.model_construct(
+            category=cat,
+            area_m2=total,
+            room_count=room_count,
+        ))
+
+    return ExtractionSummaryResponse.model_construct(
+        total_rooms=result.room_count,
+        total_area_m2=result.total_area_m2,
+        total_counted_m2=result.total_counted_m2,
+        blueprint_style=result.blueprint_style.value,
+        page_count=result.page_count,
+        by_category=category_totals,
+    )
 
 
 # =============================================================================
@@ -761,7 +887,8 @@ async def export_to_csv_endpoint(request: ExcelExportRequest):
 
 @router.post("/extract-and-export")
 async def extract_and_export_excel(
-    file: UploadFile = File(..., description="Floor plan PDF file"),
+    file: Optional[UploadFile] = File(None, description="Floor plan PDF file"),
+    file_id: Optional[str] = Query(None, description="Stored plan id from POST /files"),
     style: Optional[str] = Query(None, description="Blueprint style"),
     pages: Optional[str] = Query(None, description="Comma-separated page numbers"),
     language: str = Query("de", description="Output language"),
@@ -781,16 +908,62 @@ async def extract_and_export_excel(
     **Returns:**
     - Excel or CSV file download
     """
-    # Validate file type
-    if not file.filename:
-        raise HTTPException(status_code=400, detail="No filename provided")
+    page_list, style_enum = _parse_export_options(style, pages, format)
 
-    if not file.filename.lower().endswith(".pdf"):
-        raise HTTPException(
-            status_code=400,
-            detail=f"File must be a PDF, got: {file.filename}",
+    async with plan_input(file, file_id) as plan:
+        export_result = run_extract_and_export(
+            plan.path, plan.filename, style_enum, page_list, language, format
         )
 
+    return StreamingResponse(
+        io.BytesIO(export_result.file_bytes),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f"attachment; filename={export_result.filename}"}
+    )
+
+
+@router.post("/extract-and-export/jobs", response_model=QueuedJobResponse, status_code=202)
+async def submit_extract_and_export_job(
+    file: Optional[UploadFile] = File(None, description="Floor plan PDF file"),
+    file_id: Optional[str] = Query(None, description="Stored plan id from POST /files"),
+    style: Optional[str] = Query(None, description="Blueprint style"),
+    pages: Optional[str] = Query(None, description="Comma-separated page numbers"),
+    language: str = Query("de", description="Output language"),
+    format: str = Query("xlsx", description="Export format: xlsx or csv"),
+):
+    """
+    Queue extraction and export as a background job.
+
+    Same parameters as `POST /extract-and-export`; returns a job id
+    immediately. Poll `GET /jobs/queue/{job_id}` and download the Excel or
+    CSV file from `GET /jobs/queue/{job_id}/result`.
+    """
+    page_list, style_enum = _parse_export_options(style, pages, format)
+    return await submit_upload_job(
+        "extract_and_export",
+        file,
+        {
+            "style": style_enum.value if style_enum else None,
+            "pages": page_list,
+            "language": language,
+            "format": format,
+        },
+        file_id=file_id,
+    )
+
+
+EXPORT_MEDIA_TYPES = {
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "csv": "text/csv",
+}
+
+
+def _parse_export_options(
+    style: Optional[str],
+    pages: Optional[str],
+    format: str,
+) -> Tuple[Optional[List[int]], Optional[BlueprintStyle]]:
+    """Validate extract-and-export parameters (raises HTTPException 400)."""
     # Parse pages parameter
     page_list = None
     if pages:
@@ -814,78 +987,89 @@ async def extract_and_export_excel(
             )
 
     # Validate format
-    if format not in ["xlsx", "csv"]:
+    if format not in EXPORT_MEDIA_TYPES:
         raise HTTPException(
             status_code=400,
             detail=f"Invalid format: {format}. Use: xlsx or csv.",
         )
 
-    # Save uploaded file to temp location
-    temp_dir = tempfile.mkdtemp()
-    temp_path = Path(temp_dir) / file.filename
+    return page_list, style_enum
 
-    try:
-        with open(temp_path, "wb") as f:
-            shutil.copyfileobj(file.file, f)
 
-        # Extract room areas
-        result = extract_room_areas(
-            pdf_path=temp_path,
-            style=style_enum,
-            pages=page_list,
-        )
+def run_extract_and_export(
+    file_path: Path,
+    filename: str,
+    style: Optional[BlueprintStyle],
+    pages: Optional[List[int]],
+    language: str,
+    format: str,
+):
+    """
+    Extract room areas from a stored PDF and export them.
 
-        # Convert to dict for export
-        extraction_dict = result.to_dict()
+    Returns:
+        Successful export result (``file_bytes``, ``filename``)
 
-        # Export based on format
-        if format == "xlsx":
-            if not is_excel_available():
-                raise HTTPException(
-                    status_code=503,
-                    detail="Excel export not available. Use format=csv instead."
-                )
+    Raises:
+        HTTPException: 503 if Excel export is unavailable, 500 if export fails
+    """
+    # Extract room areas
+    result = extract_room_areas(
+        pdf_path=file_path,
+        style=style,
+        pages=pages,
+    )
+
+    # Convert to dict for export
+    extraction_dict = result.to_dict()
 
-            export_result = export_extraction_to_excel(
-                extraction_data=extraction_dict,
-                source_filename=file.filename,
-                include_summary_sheet=True,
-                include_details_sheet=True,
-                include_category_sheets=False,
-                language=language,
+    # Export based on format
+    if format == "xlsx":
+        if not is_excel_available():
+            raise HTTPException(
+                status_code=503,
+                detail="Excel export not available. Use format=csv instead."
             )
 
-            if not export_result.success:
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Export failed: {export_result.error}"
-                )
+        export_result = export_extraction_to_excel(
+            extraction_data=extraction_dict,
+            source_filename=filename,
+            include_summary_sheet=True,
+            include_details_sheet=True,
+            include_category_sheets=False,
+            language=language,
+        )
+    else:  # csv
+        export_result = export_to_csv(
+            extraction_data=extraction_dict,
+            source_filename=filename,
+            language=language,
+        )
 
-            return StreamingResponse(
-                io.BytesIO(export_result.file_bytes),
-                media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                headers={"Content-Disposition": f"attachment; filename={export_result.filename}"}
-            )
+    if not export_result.success:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Export failed: {export_result.error}"
+        )
 
-        else:  # csv
-            export_result = export_to_csv(
-                extraction_data=extraction_dict,
-                source_filename=file.filename,
-                language=language,
-            )
+    return export_result
 
-            if not export_result.success:
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Export failed: {export_result.error}"
-                )
 
-            return StreamingResponse(
-                io.BytesIO(export_result.file_bytes),
-                media_type="text/csv",
-                headers={"Content-Disposition": f"attachment; filename={export_result.filename}"}
-            )
+def extract_and_export_job(work_dir: Path, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Background job handler for extraction and export; the file is the job's artifact."""
+    export_result = run_extract_and_export(
+        work_dir / params["input"],
+        params["filename"],
+        BlueprintStyle(params["style"]) if params["style"] else None,
+        params["pages"],
+        params["language"],
+        params["format"],
+    )
 
-    finally:
-        # Cleanup temp files
-        shutil.rmtree(temp_dir, ignore_errors=True)
+    (work_dir / export_result.filename).write_bytes(export_result.file_bytes)
+    return {
+        "artifact": {
+            "filename": export_result.filename,
+            "media_type": EXPORT_MEDIA_TYPES[params["format"]],
+        },
+    }
@@ -13,10 +13,12 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, File, HTTPException, Query, UploadFile
+from fastapi import APIRouter, File, HTTPException, Query, Request, UploadFile
 from pydantic import BaseModel, Field
+from starlette.concurrency import run_in_threadpool
 
 from ..core.config import get_settings
+from ..services.admission import admitted, render_cost
 from ..services.gewerke import (
     DoorCategory,
     DoorGewerkResult,
@@ -25,6 +27,11 @@ from ..services.gewerke import (
     run_drywall_gewerk_for_sector,
 )
 from ..services.schedule_extraction import extract_schedules_from_pdf
+from ..services.annotation_tokens import RoomScheme, TokenKind, tokenize_text
+from .job_queue import QueuedJobResponse, submit_upload_job
+from .plan_files import PLAN_SUFFIXES, plan_input
+from .result_cache import cached_response
+from .streaming import StreamFormat, open_plan_stream, parse_page_list, stream_events
 from ..services.measurement_engine import Sector
 from ..services.scale_calibration import ScaleContext, compute_pixels_per_meter
 from ..services.persistence import get_scale_context, get_sector
@@ -324,93 +331,15 @@ class FloorPlanDoorsResponse(BaseModel):
     by_fire_rating: FireRatingSummary
     detection_methods_used: List[str]
     processing_time_ms: int
+    stage_timings_ms: Dict[str, int] = Field(default_factory=dict)
     warnings: List[str]
 
 
-def extract_door_labels_and_fire_ratings(pdf_path: str, page_number: int) -> Dict[str, Dict]:
-    """
-    Extract door labels and fire ratings from PDF text.
-
-    The PDF format is typically:
-        B.06.1.001-1    <- door label
-        T 30-RS         <- fire rating for the door ABOVE
-        B.06.1.002-1    <- next door label
-        -               <- dash means NO fire rating
-
-    Returns a dict mapping door labels to their fire ratings.
-    E.g., {"B.03.1.001-1": {"fire_rating": "T 90-RS", "category": "T90"}, ...}
-    """
-    import fitz
-    import re
-
-    result = {}
-
-    try:
-        doc = fitz.open(pdf_path)
-        if page_number > len(doc):
-            doc.close()
-            return result
-
-        page = doc[page_number - 1]
-        text = page.get_text()
-        doc.close()
-
-        # Find all door labels (B.XX.X.XXX-X format)
-        door_label_pattern = r'(B\.\d{2}\.\d\.\d{3}-\d+)'
-        door_labels = re.findall(door_label_pattern, text)
-
-        # Initialize all doors as standard
-        for label in set(door_labels):
-            result[label] = {"fire_rating": None, "category": "Standard"}
-
-        # Parse line by line - fire rating applies to the PREVIOUS door label
-        lines = text.split('\n')
-        last_door_label = None
-
-        for line in lines:
-            line_stripped = line.strip()
-
-            # Check if this line is a door label
-            door_match = re.match(door_label_pattern, line_stripped)
-            if door_match:
-                last_door_label = door_match.group(1)
-                continue
-
-            # Check if this line is a fire rating (only if we have a previous door)
-            if last_door_label and last_door_label in result:
-                # T90 fire rating
-                if re.match(r'^T\s*90[-\s]?RS$|^T\s*90$', line_stripped, re.IGNORECASE):
-                    result[last_door_label] = {"fire_rating": "T 90-RS", "category": "T90"}
-                    last_door_label = None  # Reset - don't apply to next door
-                    continue
-
-                # T30 fire rating
-                if re.match(r'^T\s*30[-\s]?RS$|^T\s*30$', line_stripped, re.IGNORECASE):
-                    result[last_door_label] = {"fire_rating": "T 30-RS", "category": "T30"}
-                    last_door_label = None
-                    continue
-
-                # DSS (smoke protection)
-                if re.match(r'^DSS$', line_stripped, re.IGNORECASE):
-                    result[last_door_label] = {"fire_rating": "DSS", "category": "DSS"}
-                    last_door_label = None
-                    continue
-
-                # Dash or empty means no fire rating - keep as standard
-                if line_stripped in ['-', '--', '---', '']:
-                    last_door_label = None
-                    continue
-
-    except Exception as e:
-        # Log but don't fail - fire rating is supplementary
-        print(f"Warning: Could not extract fire ratings: {e}")
-
-    return result
-
-
 @router.post("/doors/from-plan", response_model=FloorPlanDoorsResponse)
 async def detect_doors_from_plan(
-    file: UploadFile = File(..., description="Floor plan PDF file"),
+    request: Request,
+    file: Optional[UploadFile] = File(None, description="Floor plan PDF file"),
+    file_id: Optional[str] = Query(None, description="Stored plan id from POST /files (instead of file)"),
     scale: int = Query(100, gt=0, description="Scale denominator (e.g., 100 for 1:100)"),
     page_number: int = Query(1, gt=0, description="Page number to analyze"),
     use_yolo: bool = Query(True, description="Use YOLO CV detection (hybrid mode - combines with vector)"),
@@ -454,158 +383,181 @@ async def detect_doors_from_plan(
     - by_width: Count of doors grouped by width
     - by_fire_rating: Summary of fire-rated doors (T90, T30, DSS counts)
     - detection_methods_used: Which methods were used
+
+    Responses are cached per plan, parameters and models and carry an
+    `ETag` for `If-None-Match` revalidation.
     """
-    # Validate file type
-    if not file.filename or not file.filename.lower().endswith(".pdf"):
-        raise HTTPException(status_code=400, detail="File must be a PDF")
+    async with plan_input(file, file_id) as plan:
+        return await cached_response(
+            request,
+            "gewerke.doors_from_plan",
+            plan,
+            {
+                "scale": scale,
+                "page_number": page_number,
+                "use_yolo": use_yolo,
+                "use_vector": use_vector,
+                "yolo_confidence": yolo_confidence,
+            },
+            lambda: run_doors_from_plan(
+                plan.path, plan.filename, scale, page_number, use_yolo, use_vector, yolo_confidence
+            ),
+            cost=render_cost(pages=1, dpi=150, inference=use_yolo),
+        )
 
-    # Save to temp location
-    temp_dir = tempfile.mkdtemp()
-    temp_path = Path(temp_dir) / file.filename
 
-    try:
-        with open(temp_path, "wb") as f:
-            shutil.copyfileobj(file.file, f)
+def run_doors_from_plan(
+    file_path: Path,
+    filename: str,
+    scale: int,
+    page_number: int,
+    use_yolo: bool,
+    use_vector: bool,
+    yolo_confidence: float,
+) -> FloorPlanDoorsResponse:
+    """Run hybrid door detection on a stored PDF."""
+    settings = get_settings()
+    render_dpi = 150
+
+    # Run hybrid detection (vector, YOLO and label extraction in parallel)
+    detection_result = detect_doors_hybrid(
+        pdf_path=str(file_path),
+        page_number=page_number,
+        scale=scale,
+        dpi=render_dpi,
+        use_yolo=use_yolo,
+        use_vector=use_vector,
+        confidence_threshold=yolo_confidence,
+        settings=settings,
+        extract_labels=True,
+    )
 
-        settings = get_settings()
-        render_dpi = 150
+    # Door labels and fire ratings from the PDF text stage
+    door_fire_ratings = detection_result.door_labels
 
-        # Run hybrid detection
-        detection_result = detect_doors_hybrid(
-            pdf_path=str(temp_path),
-            page_number=page_number,
-            scale=scale,
-            dpi=render_dpi,
-            use_yolo=use_yolo,
-            use_vector=use_vector,
-            confidence_threshold=yolo_confidence,
-            settings=settings,
-        )
+    # Build response
+    door_responses = []
+    width_counts: Dict[str, int] = {}
+    methods_used = set()
 
-        # Extract door labels and fire ratings from PDF text
-        door_fire_ratings = extract_door_labels_and_fire_ratings(str(temp_path), page_number)
+    # Fire rating counters
+    fire_rating_counts = {"T90": 0, "T30": 0, "DSS": 0, "Standard": 0}
+    t90_door_labels = []
+    t30_door_labels = []
 
-        # Build response
-        door_responses = []
-        width_counts: Dict[str, int] = {}
-        methods_used = set()
-
-        # Fire rating counters
-        fire_rating_counts = {"T90": 0, "T30": 0, "DSS": 0, "Standard": 0}
-        t90_door_labels = []
-        t30_door_labels = []
-
-        # First, add doors from text extraction (with fire ratings)
-        for label, info in door_fire_ratings.items():
-            door_responses.append(DetectedDoorResponse(
-                door_id=f"text_{label}",
-                door_label=label,
-                page_number=page_number,
-                width_m=None,  # Will be matched with vector detection if available
-                arc_radius_px=None,
-                fire_rating=info.get("fire_rating"),
-                fire_category=info.get("category", "Standard"),
-                confidence=0.95,
-                detection_method="text_extraction",
-            ))
+    # Response models are built without validation (model_construct): the
+    # detection dataclasses already hold typed values, and plans with
+    # hundreds of doors spend noticeable time in validation otherwise
 
-            category = info.get("category", "Standard")
-            fire_rating_counts[category] = fire_rating_counts.get(category, 0) + 1
+    # First, add doors from text extraction (with fire ratings)
+    for label, info in door_fire_ratings.items():
+        door_responses.append(DetectedDoorResponse.model_construct(
+            door_id=f"text_{label}",
+            door_label=label,
+            page_number=page_number,
+            width_m=None,  # Will be matched with vector detection if available
+            arc_radius_px=None,
+            fire_rating=info.get("fire_rating"),
+            fire_category=info.get("category", "Standard"),
+            confidence=0.95,
+            detection_method="text_extraction",
+        ))
 
-            if category == "T90":
-                t90_door_labels.append(label)
-            elif category == "T30":
-                t30_door_labels.append(label)
+        category = info.get("category", "Standard")
+        fire_rating_counts[category] = fire_rating_counts.get(category, 0) + 1
 
-        methods_used.add("text_extraction")
+        if category == "T90":
+            t90_door_labels.append(label)
+        elif category == "T30":
+            t30_door_labels.append(label)
 
-        # Also add vector-detected doors (for width measurements)
-        vector_door_count = 0
-        for obj in detection_result.objects:
-            if obj.object_type != ObjectType.DOOR:
-                continue
+    methods_used.add("text_extraction")
 
-            method = obj.attributes.get("detection_method", "unknown")
-            methods_used.add(method)
+    # Also add vector-detected doors (for width measurements)
+    vector_door_count = 0
+    for obj in detection_result.objects:
+        if obj.object_type != ObjectType.DOOR:
+            continue
 
-            width_m = obj.attributes.get("width_m")
-            arc_radius_px = obj.attributes.get("arc_radius_px")
-            vector_door_count += 1
+        method = obj.attributes.get("detection_method", "unknown")
+        methods_used.add(method)
 
-            # Group by width (rounded to nearest 10cm)
-            if width_m:
-                width_key = f"{round(width_m * 10) / 10:.1f}"
-                width_counts[width_key] = width_counts.get(width_key, 0) + 1
+        width_m = obj.attributes.get("width_m")
+        arc_radius_px = obj.attributes.get("arc_radius_px")
+        vector_door_count += 1
 
-        warnings = list(detection_result.warnings)
+        # Group by width (rounded to nearest 10cm)
+        if width_m:
+            width_key = f"{round(width_m * 10) / 10:.1f}"
+            width_counts[width_key] = width_counts.get(width_key, 0) + 1
 
-        # Use text-extracted count as primary (includes fire ratings)
-        # Fall back to vector count if no labels found
-        total_doors = len(door_fire_ratings) if door_fire_ratings else vector_door_count
+    warnings = list(detection_result.warnings)
 
-        # If we have vector doors but no text labels, use vector results
-        if not door_fire_ratings and vector_door_count > 0:
-            door_responses = []
-            for obj in detection_result.objects:
-                if obj.object_type != ObjectType.DOOR:
-                    continue
-                method = obj.attributes.get("detection_method", "unknown")
-                width_m = obj.attributes.get("width_m")
-                arc_radius_px = obj.attributes.get("arc_radius_px")
-                door_responses.append(DetectedDoorResponse(
-                    door_id=obj.object_id,
-                    door_label=None,
-                    page_number=obj.page_number,
-                    width_m=round(width_m, 2) if width_m else None,
-                    arc_radius_px=round(arc_radius_px, 1) if arc_radius_px else None,
-                    fire_rating=None,
-                    fire_category="Standard",
-                    confidence=obj.confidence,
-                    detection_method=method,
-                ))
-            fire_rating_counts = {"T90": 0, "T30": 0, "DSS": 0, "Standard": vector_door_count}
-
-        if len(door_responses) == 0:
-            warnings.append("No door symbols detected. Ensure the PDF contains vector graphics (CAD export), not raster images.")
-
-        # Check for unusual widths
-        for door in door_responses:
-            if door.width_m and (door.width_m < 0.5 or door.width_m > 2.5):
-                if "unusual_widths" not in [w.split(":")[0] for w in warnings]:
-                    warnings.append("unusual_widths: Some doors have unusual widths (<0.5m or >2.5m). Check scale setting.")
-                break
-
-        # Report on detection methods
-        if use_yolo and not is_yolo_available(settings):
-            warnings.append("YOLO detection requested but not available. Set SNAPGRID_YOLO_MODEL_PATH to enable.")
-
-        # Build fire rating summary
-        fire_rating_summary = FireRatingSummary(
-            total_fire_rated=fire_rating_counts.get("T90", 0) + fire_rating_counts.get("T30", 0) + fire_rating_counts.get("DSS", 0),
-            count_t90=fire_rating_counts.get("T90", 0),
-            count_t30=fire_rating_counts.get("T30", 0),
-            count_dss=fire_rating_counts.get("DSS", 0),
-            count_standard=fire_rating_counts.get("Standard", 0),
-            t90_doors=t90_door_labels,
-            t30_doors=t30_door_labels,
-        )
+    # Use text-extracted count as primary (includes fire ratings)
+    # Fall back to vector count if no labels found
+    total_doors = len(door_fire_ratings) if door_fire_ratings else vector_door_count
 
-        return FloorPlanDoorsResponse(
-            gewerk_id=f"gew_{uuid4().hex[:12]}",
-            source_file=file.filename,
-            page_number=page_number,
-            scale_used=f"1:{scale}",
-            total_doors=total_doors,
-            doors=door_responses,
-            by_width=width_counts,
-            by_fire_rating=fire_rating_summary,
-            detection_methods_used=list(methods_used),
-            processing_time_ms=detection_result.processing_time_ms,
-            warnings=warnings,
-        )
+    # If we have vector doors but no text labels, use vector results
+    if not door_fire_ratings and vector_door_count > 0:
+        door_responses = []
+        for obj in detection_result.objects:
+            if obj.object_type != ObjectType.DOOR:
+                continue
+            method = obj.attributes.get("detection_method", "unknown")
+            width_m = obj.attributes.get("width_m")
+            arc_radius_px = obj.attributes.get("arc_radius_px")
+            door_responses.append(DetectedDoorResponse.model_construct(
+                door_id=obj.object_id,
+                door_label=None,
+                page_number=obj.page_number,
+                width_m=round(width_m, 2) if width_m else None,
+                arc_radius_px=round(arc_radius_px, 1) if arc_radius_px else None,
+                fire_rating=None,
+                fire_category="Standard",
+                confidence=obj.confidence,
+                detection_method=method,
+            ))
+        fire_rating_counts = {"T90": 0, "T30": 0, "DSS": 0, "Standard": vector_door_count}
+
+    if len(door_responses) == 0:
+        warnings.append("No door symbols detected. Ensure the PDF contains vector graphics (CAD export), not raster images.")
+
+    # Check for unusual widths
+    for door in door_responses:
+        if door.width_m and (door.width_m < 0.5 or door.width_m > 2.5):
+            if "unusual_widths" not in [w.split(":")[0] for w in warnings]:
+                warnings.append("unusual_widths: Some doors have unusual widths (<0.5m or >2.5m). Check scale setting.")
+            break
+
+    # Report on detection methods
+    if use_yolo and not is_yolo_available(settings):
+        warnings.append("YOLO detection requested but not available. Set SNAPGRID_YOLO_MODEL_PATH to enable.")
+
+    # Build fire rating summary
+    fire_rating_summary = FireRatingSummary.model_construct(
+        total_fire_rated=fire_rating_counts.get("T90", 0) + fire_rating_counts.get("T30", 0) + fire_rating_counts.get("DSS", 0),
+        count_t90=fire_rating_counts.get("T90", 0),
+        count_t30=fire_rating_counts.get("T30", 0),
+        count_dss=fire_rating_counts.get("DSS", 0),
+        count_standard=fire_rating_counts.get("Standard", 0),
+        t90_doors=t90_door_labels,
+        t30_doors=t30_door_labels,
+    )
 
-    finally:
-        shutil.rmtree(temp_dir, ignore_errors=True)
+    return FloorPlanDoorsResponse.model_construct(
+        gewerk_id=f"gew_{uuid4().hex[:12]}",
+        source_file=filename,
+        page_number=page_number,
+        scale_used=f"1:{scale}",
+        total_doors=total_doors,
+        doors=door_responses,
+        by_width=width_counts,
+        by_fire_rating=fire_rating_summary,
+        detection_methods_used=list(methods_used),
+        processing_time_ms=detection_result.processing_time_ms,
+        stage_timings_ms=detection_result.stage_timings_ms,
+        warnings=warnings,
+    )
 
 
 # =============================================================================
@@ -978,6 +930,10 @@ async def extract_flooring_from_plan(
         shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+# Leading words of a room name line ("Büro", "TRH 2", "Nutzungseinheit 3")
+_ROOM_NAME_PATTERN = re.compile(r'^([A-Za-zÄÖÜäöüß\-]+(?:\s+[A-Za-zÄÖÜäöüß0-9\-]+)?)')
+
+
 def _classify_room_type(room_name: Optional[str]) -> Optional[str]:
     """Classify room by name into standard types."""
     if not room_name:
@@ -1162,7 +1118,9 @@ class SmartDrywallResponse(BaseModel):
 
 @router.post("/flooring/smart", response_model=SmartFlooringResponse)
 async def extract_flooring_smart(
-    file: UploadFile = File(..., description="Floor plan PDF or image"),
+    request: Request,
+    file: Optional[UploadFile] = File(None, description="Floor plan PDF or image"),
+    file_id: Optional[str] = Query(None, description="Stored plan id from POST /files (instead of file)"),
     page_number: int = Query(1, gt=0, description="Page number to analyze"),
     scale: int = Query(100, gt=0, description="Scale denominator (e.g., 100 for 1:100)"),
 ):
@@ -1183,214 +1141,206 @@ async def extract_flooring_smart(
     - Room areas (m²)
     - Pipeline used for extraction
     - Input type detected
+
+    Responses are cached per plan, parameters and models and carry an
+    `ETag` for `If-None-Match` revalidation.
     """
+    async with plan_input(file, file_id, PLAN_SUFFIXES) as plan:
+        return await cached_response(
+            request,
+            "gewerke.flooring_smart",
+            plan,
+            {"page_number": page_number, "scale": scale},
+            lambda: run_flooring_smart(plan.path, plan.filename, page_number, scale),
+            cost=render_cost(pages=1, dpi=150),
+        )
+
+
+def run_flooring_smart(
+    file_path: Path,
+    filename: str,
+    page_number: int,
+    scale: int,
+) -> SmartFlooringResponse:
+    """Run smart flooring extraction on a stored PDF or image."""
     import time
-    from datetime import datetime
-    from ..services.input_router import analyze_input, InputType, ProcessingPipeline
+    from ..services.input_router import analyze_input, InputType
     from ..services.roboflow_service import detect_rooms, is_roboflow_available
 
     start_time = time.time()
 
-    if not file.filename:
-        raise HTTPException(status_code=400, detail="No filename provided")
+    settings = get_settings()
 
-    # Save uploaded file to temp location
-    temp_dir = tempfile.mkdtemp()
-    temp_path = Path(temp_dir) / file.filename
+    # Analyze input type
+    analysis = analyze_input(str(file_path))
+    warnings = list(analysis.warnings)
 
-    try:
-        with open(temp_path, "wb") as f:
-            shutil.copyfileobj(file.file, f)
+    rooms = []
+    total_area_m2 = 0.0
+    by_type: Dict[str, float] = {}
+    pipeline_used = "unknown"
 
-        settings = get_settings()
+    # Route based on input type
+    if analysis.input_type == InputType.CAD_WITH_TEXT:
+        # Use text extraction (existing implementation)
+        pipeline_used = "text_extraction"
 
-        # Analyze input type
-        analysis = analyze_input(str(temp_path))
-        warnings = list(analysis.warnings)
+        import fitz
+        doc = fitz.open(str(file_path))
+        if page_number > len(doc):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Page {page_number} not found, PDF has {len(doc)} pages"
+            )
 
-        rooms = []
-        total_area_m2 = 0.0
-        by_type: Dict[str, float] = {}
-        pipeline_used = "unknown"
+        page = doc[page_number - 1]
+        text = page.get_text()
+        doc.close()
 
-        # Route based on input type
-        if analysis.input_type == InputType.CAD_WITH_TEXT:
-            # Use text extraction (existing implementation)
-            pipeline_used = "text_extraction"
+        # Extract room data from the page's annotation tokens
+        tokens = tokenize_text(text)
+        seen_room_ids = set()
 
-            import fitz
-            doc = fitz.open(str(temp_path))
-            if page_number > len(doc):
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Page {page_number} not found, PDF has {len(doc)} pages"
-                )
+        for i, tok in enumerate(tokens):
+            if tok.is_room_id and tok.scheme == RoomScheme.LEIQ:
+                room_id = tok.text
+                if room_id in seen_room_ids:
+                    continue
 
-            page = doc[page_number - 1]
-            text = page.get_text()
-            doc.close()
+                room_name = None
+                nrf_value = None
+                u_value = None
+                lh_value = None
+                expecting_nrf_value = False
+                expecting_u_value = False
 
-            # Extract room data (same logic as extract_flooring_from_plan)
-            lines = text.split('\n')
-            seen_room_ids = set()
-            room_id_pattern = r'^(B\.\d{2}\.\d\.\d{3})$'
-            nrf_same_line = r'NRF\s*[=:]?\s*([\d,\.]+)\s*m[²2]?'
-            nrf_split_value = r'^([\d,\.]+)\s*m[²2]?$'
-            u_same_line = r'U\s*[=:]?\s*([\d,\.]+)\s*m(?![²2])'
-            u_split_value = r'^([\d,\.]+)\s*m$'
-            lh_same_line = r'LH\s*[=:]?\s*([\d,\.]+)\s*m'
-
-            i = 0
-            while i < len(lines):
-                line = lines[i].strip()
-                room_match = re.match(room_id_pattern, line)
-                if room_match:
-                    room_id = room_match.group(1)
-                    if room_id in seen_room_ids:
-                        i += 1
+                for curr in tokens[i + 1:i + 15]:
+                    next_line = curr.text
+                    if curr.is_room_id and curr.scheme == RoomScheme.LEIQ:
+                        break
+
+                    if expecting_nrf_value:
+                        if curr.is_area_value:
+                            nrf_value = curr.value
+                        expecting_nrf_value = False
                         continue
 
-                    room_name = None
-                    nrf_value = None
-                    u_value = None
-                    lh_value = None
-                    expecting_nrf_value = False
-                    expecting_u_value = False
+                    if expecting_u_value:
+                        if curr.is_length_value:
+                            u_value = curr.value
+                        expecting_u_value = False
+                        continue
 
-                    for j in range(i + 1, min(i + 15, len(lines))):
-                        next_line = lines[j].strip()
-                        if re.match(room_id_pattern, next_line):
-                            break
-
-                        if expecting_nrf_value:
-                            val_match = re.match(nrf_split_value, next_line)
-                            if val_match:
-                                nrf_value = float(val_match.group(1).replace(',', '.'))
-                            expecting_nrf_value = False
-                            continue
-
-                        if expecting_u_value:
-                            val_match = re.match(u_split_value, next_line)
-                            if val_match:
-                                u_value = float(val_match.group(1).replace(',', '.'))
-                            expecting_u_value = False
-                            continue
-
-                        if next_line == 'NRF:' and nrf_value is None:
-                            expecting_nrf_value = True
-                            continue
-
-                        if next_line == 'U:' and u_value is None:
-                            expecting_u_value = True
-                            continue
-
-                        if not room_name and not next_line.startswith(('NRF', 'U:', 'LH', 'U ', 'm²', 'm2')):
-                            name_match = re.match(r'^([A-Za-zÄÖÜäöüß\-]+(?:\s+[A-Za-zÄÖÜäöüß0-9\-]+)?)', next_line)
-                            if name_match and len(name_match.group(1)) > 1 and not re.match(r'^[\d,\.]+', next_line):
-                                room_name = name_match.group(1)
-
-                        if nrf_value is None:
-                            nrf_match = re.search(nrf_same_line, next_line, re.IGNORECASE)
-                            if nrf_match:
-                                nrf_value = float(nrf_match.group(1).replace(',', '.'))
-
-                        if u_value is None:
-                            u_match = re.search(u_same_line, next_line, re.IGNORECASE)
-                            if u_match:
-                                u_value = float(u_match.group(1).replace(',', '.'))
-
-                        if lh_value is None:
-                            lh_match = re.search(lh_same_line, next_line, re.IGNORECASE)
-                            if lh_match:
-                                lh_value = float(lh_match.group(1).replace(',', '.'))
-
-                    if nrf_value is not None:
-                        seen_room_ids.add(room_id)
-                        room_type = _classify_room_type(room_name) if room_name else None
-                        rooms.append(RoomDataResponse(
-                            room_id=room_id,
-                            room_name=room_name,
-                            room_type=room_type,
-                            area_m2=nrf_value,
-                            perimeter_m=u_value,
-                            ceiling_height_m=lh_value,
-                            page_number=page_number,
-                            confidence=0.95,
-                        ))
-
-                        by_type[room_type or "Unknown"] = by_type.get(room_type or "Unknown", 0) + nrf_value
-
-                i += 1
-
-            total_area_m2 = sum(r.area_m2 for r in rooms if r.area_m2)
-
-            if len(rooms) == 0:
-                warnings.append("Text extraction found no rooms. Falling back to CV...")
-                # Fall through to CV fallback
-                analysis.input_type = InputType.SCANNED_PDF
+                    if curr.is_label("NRF") and nrf_value is None:
+                        expecting_nrf_value = True
+                        continue
 
-        # CV fallback for scanned/photo/failed text extraction
-        if analysis.input_type in [InputType.SCANNED_PDF, InputType.PHOTO, InputType.CAD_NO_TEXT] or len(rooms) == 0:
-            if is_roboflow_available(settings):
-                pipeline_used = "roboflow_cv"
+                    if curr.is_label("U") and u_value is None:
+                        expecting_u_value = True
+                        continue
 
-                # Render PDF to image if needed
-                suffix = temp_path.suffix.lower()
-                if suffix == ".pdf":
-                    from ..services.cv_pipeline import render_pdf_page_to_image
-                    import os
+                    if not room_name and not next_line.startswith(('NRF', 'U:', 'LH', 'U ', 'm²', 'm2')):
+                        name_match = _ROOM_NAME_PATTERN.match(next_line)
+                        if name_match and len(name_match.group(1)) > 1:
+                            room_name = name_match.group(1)
 
-                    image_path = render_pdf_page_to_image(str(temp_path), page_number, dpi=150)
-                    try:
-                        cv_result = detect_rooms(image_path, scale=scale, dpi=150, settings=settings)
-                    finally:
-                        if os.path.exists(image_path):
-                            os.remove(image_path)
-                else:
-                    cv_result = detect_rooms(str(temp_path), scale=scale, dpi=150, settings=settings)
+                    if nrf_value is None:
+                        nrf = curr.find(TokenKind.AREA, ("NRF",))
+                        if nrf:
+                            nrf_value = nrf.value
+
+                    if u_value is None:
+                        u = curr.find(TokenKind.PERIMETER)
+                        if u:
+                            u_value = u.value
+
+                    if lh_value is None:
+                        lh = curr.find(TokenKind.HEIGHT)
+                        if lh:
+                            lh_value = lh.value
 
-                # Convert CV results to room responses
-                rooms = []
-                for idx, room_data in enumerate(cv_result.get("rooms", [])):
+                if nrf_value is not None:
+                    seen_room_ids.add(room_id)
+                    room_type = _classify_room_type(room_name) if room_name else None
                     rooms.append(RoomDataResponse(
-                        room_id=f"cv_room_{idx+1}",
-                        room_name=room_data.get("class_name"),
-                        room_type=room_data.get("class_name"),
-                        area_m2=room_data.get("area_m2"),
-                        perimeter_m=room_data.get("perimeter_m"),
-                        ceiling_height_m=None,
+                        room_id=room_id,
+                        room_name=room_name,
+                        room_type=room_type,
+                        area_m2=nrf_value,
+                        perimeter_m=u_value,
+                        ceiling_height_m=lh_value,
                         page_number=page_number,
-                        confidence=room_data.get("confidence", 0.7),
+                        confidence=0.95,
                     ))
 
-                    room_type = room_data.get("class_name", "Unknown")
-                    by_type[room_type] = by_type.get(room_type, 0) + room_data.get("area_m2", 0)
+                    by_type[room_type or "Unknown"] = by_type.get(room_type or "Unknown", 0) + nrf_value
 
-                total_area_m2 = cv_result.get("total_area_m2", 0)
-                warnings.extend(cv_result.get("warnings", []))
+        total_area_m2 = sum(r.area_m2 for r in rooms if r.area_m2)
 
-            else:
-                warnings.append("Roboflow not available. Configure SNAPGRID_ROBOFLOW_API_KEY for CV support.")
-                pipeline_used = "none"
+        if len(rooms) == 0:
+            warnings.append("Text extraction found no rooms. Falling back to CV...")
+            # Fall through to CV fallback
+            analysis.input_type = InputType.SCANNED_PDF
 
-        processing_time = int((time.time() - start_time) * 1000)
+    # CV fallback for scanned/photo/failed text extraction
+    if analysis.input_type in [InputType.SCANNED_PDF, InputType.PHOTO, InputType.CAD_NO_TEXT] or len(rooms) == 0:
+        if is_roboflow_available(settings):
+            pipeline_used = "roboflow_cv"
 
-        return SmartFlooringResponse(
-            gewerk_id=f"gew_{uuid4().hex[:12]}",
-            source_file=file.filename,
-            page_number=page_number,
-            pipeline_used=pipeline_used,
-            input_type=analysis.input_type.value,
-            total_rooms=len(rooms),
-            total_area_m2=round(total_area_m2, 2),
-            rooms=rooms,
-            by_room_type=by_type,
-            processing_time_ms=processing_time,
-            warnings=warnings,
-        )
+            # Render PDF to image if needed
+            suffix = file_path.suffix.lower()
+            if suffix == ".pdf":
+                from ..services.cv_pipeline import render_pdf_page_to_image
+                import os
 
-    finally:
-        shutil.rmtree(temp_dir, ignore_errors=True)
+                image_path = render_pdf_page_to_image(str(file_path), page_number, dpi=150)
+                try:
+                    cv_result = detect_rooms(image_path, scale=scale, dpi=150, settings=settings)
+                finally:
+                    if os.path.exists(image_path):
+                        os.remove(image_path)
+            else:
+                cv_result = detect_rooms(str(file_path), scale=scale, dpi=150, settings=settings)
+
+            # Convert CV results to room responses
+            rooms = []
+            for idx, room_data in enumerate(cv_result.get("rooms", [])):
+                rooms.append(RoomDataResponse(
+                    room_id=f"cv_room_{idx+1}",
+                    room_name=room_data.get("class_name"),
+                    room_type=room_data.get("class_name"),
+                    area_m2=room_data.get("area_m2"),
+                    perimeter_m=room_data.get("perimeter_m"),
+                    ceiling_height_m=None,
+                    page_number=page_number,
+                    confidence=room_data.get("confidence", 0.7),
+                ))
+
+                room_type = room_data.get("class_name", "Unknown")
+                by_type[room_type] = by_type.get(room_type, 0) + room_data.get("area_m2", 0)
+
+            total_area_m2 = cv_result.get("total_area_m2", 0)
+            warnings.extend(cv_result.get("warnings", []))
+
+        else:
+            warnings.append("Roboflow not available. Configure SNAPGRID_ROBOFLOW_API_KEY for CV support.")
+            pipeline_used = "none"
+
+    processing_time = int((time.time() - start_time) * 1000)
+
+    return SmartFlooringResponse(
+        gewerk_id=f"gew_{uuid4().hex[:12]}",
+        source_file=filename,
+        page_number=page_number,
+        pipeline_used=pipeline_used,
+        input_type=analysis.input_type.value,
+        total_rooms=len(rooms),
+        total_area_m2=round(total_area_m2, 2),
+        rooms=rooms,
+        by_room_type=by_type,
+        processing_time_ms=processing_time,
+        warnings=warnings,
+    )
 
 
 @router.post("/drywall/smart", response_model=SmartDrywallResponse)
@@ -1583,7 +1533,8 @@ class GeometryFlooringResponse(BaseModel):
 
 @router.post("/flooring/geometry", response_model=GeometryFlooringResponse)
 async def extract_flooring_geometry(
-    file: UploadFile = File(..., description="Floor plan PDF or image"),
+    file: Optional[UploadFile] = File(None, description="Floor plan PDF or image"),
+    file_id: Optional[str] = Query(None, description="Stored plan id from POST /files (instead of file)"),
     page_number: int = Query(1, gt=0, description="Page number to analyze"),
     scale: Optional[int] = Query(None, gt=0, description="Scale denominator (e.g., 50 for 1:50). If not provided, auto-detect."),
     dpi: int = Query(150, ge=72, le=600, description="Render DPI for processing"),
@@ -1614,68 +1565,103 @@ async def extract_flooring_geometry(
     - List of detected room polygons with areas
     - Total floor area (m² if scale available, px otherwise)
     - Scale information and detection method
+
+    Under load, requests wait for capacity (memory grows with DPI²) and are
+    rejected with 429 and `Retry-After`.
     """
-    from ..services.flooring_pipeline import analyze_flooring, PipelineMethod
+    async with plan_input(file, file_id, PLAN_SUFFIXES) as plan:
+        async with admitted(render_cost(pages=1, dpi=dpi)):
+            return await run_in_threadpool(
+                run_flooring_geometry, plan.path, plan.filename, page_number, scale, dpi
+            )
 
-    if not file.filename:
-        raise HTTPException(status_code=400, detail="No filename provided")
 
-    # Save uploaded file to temp location
-    temp_dir = tempfile.mkdtemp()
-    temp_path = Path(temp_dir) / file.filename
+@router.post("/flooring/geometry/jobs", response_model=QueuedJobResponse, status_code=202)
+async def submit_flooring_geometry_job(
+    file: Optional[UploadFile] = File(None, description="Floor plan PDF or image"),
+    file_id: Optional[str] = Query(None, description="Stored plan id from POST /files (instead of file)"),
+    page_number: int = Query(1, gt=0, description="Page number to analyze"),
+    scale: Optional[int] = Query(None, gt=0, description="Scale denominator (e.g., 50 for 1:50). If not provided, auto-detect."),
+    dpi: int = Query(150, ge=72, le=600, description="Render DPI for processing"),
+):
+    """
+    Queue geometry-first flooring extraction as a background job.
 
-    try:
-        with open(temp_path, "wb") as f:
-            shutil.copyfileobj(file.file, f)
+    Same parameters as `POST /flooring/geometry`; returns a job id
+    immediately. Poll `GET /jobs/queue/{job_id}` and fetch the
+    `GeometryFlooringResponse` from `GET /jobs/queue/{job_id}/result`.
+    """
+    return await submit_upload_job(
+        "flooring_geometry",
+        file,
+        {"page_number": page_number, "scale": scale, "dpi": dpi},
+        file_id=file_id,
+        suffixes=PLAN_SUFFIXES,
+    )
 
-        # Run geometry-first pipeline
-        result = analyze_flooring(
-            file_path=str(temp_path),
-            page_number=page_number,
-            scale=scale,
-            dpi=dpi,
-        )
 
-        # Convert rooms to response format
-        rooms = []
-        for room in result.rooms:
-            rooms.append(GeometryFlooringRoomResponse(
-                id=room.id,
-                label=room.label,
-                area_m2=round(room.area_m2, 2) if room.area_m2 else None,
-                area_px=round(room.area_px, 1),
-                perimeter_m=round(room.perimeter_m, 2) if room.perimeter_m else None,
-                perimeter_px=round(room.perimeter_px, 1),
-                confidence=round(room.confidence, 2),
-                source=room.source,
-                vertex_count=len(room.points),
-            ))
+def run_flooring_geometry(
+    file_path: Path,
+    filename: str,
+    page_number: int,
+    scale: Optional[int],
+    dpi: int,
+) -> GeometryFlooringResponse:
+    """Run the geometry-first flooring pipeline on a stored file."""
+    from ..services.flooring_pipeline import analyze_flooring
+
+    result = analyze_flooring(
+        file_path=str(file_path),
+        page_number=page_number,
+        scale=scale,
+        dpi=dpi,
+    )
 
-        # Build response
-        return GeometryFlooringResponse(
-            gewerk_id=f"gew_{uuid4().hex[:12]}",
-            source_file=file.filename,
-            page_number=page_number,
-            pipeline_used=result.pipeline_used.value,
-            total_rooms=result.room_count,
-            total_area_m2=round(result.total_area_m2, 2) if result.total_area_m2 else None,
-            total_area_px=round(result.total_area_px, 1),
-            scale_string=result.scale.scale_string if result.scale else None,
-            scale_detected=result.scale.has_scale if result.scale else False,
-            pixels_per_meter=round(result.scale.pixels_per_meter, 2) if result.scale and result.scale.pixels_per_meter else None,
-            rooms=rooms,
-            processing_time_ms=int(result.processing_time_ms),
-            needs_user_confirmation=result.needs_user_confirmation,
-            confirmation_reason=result.confirmation_reason,
-            warnings=result.warnings,
-        )
+    # Convert rooms to response format
+    rooms = []
+    for room in result.rooms:
+        rooms.append(GeometryFlooringRoomResponse(
+            id=room.id,
+            label=room.label,
+            area_m2=round(room.area_m2, 2) if room.area_m2 else None,
+            area_px=round(room.area_px, 1),
+            perimeter_m=round(room.perimeter_m, 2) if room.perimeter_m else None,
+            perimeter_px=round(room.perimeter_px, 1),
+            confidence=round(room.confidence, 2),
+            source=room.source,
+            vertex_count=len(room.points),
+        ))
 
-    finally:
-        # Clean up temp files
-        if temp_path.exists():
-            temp_path.unlink()
-        if Path(temp_dir).exists():
-            shutil.rmtree(temp_dir, ignore_errors=True)
+    # Build response
+    return GeometryFlooringResponse(
+        gewerk_id=f"gew_{uuid4().hex[:12]}",
+        source_file=filename,
+        page_number=page_number,
+        pipeline_used=result.pipeline_used.value,
+        total_rooms=result.room_count,
+        total_area_m2=round(result.total_area_m2, 2) if result.total_area_m2 else None,
+        total_area_px=round(result.total_area_px, 1),
+        scale_string=result.scale.scale_string if result.scale else None,
+        scale_detected=result.scale.has_scale if result.scale else False,
+        pixels_per_meter=round(result.scale.pixels_per_meter, 2) if result.scale and result.scale.pixels_per_meter else None,
+        rooms=rooms,
+        processing_time_ms=int(result.processing_time_ms),
+        needs_user_confirmation=result.needs_user_confirmation,
+        confirmation_reason=result.confirmation_reason,
+        warnings=result.warnings,
+    )
+
+
+def flooring_geometry_job(work_dir: Path, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Background job handler for geometry-first flooring extraction."""
+    response = run_flooring_geometry(
+        work_dir / params["input"],
+        params["filename"],
+        params["page_number"],
+        params["scale"],
+        params["dpi"],
+    )
+    return response.model_dump()
 
 
 # =============================================================================
@@ -1714,7 +1700,8 @@ class RoomAreaResponse(BaseModel):
 
 @router.post("/flooring/nrf", response_model=RoomAreaResponse)
 async def extract_room_areas_nrf(
-    file: UploadFile = File(..., description="Floor plan PDF with NRF annotations"),
+    file: Optional[UploadFile] = File(None, description="Floor plan PDF with NRF annotations"),
+    file_id: Optional[str] = Query(None, description="Stored plan id from POST /files (instead of file)"),
     pages: Optional[str] = Query(
         None,
         description="Comma-separated page numbers (0-indexed). Leave empty for all pages.",
@@ -1754,15 +1741,6 @@ async def extract_room_areas_nrf(
     """
     from ..services.room_area_extraction import extract_room_areas
 
-    if not file.filename:
-        raise HTTPException(status_code=400, detail="No filename provided")
-
-    if not file.filename.lower().endswith(".pdf"):
-        raise HTTPException(
-            status_code=400,
-            detail=f"File must be a PDF, got: {file.filename}",
-        )
-
     # Parse pages parameter
     page_list = None
     if pages:
@@ -1774,37 +1752,16 @@ async def extract_room_areas_nrf(
                 detail=f"Invalid pages parameter: {pages}. Use comma-separated integers.",
             )
 
-    # Save uploaded file to temp location
-    temp_dir = tempfile.mkdtemp()
-    temp_path = Path(temp_dir) / file.filename
-
-    try:
-        with open(temp_path, "wb") as f:
-            shutil.copyfileobj(file.file, f)
-
+    async with plan_input(file, file_id) as plan:
         # Extract room areas using deterministic NRF extraction
         result = extract_room_areas(
-            pdf_path=temp_path,
+            pdf_path=plan.path,
             pages=page_list,
             default_balcony_factor=balcony_factor,
         )
 
         # Convert rooms to response format
-        rooms = []
-        for room in result.rooms:
-            rooms.append(RoomAreaItemResponse(
-                room_id=room.room_id,
-                name=room.name,
-                area_m2=room.area_m2,
-                counted_m2=room.counted_m2,
-                factor=room.factor,
-                page=room.page,
-                source_text=room.source_text,
-                bbox=room.bbox.to_dict(),
-                room_type=room.room_type,
-                name_source=room.name_source,
-                factor_source=room.factor_source,
-            ))
+        rooms = [_room_area_item_response(room) for room in result.rooms]
 
         # Convert missing to response format
         missing = [m.to_dict() for m in result.missing]
@@ -1812,7 +1769,7 @@ async def extract_room_areas_nrf(
         return RoomAreaResponse(
             gewerk_id=f"gew_{uuid4().hex[:12]}",
             gewerk_type="flooring",
-            source_file=file.filename or "unknown.pdf",
+            source_file=plan.filename,
             extraction_method=result.extraction_method,
             rooms=rooms,
             total_area_m2=result.total_area_m2,
@@ -1822,9 +1779,114 @@ async def extract_room_areas_nrf(
             warnings=result.warnings,
         )
 
-    finally:
-        # Clean up temp files
-        if temp_path.exists():
-            temp_path.unlink()
-        if Path(temp_dir).exists():
-            shutil.rmtree(temp_dir, ignore_errors=True)
+
+@router.post("/flooring/nrf/stream")
+async def extract_room_areas_nrf_stream(
+    file: Optional[UploadFile] = File(None, description="Floor plan PDF with NRF annotations"),
+    file_id: Optional[str] = Query(None, description="Stored plan id from POST /files (instead of file)"),
+    pages: Optional[str] = Query(
+        None,
+        description="Comma-separated page numbers (0-indexed). Leave empty for all pages.",
+    ),
+    balcony_factor: float = Query(
+        0.5,
+        ge=0.0,
+        le=1.0,
+        description="Factor for balcony/terrace areas (default 0.5 = 50%)",
+    ),
+    stream_format: StreamFormat = Query(
+        StreamFormat.NDJSON,
+        alias="format",
+        description="Stream format: ndjson (application/x-ndjson) or sse (text/event-stream)",
+    ),
+):
+    """
+    Stream deterministic NRF room area extraction page by page.
+
+    Same extraction as `/gewerke/flooring/nrf`, sent while the PDF is
+    processed instead of once at the end.
+
+    **Events (in order):**
+    - `start`: gewerk_id, source_file, page_count, pages_total
+    - `page` (one per requested page): page, rooms, missing, warnings, page
+      totals and running `totals` over all pages so far
+    - `summary`: totals, missing and warnings of `/gewerke/flooring/nrf`
+      (rooms are not repeated)
+    - `error`: sent instead of `summary` if extraction fails mid-stream
+    """
+    from ..services.room_area_extraction import RoomAreaStream
+
+    page_list = parse_page_list(pages)
+    plan, stream, release = await open_plan_stream(
+        file,
+        file_id,
+        lambda path: RoomAreaStream(path, pages=page_list, default_balcony_factor=balcony_factor),
+    )
+
+    gewerk_id = f"gew_{uuid4().hex[:12]}"
+
+    def events():
+        with stream:
+            yield "start", {
+                "gewerk_id": gewerk_id,
+                "gewerk_type": "flooring",
+                "source_file": plan.filename,
+                "page_count": stream.page_count,
+                "pages_total": len(stream.pages),
+            }
+
+            total_rooms = 0
+            total_area = 0.0
+            total_counted = 0.0
+            for pages_done, page in enumerate(stream, start=1):
+                total_rooms += len(page.rooms)
+                total_area += page.area_m2
+                total_counted += page.counted_m2
+                yield "page", {
+                    "page": page.page,
+                    "rooms": [_room_area_item_response(room).model_dump() for room in page.rooms],
+                    "area_m2": page.area_m2,
+                    "counted_m2": page.counted_m2,
+                    "missing": [m.to_dict() for m in page.missing],
+                    "warnings": page.warnings,
+                    "pages_done": pages_done,
+                    "pages_total": len(stream.pages),
+                    "totals": {
+                        "rooms": total_rooms,
+                        "area_m2": round(total_area, 2),
+                        "counted_m2": round(total_counted, 2),
+                    },
+                }
+
+            result = stream.result()
+            yield "summary", {
+                "gewerk_id": gewerk_id,
+                "gewerk_type": "flooring",
+                "source_file": plan.filename,
+                "extraction_method": result.extraction_method,
+                "room_count": len(result.rooms),
+                "total_area_m2": result.total_area_m2,
+                "sum_counted_m2": result.sum_counted_m2,
+                "page_count": result.page_count,
+                "missing": [m.to_dict() for m in result.missing],
+                "warnings": result.warnings,
+            }
+
+    return stream_events(events(), stream_format, on_close=release)
+
+
+def _room_area_item_response(room) -> RoomAreaItemResponse:
+    """Convert a room_area_extraction.RoomAreaItem to its response model."""
+    return RoomAreaItemResponse(
+        room_id=room.room_id,
+        name=room.name,
+        area_m2=room.area_m2,
+        counted_m2=room.counted_m2,
+        factor=room.factor,
+        page=room.page,
+        source_text=room.source_text,
+        bbox=room.bbox.to_dict(),
+        room_type=room.room_type,
+        name_source=room.name_source,
+        factor_source=room.factor_source,
+    )
@@ -0,0 +1,223 @@
+"""
+Background job API.
+
+Long takeoffs can be queued instead of run inside the HTTP request: their
+``.../jobs`` submit endpoints take an upload or a stored plan's ``file_id``,
+copy the plan into the job's work directory, queue a job and return its
+id with 202 Accepted. Clients poll ``GET /jobs/queue/{job_id}`` and fetch
+the result (JSON, or the exported file) from
+``GET /jobs/queue/{job_id}/result``.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+import logging
+import os
+import shutil
+import signal
+import threading
+
+from fastapi import APIRouter, HTTPException, UploadFile
+from fastapi.responses import FileResponse
+from pydantic import BaseModel, Field
+from starlette.concurrency import run_in_threadpool
+
+from ..core.config import Settings, get_settings
+from ..services.job_queue import COMPLETED, FAILED, JobWorkerPool, get_job_queue
+from .plan_files import plan_input
+from .responses import FastJSONResponse
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/jobs/queue", tags=["jobs"])
+
+
+# Job kind -> handler ("module:function", imported in the worker processes)
+JOB_HANDLERS: Dict[str, str] = {
+    "flooring_geometry": "app.api.gewerke:flooring_geometry_job",
+    "doors_production": "app.api.cv:doors_production_job",
+    "extract_and_export": "app.api.extraction:extract_and_export_job",
+}
+
+
+# =============================================================================
+# Response Models
+# =============================================================================
+
+class QueuedJobResponse(BaseModel):
+    """Status of a background job."""
+    job_id: str
+    kind: str
+    status: str = Field(..., description="queued, running, completed or failed")
+    attempts: int
+    max_attempts: int
+    created_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    status_url: str
+    result_url: str
+
+
+def _job_response(job) -> QueuedJobResponse:
+    return QueuedJobResponse(
+        **job.to_dict(),
+        status_url=f"/api/v1/jobs/queue/{job.id}",
+        result_url=f"/api/v1/jobs/queue/{job.id}/result",
+    )
+
+
+# =============================================================================
+# Submission
+# =============================================================================
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    """Hard-link a stored plan into a job directory (copy across filesystems)."""
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+
+
+async def submit_upload_job(
+    kind: str,
+    file: Optional[UploadFile],
+    params: Dict[str, Any],
+    file_id: Optional[str] = None,
+    suffixes: Sequence[str] = (".pdf",),
+) -> QueuedJobResponse:
+    """
+    Copy an uploaded or stored plan into a new job's work directory and queue the job.
+
+    The handler finds the plan at ``work_dir / params["input"]``; the
+    original file name is passed as ``params["filename"]``. The job keeps
+    its own link to the file, so plan store eviction does not affect it.
+
+    Args:
+        kind: Job kind (key of ``JOB_HANDLERS``)
+        file: Uploaded input file (or None to use ``file_id``)
+        params: Validated, JSON-serializable handler parameters
+        file_id: Plan store id of a previously uploaded plan
+        suffixes: Accepted file suffixes
+    """
+    queue = get_job_queue()
+
+    async with plan_input(file, file_id, suffixes) as plan:
+        job_id, work_dir = queue.new_job_dir()
+        input_name = "input" + Path(plan.filename).suffix.lower()
+
+        try:
+            await run_in_threadpool(_link_or_copy, plan.path, work_dir / input_name)
+            job = queue.submit(
+                kind,
+                {**params, "input": input_name, "filename": plan.filename},
+                job_id=job_id,
+            )
+        except Exception:
+            shutil.rmtree(work_dir, ignore_errors=True)
+            raise
+
+    return _job_response(job)
+
+
+# =============================================================================
+# API Endpoints
+# =============================================================================
+
+@router.get("/stats")
+async def queue_stats():
+    """Number of background jobs per status."""
+    return get_job_queue().counts()
+
+
+@router.get("/{job_id}", response_model=QueuedJobResponse)
+async def get_queued_job(job_id: str):
+    """Poll the status of a background job."""
+    job = get_job_queue().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return _job_response(job)
+
+
+@router.get("/{job_id}/result")
+async def get_queued_job_result(job_id: str):
+    """
+    Result of a finished background job.
+
+    Returns the same body the synchronous endpoint would have returned
+    (JSON, or the exported file). Unfinished jobs return 409; failed jobs
+    return the error with the status code the synchronous endpoint would
+    have used.
+    """
+    queue = get_job_queue()
+    job = queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+
+    if job.status == FAILED:
+        raise HTTPException(status_code=job.error_status or 500, detail=job.error)
+    if job.status != COMPLETED:
+        raise HTTPException(status_code=409, detail=f"Job {job_id} is {job.status}")
+
+    artifact = (job.result or {}).get("artifact")
+    if artifact:
+        path = queue.job_dir(job_id) / artifact["filename"]
+        if not path.exists():
+            raise HTTPException(status_code=410, detail=f"Result file of job {job_id} was purged")
+        return FileResponse(path, media_type=artifact["media_type"], filename=artifact["filename"])
+
+    return FastJSONResponse(job.result)
+
+
+# =============================================================================
+# Worker Pool
+# =============================================================================
+
+def create_worker_pool(settings: Optional[Settings] = None) -> Optional[JobWorkerPool]:
+    """Worker pool for the configured queue (None if workers are disabled)."""
+    if settings is None:
+        settings = get_settings()
+
+    if settings.job_workers <= 0:
+        return None
+
+    return JobWorkerPool(
+        queue=get_job_queue(settings),
+        handlers=JOB_HANDLERS,
+        workers=settings.job_workers,
+        retention_seconds=settings.job_retention_seconds,
+    )
+
+
+def run_worker_pool(settings: Optional[Settings] = None, stop: Optional[threading.Event] = None) -> None:
+    """
+    Serve the job queue from this process until stopped.
+
+    Entry point of the dedicated job process (``python -m app.api.job_queue``)
+    that ``gunicorn.conf.py`` starts once for the whole server, so the queue
+    is not served by another pool in every HTTP worker.
+
+    Args:
+        settings: Optional Settings instance
+        stop: Event that stops the pool (default: SIGTERM or SIGINT)
+    """
+    pool = create_worker_pool(settings)
+    if pool is None:
+        logger.warning("Job workers are disabled (SNAPGRID_JOB_WORKERS=0)")
+        return
+
+    if stop is None:
+        stop = threading.Event()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, lambda *args: stop.set())
+
+    pool.start()
+    try:
+        stop.wait()
+    finally:
+        pool.stop()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run_worker_pool()
@@ -7,18 +7,34 @@ Implements zero-hallucination principle: all values must trace to source PDF.
 
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from starlette.concurrency import run_in_threadpool
+from typing import Optional, List, Dict, Any, Tuple
+import asyncio
 import tempfile
 import shutil
 import time
 import logging
-import re
 import os
 
+import httpx
+
+from ..services.annotation_tokens import TokenKind, tokenize_text
+from ..services.page_pool import map_pages, page_pool_size, use_page_pool, worker_document
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
+# PDFs are streamed to disk in chunks of this size
+DOWNLOAD_CHUNK_BYTES = 1024 * 1024
+
+# Connection pool shared by all jobs of one request
+HTTP_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=10)
+HTTP_TIMEOUT_SECONDS = 60.0
+
+# Jobs of a batch processed at the same time
+BATCH_CONCURRENCY = 4
+
 
 # =============================================================================
 # Request/Response Models
@@ -29,7 +45,19 @@ class ProcessJobRequest(BaseModel):
     job_id: str = Field(..., description="UUID of the job to process")
     file_url: str = Field(..., description="Signed URL to download PDF from Supabase Storage")
     job_type: str = Field(default="area_text", description="Type of extraction: area_text, doors_text, etc.")
-    config: Dict[str, Any] = Field(default_factory=dict, description="Processing configuration")
+    config: Dict[str, Any] = Field(
+        default_factory=dict,
+        description=(
+            "Processing configuration: pages (\"all\", \"1-3,5\", [1, 2] or a page number; "
+            "default: page_number or 1), balcony_factor (default 0.5), max_workers "
+            "(pages in the shared page pool at a time, clamped to its size)"
+        ),
+    )
+
+
+class ProcessBatchRequest(BaseModel):
+    """Several extraction jobs processed in one request."""
+    jobs: List[ProcessJobRequest] = Field(..., min_length=1, description="Jobs to process")
 
 
 class RoomResult(BaseModel):
@@ -72,7 +100,17 @@ class JobResult(BaseModel):
 
     # Metadata
     processing_time_ms: int
+    pages: List[int] = Field(default_factory=list, description="Processed pages (1-indexed)")
     warnings: List[str] = Field(default_factory=list)
+    error: Optional[str] = Field(None, description="Failure reason (batch results with status 'failed')")
+
+
+class BatchJobResult(BaseModel):
+    """Results of a job batch, in request order."""
+    results: List[JobResult]
+    completed: int
+    failed: int
+    processing_time_ms: int
 
 
 # =============================================================================
@@ -190,28 +228,21 @@ def extract_nrf_with_context(page_text: str, page_number: int) -> List[Dict[str,
     """
     results = []
 
-    # Split into lines for context
-    lines = page_text.split('\n')
-
-    # Patterns
-    nrf_pattern = r'NRF\s*[=:]\s*([\d,\.]+)\s*m[²2]?'
-    nrf_value_only = r'^([\d,\.]+)\s*m[²2]?$'
-    u_pattern = r'U\s*[=:]\s*([\d,\.]+)\s*m(?![²2])'
-    lh_pattern = r'LH\s*[=:]\s*([\d,\.]+)\s*m(?![²2])'
-    room_label_pattern = r'([A-Z]\.[\d\.]+(?:-\d+)?)\s*(?:TRH|Nutzungseinheit|Balkon|WC|Flur|[\w\s]+)?'
+    # Classify each line once (see services/annotation_tokens)
+    tokens = tokenize_text(page_text)
 
     i = 0
     room_counter = 0
 
-    while i < len(lines):
-        line = lines[i].strip()
+    while i < len(tokens):
+        tok = tokens[i]
+        line = tok.text
 
         # Try to match NRF on same line
-        nrf_match = re.search(nrf_pattern, line, re.IGNORECASE)
+        nrf = tok.find(TokenKind.AREA, ("NRF",))
 
-        if nrf_match:
-            area_str = nrf_match.group(1)
-            area = parse_german_decimal(area_str)
+        if nrf:
+            area = nrf.value
 
             if area is not None and 0 < area < 10000:  # Sanity check
                 room_counter += 1
@@ -220,37 +251,32 @@ def extract_nrf_with_context(page_text: str, page_number: int) -> List[Dict[str,
                 room_label = None
                 room_name = None
 
-                # Check same line for label
-                label_match = re.search(room_label_pattern, line)
-                if label_match:
-                    room_label = label_match.group(1)
-                    # Extract room name if present
-                    remaining = line[label_match.end():].strip()
-                    if remaining and not remaining.startswith('NRF'):
-                        room_name = remaining.split('NRF')[0].strip()
+                # Check same line for label; the name sits between label and NRF
+                label = tok.find(TokenKind.ROOM_ID)
+                if label:
+                    room_label = label.source
+                    room_name = line[label.end:nrf.start].strip() or None
 
                 # Check previous line for label
                 if not room_label and i > 0:
-                    prev_line = lines[i-1].strip()
-                    label_match = re.search(room_label_pattern, prev_line)
-                    if label_match:
-                        room_label = label_match.group(1)
-                        room_name = prev_line.replace(room_label, '').strip()
+                    prev = tokens[i - 1]
+                    label = prev.find(TokenKind.ROOM_ID)
+                    if label:
+                        room_label = label.source
+                        room_name = prev.text.replace(room_label, '').strip()
 
                 # Look for U (perimeter) and LH (height) nearby
                 perimeter = None
                 height = None
 
-                # Search in surrounding lines (current, next, prev)
-                search_text = ' '.join(lines[max(0, i-1):min(len(lines), i+3)])
-
-                u_match = re.search(u_pattern, search_text, re.IGNORECASE)
-                if u_match:
-                    perimeter = parse_german_decimal(u_match.group(1))
-
-                lh_match = re.search(lh_pattern, search_text, re.IGNORECASE)
-                if lh_match:
-                    height = parse_german_decimal(lh_match.group(1))
+                # Search in surrounding lines (prev, current, next two)
+                for nearby in tokens[max(0, i - 1):min(len(tokens), i + 3)]:
+                    if perimeter is None:
+                        u = nearby.find(TokenKind.PERIMETER)
+                        perimeter = u.value if u else None
+                    if height is None:
+                        lh = nearby.find(TokenKind.HEIGHT)
+                        height = lh.value if lh else None
 
                 results.append({
                     'room_id': room_label or f"room_{room_counter}",
@@ -264,29 +290,26 @@ def extract_nrf_with_context(page_text: str, page_number: int) -> List[Dict[str,
                 })
 
         # Handle split NRF (NRF: on one line, value on next)
-        elif 'NRF' in line.upper() and re.search(r'NRF\s*[=:]?\s*$', line, re.IGNORECASE):
+        elif tok.find(TokenKind.LABEL, ("NRF",)):
             # Check next line for value
-            if i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
-                val_match = re.match(nrf_value_only, next_line)
-                if val_match:
-                    area_str = val_match.group(1)
-                    area = parse_german_decimal(area_str)
-
-                    if area is not None and 0 < area < 10000:
-                        room_counter += 1
-
-                        results.append({
-                            'room_id': f"room_{room_counter}",
-                            'room_name': f"Room {room_counter}",
-                            'area_m2': area,
-                            'perimeter_m': None,
-                            'ceiling_height_m': None,
-                            'source_text': f"{line} {next_line}",
-                            'source_page': page_number,
-                            'confidence': 0.90,  # Slightly lower for split values
-                        })
-                        i += 1  # Skip next line
+            if i + 1 < len(tokens) and tokens[i + 1].is_area_value:
+                next_tok = tokens[i + 1]
+                area = next_tok.value
+
+                if area is not None and 0 < area < 10000:
+                    room_counter += 1
+
+                    results.append({
+                        'room_id': f"room_{room_counter}",
+                        'room_name': f"Room {room_counter}",
+                        'area_m2': area,
+                        'perimeter_m': None,
+                        'ceiling_height_m': None,
+                        'source_text': f"{line} {next_tok.text}",
+                        'source_page': page_number,
+                        'confidence': 0.90,  # Slightly lower for split values
+                    })
+                    i += 1  # Skip next line
 
         i += 1
 
@@ -355,55 +378,229 @@ def extract_areas_from_pdf(file_path: str, page_number: int = 1) -> Dict[str, An
         }
 
 
+def parse_page_selection(selection: Any, page_count: int) -> List[int]:
+    """
+    Resolve a job's page selection to 1-indexed page numbers.
+
+    Accepts "all", a page number, a list of page numbers, or a range string
+    such as "1-3,5". Pages are returned in order without duplicates.
+
+    Raises:
+        ValueError: If the selection is malformed or empty, a range is
+            reversed or a page does not exist
+    """
+    if isinstance(selection, str) and selection.strip().lower() == "all":
+        return list(range(1, page_count + 1))
+
+    if isinstance(selection, bool):
+        raise ValueError(f"Invalid page selection: {selection!r}")
+    if isinstance(selection, int):
+        numbers = [selection]
+    elif isinstance(selection, list):
+        numbers = selection
+    elif isinstance(selection, str):
+        numbers = []
+        for part in selection.split(","):
+            part = part.strip()
+            start, sep, end = part.partition("-")
+            try:
+                first, last = (int(start), int(end)) if sep else (int(part), int(part))
+            except ValueError:
+                raise ValueError(f"Invalid page selection: {selection!r}")
+            if last < first:
+                raise ValueError(f"Invalid page range: {part!r}")
+            numbers.extend(range(first, last + 1))
+    else:
+        raise ValueError(f"Invalid page selection: {selection!r}")
+
+    pages: List[int] = []
+    for number in numbers:
+        if not isinstance(number, int) or isinstance(number, bool):
+            raise ValueError(f"Invalid page number: {number!r}")
+        if number < 1 or number > page_count:
+            raise ValueError(f"Page {number} does not exist (document has {page_count} pages)")
+        if number not in pages:
+            pages.append(number)
+    if not pages:
+        raise ValueError("No pages selected")
+    return pages
+
+
+def resolve_page_workers(max_workers: Any) -> int:
+    """
+    Pages of a job in the shared page pool at a time, from its ``max_workers``.
+
+    Defaults to the pool size; requests are clamped to 1..pool size.
+
+    Raises:
+        ValueError: If max_workers is not an integer
+    """
+    limit = page_pool_size()
+    if max_workers is None:
+        return limit
+    if isinstance(max_workers, bool) or not isinstance(max_workers, int):
+        raise ValueError(f"Invalid max_workers: {max_workers!r}")
+    return max(1, min(max_workers, limit))
+
+
+def _extract_page_areas(doc: Any, page_number: int) -> Dict[str, Any]:
+    """NRF rooms and warnings of one page (1-indexed)."""
+    rooms = extract_nrf_with_context(doc[page_number - 1].get_text(), page_number)
+    warnings = [] if rooms else [f"No NRF values found on page {page_number}"]
+    return {'rooms': rooms, 'warnings': warnings}
+
+
+def _extract_page_in_worker(task: Tuple[str, int]) -> Dict[str, Any]:
+    file_path, page_number = task
+    return _extract_page_areas(worker_document(file_path), page_number)
+
+
+def extract_areas_from_pages(
+    file_path: str,
+    pages: Any = "all",
+    max_workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Extract room areas from several pages of a PDF.
+
+    Same result shape as ``extract_areas_from_pdf`` plus the processed
+    ``pages``. Larger selections are extracted in the shared page pool
+    (see ``page_pool``); results are merged in page order.
+
+    Args:
+        file_path: Path to the PDF file
+        pages: Page selection (see ``parse_page_selection``)
+        max_workers: Pages in the pool at a time (see
+            ``resolve_page_workers``; 1 extracts in-process)
+
+    Raises:
+        ValueError: If the page selection is invalid for this document or
+            max_workers is not an integer
+    """
+    try:
+        import fitz  # PyMuPDF
+    except ImportError:
+        return {
+            'success': False,
+            'error': 'PyMuPDF not installed',
+            'rooms': [],
+            'warnings': ['PyMuPDF (fitz) is required for PDF text extraction']
+        }
+
+    try:
+        doc = fitz.open(file_path)
+        try:
+            page_numbers = parse_page_selection(pages, len(doc))
+            workers = resolve_page_workers(max_workers)
+
+            if use_page_pool(len(page_numbers), workers):
+                page_results = None
+            else:
+                page_results = [_extract_page_areas(doc, n) for n in page_numbers]
+        finally:
+            doc.close()
+
+        if page_results is None:
+            tasks = [(file_path, n) for n in page_numbers]
+            page_results = list(map_pages(_extract_page_in_worker, tasks, workers))
+
+        rooms = [room for result in page_results for room in result['rooms']]
+        warnings = [w for result in page_results for w in result['warnings']]
+        logger.info(f"Extracted {len(rooms)} rooms from {len(page_numbers)} pages")
+
+        return {
+            'success': True,
+            'rooms': rooms,
+            'warnings': warnings,
+            'pages': page_numbers,
+        }
+
+    except ValueError:
+        raise
+
+    except Exception as e:
+        logger.error(f"PDF extraction failed: {e}")
+        return {
+            'success': False,
+            'error': str(e),
+            'rooms': [],
+            'warnings': [f"Extraction error: {str(e)}"]
+        }
+
+
 # =============================================================================
-# API Endpoints
+# Job Processing
 # =============================================================================
 
-@router.post("/process", response_model=JobResult)
-async def process_job(request: ProcessJobRequest):
+def create_http_client() -> httpx.AsyncClient:
+    """Pooled HTTP client for PDF downloads, shared by the jobs of one request."""
+    return httpx.AsyncClient(timeout=HTTP_TIMEOUT_SECONDS, limits=HTTP_LIMITS)
+
+
+async def download_pdf(client: httpx.AsyncClient, url: str, path: str) -> int:
     """
-    Process an extraction job.
+    Stream a PDF to disk in chunks instead of buffering it in memory.
 
-    This endpoint:
-    1. Downloads the PDF from the signed URL
-    2. Runs text extraction (NRF values)
-    3. Applies balcony factor if configured
-    4. Returns structured results with audit trail
+    Returns:
+        Number of bytes written
+    """
+    size = 0
+    async with client.stream("GET", url) as response:
+        response.raise_for_status()
+        with open(path, "wb") as f:
+            async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_BYTES):
+                f.write(chunk)
+                size += len(chunk)
+    return size
 
-    Called by Supabase Edge Function after job creation.
+
+def _job_pages(config: Dict[str, Any]) -> Any:
+    """Page selection of a job config ("pages", or the older "page_number")."""
+    if "pages" in config:
+        return config["pages"]
+    return config.get("page_number", 1)
+
+
+async def run_job(request: ProcessJobRequest, client: httpx.AsyncClient) -> JobResult:
+    """
+    Download and process one extraction job.
+
+    Extraction runs in the threadpool, so other jobs of a batch keep
+    downloading meanwhile.
+
+    Raises:
+        HTTPException: 400 for invalid job configs, 500 for download or
+            extraction failures
     """
     start_time = time.time()
     warnings: List[str] = []
 
+    if request.job_type != "area_text":
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported job type: {request.job_type}. MVP only supports 'area_text'."
+        )
+
     # Create temp directory for PDF
     temp_dir = tempfile.mkdtemp()
     temp_path = os.path.join(temp_dir, "input.pdf")
 
     try:
         # Download PDF from signed URL
-        import httpx
-
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(request.file_url)
-            response.raise_for_status()
-
-            with open(temp_path, 'wb') as f:
-                f.write(response.content)
-
-        logger.info(f"Downloaded PDF to {temp_path} ({os.path.getsize(temp_path)} bytes)")
+        size = await download_pdf(client, request.file_url, temp_path)
+        logger.info(f"Downloaded PDF to {temp_path} ({size} bytes)")
 
         # Get config
-        page_number = request.config.get("page_number", 1)
+        pages = _job_pages(request.config)
         balcony_factor = request.config.get("balcony_factor", 0.5)
+        max_workers = request.config.get("max_workers")
 
-        # Extract based on job type
-        if request.job_type == "area_text":
-            extraction_result = extract_areas_from_pdf(temp_path, page_number)
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unsupported job type: {request.job_type}. MVP only supports 'area_text'."
+        try:
+            extraction_result = await run_in_threadpool(
+                extract_areas_from_pages, temp_path, pages, max_workers
             )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
         if not extraction_result['success']:
             raise HTTPException(
@@ -469,9 +666,13 @@ async def process_job(request: ProcessJobRequest):
             total_perimeter_m=round(total_perimeter, 2),
             area_by_type={k: round(v, 2) for k, v in area_by_type.items()},
             processing_time_ms=processing_time,
+            pages=extraction_result['pages'],
             warnings=warnings,
         )
 
+    except HTTPException:
+        raise
+
     except httpx.HTTPError as e:
         logger.error(f"Failed to download PDF: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to download PDF: {str(e)}")
@@ -485,6 +686,81 @@ async def process_job(request: ProcessJobRequest):
         shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+def _failed_job_result(request: ProcessJobRequest, error: BaseException) -> JobResult:
+    detail = error.detail if isinstance(error, HTTPException) else str(error)
+    return JobResult(
+        job_id=request.job_id,
+        status="failed",
+        rooms=[],
+        total_rooms=0,
+        total_area_m2=0.0,
+        total_effective_area_m2=0.0,
+        total_perimeter_m=0.0,
+        area_by_type={},
+        processing_time_ms=0,
+        error=str(detail),
+    )
+
+
+# =============================================================================
+# API Endpoints
+# =============================================================================
+
+@router.post("/process", response_model=JobResult)
+async def process_job(request: ProcessJobRequest):
+    """
+    Process an extraction job.
+
+    This endpoint:
+    1. Streams the PDF from the signed URL to disk
+    2. Runs text extraction (NRF values) on the configured pages
+       (`config.pages`: "all", "1-3,5", a list, or a page number),
+       in parallel for larger page ranges
+    3. Applies balcony factor if configured
+    4. Returns structured results with audit trail
+
+    Called by Supabase Edge Function after job creation.
+    """
+    async with create_http_client() as client:
+        return await run_job(request, client)
+
+
+@router.post("/process-batch", response_model=BatchJobResult)
+async def process_job_batch(request: ProcessBatchRequest):
+    """
+    Process several extraction jobs in one request.
+
+    Jobs share one pooled HTTP client for their downloads and run
+    concurrently (up to 4 at a time). A failing job does not fail the
+    batch: its result has status "failed" and the reason in `error`.
+    Results are returned in request order.
+    """
+    start_time = time.time()
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async with create_http_client() as client:
+        async def run_limited(job: ProcessJobRequest) -> JobResult:
+            async with semaphore:
+                return await run_job(job, client)
+
+        outcomes = await asyncio.gather(
+            *(run_limited(job) for job in request.jobs), return_exceptions=True
+        )
+
+    results = [
+        outcome if isinstance(outcome, JobResult) else _failed_job_result(job, outcome)
+        for job, outcome in zip(request.jobs, outcomes)
+    ]
+    failed = sum(1 for r in results if r.status == "failed")
+
+    return BatchJobResult(
+        results=results,
+        completed=len(results) - failed,
+        failed=failed,
+        processing_time_ms=int((time.time() - start_time) * 1000),
+    )
+
+
 @router.get("/health")
 async def health_check():
     """Health check endpoint for Edge Function verification."""
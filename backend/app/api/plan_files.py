@@ -0,0 +1,234 @@
+"""
+Plan file API.
+
+Plans are uploaded once to ``POST /files`` and referenced afterwards by
+their ``file_id`` (the SHA-256 digest of the file). Endpoints that take a
+plan accept either a ``file`` upload or a ``file_id``; uploads go through
+the same store, so sending identical bytes again costs no extra disk space
+and returns the same ``file_id``.
+"""
+
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Optional, Sequence
+import logging
+
+from fastapi import APIRouter, File, HTTPException, UploadFile
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..core.config import get_settings
+from ..services.plan_store import get_plan_store
+from ..services.upload_validation import UploadRejected, plan_upload_validator
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/files", tags=["files"])
+
+
+# Suffixes accepted by endpoints that take PDFs or rendered plans
+PLAN_SUFFIXES = (".pdf", ".png", ".jpg", ".jpeg", ".tif", ".tiff")
+
+# Multipart framing and form fields on top of the file itself
+MULTIPART_OVERHEAD_BYTES = 1024 * 1024
+
+
+# =============================================================================
+# Response Models
+# =============================================================================
+
+class StoredPlanResponse(BaseModel):
+    """A plan in the local plan store."""
+    file_id: str = Field(..., description="SHA-256 digest of the file; pass as file_id to other endpoints")
+    filename: str
+    size_bytes: int
+    created_at: float
+    accessed_at: float
+    uploads: int = Field(..., description="Times these exact bytes were uploaded")
+    refs: int = Field(..., description="Requests currently using the file")
+    deduplicated: bool = Field(False, description="The same bytes were already stored")
+
+
+# =============================================================================
+# Request Body Limit
+# =============================================================================
+
+class UploadSizeLimitMiddleware:
+    """
+    Reject request bodies over ``upload_max_bytes`` while they stream in.
+
+    Multipart uploads are spooled to disk by the framework before a handler
+    runs, so the limit is enforced here: bodies announcing a larger
+    ``Content-Length`` are refused before any byte is read, and chunked
+    bodies are cut off as soon as they pass the limit.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("POST", "PUT"):
+            await self.app(scope, receive, send)
+            return
+
+        max_bytes = get_settings().upload_max_bytes
+        limit = max_bytes + MULTIPART_OVERHEAD_BYTES
+        detail = f"Upload exceeds the limit of {max_bytes // (1024 * 1024)} MB"
+
+        content_length = dict(scope["headers"]).get(b"content-length", b"")
+        if content_length.isdigit() and int(content_length) > limit:
+            response = JSONResponse({"detail": detail}, status_code=413)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise HTTPException(status_code=413, detail=detail)
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+# =============================================================================
+# Plan Input Resolution
+# =============================================================================
+
+@dataclass
+class PlanInput:
+    """A stored plan pinned for the duration of a request."""
+    file_id: str
+    path: Path
+    filename: str
+    deduplicated: bool = False
+
+
+def _check_suffix(filename: str, suffixes: Sequence[str]) -> None:
+    if Path(filename).suffix.lower() not in suffixes:
+        if tuple(suffixes) == (".pdf",):
+            detail = f"File must be a PDF, got: {filename}"
+        else:
+            detail = f"Unsupported file type: {filename}. Use: {', '.join(suffixes)}"
+        raise HTTPException(status_code=400, detail=detail)
+
+
+async def acquire_plan_input(
+    file: Optional[UploadFile],
+    file_id: Optional[str],
+    suffixes: Sequence[str] = (".pdf",),
+) -> PlanInput:
+    """
+    Resolve an uploaded file or a ``file_id`` to a pinned stored plan.
+
+    Uploads are streamed into the plan store (deduplicated by digest) and
+    validated on the way: file signature, size and page limits, and for
+    PDFs an intact trailer and a readable page tree. The caller must call
+    ``release_plan_input`` when done; ``plan_input`` does both for request
+    handlers that finish within the request.
+
+    Raises:
+        HTTPException: 400 if neither (or an unsupported or malformed file)
+            is given, 413 if the upload exceeds the size or page limits,
+            404 if the file_id is unknown or expired
+    """
+    store = get_plan_store()
+
+    if file is not None:
+        if not file.filename:
+            raise HTTPException(status_code=400, detail="No filename provided")
+        _check_suffix(file.filename, suffixes)
+        try:
+            plan, deduplicated = await run_in_threadpool(
+                store.put, file.file, file.filename, plan_upload_validator(file.filename)
+            )
+        except UploadRejected as e:
+            raise HTTPException(status_code=e.status_code, detail=str(e))
+        filename = file.filename
+    elif file_id:
+        plan, deduplicated = store.get(file_id), False
+        if plan is None:
+            raise HTTPException(status_code=404, detail=f"Plan file not found: {file_id}")
+        _check_suffix(plan.filename, suffixes)
+        filename = plan.filename
+    else:
+        raise HTTPException(status_code=400, detail="Provide a file upload or a file_id")
+
+    if store.acquire(plan.file_id) is None:
+        raise HTTPException(status_code=404, detail=f"Plan file not found: {plan.file_id}")
+    return PlanInput(plan.file_id, plan.path, filename, deduplicated)
+
+
+def release_plan_input(plan: PlanInput) -> None:
+    """Unpin a plan returned by ``acquire_plan_input``."""
+    get_plan_store().release(plan.file_id)
+
+
+@asynccontextmanager
+async def plan_input(
+    file: Optional[UploadFile],
+    file_id: Optional[str],
+    suffixes: Sequence[str] = (".pdf",),
+) -> AsyncIterator[PlanInput]:
+    """Context manager form of ``acquire_plan_input``/``release_plan_input``."""
+    plan = await acquire_plan_input(file, file_id, suffixes)
+    try:
+        yield plan
+    finally:
+        release_plan_input(plan)
+
+
+# =============================================================================
+# API Endpoints
+# =============================================================================
+
+def _stored_response(file_id: str, deduplicated: bool = False) -> StoredPlanResponse:
+    plan = get_plan_store().get(file_id)
+    if plan is None:
+        raise HTTPException(status_code=404, detail=f"Plan file not found: {file_id}")
+    return StoredPlanResponse(**plan.to_dict(), deduplicated=deduplicated)
+
+
+@router.post("", response_model=StoredPlanResponse, status_code=201)
+async def upload_plan_file(
+    file: UploadFile = File(..., description="Plan PDF or image"),
+):
+    """
+    Store a plan and return its `file_id`.
+
+    Pass the `file_id` to analysis endpoints instead of uploading the same
+    plan again. Uploading identical bytes twice returns the same `file_id`
+    (`deduplicated=true`). Plans unused for the configured TTL are removed.
+    """
+    async with plan_input(file, None, PLAN_SUFFIXES) as plan:
+        return _stored_response(plan.file_id, plan.deduplicated)
+
+
+@router.get("/stats")
+async def plan_store_stats():
+    """Plan store size and deduplication counters."""
+    return get_plan_store().stats.to_dict()
+
+
+@router.get("/{file_id}", response_model=StoredPlanResponse)
+async def get_plan_file(file_id: str):
+    """Metadata of a stored plan."""
+    return _stored_response(file_id)
+
+
+@router.delete("/{file_id}", status_code=204)
+async def delete_plan_file(file_id: str):
+    """Remove a stored plan (409 while a request is using it)."""
+    try:
+        deleted = get_plan_store().delete(file_id)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    if not deleted:
+        raise HTTPException(status_code=404, detail=f"Plan file not found: {file_id}")
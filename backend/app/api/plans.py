@@ -5,13 +5,13 @@ Endpoints for blueprint analysis, object detection, and measurement.
 Part of the Aufmaß Engine - Phase B scale detection implemented.
 """
 
-import tempfile
 import time
 import uuid
 from pathlib import Path
 
 from fastapi import APIRouter, UploadFile, File, HTTPException, Query
 from pydantic import BaseModel, Field
+from starlette.concurrency import run_in_threadpool
 from typing import List, Optional, Dict, Any
 from enum import Enum
 
@@ -53,6 +53,9 @@ from ..services.cv_pipeline import (
     store_detections,
     ObjectType,
 )
+from ..services.admission import RequestCost, admitted, render_cost
+from ..services.plan_analysis import DETECTION_TYPES, analyze_plan_set
+from ..services.plan_store import get_plan_store
 from ..services.vector_measurement import (
     extract_wall_segments_from_page,
     compute_wall_length_in_sector_m,
@@ -60,6 +63,7 @@ from ..services.vector_measurement import (
     FITZ_AVAILABLE,
 )
 from ..core.config import get_settings
+from .plan_files import acquire_plan_input, plan_input, release_plan_input
 
 router = APIRouter(prefix="/plans", tags=["Plan Analysis"])
 
@@ -77,6 +81,7 @@ class AnalysisType(str, Enum):
     WINDOWS_ONLY = "windows"
     ROOMS_ONLY = "rooms"
     FIXTURES_ONLY = "fixtures"
+    WALLS_ONLY = "walls"
 
 
 # ============================================
@@ -255,7 +260,7 @@ class SectorWallMeasurementRequest(BaseModel):
     )
     pdf_path: Optional[str] = Field(
         default=None,
-        description="Path to the PDF file. If not provided, uses file_id to look up storage path.",
+        description="Path to the PDF file. If not provided, file_id is looked up in the plan store.",
     )
     persist: bool = Field(
         default=True,
@@ -359,6 +364,14 @@ class AnalyzeResponse(BaseModel):
     objects_by_type: Dict[str, int]
     objects: List[DetectedObjectResponse]
     scale_detected: Optional[ScaleInfoResponse] = None
+    pages: List[Dict[str, Any]] = Field(
+        default_factory=list,
+        description="Per-page results: scale, rooms, object counts, walls",
+    )
+    trades: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Totals per trade: flooring, doors, windows, fixtures, walls",
+    )
     processing_time_ms: int
     warnings: List[str] = Field(default_factory=list)
 
@@ -525,9 +538,30 @@ class SectorWallMeasurementResponse(BaseModel):
 # ============================================
 
 
+def _analysis_cost(pages: Optional[List[int]], analysis_types: List[str]) -> RequestCost:
+    """
+    Admission cost of a plan set analysis.
+
+    The task graph never holds more than its memory budget of page images,
+    so that budget caps the estimate (and is the estimate when all pages
+    are analyzed).
+    """
+    settings = get_settings()
+    budget = settings.analysis_memory_budget_bytes
+    inference = any(t in DETECTION_TYPES for t in analysis_types)
+    if not pages:
+        return RequestCost(memory_bytes=budget, inference_slots=int(inference))
+    cost = render_cost(pages=len(pages), dpi=DEFAULT_RENDER_DPI, inference=inference)
+    return RequestCost(min(cost.memory_bytes, budget), cost.cpu_slots, cost.inference_slots)
+
+
 @router.post("/analyze", response_model=AnalyzeResponse)
 async def analyze_plan(
-    file: UploadFile = File(..., description="PDF blueprint to analyze"),
+    file: Optional[UploadFile] = File(None, description="PDF blueprint to analyze"),
+    file_id: Optional[str] = Query(
+        default=None,
+        description="Stored plan id from POST /files (instead of uploading file)",
+    ),
     analysis_types: str = Query(
         default="full",
         description="Comma-separated analysis types: full,doors,windows,rooms,fixtures",
@@ -544,29 +578,95 @@ async def analyze_plan(
     ),
 ):
     """
-    Upload a blueprint and detect objects.
+    Analyze a full plan set in one pass.
+
+    Each page is parsed and rendered once; its results feed all trades:
+    - Scale detection (from "M 1:100" style annotations)
+    - Rooms with NRF areas (text extraction)
+    - Doors, windows and fixtures (YOLO, when configured)
+    - Walls (wall mask footprint, m² when a scale was found)
 
-    Analyzes the uploaded PDF to detect:
-    - Doors (with fire ratings and swing direction)
-    - Windows
-    - Rooms (with polygon boundaries)
-    - Fixtures (sinks, toilets, appliances)
+    Per-page tasks run as a dependency graph on a shared worker pool
+    with bounded memory, so long plan sets don't hold every rendered
+    page at once.
 
-    Returns detected objects with bounding boxes and confidence scores.
-    Optionally attempts automatic scale detection.
+    **Returns:**
+    - Per-page results and totals per trade (`trades`)
+    - Detected objects with bounding boxes and confidence scores
+    - Best detected scale
+
+    Pass `file_id` from `POST /files` instead of uploading the plan again;
+    the stored plan's `file_id` is used as `document_id`.
 
-    **Phase B/C Implementation Pending**
+    Under load, requests wait for capacity and are rejected with 429 and
+    `Retry-After`.
     """
-    # TODO: Phase B - Ingest PDF with plan_ingestion
-    # TODO: Phase B - Detect scale with scale_calibration
-    # TODO: Phase C - Run object detection with cv_pipeline
-    raise HTTPException(
-        status_code=501,
-        detail={
-            "error": "Not Implemented",
-            "message": "Phase B/C implementation pending - CV pipeline not yet available",
-            "phase": "B/C",
-        },
+    types = [t.strip().lower() for t in analysis_types.split(",") if t.strip()]
+    valid = {t.value for t in AnalysisType}
+    unknown = [t for t in types if t not in valid]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid analysis types: {unknown}. Use: {', '.join(sorted(valid))}",
+        )
+    if not types or AnalysisType.FULL.value in types:
+        types = [t.value for t in AnalysisType if t != AnalysisType.FULL]
+
+    page_list = None
+    if pages:
+        try:
+            page_list = list(dict.fromkeys(int(p.strip()) for p in pages.split(",")))
+        except ValueError:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid pages parameter: {pages}. Use comma-separated integers.",
+            )
+
+    async with plan_input(file, file_id) as plan:
+        async with admitted(_analysis_cost(page_list, types)):
+            try:
+                result = await run_in_threadpool(
+                    analyze_plan_set,
+                    plan.path,
+                    pages=page_list,
+                    analysis_types=types,
+                    confidence_threshold=confidence_threshold,
+                    document_id=plan.file_id,
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+    objects = [
+        DetectedObjectResponse(**obj.to_dict())
+        for obj in result.objects
+    ]
+    objects_by_type: Dict[str, int] = {}
+    for obj in objects:
+        objects_by_type[obj.object_type] = objects_by_type.get(obj.object_type, 0) + 1
+
+    scale = result.scale
+    result_dict = result.to_dict()
+
+    return AnalyzeResponse(
+        analysis_id=f"ana_{uuid.uuid4().hex[:12]}",
+        document_id=result.document_id,
+        filename=plan.filename,
+        status=result.status,
+        total_pages=result.total_pages,
+        total_objects=len(objects),
+        objects_by_type=objects_by_type,
+        objects=objects,
+        scale_detected=ScaleInfoResponse(
+            scale_string=scale.scale_string,
+            pixels_per_meter=scale.pixels_per_meter,
+            detection_method=scale.detection_method,
+            confidence=scale.confidence,
+            source_page=scale.source_page,
+        ) if scale else None,
+        pages=result_dict["pages"],
+        trades=result_dict["trades"],
+        processing_time_ms=result.processing_time_ms,
+        warnings=result.warnings,
     )
 
 
@@ -705,10 +805,13 @@ async def get_scale(file_id: str):
 
 @router.post("/scale/detect", response_model=ScaleContextResponse)
 async def detect_scale(
-    file: UploadFile = File(..., description="PDF blueprint to detect scale from"),
+    file: Optional[UploadFile] = File(None, description="PDF blueprint to detect scale from"),
     file_id: Optional[str] = Query(
         default=None,
-        description="Optional file ID to associate with scale context",
+        description=(
+            "Without an upload: stored plan id from POST /files. With an upload: "
+            "file ID to associate with the scale context (default: the stored plan id)"
+        ),
     ),
     search_pages: Optional[str] = Query(
         default=None,
@@ -727,6 +830,9 @@ async def detect_scale(
 
     Returns the detected scale context with confidence score.
     If no scale is detected, returns has_scale=false.
+
+    Uploads are kept in the plan store; detect again (or measure walls with
+    `/measure/sector-walls`) by `file_id` without re-uploading.
     """
     start_time = time.time()
 
@@ -741,25 +847,15 @@ async def detect_scale(
                 detail="Invalid page numbers. Use comma-separated integers.",
             )
 
-    # Generate file_id if not provided
-    if not file_id:
-        file_id = str(uuid.uuid4())
+    plan = await acquire_plan_input(file, None if file is not None else file_id)
 
-    # Save uploaded file to temp location
-    try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-            content = await file.read()
-            tmp.write(content)
-            tmp_path = tmp.name
-    except Exception as e:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Failed to save uploaded file: {str(e)}",
-        )
+    # Scale contexts are stored under the plan store id unless told otherwise
+    if file is None or not file_id:
+        file_id = plan.file_id
 
     try:
         # Load the document
-        document = load_plan_document(tmp_path, file_id=file_id)
+        document = load_plan_document(plan.path, file_id=file_id)
 
         # Detect scale
         scale_context = detect_scale_from_document(
@@ -785,8 +881,7 @@ async def detect_scale(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     finally:
-        # Clean up temp file
-        Path(tmp_path).unlink(missing_ok=True)
+        release_plan_input(plan)
 
 
 @router.post("/scale/calibrate", response_model=ScaleContextResponse)
@@ -1130,7 +1225,8 @@ async def measure_sector_walls(request: SectorWallMeasurementRequest):
     **Requirements:**
     - The file must have an active scale context (detected or calibrated)
     - A sector must be defined for the file/page
-    - PDF file must be accessible (via pdf_path or file storage)
+    - PDF file must be accessible (via pdf_path, or stored with `POST /files`
+      so that file_id is its plan store id)
 
     **Returns:**
     - has_scale: Whether a valid scale was found
@@ -1192,22 +1288,25 @@ async def measure_sector_walls(request: SectorWallMeasurementRequest):
             "No wall segments will match."
         )
 
-    # 3. Determine PDF path
+    # 3. Determine PDF path (explicit path, or the plan store entry for file_id)
     pdf_path = request.pdf_path
+    plan_store = get_plan_store(settings)
+    stored_plan = None
 
     if pdf_path is None:
-        # TODO: Look up storage path from Supabase using file_id
-        # For now, require pdf_path to be provided
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error": "Missing pdf_path",
-                "message": "pdf_path is required. Storage lookup by file_id not yet implemented.",
-            },
-        )
+        stored_plan = plan_store.acquire(request.file_id)
+        if stored_plan is None:
+            raise HTTPException(
+                status_code=404,
+                detail={
+                    "error": "File not stored",
+                    "message": "No stored plan for file_id. Upload it to POST /files or provide pdf_path.",
+                },
+            )
+        pdf_path = str(stored_plan.path)
 
     # Verify PDF exists
-    if not Path(pdf_path).exists():
+    elif not Path(pdf_path).exists():
         raise HTTPException(
             status_code=404,
             detail=f"PDF file not found: {pdf_path}",
@@ -1227,6 +1326,9 @@ async def measure_sector_walls(request: SectorWallMeasurementRequest):
             status_code=500,
             detail=f"Failed to extract wall segments: {str(e)}",
         )
+    finally:
+        if stored_plan is not None:
+            plan_store.release(stored_plan.file_id)
 
     if len(wall_segments) == 0:
         warnings.append("No vector line segments found in PDF page. The PDF may be raster-only.")
@@ -0,0 +1,58 @@
+"""
+Fast JSON responses.
+
+Room and door results of a large plan set run into thousands of entries.
+Instead of ``jsonable_encoder`` (a Python-level walk over every value)
+followed by ``json.dumps``, results are converted with pydantic-core's
+``to_jsonable_python`` and encoded with orjson when it is installed (the
+standard library encoder is the fallback).
+
+``FastJSONResponse`` is the application's default response class for
+endpoints that return dicts or cached results. Endpoints with a response
+model are still serialized by Pydantic directly to JSON bytes.
+"""
+
+from typing import Any
+import json
+import logging
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_jsonable_python
+
+from ..core.lazy_imports import is_available, lazy_import
+
+logger = logging.getLogger(__name__)
+
+orjson = lazy_import("orjson")
+ORJSON_AVAILABLE = is_available("orjson")
+if not ORJSON_AVAILABLE:
+    logger.warning("orjson not installed - using the standard JSON encoder")
+
+
+def to_jsonable(content: Any) -> Any:
+    """
+    Convert a result (response model, dataclass, dict, ...) to JSON-compatible data.
+
+    Equivalent to ``jsonable_encoder`` for the response models of this API,
+    but runs in pydantic-core.
+    """
+    return to_jsonable_python(content)
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Encode JSON-compatible data as compact UTF-8 JSON.
+
+    With orjson, NaN and infinity are encoded as null and NumPy scalars and
+    arrays are accepted.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response encoded with orjson (standard encoder if not installed)."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,188 @@
+"""
+Cached analysis responses and cache administration.
+
+Idempotent analysis endpoints return their result through
+``cached_response``: results are cached by plan digest, endpoint and
+parameters, carry an ``ETag``, and requests with a matching
+``If-None-Match`` get ``304 Not Modified`` without recomputing. The
+``X-Cache`` header reports where the body came from (memory, disk,
+coalesced or computed).
+"""
+
+from contextlib import nullcontext
+from typing import Any, AsyncContextManager, Callable, Dict, List, Optional, Tuple
+import asyncio
+import logging
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response
+from starlette.concurrency import run_in_threadpool
+
+from ..core.config import get_settings
+from ..services.admission import RequestCost, admitted
+from ..services.plan_store import get_plan_store
+from ..services.result_cache import ResultCache, code_version, get_result_cache, model_versions
+from ..services.roboflow_service import get_response_cache
+from ..services.unified_extraction import get_extraction_cache
+from .plan_files import PlanInput
+from .responses import FastJSONResponse, to_jsonable
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/admin/cache", tags=["admin"])
+
+
+# =============================================================================
+# Cached Responses
+# =============================================================================
+
+async def _not_modified(cache: ResultCache, key: str, etag: str, if_none_match: Optional[str]) -> bool:
+    """
+    Check an If-None-Match header (list of tags, weak tags or "*").
+
+    "*" only matches when the result is cached: on a miss the client
+    cannot hold a current representation.
+    """
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    if any(tag.removeprefix("W/") == etag for tag in tags):
+        return True
+    return "*" in tags and await asyncio.to_thread(cache.contains, key)
+
+
+def _result_key(endpoint: str, plan: PlanInput, params: Dict[str, Any]) -> str:
+    settings = get_settings()
+    return ResultCache.make_key(
+        endpoint,
+        plan.file_id,
+        {**params, "filename": plan.filename, "models": model_versions(settings)},
+        version=f"{settings.app_version}:{code_version()}",
+    )
+
+
+def _admission(cost: Optional[RequestCost]) -> Callable[[], AsyncContextManager[Any]]:
+    return lambda: admitted(cost) if cost is not None else nullcontext()
+
+
+async def cached_result(
+    endpoint: str,
+    plan: PlanInput,
+    params: Dict[str, Any],
+    compute: Callable[[], Any],
+    cost: Optional[RequestCost] = None,
+) -> Tuple[Any, str]:
+    """
+    Get an endpoint result from the result cache, computing it on a miss.
+
+    Uses the same keys as ``cached_response``, so results computed for one
+    caller (e.g. a batch) are served to the single-file endpoint and back.
+
+    Returns:
+        Tuple of (JSON-compatible result, source); source is "computed"
+        when the cache is disabled
+    """
+    admit = _admission(cost)
+    cache = get_result_cache()
+    if cache is None:
+        async with admit():
+            return to_jsonable(await run_in_threadpool(compute)), "computed"
+
+    return await cache.get_or_compute(
+        _result_key(endpoint, plan, params), lambda: to_jsonable(compute()), admit=admit
+    )
+
+
+async def cached_response(
+    request: Request,
+    endpoint: str,
+    plan: PlanInput,
+    params: Dict[str, Any],
+    compute: Callable[[], Any],
+    cost: Optional[RequestCost] = None,
+) -> Response:
+    """
+    Serve an endpoint result from the result cache, computing it on a miss.
+
+    Args:
+        request: Incoming request (for ``If-None-Match``)
+        endpoint: Stable endpoint name used in the cache key
+        plan: The (pinned) input plan; its digest is part of the key
+        params: Every request parameter that affects the result
+        compute: Builds the response model (runs in a worker thread)
+        cost: Estimated cost of ``compute``; only computations wait for
+            admission, cached and 304 responses never do
+
+    Returns:
+        JSON response with ``ETag`` and ``X-Cache`` headers, or 304
+    """
+    cache = get_result_cache()
+    if cache is None:
+        content, _ = await cached_result(endpoint, plan, params, compute, cost)
+        return FastJSONResponse(content)
+
+    key = _result_key(endpoint, plan, params)
+    etag = f'"{key}"'
+
+    if await _not_modified(cache, key, etag, request.headers.get("if-none-match")):
+        cache.record_not_modified()
+        return Response(status_code=304, headers={"ETag": etag, "X-Cache": "not-modified"})
+
+    content, source = await cache.get_or_compute(
+        key, lambda: to_jsonable(compute()), admit=_admission(cost)
+    )
+    return FastJSONResponse(content, headers={"ETag": etag, "X-Cache": source})
+
+
+# =============================================================================
+# Admin Endpoints
+# =============================================================================
+
+CACHE_NAMES = ("results", "extraction", "roboflow")
+
+
+@router.get("")
+async def cache_stats():
+    """
+    Report all caches.
+
+    - `results`: request result cache (memory/disk hits, coalesced and
+      304 responses)
+    - `extraction`: per-page room extraction cache
+    - `roboflow`: Roboflow response cache
+    - `plan_store`: stored plan uploads
+    """
+    results = get_result_cache()
+    extraction = get_extraction_cache()
+    roboflow = get_response_cache()
+    return {
+        "results": results.stats if results is not None else None,
+        "extraction": extraction.stats.to_dict() if extraction is not None else None,
+        "roboflow": roboflow.stats.to_dict() if roboflow is not None else None,
+        "plan_store": get_plan_store().stats.to_dict(),
+        "code_version": code_version(),
+    }
+
+
+@router.delete("")
+async def clear_caches(
+    caches: List[str] = Query(["results"], description="Caches to clear: results, extraction, roboflow"),
+):
+    """Clear caches (default: the result cache) and reset its counters."""
+    unknown = [name for name in caches if name not in CACHE_NAMES]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown caches: {unknown}. Use: {', '.join(CACHE_NAMES)}",
+        )
+
+    getters = {
+        "results": get_result_cache,
+        "extraction": get_extraction_cache,
+        "roboflow": get_response_cache,
+    }
+    cleared: Dict[str, Optional[int]] = {}
+    for name in caches:
+        cache = getters[name]()
+        cleared[name] = cache.clear() if cache is not None else None
+    return {"cleared": cleared}
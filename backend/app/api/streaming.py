@@ -0,0 +1,169 @@
+"""
+Streaming response helpers.
+
+Encodes event dictionaries as NDJSON (one JSON object per line) or as
+Server-Sent Events, so long-running extractions can report progress page
+by page instead of returning once at the end.
+"""
+
+import logging
+from enum import Enum
+from pathlib import Path
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
+
+from fastapi import HTTPException, UploadFile
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from .plan_files import PlanInput, acquire_plan_input, release_plan_input
+from .responses import dumps
+
+logger = logging.getLogger(__name__)
+
+
+class StreamFormat(str, Enum):
+    """Wire format of a streaming endpoint."""
+    NDJSON = "ndjson"
+    SSE = "sse"
+
+
+MEDIA_TYPES = {
+    StreamFormat.NDJSON: "application/x-ndjson",
+    StreamFormat.SSE: "text/event-stream",
+}
+
+T = TypeVar("T")
+
+
+def parse_page_list(pages: Optional[str]) -> Optional[List[int]]:
+    """
+    Parse a comma-separated ``pages`` query parameter (0-indexed pages).
+
+    Raises:
+        HTTPException: 400 if a page is not an integer
+    """
+    if not pages:
+        return None
+    try:
+        return [int(p.strip()) for p in pages.split(",")]
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid pages parameter: {pages}. Use comma-separated integers.",
+        )
+
+
+async def open_plan_stream(
+    file: Optional[UploadFile],
+    file_id: Optional[str],
+    open_stream: Callable[[Path], T],
+) -> Tuple[PlanInput, T, Callable[[], None]]:
+    """
+    Pin the request's plan and open a page stream on it.
+
+    ``open_stream`` (opening the PDF, style detection, ...) runs in the
+    threadpool. The plan must stay pinned after the handler returns, so the
+    returned ``release`` callback is meant for ``stream_events(on_close=...)``;
+    it is called here if opening fails.
+
+    Returns:
+        Tuple of (plan, stream, release)
+
+    Raises:
+        HTTPException: 400 if the stream can't be opened (``ValueError``),
+            and the upload errors of ``acquire_plan_input``
+    """
+    plan = await acquire_plan_input(file, file_id)
+
+    def release() -> None:
+        release_plan_input(plan)
+
+    try:
+        stream = await run_in_threadpool(open_stream, plan.path)
+    except ValueError as e:
+        release()
+        raise HTTPException(status_code=400, detail=str(e))
+    except BaseException:
+        release()
+        raise
+    return plan, stream, release
+
+
+def encode_event(event: str, data: Dict[str, Any], fmt: StreamFormat) -> str:
+    """
+    Encode one event.
+
+    NDJSON lines carry the event name in an ``event`` field; SSE uses the
+    ``event:`` field and puts the payload on a single ``data:`` line.
+    """
+    if fmt == StreamFormat.SSE:
+        return f"event: {event}\ndata: {dumps(data).decode()}\n\n"
+    return dumps({"event": event, **data}).decode() + "\n"
+
+
+def stream_events(
+    events: Union[Iterable[tuple], AsyncIterable[tuple]],
+    fmt: StreamFormat,
+    on_close: Optional[Callable[[], None]] = None,
+) -> StreamingResponse:
+    """
+    Wrap a (sync or async) iterable of (event, data) pairs in a StreamingResponse.
+
+    A failure while producing events is reported as a final ``error`` event
+    (the status code has already been sent). ``on_close`` runs when the
+    stream ends, including on client disconnect - use it to remove temp
+    files the generator still needs while streaming.
+
+    Sync iterables are consumed in Starlette's threadpool, so blocking
+    extraction work does not stall the event loop. Async iterables (events
+    produced by concurrent tasks) are consumed on the event loop.
+    """
+    if hasattr(events, "__aiter__"):
+        return _stream_async_events(events, fmt, on_close)
+
+    def body() -> Iterator[str]:
+        try:
+            for event, data in events:
+                yield encode_event(event, data, fmt)
+        except Exception as e:
+            logger.exception("Streaming response failed")
+            yield encode_event("error", {"detail": str(e)}, fmt)
+        finally:
+            close = getattr(events, "close", None)
+            if close is not None:
+                close()
+            if on_close is not None:
+                on_close()
+
+    return StreamingResponse(body(), media_type=MEDIA_TYPES[fmt], headers=_stream_headers(fmt))
+
+
+def _stream_async_events(
+    events: AsyncIterable[tuple],
+    fmt: StreamFormat,
+    on_close: Optional[Callable[[], None]] = None,
+) -> StreamingResponse:
+    """Async counterpart of ``stream_events``."""
+
+    async def body() -> AsyncIterator[str]:
+        try:
+            async for event, data in events:
+                yield encode_event(event, data, fmt)
+        except Exception as e:
+            logger.exception("Streaming response failed")
+            yield encode_event("error", {"detail": str(e)}, fmt)
+        finally:
+            aclose = getattr(events, "aclose", None)
+            if aclose is not None:
+                await aclose()
+            if on_close is not None:
+                on_close()
+
+    return StreamingResponse(body(), media_type=MEDIA_TYPES[fmt], headers=_stream_headers(fmt))
+
+
+def _stream_headers(fmt: StreamFormat) -> Dict[str, str]:
+    headers = {"Cache-Control": "no-cache"}
+    if fmt == StreamFormat.SSE:
+        headers["X-Accel-Buffering"] = "no"  # Disable proxy buffering (nginx)
+    return headers
@@ -4,12 +4,19 @@ SnapGrid configuration settings.
 Manages application settings via environment variables with sensible defaults.
 """
 
+import logging
 import os
 from pathlib import Path
 from typing import Optional
 
+from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+logger = logging.getLogger(__name__)
+
+# Schedule table backends (see schedule_extraction)
+PDF_EXTRACTION_METHODS = ("pdfplumber", "pymupdf", "auto")
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -36,12 +43,35 @@ class Settings(BaseSettings):
     sample_door_schedule: Path = project_root / "Tuerenliste_Bauteil_B_OG1.pdf"
 
     # PDF Extraction settings
-    pdf_extraction_method: str = "pdfplumber"  # "pdfplumber" or "camelot"
+    # Schedule table backend: "pdfplumber", "pymupdf" (find_tables, much faster),
+    # or "auto" (PyMuPDF first, pdfplumber for low-confidence pages)
+    pdf_extraction_method: str = "auto"
+
+    @field_validator("pdf_extraction_method", mode="before")
+    @classmethod
+    def _check_pdf_extraction_method(cls, value: str) -> str:
+        """Reject unknown backends at startup instead of on every extraction."""
+        method = str(value).strip().lower()
+        if method == "camelot":
+            # Documented before any backend read this setting; never used
+            logger.warning("SNAPGRID_PDF_EXTRACTION_METHOD=camelot is not supported, using pdfplumber")
+            return "pdfplumber"
+        if method not in PDF_EXTRACTION_METHODS:
+            raise ValueError(
+                f"Unknown PDF extraction method: {value}. Use one of: {', '.join(PDF_EXTRACTION_METHODS)}"
+            )
+        return method
 
     # CV Pipeline / YOLO Configuration
     yolo_model_path: Optional[str] = None  # Path to YOLO model weights (.pt file)
     yolo_confidence_threshold: float = 0.15  # Lower threshold for architectural blueprints
     cv_pipeline_enabled: bool = True  # Set False to disable CV features entirely
+    yolo_model_version: Optional[str] = None  # Version label (default: weight file stem)
+
+    # YOLO model registry (several model versions resident at once)
+    yolo_registry_max_models: int = 4
+    yolo_registry_max_memory_bytes: int = 2 * 1024 * 1024 * 1024  # 2 GB
+    yolo_hot_reload: bool = True  # Reload when the weight file changes on disk
 
     @property
     def yolo_enabled(self) -> bool:
@@ -66,6 +96,69 @@ class Settings(BaseSettings):
     roboflow_wall_floor_model: str = "wall-floor-2zskh/1"  # Wall-floor segmentation
     roboflow_confidence_threshold: float = 0.3
 
+    # Roboflow response cache (avoids re-sending identical images to the paid API)
+    roboflow_cache_enabled: bool = True
+    roboflow_cache_dir: Path = data_dir / "cache" / "roboflow"
+    roboflow_cache_ttl_seconds: int = 7 * 24 * 3600  # 1 week
+    roboflow_cache_max_bytes: int = 256 * 1024 * 1024  # 256 MB
+
+    # Per-page extraction cache (plan revisions re-extract only changed sheets)
+    extraction_cache_enabled: bool = True
+    extraction_cache_dir: Path = data_dir / "cache" / "extraction"
+    extraction_cache_ttl_seconds: int = 30 * 24 * 3600  # 30 days
+    extraction_cache_max_bytes: int = 128 * 1024 * 1024  # 128 MB
+
+    # Request result cache (idempotent analysis endpoints, ETag revalidation)
+    result_cache_enabled: bool = True
+    result_cache_dir: Path = data_dir / "cache" / "results"
+    result_cache_ttl_seconds: int = 7 * 24 * 3600  # 1 week
+    result_cache_max_bytes: int = 256 * 1024 * 1024  # 256 MB
+    result_cache_memory_entries: int = 128
+
+    # Upload limits (checked while the body streams in, before it is stored)
+    upload_max_bytes: int = 256 * 1024 * 1024  # 256 MB
+    upload_max_pages: int = 500
+
+    # Content-addressed plan store (uploads are kept once per digest as file_id)
+    plan_store_dir: Path = data_dir / "plans"
+    plan_store_ttl_seconds: int = 7 * 24 * 3600  # Unused plans kept for 1 week
+    plan_store_max_bytes: int = 5 * 1024 * 1024 * 1024  # 5 GB
+
+    # Shared process pool for page extraction (rooms, schedules, /jobs)
+    page_workers: int = 0  # Pool processes; 0 = number of CPUs, capped at 8
+    parallel_min_pages: int = 4  # Smaller page selections are extracted in-process
+
+    # Background job queue (long takeoffs run in worker processes)
+    job_workers: int = 2  # 0 disables the worker pool in this process
+    job_queue_db: Path = data_dir / "jobs" / "queue.sqlite3"
+    job_work_dir: Path = data_dir / "jobs" / "work"
+    job_lease_seconds: int = 60  # Jobs without heartbeat this long are re-queued
+    job_max_attempts: int = 3
+    job_retention_seconds: int = 7 * 24 * 3600  # Finished jobs kept for 1 week
+
+    # Project batches (/batch/analyze)
+    batch_max_files: int = 100
+    batch_max_concurrency: int = 4  # Files analyzed at the same time
+
+    # Plan set analysis (/plans/analyze task graph)
+    analysis_workers: int = 4  # Threads shared by all analyses
+    analysis_memory_budget_bytes: int = 1024 * 1024 * 1024  # 1 GB of in-flight page images
+
+    # Worker warm-up (heavy imports and YOLO weights loaded before serving)
+    warmup_enabled: bool = False  # Warm each worker at startup; gunicorn.conf.py warms the master instead
+
+    # Admission control for rendering / inference endpoints (429 + Retry-After when full)
+    admission_enabled: bool = True
+    admission_memory_budget_bytes: int = 2 * 1024 * 1024 * 1024  # 2 GB of estimated page images
+    admission_cpu_slots: int = 0  # Concurrent heavy requests; 0 = number of CPUs
+    admission_inference_slots: int = 1  # Concurrent local model (YOLO) runs
+    admission_max_queue: int = 16  # Requests waiting beyond this are rejected at once
+    admission_max_wait_seconds: float = 10.0  # Bounded wait before rejecting
+
+    # Upload payload optimization (hosted models resize inputs to their native size)
+    roboflow_payload_optimization: bool = True
+    roboflow_model_input_size: int = 640  # Longest side in pixels
+
     @property
     def roboflow_enabled(self) -> bool:
         """Check if Roboflow is properly configured for CV processing."""
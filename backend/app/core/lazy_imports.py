@@ -0,0 +1,100 @@
+"""
+Lazy imports of heavy dependencies.
+
+PyMuPDF, OpenCV, NumPy, pdfplumber, openpyxl and the optional ML / cloud
+SDKs together take most of the application's import time, yet a worker
+that only serves schedules or job status never touches most of them.
+Services bind these modules with ``lazy_import`` and check availability
+with ``is_available``, so they are imported on first use instead of at
+startup:
+
+    fitz = lazy_import("fitz")
+    FITZ_AVAILABLE = is_available("fitz")
+
+``is_available`` only locates the module (``importlib.util.find_spec``);
+it does not execute it.
+"""
+
+from types import ModuleType
+from typing import Any, Dict, List
+import functools
+import importlib
+import importlib.util
+import sys
+
+
+@functools.lru_cache(maxsize=None)
+def is_available(name: str) -> bool:
+    """Check whether a module can be found, without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        # Parent package missing, or a module without __spec__ in sys.modules
+        return False
+
+
+class LazyModule(ModuleType):
+    """
+    Module proxy that imports the real module on first attribute access.
+
+    After loading, the module's namespace is copied into the proxy, so
+    later attribute lookups are as fast as on the module itself.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_loaded"] = False
+
+    def _load(self) -> ModuleType:
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        self.__dict__["_lazy_loaded"] = True
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        if self.__dict__["_lazy_loaded"]:
+            raise AttributeError(f"module {self.__name__!r} has no attribute {attr!r}")
+        return getattr(self._load(), attr)
+
+    def __dir__(self) -> List[str]:
+        if not self.__dict__["_lazy_loaded"]:
+            self._load()
+        return list(self.__dict__)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_loaded"] else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Return a module that is imported on first attribute access.
+
+    Importing a missing module raises ``ImportError`` at that first access;
+    guard uses with ``is_available``.
+    """
+    return LazyModule(name)
+
+
+def ensure_loaded(module: ModuleType) -> ModuleType:
+    """Import a lazy module now (no-op for regular and loaded modules)."""
+    if isinstance(module, LazyModule) and not module.__dict__["_lazy_loaded"]:
+        module._load()
+    return module
+
+
+def lazy_modules(package: str) -> Dict[str, LazyModule]:
+    """
+    Lazy module proxies bound by the imported modules of a package.
+
+    Returns:
+        Proxies keyed by the name of the module they stand for
+    """
+    found: Dict[str, LazyModule] = {}
+    for name, module in list(sys.modules.items()):
+        if module is None or not (name == package or name.startswith(package + ".")):
+            continue
+        for value in list(vars(module).values()):
+            if isinstance(value, LazyModule):
+                found.setdefault(value.__name__, value)
+    return found
@@ -4,8 +4,12 @@ SnapGrid Backend API
 FastAPI application for deterministic construction document extraction.
 """
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
+from fastapi.datastructures import Default
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from .api.schedules import router as schedules_router
 from .api.plans import router as plans_router
@@ -13,7 +17,32 @@ from .api.gewerke import router as gewerke_router
 from .api.cv import router as cv_router
 from .api.jobs import router as jobs_router
 from .api.extraction import router as extraction_router
+from .api.job_queue import create_worker_pool, router as job_queue_router
+from .api.plan_files import UploadSizeLimitMiddleware, router as plan_files_router
+from .api.result_cache import router as result_cache_router
+from .api.batch import router as batch_router
+from .api.responses import FastJSONResponse
 from .core.config import settings
+from .services.admission import AdmissionRejected, get_admission_controller
+from .services.page_pool import shutdown_page_pool
+from .services.warmup import get_warmup_state, start_warmup
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up (if enabled), run the background job workers and stop the page pool on shutdown."""
+    if settings.warmup_enabled:
+        start_warmup()
+    pool = create_worker_pool()
+    if pool is not None:
+        pool.start()
+    try:
+        yield
+    finally:
+        if pool is not None:
+            pool.stop()
+        shutdown_page_pool()
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -34,6 +63,7 @@ All extracted values come from actual PDF content with full auditability:
 
 - **Schedule Extraction**: Extract door lists (Türenliste), room lists, and other tabular schedules from PDF documents.
 - **Plan Analysis**: API endpoints for blueprint analysis, object detection, and measurement.
+- **Project Batches**: Analyze a whole plan set (PDF list or zip) with totals per floor.
 - **Gewerke (Trade Modules)**: Trade-specific quantity takeoff:
   - Doors: Parse door schedules, classify by category (T30, T90, DSS, Standard)
   - Drywall: Calculate wall length and area for sectors
@@ -52,6 +82,10 @@ All extracted values come from actual PDF content with full auditability:
     version=settings.app_version,
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
+    # Wrapped in Default() so endpoints with a response model keep FastAPI's
+    # direct Pydantic-to-JSON path; FastJSONResponse serves all others
+    default_response_class=Default(FastJSONResponse),
 )
 
 # Configure CORS for frontend and Supabase Edge Functions
@@ -75,13 +109,31 @@ app.add_middleware(
 )
 
 
+@app.exception_handler(AdmissionRejected)
+async def admission_rejected_handler(request: Request, exc: AdmissionRejected):
+    """Answer requests beyond the admission budgets with 429 and Retry-After."""
+    return JSONResponse(
+        status_code=429,
+        content={"detail": str(exc), "retry_after": exc.retry_after},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+# Refuse oversized uploads before they are transferred
+app.add_middleware(UploadSizeLimitMiddleware)
+
+
 # Include API routers
 app.include_router(schedules_router, prefix="/api/v1")
 app.include_router(plans_router, prefix="/api/v1")
+app.include_router(plan_files_router, prefix="/api/v1")
 app.include_router(gewerke_router, prefix="/api/v1")
 app.include_router(cv_router, prefix="/api/v1")
 app.include_router(jobs_router, prefix="/api/v1")
+app.include_router(job_queue_router, prefix="/api/v1")
 app.include_router(extraction_router, prefix="/api/v1")
+app.include_router(result_cache_router, prefix="/api/v1")
+app.include_router(batch_router, prefix="/api/v1")
 
 
 @app.get("/")
@@ -93,14 +145,31 @@ async def root():
         "description": "Deterministic construction document extraction API",
         "docs": "/docs",
         "health": "/health",
+        "ready": "/ready",
     }
 
 
 @app.get("/health")
 async def health():
-    """Global health check endpoint."""
-    return {
-        "status": "ok",
+    """
+    Global health check endpoint with admission utilization.
+
+    Answers 503 while the worker is warming up.
+    """
+    controller = get_admission_controller()
+    warmup = get_warmup_state()
+    content = {
+        "status": "ok" if warmup.ready else "warming",
         "app": settings.app_name,
         "version": settings.app_version,
+        "warmup": warmup.status,
+        "admission": controller.utilization() if controller is not None else None,
     }
+    return JSONResponse(status_code=200 if warmup.ready else 503, content=content)
+
+
+@app.get("/ready")
+async def ready():
+    """Readiness check: warm state of this worker (503 until warm-up completes)."""
+    warmup = get_warmup_state()
+    return JSONResponse(status_code=200 if warmup.ready else 503, content=warmup.to_dict())
@@ -0,0 +1,344 @@
+"""
+Admission Control
+
+Rendering and model inference are the expensive parts of the analysis
+endpoints: a single A1 sheet at 300 DPI is ~70 megapixels, and every
+request renders, decodes and runs OpenCV or YOLO on such images. Without a
+limit, a burst of uploads runs them all at once and the process runs out of
+memory instead of answering slower.
+
+Each heavy request declares an estimated cost (memory of its rendered
+pages, CPU slots, model inference slots). Requests are admitted while the
+costs in flight fit the budgets; the rest wait in FIFO order for a bounded
+time and are rejected with ``AdmissionRejected`` (HTTP 429 with
+``Retry-After``) when the queue is full or the wait runs out.
+
+A request larger than a whole budget is admitted alone, so oversized
+requests still run (just never next to others).
+"""
+
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Tuple
+import asyncio
+import logging
+import math
+import os
+import threading
+import time
+
+from ..core.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+
+# Plans are estimated as A1 sheets (841 x 594 mm) when the page size is unknown
+ASSUMED_PAGE_SIZE_INCHES = (33.1, 23.4)
+
+# Estimated peak bytes per rendered pixel (image, gray/binary copies, model input)
+DEFAULT_BYTES_PER_PIXEL = 8
+
+# Weight of the latest request in the average hold time (Retry-After estimate)
+_HOLD_TIME_SMOOTHING = 0.2
+
+
+class AdmissionRejected(Exception):
+    """A request was not admitted; retry after ``retry_after`` seconds."""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+# =============================================================================
+# Request Costs
+# =============================================================================
+
+@dataclass(frozen=True)
+class RequestCost:
+    """Estimated resources a request holds while it runs."""
+
+    memory_bytes: int = 0
+    cpu_slots: int = 1
+    inference_slots: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for API response."""
+        return {
+            "memory_bytes": self.memory_bytes,
+            "cpu_slots": self.cpu_slots,
+            "inference_slots": self.inference_slots,
+        }
+
+
+def render_cost(
+    pages: int,
+    dpi: int,
+    inference: bool = False,
+    bytes_per_pixel: int = DEFAULT_BYTES_PER_PIXEL,
+) -> RequestCost:
+    """
+    Estimate the cost of rendering and processing plan pages.
+
+    Memory grows with pages x DPI²; pages are assumed to be A1 sheets.
+
+    Args:
+        pages: Pages rendered (and held) at the same time
+        dpi: Render resolution
+        inference: Whether the request runs a local model (YOLO)
+        bytes_per_pixel: Peak bytes held per rendered pixel
+
+    Returns:
+        RequestCost for the admission controller
+    """
+    width_in, height_in = ASSUMED_PAGE_SIZE_INCHES
+    pixels = (width_in * dpi) * (height_in * dpi)
+    return RequestCost(
+        memory_bytes=int(max(1, pages) * pixels * bytes_per_pixel),
+        cpu_slots=1,
+        inference_slots=1 if inference else 0,
+    )
+
+
+# =============================================================================
+# Admission Controller
+# =============================================================================
+
+@dataclass
+class AdmissionStats:
+    """Counters describing admission decisions."""
+
+    admitted: int = 0
+    waited: int = 0  # Admitted or not, had to queue
+    rejected: int = 0
+    timed_out: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for API response."""
+        return {
+            "admitted": self.admitted,
+            "waited": self.waited,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+        }
+
+
+class _Waiter:
+    """A queued request; granted by whichever thread releases resources."""
+
+    def __init__(self, cost: RequestCost, loop: asyncio.AbstractEventLoop):
+        self.cost = cost
+        self.loop = loop
+        self.future: asyncio.Future = loop.create_future()
+        self.granted = False
+
+    def grant(self) -> None:
+        self.granted = True
+        self.loop.call_soon_threadsafe(self._wake)
+
+    def _wake(self) -> None:
+        if not self.future.done():
+            self.future.set_result(None)
+
+
+class AdmissionController:
+    """
+    Admit requests while their estimated costs fit memory, CPU and
+    inference budgets; queue the rest for a bounded time.
+
+    Thread-safe; waiters may belong to different event loops.
+    """
+
+    def __init__(
+        self,
+        memory_budget_bytes: int,
+        cpu_slots: int,
+        inference_slots: int = 1,
+        max_queue: int = 16,
+        max_wait_seconds: float = 10.0,
+    ):
+        self.memory_budget_bytes = memory_budget_bytes
+        self.cpu_slots = cpu_slots
+        self.inference_slots = inference_slots
+        self.max_queue = max_queue
+        self.max_wait_seconds = max_wait_seconds
+
+        self._lock = threading.Lock()
+        self._waiters: Deque[_Waiter] = deque()
+        self._memory_in_use = 0
+        self._cpu_in_use = 0
+        self._inference_in_use = 0
+        self._active = 0
+        self._avg_hold_seconds = 1.0
+        self._stats = AdmissionStats()
+
+    # Must hold self._lock
+    def _fits(self, cost: RequestCost) -> bool:
+        if self._active == 0:
+            return True
+        return (
+            self._memory_in_use + cost.memory_bytes <= self.memory_budget_bytes
+            and self._cpu_in_use + cost.cpu_slots <= self.cpu_slots
+            and self._inference_in_use + cost.inference_slots <= self.inference_slots
+        )
+
+    # Must hold self._lock
+    def _take(self, cost: RequestCost) -> None:
+        self._memory_in_use += cost.memory_bytes
+        self._cpu_in_use += cost.cpu_slots
+        self._inference_in_use += cost.inference_slots
+        self._active += 1
+        self._stats.admitted += 1
+
+    # Must hold self._lock
+    def _grant_waiters(self) -> None:
+        while self._waiters and self._fits(self._waiters[0].cost):
+            waiter = self._waiters.popleft()
+            self._take(waiter.cost)
+            waiter.grant()
+
+    # Must hold self._lock
+    def _retry_after(self) -> int:
+        """Seconds until a retry has a fair chance (queue drained at the current pace)."""
+        rounds = 1 + len(self._waiters) / max(1, self.cpu_slots)
+        return max(1, math.ceil(self._avg_hold_seconds * rounds))
+
+    def try_acquire(self, cost: RequestCost) -> bool:
+        """Admit ``cost`` if it fits now and nobody is queued ahead of it."""
+        with self._lock:
+            if self._waiters or not self._fits(cost):
+                return False
+            self._take(cost)
+            return True
+
+    async def acquire(self, cost: RequestCost) -> None:
+        """
+        Wait until ``cost`` is admitted.
+
+        Raises:
+            AdmissionRejected: If the queue is full or the bounded wait expires
+        """
+        with self._lock:
+            if not self._waiters and self._fits(cost):
+                self._take(cost)
+                return
+            if len(self._waiters) >= self.max_queue or self.max_wait_seconds <= 0:
+                self._stats.rejected += 1
+                raise AdmissionRejected(
+                    "Server is at capacity, retry later", self._retry_after()
+                )
+            waiter = _Waiter(cost, asyncio.get_running_loop())
+            self._waiters.append(waiter)
+            self._stats.waited += 1
+
+        try:
+            await asyncio.wait_for(waiter.future, timeout=self.max_wait_seconds)
+        except asyncio.TimeoutError:
+            with self._lock:
+                if not waiter.granted:
+                    self._waiters.remove(waiter)
+                    self._stats.timed_out += 1
+                    retry_after = self._retry_after()
+                    # A large request leaving the head may unblock smaller ones
+                    self._grant_waiters()
+                    raise AdmissionRejected(
+                        f"Request waited {self.max_wait_seconds:g}s for capacity, retry later",
+                        retry_after,
+                    )
+        except BaseException:
+            with self._lock:
+                if not waiter.granted:
+                    self._waiters.remove(waiter)
+                    self._grant_waiters()
+                    raise
+            self.release(cost)
+            raise
+
+    def release(self, cost: RequestCost, held_seconds: Optional[float] = None) -> None:
+        """Return the resources of an admitted request and admit waiters."""
+        with self._lock:
+            self._memory_in_use -= cost.memory_bytes
+            self._cpu_in_use -= cost.cpu_slots
+            self._inference_in_use -= cost.inference_slots
+            self._active -= 1
+            if held_seconds is not None:
+                self._avg_hold_seconds += _HOLD_TIME_SMOOTHING * (
+                    held_seconds - self._avg_hold_seconds
+                )
+            self._grant_waiters()
+
+    @asynccontextmanager
+    async def admit(self, cost: RequestCost) -> AsyncIterator[None]:
+        """Hold ``cost`` for the duration of the block."""
+        await self.acquire(cost)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.release(cost, time.monotonic() - started)
+
+    def utilization(self) -> Dict[str, Any]:
+        """Resources in use, queue length and admission counters."""
+        with self._lock:
+            return {
+                "active": self._active,
+                "queued": len(self._waiters),
+                "memory_in_use_bytes": self._memory_in_use,
+                "memory_budget_bytes": self.memory_budget_bytes,
+                "memory_utilization": round(self._memory_in_use / self.memory_budget_bytes, 4)
+                if self.memory_budget_bytes else 0.0,
+                "cpu_in_use": self._cpu_in_use,
+                "cpu_slots": self.cpu_slots,
+                "inference_in_use": self._inference_in_use,
+                "inference_slots": self.inference_slots,
+                "avg_hold_seconds": round(self._avg_hold_seconds, 3),
+                **self._stats.to_dict(),
+            }
+
+
+# =============================================================================
+# Global Controller
+# =============================================================================
+
+_controller: Optional[AdmissionController] = None
+_controller_config: Optional[Tuple] = None
+
+
+def get_admission_controller(settings: Optional[Settings] = None) -> Optional[AdmissionController]:
+    """
+    Get or initialize the admission controller.
+
+    Returns None if admission control is disabled.
+    """
+    global _controller, _controller_config
+
+    if settings is None:
+        settings = get_settings()
+
+    if not settings.admission_enabled:
+        return None
+
+    config = (
+        settings.admission_memory_budget_bytes,
+        settings.admission_cpu_slots or os.cpu_count() or 1,
+        settings.admission_inference_slots,
+        settings.admission_max_queue,
+        settings.admission_max_wait_seconds,
+    )
+    if _controller is None or _controller_config != config:
+        _controller = AdmissionController(*config)
+        _controller_config = config
+
+    return _controller
+
+
+@asynccontextmanager
+async def admitted(cost: RequestCost) -> AsyncIterator[None]:
+    """Hold ``cost`` on the global controller (no-op when disabled)."""
+    controller = get_admission_controller()
+    if controller is None:
+        yield
+        return
+    async with controller.admit(cost):
+        yield
@@ -0,0 +1,332 @@
+"""
+German Area Annotation Tokenizer
+
+Single-pass scanner for the room annotations found in German CAD floor
+plans. Each text line is classified once with precompiled combined
+patterns and turned into a typed token; extractors then walk the token
+stream instead of re-running regexes over sliding windows of lines.
+
+Token kinds:
+- ROOM_ID:        "R2.E5.3.5", "B.00.2.002", "33_b6.12", "BT1.EG.001", ...
+- AREA:           "NRF: 12,34 m²", "NGF: 1.070,55 m2", "F: 22,79 m", "BGF: ..."
+- PERIMETER:      "U: 14,20 m"
+- HEIGHT:         "LH: 2,60 m"
+- PERCENT:        "50%: 1,15 m²" (counted area with factor)
+- LABEL:          "NRF:" / "U:" alone - value follows on the next line
+- VALUE:          "12,34 m²" / "14,20 m" alone (split annotation value)
+- TEXT:           anything else (room names, notes)
+
+A line that holds several annotations ("B.01 Büro NRF: 12,34 m² U: 14 m")
+is a TEXT token whose ``annotations`` list carries each of them in order.
+"""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Iterable, List, Optional, Sequence
+import re
+
+
+class TokenKind(str, Enum):
+    """Classification of a single text line."""
+    ROOM_ID = "room_id"
+    AREA = "area"
+    PERIMETER = "perimeter"
+    HEIGHT = "height"
+    PERCENT = "percent"
+    LABEL = "label"
+    VALUE = "value"
+    TEXT = "text"
+
+
+class RoomScheme(str, Enum):
+    """Room numbering scheme of a ROOM_ID token."""
+    HAARDTRING = "haardtring"  # R2.E5.3.5
+    LEIQ = "leiq"              # B.00.2.002
+    OMNITURM = "omniturm"      # 33_b6.12, BT1.EG.001
+    GENERIC = "generic"        # EG.001, R001, A1-2-3, ...
+
+
+# Area labels in priority order (Netto-Raumfläche first)
+AREA_LABELS = ("NRF", "NGF", "BGF", "FLAECHE", "WF", "F", "FL", "GF", "NF", "A", "AREA")
+
+# Labels that may be written without ":"/"=" ("NRF 12,34 m²"). Single
+# letters need a separator so grid axes and notes aren't read as labels.
+_SEPARATOR_OPTIONAL = {"NRF", "LH"}
+
+_NUMBER = r"\d[\d.,]*"
+
+# Whole-line classification: room identifiers, bare labels, bare values.
+# Specific schemes come first so their group wins over the generic one.
+_LINE_SCANNER = re.compile(
+    r"(?P<room_haardtring>R\d+\.E\d+\.\d+\.\d+)"
+    r"|(?P<room_leiq>B\.\d+\.[0-9A-Z]+\.[A-Z]?\d+)"
+    r"|(?P<room_omniturm>\d+_[a-z]\d+\.\d+|BT\d+\.[A-Z]+\.\d+)"
+    r"|(?P<room_generic>"
+    r"(?i:[A-Z]+\d*[._][A-Z0-9]+[._][A-Z0-9]+[._][A-Z0-9]+)"
+    r"|(?i:(?:R(?:aum|oom)?[\s\-_]?)?\d{2,4})"
+    r"|(?i:[A-Z]{2}\d*[._]\d{3})"
+    r"|(?i:[A-Z0-9]{1,4}[.\-_][A-Z0-9]+[.\-_][A-Z0-9]+))"
+    r"|(?P<bare_label>(?i:NRF|NGF|BGF|LH|WF)\s*[=:]?|(?i:F|U)\s*[=:])"
+    rf"|(?P<bare_value>{_NUMBER})\s*(?P<bare_unit>m[²2]?|qm)"
+)
+
+# Inline annotations, scanned left to right with finditer
+_INLINE_SCANNER = re.compile(
+    rf"(?P<pct>\d+)\s*%\s*[:=]\s*(?P<pct_value>{_NUMBER})\s*(?:m[²2]?|qm)"
+    r"|(?<![A-Za-zÄÖÜäöüß])"
+    r"(?P<label>(?i:NRF|NGF|BGF|Fl[äa]che|WF|NF|GF|Fl|F|Area|A|LH|U))"
+    rf"\s*(?P<sep>[=:])?\s*(?P<value>{_NUMBER})\s*(?P<unit>m[²2]?|qm)(?![A-Za-z])"
+    r"|(?P<room_label>[A-Z]\.[\d.]+(?:-\d+)?)"
+    r"|(?<![A-Za-zÄÖÜäöüß])(?P<open_label>(?i:NRF|NGF|BGF|LH)\s*[=:]?|(?i:F|U)\s*[=:])\s*$"
+    rf"|(?P<qm_value>{_NUMBER})\s*(?i:qm)\b"
+    rf"|[=:]\s*(?P<tail_value>{_NUMBER})\s*(?P<tail_unit>m[²2]?)\s*$"
+)
+
+
+def parse_number(value: str) -> Optional[float]:
+    """
+    Parse a German-format number.
+
+    "22,79" -> 22.79, "1.070,55" -> 1070.55, "42.18" -> 42.18.
+    Returns None if the text is not a number.
+    """
+    clean = value.strip()
+    if "." in clean and "," in clean:
+        clean = clean.replace(".", "").replace(",", ".")
+    else:
+        clean = clean.replace(",", ".")
+    try:
+        return float(clean)
+    except ValueError:
+        return None
+
+
+def _normalize_label(label: str) -> str:
+    return label.upper().replace("Ä", "AE")
+
+
+@dataclass
+class Annotation:
+    """One annotation found inside a line."""
+    kind: TokenKind
+    source: str                    # Matched text
+    start: int
+    end: int
+    label: Optional[str] = None    # Normalized label ("NRF", "U", "FLAECHE", ...)
+    value: Optional[float] = None  # Area (m²), length (m) or percent value
+    factor: Optional[float] = None  # PERCENT only: 0.5 for "50%"
+    unit: Optional[str] = None
+
+
+@dataclass
+class Token:
+    """A classified text line."""
+    kind: TokenKind
+    index: int                     # Line index within the page
+    text: str                      # Stripped line text
+    label: Optional[str] = None
+    value: Optional[float] = None
+    factor: Optional[float] = None
+    unit: Optional[str] = None
+    scheme: Optional[RoomScheme] = None
+    annotations: List[Annotation] = field(default_factory=list)
+
+    def find(self, kind: TokenKind, labels: Optional[Iterable[str]] = None) -> Optional[Annotation]:
+        """First annotation of a kind in this line (see ``find_annotation``)."""
+        return find_annotation(self.annotations, kind, labels)
+
+    @property
+    def is_room_id(self) -> bool:
+        return self.kind == TokenKind.ROOM_ID
+
+    def is_label(self, label: str) -> bool:
+        """True for a bare label line such as "NRF:"."""
+        return self.kind == TokenKind.LABEL and self.label == label
+
+    @property
+    def is_area_value(self) -> bool:
+        """Bare "12,34 m²" / "12,34 m" value."""
+        return self.kind == TokenKind.VALUE and self.unit != "qm"
+
+    @property
+    def is_length_value(self) -> bool:
+        """Bare "14,20 m" value."""
+        return self.kind == TokenKind.VALUE and self.unit == "m"
+
+
+def find_annotation(
+    annotations: Sequence[Annotation],
+    kind: TokenKind,
+    labels: Optional[Iterable[str]] = None,
+) -> Optional[Annotation]:
+    """
+    First annotation of a kind, left to right.
+
+    With ``labels``, only annotations with one of these labels count and
+    earlier labels take priority over later ones.
+    """
+    matches = [a for a in annotations if a.kind == kind]
+    if labels is None:
+        return matches[0] if matches else None
+    for label in labels:
+        for annotation in matches:
+            if annotation.label == label:
+                return annotation
+    return None
+
+
+def _unit(raw: str) -> str:
+    raw = raw.lower()
+    if raw == "m":
+        return "m"
+    if raw == "qm":
+        return "qm"
+    return "m2"
+
+
+def scan_annotations(text: str) -> List[Annotation]:
+    """Find all inline annotations in one line of text, left to right."""
+    annotations: List[Annotation] = []
+
+    for m in _INLINE_SCANNER.finditer(text):
+        if m.group("pct") is not None:
+            value = parse_number(m.group("pct_value"))
+            if value is None:
+                continue
+            annotations.append(Annotation(
+                kind=TokenKind.PERCENT,
+                source=m.group(0),
+                start=m.start(),
+                end=m.end(),
+                label=f"{m.group('pct')}%",
+                value=value,
+                factor=float(m.group("pct")) / 100.0,
+                unit=_unit("m2"),
+            ))
+
+        elif m.group("label") is not None:
+            label = _normalize_label(m.group("label"))
+            if m.group("sep") is None and label not in _SEPARATOR_OPTIONAL:
+                continue
+            value = parse_number(m.group("value"))
+            if value is None:
+                continue
+            unit = _unit(m.group("unit"))
+
+            if label == "U":
+                if unit != "m":
+                    continue
+                kind = TokenKind.PERIMETER
+            elif label == "LH":
+                if unit != "m":
+                    continue
+                kind = TokenKind.HEIGHT
+            else:
+                kind = TokenKind.AREA
+
+            annotations.append(Annotation(
+                kind=kind,
+                source=m.group(0),
+                start=m.start(),
+                end=m.end(),
+                label=label,
+                value=value,
+                unit=unit,
+            ))
+
+        elif m.group("room_label") is not None:
+            annotations.append(Annotation(
+                kind=TokenKind.ROOM_ID,
+                source=m.group("room_label"),
+                start=m.start(),
+                end=m.end(),
+            ))
+
+        elif m.group("qm_value") is not None or m.group("tail_value") is not None:
+            # Unlabelled area ("12 qm", "Whg. 3: 54,20 m²")
+            raw = m.group("qm_value") or m.group("tail_value")
+            value = parse_number(raw)
+            if value is None:
+                continue
+            annotations.append(Annotation(
+                kind=TokenKind.AREA,
+                source=m.group(0),
+                start=m.start(),
+                end=m.end(),
+                value=value,
+                unit="qm" if m.group("qm_value") is not None else _unit(m.group("tail_unit")),
+            ))
+
+        else:
+            annotations.append(Annotation(
+                kind=TokenKind.LABEL,
+                source=m.group(0),
+                start=m.start(),
+                end=m.end(),
+                label=_normalize_label(m.group("open_label").rstrip("=: ")),
+            ))
+
+    return annotations
+
+
+def tokenize_line(line: str, index: int = 0) -> Token:
+    """Classify a single line and collect its inline annotations."""
+    text = line.strip()
+    annotations = scan_annotations(text) if text else []
+
+    m = _LINE_SCANNER.fullmatch(text)
+    if m is not None:
+        group = m.lastgroup or ""
+        if group.startswith("room_"):
+            return Token(
+                kind=TokenKind.ROOM_ID,
+                index=index,
+                text=text,
+                scheme=RoomScheme(group[len("room_"):]),
+                annotations=annotations,
+            )
+        if m.group("bare_label") is not None:
+            return Token(
+                kind=TokenKind.LABEL,
+                index=index,
+                text=text,
+                label=_normalize_label(m.group("bare_label").rstrip("=: ")),
+                annotations=annotations,
+            )
+        value = parse_number(m.group("bare_value"))
+        if value is not None:
+            return Token(
+                kind=TokenKind.VALUE,
+                index=index,
+                text=text,
+                value=value,
+                unit=_unit(m.group("bare_unit")),
+                annotations=annotations,
+            )
+
+    # A line that is exactly one annotation takes that annotation's kind
+    if len(annotations) == 1 and annotations[0].start == 0 and annotations[0].end == len(text):
+        a = annotations[0]
+        if a.kind not in (TokenKind.ROOM_ID, TokenKind.LABEL):
+            return Token(
+                kind=a.kind,
+                index=index,
+                text=text,
+                label=a.label,
+                value=a.value,
+                factor=a.factor,
+                unit=a.unit,
+                annotations=annotations,
+            )
+
+    return Token(kind=TokenKind.TEXT, index=index, text=text, annotations=annotations)
+
+
+def tokenize_lines(lines: Sequence[str]) -> List[Token]:
+    """Tokenize a page's lines. Token i corresponds to line i."""
+    return [tokenize_line(line, i) for i, line in enumerate(lines)]
+
+
+def tokenize_text(text: str) -> List[Token]:
+    """Tokenize page text (as returned by ``page.get_text()``)."""
+    return tokenize_lines(text.split("\n"))
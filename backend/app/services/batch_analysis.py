@@ -0,0 +1,211 @@
+"""
+Project Batch Aggregation
+
+German projects deliver plans as one PDF per floor and section
+("LeiQ_B_EG.pdf", "Haus2_1.OG_Nord.pdf", ...). The batch endpoint analyzes
+the files one by one; this module assigns each file to a floor and sums the
+per-file results into a project view:
+
+- Rooms: count, NRF area, counted area and area by category
+- Doors: count by fire rating (T90, T30, DSS, Standard)
+- Drywall: wall length from room perimeters (U values) × wall height
+
+Floors come from the filename (UG/KG, EG, n.OG, DG and their long German
+forms), or from the floor segment of LeiQ-style room numbers
+("B.01.2.003" -> "01"); files with neither are grouped under their own name.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+
+FIRE_RATING_KEYS = {
+    "count_t90": "T90",
+    "count_t30": "T30",
+    "count_dss": "DSS",
+    "count_standard": "Standard",
+}
+
+_UPPER_FLOOR_RE = re.compile(r"(?<![A-Z0-9])(?:(\d{1,2})\s*OG|OG\s*(\d{1,2})|(\d{1,2})\s*OBERGESCHOSS)(?![A-Z])")
+_BASEMENT_RE = re.compile(r"(?<![A-Z0-9])(\d?)\s*(?:UG|KG|UNTERGESCHOSS|KELLERGESCHOSS|KELLER)(?![A-Z])")
+_GROUND_RE = re.compile(r"(?<![A-Z0-9])(?:EG|ERDGESCHOSS)(?![A-Z])")
+_ROOF_RE = re.compile(r"(?<![A-Z0-9])(?:DG|DACHGESCHOSS)(?![A-Z])")
+_ROOM_FLOOR_RE = re.compile(r"^[A-Z]+\d*\.(\d{2})\.")
+
+
+def floor_from_filename(filename: str) -> Optional[str]:
+    """
+    Floor label from a plan filename ("EG", "1.OG", "UG", "2.UG", "DG").
+
+    Returns None if the name carries no floor.
+    """
+    name = Path(filename).stem.upper()
+    name = re.sub(r"[^0-9A-Z]+", " ", name)
+
+    match = _UPPER_FLOOR_RE.search(name)
+    if match:
+        return f"{int(next(g for g in match.groups() if g))}.OG"
+    match = _BASEMENT_RE.search(name)
+    if match:
+        return f"{match.group(1)}.UG" if match.group(1) and match.group(1) != "1" else "UG"
+    if _GROUND_RE.search(name):
+        return "EG"
+    if _ROOF_RE.search(name):
+        return "DG"
+    return None
+
+
+def floor_from_room_numbers(room_numbers: Iterable[str]) -> Optional[str]:
+    """Most common floor segment of LeiQ-style room numbers ("B.01.2.003" -> "01")."""
+    floors = Counter(
+        match.group(1)
+        for match in (_ROOM_FLOOR_RE.match(number or "") for number in room_numbers)
+        if match
+    )
+    return floors.most_common(1)[0][0] if floors else None
+
+
+def floor_sort_key(floor: str) -> Tuple[int, int, str]:
+    """Order floors bottom to top: n.UG ... UG, EG, 1.OG ..., DG, others."""
+    match = re.fullmatch(r"(\d+)\.UG", floor)
+    if match:
+        return (0, -int(match.group(1)), floor)
+    if floor == "UG":
+        return (0, -1, floor)
+    if floor == "EG":
+        return (1, 0, floor)
+    match = re.fullmatch(r"(\d+)\.OG", floor)
+    if match:
+        return (1, int(match.group(1)), floor)
+    if floor == "DG":
+        return (2, 0, floor)
+    return (3, 0, floor)
+
+
+# =============================================================================
+# Aggregation
+# =============================================================================
+
+@dataclass
+class FloorTotals:
+    """Summed results of the files on one floor."""
+
+    floor: str
+    files: List[str] = field(default_factory=list)
+    rooms: int = 0
+    area_m2: float = 0.0
+    counted_m2: float = 0.0
+    doors: int = 0
+    doors_by_fire_rating: Dict[str, int] = field(
+        default_factory=lambda: dict.fromkeys(FIRE_RATING_KEYS.values(), 0)
+    )
+    wall_length_m: float = 0.0
+    drywall_area_m2: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for API response."""
+        return {
+            "floor": self.floor,
+            "files": self.files,
+            "rooms": self.rooms,
+            "area_m2": round(self.area_m2, 2),
+            "counted_m2": round(self.counted_m2, 2),
+            "doors": self.doors,
+            "doors_by_fire_rating": self.doors_by_fire_rating,
+            "wall_length_m": round(self.wall_length_m, 2),
+            "drywall_area_m2": round(self.drywall_area_m2, 2),
+        }
+
+
+class ProjectAggregate:
+    """
+    Project-level totals over the per-file results of a batch.
+
+    ``add`` takes the JSON results of ``/extraction/rooms`` and (optionally)
+    ``/gewerke/doors/from-plan`` for one file.
+    """
+
+    def __init__(self, wall_height_m: float, include_doors: bool = True):
+        self.wall_height_m = wall_height_m
+        self.include_doors = include_doors
+        self.floors: Dict[str, FloorTotals] = {}
+        self.by_category: Dict[str, float] = {}
+        self.files_ok = 0
+        self.files_failed = 0
+
+    def floor_of(self, filename: str, rooms: Optional[Dict[str, Any]]) -> str:
+        """Floor of a file: from its name, its room numbers, or the name itself."""
+        floor = floor_from_filename(filename)
+        if floor is None and rooms:
+            floor = floor_from_room_numbers(r["room_number"] for r in rooms.get("rooms", []))
+        return floor or Path(filename).stem
+
+    def add_failure(self) -> None:
+        """Count a file that could not be analyzed."""
+        self.files_failed += 1
+
+    def add(
+        self,
+        filename: str,
+        floor: str,
+        rooms: Dict[str, Any],
+        doors: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Add one analyzed file."""
+        totals = self.floors.setdefault(floor, FloorTotals(floor))
+        totals.files.append(filename)
+        self.files_ok += 1
+
+        summary = rooms["summary"]
+        totals.rooms += summary["total_rooms"]
+        totals.area_m2 += summary["total_area_m2"]
+        totals.counted_m2 += summary["total_counted_m2"]
+        for category in summary["by_category"]:
+            self.by_category[category["category"]] = (
+                self.by_category.get(category["category"], 0.0) + category["area_m2"]
+            )
+
+        perimeter = sum(r["perimeter_m"] or 0.0 for r in rooms["rooms"])
+        totals.wall_length_m += perimeter
+        totals.drywall_area_m2 += perimeter * self.wall_height_m
+
+        if doors is not None:
+            totals.doors += doors["total_doors"]
+            for key, rating in FIRE_RATING_KEYS.items():
+                totals.doors_by_fire_rating[rating] += doors["by_fire_rating"][key]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Project totals and per-floor breakdown (bottom floor first)."""
+        floors = [self.floors[f] for f in sorted(self.floors, key=floor_sort_key)]
+
+        doors_by_rating = dict.fromkeys(FIRE_RATING_KEYS.values(), 0)
+        for totals in floors:
+            for rating, count in totals.doors_by_fire_rating.items():
+                doors_by_rating[rating] += count
+
+        return {
+            "files": self.files_ok + self.files_failed,
+            "files_failed": self.files_failed,
+            "rooms": {
+                "total_rooms": sum(f.rooms for f in floors),
+                "total_area_m2": round(sum(f.area_m2 for f in floors), 2),
+                "total_counted_m2": round(sum(f.counted_m2 for f in floors), 2),
+                "by_category": {k: round(v, 2) for k, v in sorted(self.by_category.items())},
+            },
+            "doors": {
+                "total_doors": sum(f.doors for f in floors),
+                "by_fire_rating": doors_by_rating,
+            } if self.include_doors else None,
+            "drywall": {
+                "wall_height_m": self.wall_height_m,
+                "total_wall_length_m": round(sum(f.wall_length_m for f in floors), 2),
+                "total_drywall_area_m2": round(sum(f.drywall_area_m2 for f in floors), 2),
+            },
+            "floors": [f.to_dict() for f in floors],
+        }
@@ -10,37 +10,36 @@ YOLO Integration:
 - Without YOLO configured, detection functions return empty results
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import logging
 import time
 import uuid
 
 from ..core.config import Settings, get_settings
+from ..core.lazy_imports import is_available, lazy_import
+from .model_registry import ModelRegistry
+from .pdf_utils import PDF_LOCK
 
 logger = logging.getLogger(__name__)
 
-# Optional imports - gracefully handle missing dependencies
-try:
-    import cv2
-    CV2_AVAILABLE = True
-except ImportError:
-    CV2_AVAILABLE = False
+# Optional imports - loaded on first use, missing dependencies disable features
+cv2 = lazy_import("cv2")
+CV2_AVAILABLE = is_available("cv2")
+if not CV2_AVAILABLE:
     logger.warning("OpenCV (cv2) not installed - CV preprocessing disabled")
 
-try:
-    from ultralytics import YOLO
-    YOLO_AVAILABLE = True
-except ImportError:
-    YOLO_AVAILABLE = False
+ultralytics = lazy_import("ultralytics")
+YOLO_AVAILABLE = is_available("ultralytics")
+if not YOLO_AVAILABLE:
     logger.warning("Ultralytics not installed - YOLO detection disabled")
 
-# Global model instance (lazy loaded)
-_yolo_model: Optional[Any] = None
-_yolo_model_path: Optional[str] = None
+# Global model registry (lazy created, models lazy loaded)
+_yolo_registry: Optional[ModelRegistry] = None
 
 
 class ObjectType(Enum):
@@ -153,6 +152,8 @@ class DetectionResult:
     processing_time_ms: int = 0
     model_version: str = "stub-v0"
     warnings: List[str] = field(default_factory=list)
+    stage_timings_ms: Dict[str, int] = field(default_factory=dict)
+    door_labels: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -163,6 +164,8 @@ class DetectionResult:
             "processing_time_ms": self.processing_time_ms,
             "model_version": self.model_version,
             "warnings": self.warnings,
+            "stage_timings_ms": self.stage_timings_ms,
+            "door_labels": self.door_labels,
         }
 
     @property
@@ -342,51 +345,91 @@ async def extract_labels(
 # ============================================
 
 
-def get_yolo_model(settings: Optional[Settings] = None) -> Optional[Any]:
+def get_yolo_registry(settings: Optional[Settings] = None) -> ModelRegistry:
     """
-    Get or initialize the YOLO model instance.
+    Get or create the global YOLO model registry.
 
-    Uses lazy loading to avoid loading the model until needed.
-    Model is cached globally for reuse.
-
-    Args:
-        settings: Optional Settings instance
-
-    Returns:
-        YOLO model instance or None if not configured
+    Limits are taken from settings when the registry is first created.
     """
-    global _yolo_model, _yolo_model_path
+    global _yolo_registry
 
     if settings is None:
         settings = get_settings()
 
-    # Check if YOLO is available and configured
+    if _yolo_registry is None:
+        _yolo_registry = ModelRegistry(
+            loader=lambda path: ultralytics.YOLO(path),
+            max_models=settings.yolo_registry_max_models,
+            max_memory_bytes=settings.yolo_registry_max_memory_bytes,
+            hot_reload=settings.yolo_hot_reload,
+        )
+    return _yolo_registry
+
+
+def _resolve_yolo_model(
+    settings: Settings,
+    model_path: Optional[str] = None,
+    model_version: Optional[str] = None,
+) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Resolve which weight file and version to use.
+
+    Returns:
+        (model_path, model_version) or None if YOLO is unavailable
+    """
     if not YOLO_AVAILABLE:
         logger.debug("YOLO not available - ultralytics not installed")
         return None
 
-    if not settings.yolo_enabled:
-        logger.debug("YOLO not enabled - model path not configured")
+    if model_path is None:
+        if not settings.yolo_enabled:
+            logger.debug("YOLO not enabled - model path not configured")
+            return None
+        model_path = settings.yolo_model_path
+        model_version = model_version or settings.yolo_model_version
+    elif not settings.cv_pipeline_enabled:
         return None
 
-    model_path = settings.yolo_model_path
-
     # Check if model file exists
     if not Path(model_path).exists():
         logger.warning(f"YOLO model file not found: {model_path}")
         return None
 
-    # Return cached model if same path
-    if _yolo_model is not None and _yolo_model_path == model_path:
-        return _yolo_model
+    return model_path, model_version
+
+
+def get_yolo_model(
+    settings: Optional[Settings] = None,
+    model_path: Optional[str] = None,
+    model_version: Optional[str] = None,
+) -> Optional[Any]:
+    """
+    Get or initialize a YOLO model instance.
+
+    Models are lazy loaded into the shared registry and reused across
+    requests. Several versions can be resident at once; a model is
+    reloaded when its weight file changes on disk.
+
+    Callers running inference should prefer ``run_object_detection_on_page``,
+    which holds the model's inference lock.
+
+    Args:
+        settings: Optional Settings instance
+        model_path: Weight file (default: settings.yolo_model_path)
+        model_version: Version label (default: settings.yolo_model_version)
+
+    Returns:
+        YOLO model instance or None if not configured
+    """
+    if settings is None:
+        settings = get_settings()
+
+    resolved = _resolve_yolo_model(settings, model_path, model_version)
+    if resolved is None:
+        return None
 
-    # Load new model
     try:
-        logger.info(f"Loading YOLO model from: {model_path}")
-        _yolo_model = YOLO(model_path)
-        _yolo_model_path = model_path
-        logger.info("YOLO model loaded successfully")
-        return _yolo_model
+        return get_yolo_registry(settings).get(*resolved).model
     except Exception as e:
         logger.error(f"Failed to load YOLO model: {e}")
         return None
@@ -442,6 +485,7 @@ class CVPipelineStatus:
     yolo_model_configured: bool
     yolo_model_path: Optional[str]
     confidence_threshold: float
+    model_registry: Optional[Dict[str, Any]] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API response."""
@@ -452,6 +496,7 @@ class CVPipelineStatus:
             "yolo_model_configured": self.yolo_model_configured,
             "yolo_model_path": self.yolo_model_path,
             "confidence_threshold": self.confidence_threshold,
+            "model_registry": self.model_registry,
         }
 
 
@@ -471,6 +516,7 @@ def get_cv_pipeline_status(settings: Optional[Settings] = None) -> CVPipelineSta
         yolo_model_configured=is_yolo_available(settings),
         yolo_model_path=settings.yolo_model_path,
         confidence_threshold=settings.yolo_confidence_threshold,
+        model_registry=_yolo_registry.status() if _yolo_registry is not None else None,
     )
 
 
@@ -481,6 +527,8 @@ def run_object_detection_on_page(
     object_types: Optional[List[ObjectType]] = None,
     confidence_threshold: Optional[float] = None,
     settings: Optional[Settings] = None,
+    model_path: Optional[str] = None,
+    model_version: Optional[str] = None,
 ) -> DetectionResult:
     """
     Run YOLO object detection on a blueprint page image.
@@ -495,6 +543,8 @@ def run_object_detection_on_page(
         object_types: Types of objects to detect (default: all)
         confidence_threshold: Minimum confidence (default: from settings)
         settings: Optional Settings instance
+        model_path: Weight file (default: settings.yolo_model_path)
+        model_version: Version label (default: settings.yolo_model_version)
 
     Returns:
         DetectionResult with detected objects
@@ -519,8 +569,14 @@ def run_object_detection_on_page(
         )
 
     # Check if YOLO is available
-    model = get_yolo_model(settings)
-    if model is None:
+    entry = None
+    resolved = _resolve_yolo_model(settings, model_path, model_version)
+    if resolved is not None:
+        try:
+            entry = get_yolo_registry(settings).get(*resolved)
+        except Exception as e:
+            logger.error(f"Failed to load YOLO model: {e}")
+    if entry is None:
         return DetectionResult(
             document_id=document_id,
             page_number=page_number,
@@ -531,8 +587,9 @@ def run_object_detection_on_page(
         )
 
     try:
-        # Run YOLO inference
-        results = model(image_path, conf=confidence_threshold)
+        # Run YOLO inference (one inference at a time per model)
+        with entry.use() as model:
+            results = model(image_path, conf=confidence_threshold)
 
         # Process results
         detected_objects = []
@@ -578,15 +635,12 @@ def run_object_detection_on_page(
 
         processing_time_ms = int((time.time() - start_time) * 1000)
 
-        # Get model version from file path
-        model_version = Path(settings.yolo_model_path).stem if settings.yolo_model_path else "unknown"
-
         return DetectionResult(
             document_id=document_id,
             page_number=page_number,
             objects=detected_objects,
             processing_time_ms=processing_time_ms,
-            model_version=model_version,
+            model_version=entry.version,
             warnings=[],
         )
 
@@ -716,6 +770,14 @@ def render_pdf_page_to_image(
 # ============================================
 
 
+# Human-readable stage names used in warnings
+_DOOR_STAGE_LABELS = {
+    "vector": "Vector detection",
+    "yolo": "YOLO detection",
+    "text": "Label extraction",
+}
+
+
 def detect_doors_hybrid(
     pdf_path: str,
     page_number: int = 1,
@@ -725,6 +787,7 @@ def detect_doors_hybrid(
     use_vector: bool = True,
     confidence_threshold: float = 0.5,
     settings: Optional[Settings] = None,
+    extract_labels: bool = False,
 ) -> DetectionResult:
     """
     Hybrid door detection combining vector analysis and YOLO.
@@ -732,7 +795,13 @@ def detect_doors_hybrid(
     Strategy:
     1. Run vector-based detection (fast, precise for CAD)
     2. Run YOLO detection (catches non-standard symbols)
-    3. Merge results, removing duplicates
+    3. Optionally extract door labels and fire ratings from the text layer
+    4. Merge results once all stages finish, removing duplicates
+
+    The stages are independent and run concurrently. PyMuPDF is not
+    thread-safe, so each stage opens its own handle and holds ``PDF_LOCK``
+    while it reads or renders the page; YOLO inference runs outside the
+    lock. Per-stage wall-clock times are reported in ``stage_timings_ms``.
 
     Args:
         pdf_path: Path to the PDF file
@@ -743,6 +812,7 @@ def detect_doors_hybrid(
         use_vector: Whether to use vector detection
         confidence_threshold: Minimum confidence
         settings: Optional Settings instance
+        extract_labels: Whether to extract door labels and fire ratings
 
     Returns:
         DetectionResult with merged detections
@@ -751,96 +821,50 @@ def detect_doors_hybrid(
         settings = get_settings()
 
     start_time = time.time()
-    all_objects: List[DetectedObject] = []
     warnings: List[str] = []
     document_id = Path(pdf_path).stem
 
-    # Vector-based detection
+    stages: Dict[str, Callable[[], Any]] = {}
     if use_vector:
-        try:
-            from .vector_measurement import measure_doors_on_page
-
-            INCHES_PER_METER = 39.3701
-            pixels_per_meter = (1.0 / scale) * INCHES_PER_METER * dpi
-
-            vector_doors = measure_doors_on_page(
-                path=pdf_path,
-                page_number=page_number,
-                pixels_per_meter=pixels_per_meter,
-                dpi=dpi,
-            )
-
-            for door in vector_doors:
-                # Create bounding box around door arc
-                cx, cy = door.arc_center
-                r = door.arc_radius_px
-                bbox = BoundingBox(
-                    x=cx - r,
-                    y=cy - r,
-                    width=r * 2,
-                    height=r * 2,
-                )
-
-                detected_obj = DetectedObject(
-                    object_id=door.door_id,
-                    object_type=ObjectType.DOOR,
-                    bbox=bbox,
-                    confidence=door.confidence,
-                    page_number=page_number,
-                    label=door.label,
-                    attributes={
-                        "detection_method": "vector",
-                        "width_m": door.width_m,
-                        "arc_radius_px": door.arc_radius_px,
-                    },
-                )
-                all_objects.append(detected_obj)
-
-            logger.info(f"Vector detection found {len(vector_doors)} doors")
-
-        except Exception as e:
-            logger.warning(f"Vector detection failed: {e}")
-            warnings.append(f"Vector detection failed: {str(e)}")
-
-    # YOLO-based detection
+        stages["vector"] = lambda: _run_vector_door_stage(pdf_path, page_number, scale, dpi)
     if use_yolo and is_yolo_available(settings):
-        try:
-            # Render PDF page to image
-            image_path = render_pdf_page_to_image(pdf_path, page_number, dpi)
-
-            try:
-                yolo_result = run_object_detection_on_page(
-                    image_path=image_path,
-                    document_id=document_id,
-                    page_number=page_number,
-                    object_types=[ObjectType.DOOR],
-                    confidence_threshold=confidence_threshold,
-                    settings=settings,
-                )
-
-                # Add YOLO detections (marking source)
-                for obj in yolo_result.objects:
-                    obj.attributes["detection_method"] = "yolo"
-                    all_objects.append(obj)
-
-                logger.info(f"YOLO detection found {len(yolo_result.objects)} doors")
-                warnings.extend(yolo_result.warnings)
-
-            finally:
-                # Clean up temp image
-                import os
-                if os.path.exists(image_path):
-                    os.remove(image_path)
-
-        except Exception as e:
-            logger.warning(f"YOLO detection failed: {e}")
-            warnings.append(f"YOLO detection failed: {str(e)}")
-
-    elif use_yolo and not is_yolo_available(settings):
+        stages["yolo"] = lambda: _run_yolo_door_stage(
+            pdf_path, document_id, page_number, dpi, confidence_threshold, settings
+        )
+    elif use_yolo:
         warnings.append("YOLO not available - set SNAPGRID_YOLO_MODEL_PATH")
+    if extract_labels:
+        stages["text"] = lambda: _run_text_door_stage(pdf_path, page_number)
+
+    outcomes = _run_stages_concurrently(stages)
+
+    stage_timings_ms: Dict[str, int] = {}
+    stage_objects: Dict[str, List[DetectedObject]] = {}
+    stage_warnings: Dict[str, List[str]] = {}
+    door_labels: Dict[str, Dict[str, Any]] = {}
+
+    for name, (value, error, elapsed_ms) in outcomes.items():
+        stage_timings_ms[name] = elapsed_ms
+        if error is not None:
+            label = _DOOR_STAGE_LABELS[name]
+            logger.warning(f"{label} failed: {error}")
+            stage_warnings[name] = [f"{label} failed: {str(error)}"]
+            continue
+        if name == "text":
+            door_labels = value
+        else:
+            stage_objects[name], stage_warnings[name] = value
+
+    # Merge in a fixed stage order so results don't depend on completion order
+    all_objects: List[DetectedObject] = []
+    for name in ("vector", "yolo", "text"):
+        all_objects.extend(stage_objects.get(name, []))
+        warnings.extend(stage_warnings.get(name, []))
 
     # Remove duplicate detections (overlapping bboxes)
+    merge_start = time.time()
     final_objects = _merge_overlapping_detections(all_objects)
+    stage_timings_ms["merge"] = int((time.time() - merge_start) * 1000)
 
     processing_time_ms = int((time.time() - start_time) * 1000)
 
@@ -851,9 +875,131 @@ def detect_doors_hybrid(
         processing_time_ms=processing_time_ms,
         model_version="hybrid-v1",
         warnings=warnings,
+        stage_timings_ms=stage_timings_ms,
+        door_labels=door_labels,
     )
 
 
+def _run_stages_concurrently(
+    stages: Dict[str, Callable[[], Any]],
+) -> Dict[str, Tuple[Any, Optional[Exception], int]]:
+    """
+    Run independent detection stages in parallel threads.
+
+    Returns:
+        Dict of stage name -> (result, exception or None, elapsed ms)
+    """
+
+    def timed(fn: Callable[[], Any]) -> Tuple[Any, Optional[Exception], int]:
+        stage_start = time.time()
+        try:
+            value, error = fn(), None
+        except Exception as e:
+            value, error = None, e
+        return value, error, int((time.time() - stage_start) * 1000)
+
+    if len(stages) <= 1:
+        return {name: timed(fn) for name, fn in stages.items()}
+
+    with ThreadPoolExecutor(max_workers=len(stages), thread_name_prefix="door-stage") as pool:
+        futures = {name: pool.submit(timed, fn) for name, fn in stages.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def _run_vector_door_stage(
+    pdf_path: str,
+    page_number: int,
+    scale: int,
+    dpi: int,
+) -> Tuple[List[DetectedObject], List[str]]:
+    """Vector arc detection stage of hybrid door detection."""
+    from .vector_measurement import measure_doors_on_page
+
+    INCHES_PER_METER = 39.3701
+    pixels_per_meter = (1.0 / scale) * INCHES_PER_METER * dpi
+
+    with PDF_LOCK:
+        vector_doors = measure_doors_on_page(
+            path=pdf_path,
+            page_number=page_number,
+            pixels_per_meter=pixels_per_meter,
+            dpi=dpi,
+        )
+
+    objects: List[DetectedObject] = []
+    for door in vector_doors:
+        # Create bounding box around door arc
+        cx, cy = door.arc_center
+        r = door.arc_radius_px
+        bbox = BoundingBox(
+            x=cx - r,
+            y=cy - r,
+            width=r * 2,
+            height=r * 2,
+        )
+
+        objects.append(DetectedObject(
+            object_id=door.door_id,
+            object_type=ObjectType.DOOR,
+            bbox=bbox,
+            confidence=door.confidence,
+            page_number=page_number,
+            label=door.label,
+            attributes={
+                "detection_method": "vector",
+                "width_m": door.width_m,
+                "arc_radius_px": door.arc_radius_px,
+            },
+        ))
+
+    logger.info(f"Vector detection found {len(vector_doors)} doors")
+    return objects, []
+
+
+def _run_yolo_door_stage(
+    pdf_path: str,
+    document_id: str,
+    page_number: int,
+    dpi: int,
+    confidence_threshold: float,
+    settings: Settings,
+) -> Tuple[List[DetectedObject], List[str]]:
+    """Render + YOLO detection stage of hybrid door detection."""
+    with PDF_LOCK:
+        image_path = render_pdf_page_to_image(pdf_path, page_number, dpi)
+
+    try:
+        yolo_result = run_object_detection_on_page(
+            image_path=image_path,
+            document_id=document_id,
+            page_number=page_number,
+            object_types=[ObjectType.DOOR],
+            confidence_threshold=confidence_threshold,
+            settings=settings,
+        )
+
+        # Mark source of YOLO detections
+        for obj in yolo_result.objects:
+            obj.attributes["detection_method"] = "yolo"
+
+        logger.info(f"YOLO detection found {len(yolo_result.objects)} doors")
+        return yolo_result.objects, list(yolo_result.warnings)
+
+    finally:
+        # Clean up temp image
+        import os
+        if os.path.exists(image_path):
+            os.remove(image_path)
+
+
+def _run_text_door_stage(pdf_path: str, page_number: int) -> Dict[str, Dict[str, Any]]:
+    """Door label and fire rating stage of hybrid door detection."""
+    from .door_labels import extract_door_labels_and_fire_ratings
+
+    with PDF_LOCK:
+        return extract_door_labels_and_fire_ratings(pdf_path, page_number)
+
+
 def _merge_overlapping_detections(
     objects: List[DetectedObject],
     iou_threshold: float = 0.5,
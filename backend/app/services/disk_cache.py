@@ -0,0 +1,316 @@
+"""
+Local Disk Cache
+
+Small JSON-on-disk key/value cache used to avoid repeating expensive work
+(paid remote inference, PDF re-extraction) for identical inputs.
+
+Features:
+- TTL expiry (checked on read and during eviction)
+- Size eviction (least recently used entries first), with limits that hold
+  for the whole directory when several processes share it
+- Hit/miss/eviction counters for status endpoints
+- Atomic writes (tempfile + os.replace), safe across threads
+
+Values must be JSON-serializable.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheStats:
+    """Counters describing cache effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for API response."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "entries": self.entries,
+            "size_bytes": self.size_bytes,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+def make_cache_key(*parts: Any) -> str:
+    """
+    Build a stable cache key from arbitrary parts.
+
+    Parts are joined with a separator and hashed, so keys are safe to use
+    as file names regardless of their content.
+    """
+    joined = "\x1f".join(str(p) for p in parts)
+    return hashlib.sha256(joined.encode("utf-8")).hexdigest()
+
+
+def file_digest(path: Union[str, Path], chunk_size: int = 1024 * 1024) -> str:
+    """Compute the SHA-256 digest of a file's exact bytes."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DiskCache:
+    """
+    JSON-on-disk cache with TTL and LRU size eviction.
+
+    Entries are stored as ``<directory>/<key[:2]>/<key>.json``. An in-memory
+    index of entry sizes and access times is built lazily from the directory
+    on first use, so the cache survives process restarts.
+
+    Several processes (server workers) may share the directory, and the size
+    limits apply to the directory as a whole: lookups fall back to the file
+    system for keys the index doesn't know, and the index is rebuilt from
+    the directory before evicting and at least every ``rescan_seconds``.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        ttl_seconds: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        rescan_seconds: float = 60.0,
+    ):
+        self.directory = Path(directory)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.rescan_seconds = rescan_seconds
+
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[str, Dict[str, float]]] = None
+        self._size = 0  # Running total of index sizes
+        self._scanned_at = 0.0
+        self._stats = CacheStats()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _path_for(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _load_index(self) -> Dict[str, Dict[str, float]]:
+        """Scan the cache directory (once, or again after ``_rescan``) and build the entry index."""
+        if self._index is not None:
+            return self._index
+
+        index: Dict[str, Dict[str, float]] = {}
+        size = 0
+        if self.directory.exists():
+            for entry_path in self.directory.glob("*/*.json"):
+                try:
+                    stat = entry_path.stat()
+                except OSError:
+                    continue
+                index[entry_path.stem] = {
+                    "size": stat.st_size,
+                    "accessed": stat.st_mtime,
+                }
+                size += stat.st_size
+        self._index = index
+        self._size = size
+        self._scanned_at = time.time()
+        return index
+
+    def _rescan(self) -> Dict[str, Dict[str, float]]:
+        """Rebuild the index from the directory (picks up other processes' entries)."""
+        self._index = None
+        return self._load_index()
+
+    def _track(self, key: str, size: int, accessed: float) -> None:
+        index = self._load_index()
+        previous = index.get(key)
+        if previous is not None:
+            self._size -= previous["size"]
+        index[key] = {"size": size, "accessed": accessed}
+        self._size += size
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def _remove(self, key: str) -> None:
+        index = self._load_index()
+        entry = index.pop(key, None)
+        if entry is not None:
+            self._size -= entry["size"]
+        try:
+            self._path_for(key).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to remove cache entry {key}: {e}")
+
+    def _over_limits(self) -> bool:
+        index = self._load_index()
+        if self.max_entries is not None and len(index) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self._size > self.max_bytes
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until the directory is within size limits."""
+        if self.max_entries is None and self.max_bytes is None:
+            return
+
+        # The index misses entries written by other processes since the last scan
+        stale = time.time() - self._scanned_at > self.rescan_seconds
+        if not (stale or self._over_limits()):
+            return
+        index = self._rescan()
+        if not self._over_limits():
+            return
+
+        for key in sorted(index, key=lambda k: index[k]["accessed"]):
+            self._remove(key)
+            self._stats.evictions += 1
+            if not self._over_limits():
+                break
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached value.
+
+        Returns None on miss or when the entry has expired.
+        """
+        with self._lock:
+            path = self._path_for(key)
+
+            # Not only indexed keys: another process may have stored it
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+                    size = os.fstat(f.fileno()).st_size
+            except FileNotFoundError:
+                self._remove(key)
+                self._stats.misses += 1
+                return None
+            except (OSError, ValueError) as e:
+                logger.warning(f"Discarding unreadable cache entry {key}: {e}")
+                self._remove(key)
+                self._stats.misses += 1
+                return None
+
+            now = time.time()
+            if self._is_expired(entry.get("created_at", 0.0), now):
+                self._remove(key)
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+
+            # Record access for LRU ordering (also persisted via mtime)
+            self._track(key, size, now)
+            try:
+                os.utime(path, (now, now))
+            except OSError:
+                pass
+
+            self._stats.hits += 1
+            return entry.get("value")
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value, evicting old entries if needed."""
+        payload = json.dumps({"created_at": time.time(), "value": value})
+
+        with self._lock:
+            path = self._path_for(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(payload)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"Failed to write cache entry {key}: {e}")
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                return
+
+            self._track(key, len(payload.encode("utf-8")), time.time())
+            self._stats.stores += 1
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        """Remove a single entry if present."""
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> int:
+        """Remove all entries. Returns the number of entries removed."""
+        with self._lock:
+            index = self._rescan()
+            keys = list(index)
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def purge_expired(self) -> int:
+        """Remove all expired entries. Returns the number removed."""
+        if self.ttl_seconds is None:
+            return 0
+
+        removed = 0
+        with self._lock:
+            index = self._rescan()
+            now = time.time()
+            for key in list(index):
+                try:
+                    with open(self._path_for(key), "r", encoding="utf-8") as f:
+                        created_at = json.load(f).get("created_at", 0.0)
+                except (OSError, ValueError):
+                    created_at = 0.0
+                if self._is_expired(created_at, now):
+                    self._remove(key)
+                    self._stats.expirations += 1
+                    removed += 1
+        return removed
+
+    @property
+    def stats(self) -> CacheStats:
+        """Snapshot of the cache counters and current size."""
+        with self._lock:
+            index = self._load_index()
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                stores=self._stats.stores,
+                evictions=self._stats.evictions,
+                expirations=self._stats.expirations,
+                entries=len(index),
+                size_bytes=int(self._size),
+            )
@@ -0,0 +1,119 @@
+"""
+Door Label and Fire Rating Extraction
+
+Reads door labels (B.XX.X.XXX-X format) and their fire ratings from the
+text layer of a floor plan page. Runs as the text stage of hybrid door
+detection alongside vector and YOLO detection.
+
+The PDF format is typically:
+    B.06.1.001-1    <- door label
+    T 30-RS         <- fire rating for the door ABOVE
+    B.06.1.002-1    <- next door label
+    -               <- dash means NO fire rating
+"""
+
+from pathlib import Path
+from typing import Dict, Union
+import logging
+import re
+
+from ..core.lazy_imports import is_available, lazy_import
+
+logger = logging.getLogger(__name__)
+
+fitz = lazy_import("fitz")  # PyMuPDF
+FITZ_AVAILABLE = is_available("fitz")
+
+
+DOOR_LABEL_PATTERN = re.compile(r'(B\.\d{2}\.\d\.\d{3}-\d+)')
+T90_PATTERN = re.compile(r'^T\s*90[-\s]?RS$|^T\s*90$', re.IGNORECASE)
+T30_PATTERN = re.compile(r'^T\s*30[-\s]?RS$|^T\s*30$', re.IGNORECASE)
+DSS_PATTERN = re.compile(r'^DSS$', re.IGNORECASE)
+
+
+def parse_door_labels_and_fire_ratings(text: str) -> Dict[str, Dict]:
+    """
+    Parse door labels and fire ratings from page text.
+
+    Returns a dict mapping door labels to their fire ratings.
+    E.g., {"B.03.1.001-1": {"fire_rating": "T 90-RS", "category": "T90"}, ...}
+    """
+    result: Dict[str, Dict] = {}
+
+    # Initialize all doors as standard
+    for label in set(DOOR_LABEL_PATTERN.findall(text)):
+        result[label] = {"fire_rating": None, "category": "Standard"}
+
+    # Parse line by line - fire rating applies to the PREVIOUS door label
+    last_door_label = None
+
+    for line in text.split('\n'):
+        line_stripped = line.strip()
+
+        # Check if this line is a door label
+        door_match = DOOR_LABEL_PATTERN.match(line_stripped)
+        if door_match:
+            last_door_label = door_match.group(1)
+            continue
+
+        # Check if this line is a fire rating (only if we have a previous door)
+        if last_door_label and last_door_label in result:
+            if T90_PATTERN.match(line_stripped):
+                result[last_door_label] = {"fire_rating": "T 90-RS", "category": "T90"}
+                last_door_label = None  # Reset - don't apply to next door
+                continue
+
+            if T30_PATTERN.match(line_stripped):
+                result[last_door_label] = {"fire_rating": "T 30-RS", "category": "T30"}
+                last_door_label = None
+                continue
+
+            # DSS (smoke protection)
+            if DSS_PATTERN.match(line_stripped):
+                result[last_door_label] = {"fire_rating": "DSS", "category": "DSS"}
+                last_door_label = None
+                continue
+
+            # Dash or empty means no fire rating - keep as standard
+            if line_stripped in ['-', '--', '---', '']:
+                last_door_label = None
+                continue
+
+    return result
+
+
+def extract_door_labels_and_fire_ratings(
+    pdf_path: Union[str, Path],
+    page_number: int,
+) -> Dict[str, Dict]:
+    """
+    Extract door labels and fire ratings from a PDF page's text.
+
+    Fire ratings are supplementary, so failures are logged and an empty
+    result is returned instead of raising.
+
+    Args:
+        pdf_path: Path to the PDF file
+        page_number: Page number (1-indexed)
+
+    Returns:
+        Dict mapping door labels to {"fire_rating", "category"}
+    """
+    if not FITZ_AVAILABLE:
+        logger.warning("PyMuPDF not available - skipping door label extraction")
+        return {}
+
+    try:
+        doc = fitz.open(str(pdf_path))
+        try:
+            if page_number < 1 or page_number > len(doc):
+                return {}
+            text = doc[page_number - 1].get_text()
+        finally:
+            doc.close()
+    except Exception as e:
+        # Log but don't fail - fire rating is supplementary
+        logger.warning(f"Could not extract fire ratings: {e}")
+        return {}
+
+    return parse_door_labels_and_fire_ratings(text)
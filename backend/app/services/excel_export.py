@@ -11,15 +11,14 @@ from datetime import datetime
 from dataclasses import dataclass
 import logging
 
+from ..core.lazy_imports import is_available, lazy_import
+
 logger = logging.getLogger(__name__)
 
-try:
-    import openpyxl
-    from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
-    from openpyxl.utils import get_column_letter
-    OPENPYXL_AVAILABLE = True
-except ImportError:
-    OPENPYXL_AVAILABLE = False
+openpyxl = lazy_import("openpyxl")
+styles = lazy_import("openpyxl.styles")
+OPENPYXL_AVAILABLE = is_available("openpyxl")
+if not OPENPYXL_AVAILABLE:
     logger.warning("openpyxl not installed. Excel export will not be available.")
 
 
@@ -147,14 +146,14 @@ def _create_summary_sheet(
     ws = wb.create_sheet("Zusammenfassung" if language == "de" else "Summary")
 
     # Styles
-    header_font = Font(bold=True, color=COLORS["header_fg"], size=12)
-    header_fill = PatternFill(start_color=COLORS["header_bg"], end_color=COLORS["header_bg"], fill_type="solid")
-    total_fill = PatternFill(start_color=COLORS["total_bg"], end_color=COLORS["total_bg"], fill_type="solid")
-    bold_font = Font(bold=True)
+    header_font = styles.Font(bold=True, color=COLORS["header_fg"], size=12)
+    header_fill = styles.PatternFill(start_color=COLORS["header_bg"], end_color=COLORS["header_bg"], fill_type="solid")
+    total_fill = styles.PatternFill(start_color=COLORS["total_bg"], end_color=COLORS["total_bg"], fill_type="solid")
+    bold_font = styles.Font(bold=True)
 
     # Title
     ws["A1"] = "AUFMASS - Flächenextraktion" if language == "de" else "MEASUREMENT - Area Extraction"
-    ws["A1"].font = Font(bold=True, size=16)
+    ws["A1"].font = styles.Font(bold=True, size=16)
     ws.merge_cells("A1:D1")
 
     # Metadata
@@ -174,7 +173,7 @@ def _create_summary_sheet(
     for col in ["A", "B", "C"]:
         ws[f"{col}{row}"].font = header_font
         ws[f"{col}{row}"].fill = header_fill
-        ws[f"{col}{row}"].alignment = Alignment(horizontal="center")
+        ws[f"{col}{row}"].alignment = styles.Alignment(horizontal="center")
 
     # Category rows
     row += 1
@@ -235,14 +234,14 @@ def _create_details_sheet(
     ws = wb.create_sheet("Raumliste" if language == "de" else "Room List")
 
     # Styles
-    header_font = Font(bold=True, color=COLORS["header_fg"])
-    header_fill = PatternFill(start_color=COLORS["header_bg"], end_color=COLORS["header_bg"], fill_type="solid")
-    outdoor_fill = PatternFill(start_color=COLORS["outdoor_bg"], end_color=COLORS["outdoor_bg"], fill_type="solid")
-    thin_border = Border(
-        left=Side(style="thin"),
-        right=Side(style="thin"),
-        top=Side(style="thin"),
-        bottom=Side(style="thin"),
+    header_font = styles.Font(bold=True, color=COLORS["header_fg"])
+    header_fill = styles.PatternFill(start_color=COLORS["header_bg"], end_color=COLORS["header_bg"], fill_type="solid")
+    outdoor_fill = styles.PatternFill(start_color=COLORS["outdoor_bg"], end_color=COLORS["outdoor_bg"], fill_type="solid")
+    thin_border = styles.Border(
+        left=styles.Side(style="thin"),
+        right=styles.Side(style="thin"),
+        top=styles.Side(style="thin"),
+        bottom=styles.Side(style="thin"),
     )
 
     # Headers
@@ -255,7 +254,7 @@ def _create_details_sheet(
         cell = ws.cell(row=1, column=col, value=header)
         cell.font = header_font
         cell.fill = header_fill
-        cell.alignment = Alignment(horizontal="center")
+        cell.alignment = styles.Alignment(horizontal="center")
         cell.border = thin_border
 
     # Data rows
@@ -287,7 +286,7 @@ def _create_details_sheet(
     # Adjust column widths
     column_widths = [5, 15, 25, 15, 12, 8, 12, 6, 30]
     for col, width in enumerate(column_widths, 1):
-        ws.column_dimensions[get_column_letter(col)].width = width
+        ws.column_dimensions[openpyxl.utils.get_column_letter(col)].width = width
 
     # Add total row
     total_row = len(rooms) + 2
@@ -295,10 +294,10 @@ def _create_details_sheet(
     ws.cell(row=total_row, column=5, value=f"=SUM(E2:E{total_row-1})")
     ws.cell(row=total_row, column=7, value=f"=SUM(G2:G{total_row-1})")
 
-    ws.cell(row=total_row, column=4).font = Font(bold=True)
-    ws.cell(row=total_row, column=5).font = Font(bold=True)
+    ws.cell(row=total_row, column=4).font = styles.Font(bold=True)
+    ws.cell(row=total_row, column=5).font = styles.Font(bold=True)
     ws.cell(row=total_row, column=5).number_format = "#,##0.00"
-    ws.cell(row=total_row, column=7).font = Font(bold=True)
+    ws.cell(row=total_row, column=7).font = styles.Font(bold=True)
     ws.cell(row=total_row, column=7).number_format = "#,##0.00"
 
     # Freeze header row
@@ -342,7 +341,7 @@ def _create_category_sheets(
 
         for col, header in enumerate(headers, 1):
             cell = ws.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True)
+            cell.font = styles.Font(bold=True)
 
         for row_idx, room in enumerate(cat_rooms, 2):
             ws.cell(row=row_idx, column=1, value=room.get("room_number", ""))
@@ -354,8 +353,8 @@ def _create_category_sheets(
         total_row = len(cat_rooms) + 2
         ws.cell(row=total_row, column=2, value="Gesamt:" if language == "de" else "Total:")
         ws.cell(row=total_row, column=3, value=f"=SUM(C2:C{total_row-1})")
-        ws.cell(row=total_row, column=2).font = Font(bold=True)
-        ws.cell(row=total_row, column=3).font = Font(bold=True)
+        ws.cell(row=total_row, column=2).font = styles.Font(bold=True)
+        ws.cell(row=total_row, column=3).font = styles.Font(bold=True)
         ws.cell(row=total_row, column=3).number_format = "#,##0.00"
 
         # Column widths
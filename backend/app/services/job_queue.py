@@ -0,0 +1,516 @@
+"""
+Durable Local Job Queue
+
+Runs long takeoffs (geometry flooring, YOLO door detection, export) outside
+the HTTP request. Jobs are stored in a local SQLite database and pass
+through ``queued -> running -> completed / failed``; a pool of worker
+processes dequeues and executes them.
+
+Features:
+- Atomic dequeue (one ``BEGIN IMMEDIATE`` transaction per claim), safe
+  across worker processes and several API processes sharing the database
+- Leases with heartbeats: a job whose worker crashed is re-queued once its
+  lease expires, up to ``max_attempts`` runs
+- One work directory per job for the uploaded input and result artifacts
+- Finished jobs (and their files) are purged after a retention period
+
+Handlers are referenced as ``"module:function"`` strings so spawned worker
+processes can import them. A handler is called as
+``handler(work_dir, params)`` and returns a JSON-serializable dict. It may
+write a file into ``work_dir`` and name it in the result under
+``"artifact": {"filename": ..., "media_type": ...}``.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Tuple
+import importlib
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+
+from ..core.config import Settings, get_settings
+from .sqlite_utils import sqlite_connection
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Job Records
+# =============================================================================
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+FINISHED_STATUSES = (COMPLETED, FAILED)
+
+
+class JobError(Exception):
+    """Job failure reported to the client with an HTTP-style status code."""
+
+    def __init__(self, message: str, status_code: int = 500):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+@dataclass
+class QueuedJob:
+    """One job as stored in the queue."""
+
+    id: str
+    kind: str
+    status: str
+    params: Dict[str, Any]
+    attempts: int
+    max_attempts: int
+    created_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    worker_id: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    error_status: Optional[int] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for API response (without the result)."""
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "QueuedJob":
+        return cls(
+            id=row["id"],
+            kind=row["kind"],
+            status=row["status"],
+            params=json.loads(row["params"]),
+            attempts=row["attempts"],
+            max_attempts=row["max_attempts"],
+            created_at=row["created_at"],
+            started_at=row["started_at"],
+            finished_at=row["finished_at"],
+            worker_id=row["worker_id"],
+            result=json.loads(row["result"]) if row["result"] is not None else None,
+            error=row["error"],
+            error_status=row["error_status"],
+        )
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    params TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    lease_until REAL,
+    worker_id TEXT,
+    result TEXT,
+    error TEXT,
+    error_status INTEGER
+);
+CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created_at);
+"""
+
+
+# =============================================================================
+# Queue
+# =============================================================================
+
+class JobQueue:
+    """
+    SQLite-backed job queue.
+
+    Each call opens its own connection, so one instance can be shared by
+    threads; worker processes open their own instance on the same file.
+
+    Args:
+        db_path: SQLite database file (created if missing)
+        work_dir: Directory holding one subdirectory per job
+        lease_seconds: How long a running job may go without a heartbeat
+            before it counts as interrupted
+        max_attempts: Runs per job before an interrupted job is failed
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        work_dir: Path,
+        lease_seconds: float = 60.0,
+        max_attempts: int = 3,
+    ):
+        self.db_path = Path(db_path)
+        self.work_dir = Path(work_dir)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        with self._connection() as conn:
+            # WAL lets readers (status polls) proceed while a worker writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def _connection(self, immediate: bool = False) -> ContextManager[sqlite3.Connection]:
+        """
+        Open a connection (autocommit), closed on exit.
+
+        With ``immediate`` the block runs in one write transaction, so
+        concurrent claims from several processes never see the same job.
+        """
+        return sqlite_connection(self.db_path, immediate)
+
+    def job_dir(self, job_id: str) -> Path:
+        """Work directory of a job (input file and result artifacts)."""
+        return self.work_dir / job_id
+
+    def new_job_dir(self) -> Tuple[str, Path]:
+        """Reserve a job id and create its work directory before submitting."""
+        job_id = uuid.uuid4().hex
+        path = self.job_dir(job_id)
+        path.mkdir(parents=True, exist_ok=True)
+        return job_id, path
+
+    def submit(self, kind: str, params: Dict[str, Any], job_id: Optional[str] = None) -> QueuedJob:
+        """
+        Queue a job.
+
+        Args:
+            kind: Handler name
+            params: JSON-serializable handler parameters
+            job_id: Id from ``new_job_dir`` when the input was written first
+        """
+        job_id = job_id or uuid.uuid4().hex
+        self.job_dir(job_id).mkdir(parents=True, exist_ok=True)
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, kind, status, params, max_attempts, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, kind, QUEUED, json.dumps(params), self.max_attempts, time.time()),
+            )
+        logger.info(f"Queued {kind} job {job_id}")
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[QueuedJob]:
+        with self._connection() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return QueuedJob.from_row(row) if row else None
+
+    def claim(self, worker_id: str) -> Optional[QueuedJob]:
+        """Move the oldest queued job to running and lease it to a worker."""
+        now = time.time()
+        with self._connection(immediate=True) as conn:
+            row = conn.execute(
+                "SELECT id FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1",
+                (QUEUED,),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = ?, attempts = attempts + 1, started_at = ?, "
+                "lease_until = ?, worker_id = ? WHERE id = ?",
+                (RUNNING, now, now + self.lease_seconds, worker_id, row["id"]),
+            )
+        return self.get(row["id"])
+
+    def heartbeat(self, job_id: str, worker_id: str) -> bool:
+        """Extend a running job's lease. False if the worker lost the job."""
+        with self._connection() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_until = ? WHERE id = ? AND status = ? AND worker_id = ?",
+                (time.time() + self.lease_seconds, job_id, RUNNING, worker_id),
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, job_id: str, worker_id: str, result: Dict[str, Any]) -> None:
+        self._finish(job_id, worker_id, COMPLETED, result=json.dumps(result))
+
+    def fail(self, job_id: str, worker_id: str, error: str, status_code: int = 500) -> None:
+        self._finish(job_id, worker_id, FAILED, error=error, error_status=status_code)
+
+    def _finish(self, job_id: str, worker_id: str, status: str, **fields: Any) -> None:
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self._connection() as conn:
+            cursor = conn.execute(
+                f"UPDATE jobs SET status = ?, finished_at = ?, lease_until = NULL, {columns} "
+                "WHERE id = ? AND status = ? AND worker_id = ?",
+                (status, time.time(), *fields.values(), job_id, RUNNING, worker_id),
+            )
+        if cursor.rowcount != 1:
+            logger.warning(f"Job {job_id} was re-queued before {worker_id} finished it")
+
+    def recover_expired(self) -> List[str]:
+        """
+        Re-queue running jobs whose lease expired (worker crashed or hung).
+
+        Jobs that already used all attempts are failed instead.
+
+        Returns:
+            Ids of the re-queued jobs
+        """
+        now = time.time()
+        with self._connection(immediate=True) as conn:
+            rows = conn.execute(
+                "SELECT id, attempts, max_attempts FROM jobs WHERE status = ? AND lease_until < ?",
+                (RUNNING, now),
+            ).fetchall()
+            requeued = []
+            for row in rows:
+                if row["attempts"] < row["max_attempts"]:
+                    conn.execute(
+                        "UPDATE jobs SET status = ?, lease_until = NULL, worker_id = NULL WHERE id = ?",
+                        (QUEUED, row["id"]),
+                    )
+                    requeued.append(row["id"])
+                else:
+                    conn.execute(
+                        "UPDATE jobs SET status = ?, finished_at = ?, lease_until = NULL, "
+                        "error = ?, error_status = 500 WHERE id = ?",
+                        (FAILED, now, f"Job interrupted {row['attempts']} times", row["id"]),
+                    )
+
+        for job_id in requeued:
+            logger.warning(f"Re-queued interrupted job {job_id}")
+        return requeued
+
+    def purge(self, older_than_seconds: float) -> int:
+        """Delete finished jobs (and their work directories) older than the limit."""
+        cutoff = time.time() - older_than_seconds
+        with self._connection() as conn:
+            rows = conn.execute(
+                "SELECT id FROM jobs WHERE status IN (?, ?) AND finished_at < ?",
+                (*FINISHED_STATUSES, cutoff),
+            ).fetchall()
+            conn.executemany("DELETE FROM jobs WHERE id = ?", [(row["id"],) for row in rows])
+
+        for row in rows:
+            shutil.rmtree(self.job_dir(row["id"]), ignore_errors=True)
+        return len(rows)
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs per status."""
+        with self._connection() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+        counts = {status: 0 for status in (QUEUED, RUNNING, COMPLETED, FAILED)}
+        counts.update({row["status"]: row["n"] for row in rows})
+        return counts
+
+
+# =============================================================================
+# Execution
+# =============================================================================
+
+def resolve_handler(spec: str) -> Callable[[Path, Dict[str, Any]], Dict[str, Any]]:
+    """Import a ``"module:function"`` handler reference."""
+    module_name, _, attr = spec.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def run_claimed_job(
+    queue: JobQueue,
+    job: QueuedJob,
+    worker_id: str,
+    handlers: Dict[str, str],
+) -> None:
+    """
+    Execute a claimed job and record its result.
+
+    Handler exceptions fail the job without retry: extraction is
+    deterministic, so another run would fail the same way. Only
+    interrupted runs (expired leases) are retried.
+    """
+    stop = threading.Event()
+
+    def keep_lease() -> None:
+        while not stop.wait(queue.lease_seconds / 3):
+            queue.heartbeat(job.id, worker_id)
+
+    heartbeat = threading.Thread(target=keep_lease, daemon=True)
+    heartbeat.start()
+    try:
+        spec = handlers.get(job.kind)
+        if spec is None:
+            raise JobError(f"Unknown job kind: {job.kind}", status_code=400)
+        result = resolve_handler(spec)(queue.job_dir(job.id), job.params)
+        queue.complete(job.id, worker_id, result)
+        logger.info(f"Completed {job.kind} job {job.id}")
+    except Exception as e:
+        status_code = getattr(e, "status_code", 500)
+        detail = getattr(e, "detail", None) or str(e) or type(e).__name__
+        logger.error(f"{job.kind} job {job.id} failed: {detail}")
+        queue.fail(job.id, worker_id, str(detail), status_code)
+    finally:
+        stop.set()
+        heartbeat.join()
+
+
+def run_next_job(queue: JobQueue, handlers: Dict[str, str], worker_id: Optional[str] = None) -> Optional[QueuedJob]:
+    """Claim and run one job in the current process. Returns the finished job."""
+    worker_id = worker_id or _worker_id()
+    job = queue.claim(worker_id)
+    if job is None:
+        return None
+    run_claimed_job(queue, job, worker_id, handlers)
+    return queue.get(job.id)
+
+
+def _worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _worker_main(
+    db_path: str,
+    work_dir: str,
+    lease_seconds: float,
+    max_attempts: int,
+    handlers: Dict[str, str],
+    poll_interval: float,
+    stop_event: Any,
+) -> None:
+    """Worker process loop: claim, run, repeat until stopped."""
+    queue = JobQueue(Path(db_path), Path(work_dir), lease_seconds, max_attempts)
+    worker_id = _worker_id()
+    logger.info(f"Job worker {worker_id} started")
+    while not stop_event.is_set():
+        job = queue.claim(worker_id)
+        if job is None:
+            stop_event.wait(poll_interval)
+            continue
+        run_claimed_job(queue, job, worker_id, handlers)
+
+
+class JobWorkerPool:
+    """
+    Worker processes executing jobs from a queue.
+
+    A supervisor thread in the parent re-queues jobs with expired leases,
+    restarts crashed workers and purges old finished jobs. Workers are
+    spawned (not forked) so they never inherit the server's threads.
+
+    Args:
+        queue: Queue to serve
+        handlers: Job kind -> ``"module:function"`` handler reference
+        workers: Number of worker processes
+        poll_interval: Seconds an idle worker waits before polling again
+        retention_seconds: Age after which finished jobs are purged
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        handlers: Dict[str, str],
+        workers: int = 2,
+        poll_interval: float = 0.5,
+        retention_seconds: float = 7 * 24 * 3600,
+    ):
+        self.queue = queue
+        self.handlers = dict(handlers)
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.retention_seconds = retention_seconds
+
+        self._context = multiprocessing.get_context("spawn")
+        self._stop = self._context.Event()
+        self._processes: List[multiprocessing.process.BaseProcess] = []
+        self._supervisor: Optional[threading.Thread] = None
+
+    def _spawn(self) -> multiprocessing.process.BaseProcess:
+        process = self._context.Process(
+            target=_worker_main,
+            args=(
+                str(self.queue.db_path),
+                str(self.queue.work_dir),
+                self.queue.lease_seconds,
+                self.queue.max_attempts,
+                self.handlers,
+                self.poll_interval,
+                self._stop,
+            ),
+            daemon=True,
+        )
+        process.start()
+        return process
+
+    def start(self) -> None:
+        """Recover interrupted jobs and start the workers."""
+        self.queue.recover_expired()
+        self._stop.clear()
+        self._processes = [self._spawn() for _ in range(self.workers)]
+        self._supervisor = threading.Thread(target=self._supervise, daemon=True)
+        self._supervisor.start()
+        logger.info(f"Started {self.workers} job workers")
+
+    def _supervise(self) -> None:
+        interval = max(self.queue.lease_seconds / 3, self.poll_interval)
+        while not self._stop.wait(interval):
+            for i, process in enumerate(self._processes):
+                if not process.is_alive():
+                    logger.warning(f"Job worker {process.pid} exited ({process.exitcode}), restarting")
+                    self._processes[i] = self._spawn()
+            try:
+                self.queue.recover_expired()
+                self.queue.purge(self.retention_seconds)
+            except sqlite3.Error as e:
+                logger.error(f"Job queue maintenance failed: {e}")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop the workers; running jobs are finished or re-queued later."""
+        self._stop.set()
+        if self._supervisor is not None:
+            self._supervisor.join(timeout)
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+        self._processes = []
+
+
+# =============================================================================
+# Global Queue
+# =============================================================================
+
+_job_queue: Optional[JobQueue] = None
+
+
+def get_job_queue(settings: Optional[Settings] = None) -> JobQueue:
+    """Get or initialize the job queue configured in settings."""
+    global _job_queue
+
+    if settings is None:
+        settings = get_settings()
+
+    db_path = Path(settings.job_queue_db)
+    if _job_queue is None or _job_queue.db_path != db_path:
+        _job_queue = JobQueue(
+            db_path=db_path,
+            work_dir=Path(settings.job_work_dir),
+            lease_seconds=settings.job_lease_seconds,
+            max_attempts=settings.job_max_attempts,
+        )
+
+    return _job_queue
@@ -9,9 +9,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Tuple, Optional, Dict, Any
 import uuid
-import math
 from enum import Enum
 
+from .polygon_metrics import polygon_area, polygon_perimeter
+
 
 class MeasurementType(str, Enum):
     """Types of measurements that can be performed."""
@@ -300,6 +301,7 @@ def shoelace_area_pixels(polygon_points: List[Tuple[float, float]]) -> float:
     A = 0.5 * |Σ(x_i * y_{i+1} - x_{i+1} * y_i)|
 
     This is a pure geometric calculation - no unit conversion.
+    Computed by the batched implementation in polygon_metrics.
 
     Args:
         polygon_points: List of (x, y) vertices in any coordinate system.
@@ -317,16 +319,7 @@ def shoelace_area_pixels(polygon_points: List[Tuple[float, float]]) -> float:
     if n < 3:
         raise ValueError(f"Polygon must have at least 3 points, got {n}")
 
-    # Shoelace formula
-    area = 0.0
-    for i in range(n):
-        j = (i + 1) % n  # Wrap around to close the polygon
-        xi, yi = polygon_points[i]
-        xj, yj = polygon_points[j]
-        area += xi * yj
-        area -= xj * yi
-
-    return abs(area) / 2.0
+    return polygon_area(polygon_points)
 
 
 def shoelace_perimeter_pixels(polygon_points: List[Tuple[float, float]]) -> float:
@@ -350,15 +343,7 @@ def shoelace_perimeter_pixels(polygon_points: List[Tuple[float, float]]) -> floa
     if n < 2:
         raise ValueError(f"Polygon must have at least 2 points, got {n}")
 
-    perimeter = 0.0
-    for i in range(n):
-        j = (i + 1) % n  # Wrap around to close the polygon
-        xi, yi = polygon_points[i]
-        xj, yj = polygon_points[j]
-        distance = math.sqrt((xj - xi) ** 2 + (yj - yi) ** 2)
-        perimeter += distance
-
-    return perimeter
+    return polygon_perimeter(polygon_points)
 
 
 def compute_sector_area_m2(
@@ -0,0 +1,258 @@
+"""
+Model Registry
+
+Keeps several loaded CV models resident at once, keyed by weight file path
+and version label, so requests pinned to different model versions do not
+reload weights on every alternating call.
+
+Features:
+- Thread-safe lazy loading (one load per key, other keys not blocked)
+- LRU eviction by estimated memory footprint and model count
+- Hot reload when the weight file's mtime changes
+- Per-model inference lock (models like YOLO are not safe to call
+  concurrently from several threads)
+"""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+ModelKey = Tuple[str, str]  # (resolved weight path, version label)
+
+
+@dataclass
+class ResidentModel:
+    """A model held in memory by the registry."""
+
+    key: ModelKey
+    model: Any
+    mtime: float
+    memory_bytes: int
+    loaded_at: float = field(default_factory=time.time)
+    last_used: float = field(default_factory=time.time)
+    inference_count: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def path(self) -> str:
+        return self.key[0]
+
+    @property
+    def version(self) -> str:
+        return self.key[1]
+
+    @contextmanager
+    def use(self) -> Iterator[Any]:
+        """Hold this model's inference lock for the duration of the block."""
+        with self.lock:
+            self.inference_count += 1
+            self.last_used = time.time()
+            yield self.model
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for API response."""
+        return {
+            "path": self.path,
+            "version": self.version,
+            "memory_bytes": self.memory_bytes,
+            "loaded_at": self.loaded_at,
+            "last_used": self.last_used,
+            "inference_count": self.inference_count,
+            "busy": self.lock.locked(),
+        }
+
+
+def estimate_model_memory(model: Any, path: str) -> int:
+    """
+    Estimate the in-memory size of a loaded model.
+
+    Sums parameter and buffer sizes for torch-backed models (e.g. YOLO's
+    ``model.model``). Falls back to the weight file size, which is a good
+    approximation for fp32 checkpoints.
+    """
+    module = getattr(model, "model", model)
+    try:
+        tensors = list(module.parameters()) + list(module.buffers())
+        total = sum(t.numel() * t.element_size() for t in tensors)
+        if total > 0:
+            return int(total)
+    except Exception:
+        pass
+
+    try:
+        return Path(path).stat().st_size
+    except OSError:
+        return 0
+
+
+class ModelRegistry:
+    """
+    LRU cache of loaded models keyed by (path, version).
+
+    Args:
+        loader: Callable that loads a model from a weight file path
+        max_models: Maximum number of resident models
+        max_memory_bytes: Maximum total estimated memory of resident models
+        hot_reload: Reload a model when its weight file's mtime changes
+        memory_estimator: Callable (model, path) -> bytes
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str], Any],
+        max_models: Optional[int] = None,
+        max_memory_bytes: Optional[int] = None,
+        hot_reload: bool = True,
+        memory_estimator: Callable[[Any, str], int] = estimate_model_memory,
+    ):
+        self.loader = loader
+        self.max_models = max_models
+        self.max_memory_bytes = max_memory_bytes
+        self.hot_reload = hot_reload
+        self.memory_estimator = memory_estimator
+
+        self._lock = threading.Lock()
+        self._models: "OrderedDict[ModelKey, ResidentModel]" = OrderedDict()
+        self._load_locks: Dict[ModelKey, threading.Lock] = {}
+        self.loads = 0
+        self.reloads = 0
+        self.evictions = 0
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def make_key(path: str, version: Optional[str] = None) -> ModelKey:
+        resolved = str(Path(path).resolve())
+        return resolved, version or Path(path).stem
+
+    def _is_stale(self, entry: ResidentModel, mtime: float) -> bool:
+        return self.hot_reload and mtime != entry.mtime
+
+    def _evict(self, keep: ModelKey) -> None:
+        """Evict least recently used models until within limits."""
+
+        def over_limits() -> bool:
+            if self.max_models is not None and len(self._models) > self.max_models:
+                return True
+            if self.max_memory_bytes is not None:
+                return self.memory_bytes > self.max_memory_bytes
+            return False
+
+        for key in list(self._models):
+            if not over_limits():
+                break
+            if key == keep:
+                continue
+            # In-flight inferences keep their reference; the model is freed
+            # once they finish.
+            self._models.pop(key)
+            self.evictions += 1
+            logger.info(f"Evicted model {key[1]} ({key[0]}) from registry")
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(self, path: str, version: Optional[str] = None) -> ResidentModel:
+        """
+        Return the resident model for (path, version), loading it if needed.
+
+        Raises:
+            FileNotFoundError: If the weight file doesn't exist
+            Exception: Whatever the loader raises
+        """
+        key = self.make_key(path, version)
+        mtime = Path(key[0]).stat().st_mtime
+
+        with self._lock:
+            entry = self._models.get(key)
+            if entry is not None and not self._is_stale(entry, mtime):
+                self._models.move_to_end(key)
+                entry.last_used = time.time()
+                return entry
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        # Load outside the registry lock so other models stay available
+        with load_lock:
+            with self._lock:
+                entry = self._models.get(key)
+                if entry is not None and not self._is_stale(entry, mtime):
+                    self._models.move_to_end(key)
+                    entry.last_used = time.time()
+                    return entry
+                reloading = entry is not None
+
+            logger.info(f"{'Reloading' if reloading else 'Loading'} model {key[1]} from: {key[0]}")
+            model = self.loader(key[0])
+            entry = ResidentModel(
+                key=key,
+                model=model,
+                mtime=mtime,
+                memory_bytes=self.memory_estimator(model, key[0]),
+            )
+
+            with self._lock:
+                self._models[key] = entry
+                self._models.move_to_end(key)
+                if reloading:
+                    self.reloads += 1
+                else:
+                    self.loads += 1
+                self._evict(keep=key)
+            return entry
+
+    @contextmanager
+    def acquire(self, path: str, version: Optional[str] = None) -> Iterator[Any]:
+        """
+        Hold a model's inference lock for the duration of the block.
+
+        Example:
+            >>> with registry.acquire("weights/best.pt") as model:
+            ...     results = model(image_path)
+        """
+        with self.get(path, version).use() as model:
+            yield model
+
+    def evict(self, path: str, version: Optional[str] = None) -> bool:
+        """Remove a model from the registry. Returns True if it was resident."""
+        key = self.make_key(path, version)
+        with self._lock:
+            return self._models.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Remove all resident models."""
+        with self._lock:
+            self._models.clear()
+
+    @property
+    def memory_bytes(self) -> int:
+        """Total estimated memory of resident models."""
+        return sum(e.memory_bytes for e in self._models.values())
+
+    def resident_models(self) -> List[ResidentModel]:
+        """Resident models, least recently used first."""
+        with self._lock:
+            return list(self._models.values())
+
+    def status(self) -> Dict[str, Any]:
+        """Registry summary for status endpoints."""
+        with self._lock:
+            return {
+                "resident_models": [e.to_dict() for e in self._models.values()],
+                "memory_bytes": self.memory_bytes,
+                "max_models": self.max_models,
+                "max_memory_bytes": self.max_memory_bytes,
+                "loads": self.loads,
+                "reloads": self.reloads,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,93 @@
+"""
+Page Content Fingerprints
+
+Identifies unchanged sheets across plan revisions (Index A -> B -> C)
+without rendering or text extraction. A page's fingerprint is a SHA-256
+over its page box, rotation, decoded content stream and the objects its
+resources reference (fonts, XObjects, images).
+
+Referenced objects are hashed by content rather than by object number
+(``12 0 R`` is replaced by the digest of object 12, recursively), so a
+sheet keeps its fingerprint when the PDF is re-saved, pages are inserted
+or reordered, or objects are renumbered.
+"""
+
+import hashlib
+import re
+from typing import Dict, List, Set
+
+from ..core.lazy_imports import is_available, lazy_import
+
+fitz = lazy_import("fitz")  # PyMuPDF
+FITZ_AVAILABLE = is_available("fitz")
+
+
+# Indirect object reference "12 0 R"
+_REFERENCE = re.compile(r"\b(\d+) \d+ R\b")
+
+
+class PageFingerprinter:
+    """
+    Fingerprints the pages of one open document.
+
+    Object digests are memoized, so resources shared between pages (fonts,
+    title block XObjects) are hashed once per document.
+
+    Args:
+        doc: Open PyMuPDF document
+    """
+
+    def __init__(self, doc: "fitz.Document"):
+        self.doc = doc
+        self._digests: Dict[int, str] = {}
+        self._pending: Set[int] = set()
+
+    def __call__(self, page_idx: int) -> str:
+        """Fingerprint of a page (0-indexed)."""
+        page = self.doc[page_idx]
+        digest = hashlib.sha256()
+        digest.update(f"{tuple(page.mediabox)}|{page.rotation}|".encode("utf-8"))
+        digest.update(page.read_contents())
+        digest.update(self._resources(page.xref).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _resources(self, page_xref: int) -> str:
+        """Expanded /Resources of a page, inherited from the page tree if needed."""
+        xref = page_xref
+        seen: Set[int] = set()
+        while xref and xref not in seen:
+            seen.add(xref)
+            kind, value = self.doc.xref_get_key(xref, "Resources")
+            if kind != "null":
+                return self._expand(value)
+            kind, value = self.doc.xref_get_key(xref, "Parent")
+            xref = int(value.split()[0]) if kind == "xref" else 0
+        return ""
+
+    def _expand(self, source: str) -> str:
+        """Replace object references with the digests of their targets."""
+        return _REFERENCE.sub(lambda m: self._object_digest(int(m.group(1))), source)
+
+    def _object_digest(self, xref: int) -> str:
+        cached = self._digests.get(xref)
+        if cached is not None:
+            return cached
+        if xref in self._pending:
+            return "cycle"
+
+        self._pending.add(xref)
+        try:
+            digest = hashlib.sha256(self._expand(self.doc.xref_object(xref, compressed=True)).encode("utf-8"))
+            if self.doc.xref_is_stream(xref):
+                digest.update(self.doc.xref_stream_raw(xref) or b"")
+        finally:
+            self._pending.discard(xref)
+
+        self._digests[xref] = digest.hexdigest()
+        return self._digests[xref]
+
+
+def page_fingerprints(doc: "fitz.Document") -> List[str]:
+    """Fingerprints of all pages of a document, in page order."""
+    fingerprint = PageFingerprinter(doc)
+    return [fingerprint(page_idx) for page_idx in range(len(doc))]
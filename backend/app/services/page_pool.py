@@ -0,0 +1,184 @@
+"""
+Shared Page Worker Pool
+
+Text extraction of large plan sets and schedules is CPU-bound pure Python,
+so pages are extracted in worker processes. Instead of every call starting
+(and tearing down) its own pool, all callers share one lazily created
+``ProcessPoolExecutor``:
+
+- Bounded: ``Settings.page_workers`` processes for the whole server
+- Started with forkserver (spawn where unavailable), never forked from a
+  server process with threads running
+- Workers keep their last PDF open (``worker_document``), so consecutive
+  pages of one document don't reopen it
+
+Callers extract in-process when fewer than ``Settings.parallel_min_pages``
+pages are requested (see ``use_page_pool``).
+"""
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Deque, Iterable, Iterator, Optional, Tuple
+import logging
+import multiprocessing
+import os
+import threading
+
+from ..core.config import Settings, get_settings
+from ..core.lazy_imports import lazy_import
+
+fitz = lazy_import("fitz")  # PyMuPDF
+
+logger = logging.getLogger(__name__)
+
+
+# Upper bound for the default pool size (CPU count otherwise)
+MAX_PAGE_WORKERS = 8
+
+
+def page_pool_size(settings: Optional[Settings] = None) -> int:
+    """Processes of the shared pool (``page_workers``, 0 = CPU count capped at 8)."""
+    if settings is None:
+        settings = get_settings()
+    if settings.page_workers > 0:
+        return settings.page_workers
+    return max(1, min(os.cpu_count() or 1, MAX_PAGE_WORKERS))
+
+
+def use_page_pool(
+    page_count: int,
+    max_workers: Optional[int] = None,
+    settings: Optional[Settings] = None,
+) -> bool:
+    """
+    Decide whether to extract ``page_count`` pages in the shared pool.
+
+    Args:
+        page_count: Pages to extract
+        max_workers: Caller's limit (1 extracts in-process)
+        settings: Optional Settings instance
+    """
+    if settings is None:
+        settings = get_settings()
+    if max_workers is not None and max_workers <= 1:
+        return False
+    return page_pool_size(settings) > 1 and page_count >= settings.parallel_min_pages
+
+
+# =============================================================================
+# Pool
+# =============================================================================
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _start_method() -> str:
+    methods = multiprocessing.get_all_start_methods()
+    return "forkserver" if "forkserver" in methods else "spawn"
+
+
+def get_page_pool(settings: Optional[Settings] = None) -> ProcessPoolExecutor:
+    """Get or initialize the process pool shared by all page extractions."""
+    global _pool
+
+    if settings is None:
+        settings = get_settings()
+
+    with _pool_lock:
+        if _pool is None:
+            workers = page_pool_size(settings)
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context(_start_method()),
+            )
+            logger.info(f"Started page pool with {workers} {_start_method()} workers")
+    return _pool
+
+
+def shutdown_page_pool() -> None:
+    """Stop the shared pool (a later call starts a new one)."""
+    global _pool
+
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _discard_broken(pool: ProcessPoolExecutor) -> None:
+    global _pool
+
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def map_pages(
+    fn: Callable[[Any], Any],
+    tasks: Iterable[Any],
+    max_workers: Optional[int] = None,
+    settings: Optional[Settings] = None,
+) -> Iterator[Any]:
+    """
+    Run ``fn`` over tasks in the shared pool, yielding results in task order.
+
+    At most ``max_workers`` tasks of this call are queued or running at a
+    time (default: the pool size), so one large document does not fill the
+    pool's queue. Closing the iterator early (e.g. a client disconnect)
+    cancels the tasks that have not started.
+
+    Raises:
+        BrokenProcessPool: If a worker died; the pool is replaced for the
+            next call
+    """
+    pool = get_page_pool(settings)
+    limit = max(1, min(max_workers or page_pool_size(settings), page_pool_size(settings)))
+
+    pending: Deque[Future] = deque()
+    try:
+        for task in tasks:
+            pending.append(pool.submit(fn, task))
+            if len(pending) >= limit:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    except BrokenProcessPool:
+        logger.error("Page pool worker died, restarting the pool")
+        _discard_broken(pool)
+        raise
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+# =============================================================================
+# Worker Side
+# =============================================================================
+
+# Last document opened by this worker process: (path, mtime_ns, size), handle
+_worker_doc: Optional[Tuple[Tuple[str, int, int], "fitz.Document"]] = None
+
+
+def worker_document(path: str) -> "fitz.Document":
+    """
+    PyMuPDF document for ``path`` in a pool worker (documents can't be pickled).
+
+    The handle is kept until a task for another file (or a changed file)
+    arrives.
+    """
+    global _worker_doc
+
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    if _worker_doc is not None and _worker_doc[0] == key:
+        return _worker_doc[1]
+
+    if _worker_doc is not None:
+        _worker_doc[1].close()
+        _worker_doc = None
+    doc = fitz.open(path)
+    _worker_doc = (key, doc)
+    return doc
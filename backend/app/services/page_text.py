@@ -0,0 +1,137 @@
+"""
+Shared PyMuPDF text extraction per page.
+
+Every ``page.get_text(...)`` call builds a new internal text page (MuPDF's
+structured text) before formatting it. Extractors that read the same page
+as plain text, blocks and dict each paid that cost again. ``PageText``
+builds the text page once with ``page.get_textpage()`` and serves all
+output formats from it; ``PageTextCache`` holds them per open document.
+
+The text page is built without ``TEXT_PRESERVE_IMAGES``: image blocks are
+not decoded, which no text consumer here needs.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from ..core.lazy_imports import is_available, lazy_import
+
+fitz = lazy_import("fitz")  # PyMuPDF
+FITZ_AVAILABLE = is_available("fitz")
+
+# Pages kept by a PageTextCache (text pages of large CAD sheets are big)
+DEFAULT_CACHE_PAGES = 8
+
+
+class PageText:
+    """
+    All text output formats of one page, built from one text page.
+
+    Outputs are computed on first use and kept, so repeated reads of the
+    same format are free as well.
+
+    Args:
+        page: PyMuPDF page
+        flags: Text extraction flags for the shared text page
+    """
+
+    def __init__(self, page: "fitz.Page", flags: Optional[int] = None):
+        self.page = page
+        # Default: ligatures, whitespace, mediabox clip - no images
+        self.flags = fitz.TEXTFLAGS_TEXT if flags is None else flags
+        self._textpage = None
+        self._outputs: Dict[str, Any] = {}
+
+    @classmethod
+    def of(cls, page: Union["fitz.Page", "PageText"]) -> "PageText":
+        """Wrap a page, or return an existing PageText unchanged."""
+        return page if isinstance(page, PageText) else cls(page)
+
+    @property
+    def textpage(self) -> "fitz.TextPage":
+        if self._textpage is None:
+            self._textpage = self.page.get_textpage(flags=self.flags)
+        return self._textpage
+
+    def _get(self, option: str) -> Any:
+        if option not in self._outputs:
+            self._outputs[option] = self.page.get_text(option, textpage=self.textpage)
+        return self._outputs[option]
+
+    def text(self) -> str:
+        """Plain text, as ``page.get_text()``."""
+        return self._get("text")
+
+    def lines(self) -> List[str]:
+        """Plain text split into lines."""
+        return self.text().split("\n")
+
+    def dict(self) -> Dict[str, Any]:
+        """Block / line / span structure, as ``page.get_text("dict")``."""
+        return self._get("dict")
+
+    def blocks(self) -> List[Tuple]:
+        """Text blocks (x0, y0, x1, y1, text, block_no, type)."""
+        return self._get("blocks")
+
+    def words(self) -> List[Tuple]:
+        """Words (x0, y0, x1, y1, text, block_no, line_no, word_no)."""
+        return self._get("words")
+
+    def release_textpage(self) -> None:
+        """
+        Release the text page but keep the outputs computed so far.
+
+        Use after reading the needed formats to hand them to code running
+        on another thread (PyMuPDF objects must stay on their thread).
+        """
+        self._textpage = None
+
+    def close(self) -> None:
+        """Release the text page and cached outputs."""
+        self._textpage = None
+        self._outputs.clear()
+
+
+class PageTextCache:
+    """
+    PageText handles of one open document, least recently used first out.
+
+    Args:
+        doc: Open PyMuPDF document (must outlive the cache)
+        max_pages: Number of pages whose text is kept
+    """
+
+    def __init__(self, doc: "fitz.Document", max_pages: int = DEFAULT_CACHE_PAGES):
+        self.doc = doc
+        self.max_pages = max_pages
+        self._pages: "OrderedDict[int, PageText]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def get(self, page_idx: int) -> PageText:
+        """PageText for a page (0-indexed)."""
+        cached = self._pages.get(page_idx)
+        if cached is not None:
+            self._pages.move_to_end(page_idx)
+            return cached
+
+        cached = PageText(self.doc[page_idx])
+        self._pages[page_idx] = cached
+        while len(self._pages) > self.max_pages:
+            _, evicted = self._pages.popitem(last=False)
+            evicted.close()
+        return cached
+
+    def discard(self, page_idx: int) -> None:
+        """Drop one page (e.g. once all extractors are done with it)."""
+        cached = self._pages.pop(page_idx, None)
+        if cached is not None:
+            cached.close()
+
+    def clear(self) -> None:
+        for cached in self._pages.values():
+            cached.close()
+        self._pages.clear()
+
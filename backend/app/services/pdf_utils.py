@@ -5,10 +5,17 @@ Provides helpers for loading and inspecting PDF files.
 """
 
 import os
+import threading
 from pathlib import Path
 from typing import Optional
 
-import pdfplumber
+from ..core.lazy_imports import lazy_import
+
+pdfplumber = lazy_import("pdfplumber")
+
+# PyMuPDF is not thread-safe: threads that open, read or render PDFs
+# concurrently must hold this lock around every fitz call.
+PDF_LOCK = threading.RLock()
 
 
 def validate_pdf_path(path: str | Path) -> Path:
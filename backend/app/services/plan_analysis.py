@@ -0,0 +1,498 @@
+"""
+Plan Set Analysis
+
+Runs the full per-page takeoff of a plan set in one pass instead of one
+HTTP call (and one upload, parse and render) per trade. Each page becomes a
+small task graph:
+
+    parse -> scale
+          -> rooms            (NRF text extraction)
+          -> render -> detect (YOLO doors / windows / fixtures)
+                    -> walls  (wall mask, needs scale for m²)
+
+and the results of all pages are aggregated per trade. The graph
+runs on a shared thread pool (see ``task_graph``): pages are finished in
+order, rendered images are deleted as soon as detection and the wall mask
+are done with them, and renders only start within the memory budget.
+
+PyMuPDF is not thread-safe, so all tasks share one open document and every
+PyMuPDF call (parse, render) holds one lock; YOLO and OpenCV release the
+GIL and overlap with them.
+"""
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from ..core.config import Settings, get_settings
+from ..core.lazy_imports import lazy_import
+from .cv_pipeline import (
+    CV2_AVAILABLE,
+    DetectionResult,
+    ObjectType,
+    is_yolo_available,
+    run_object_detection_on_page,
+)
+from .page_text import PageText
+from .pdf_utils import PDF_LOCK
+from .plan_ingestion import PDF_POINTS_PER_INCH, DEFAULT_RENDER_DPI, PageInfo, load_plan_document
+from .room_area_extraction import RoomAreaPage, extract_page_room_areas
+from .scale_calibration import ScaleContext, scale_context_from_text
+from .task_graph import GraphResult, Task, TaskGraph
+
+fitz = lazy_import("fitz")  # PyMuPDF
+
+logger = logging.getLogger(__name__)
+
+# Wall stroke widths / lengths of extract_wall_mask are tuned for 400 DPI
+WALL_MASK_REFERENCE_DPI = 400
+
+# Estimated peak bytes per rendered pixel while a task holds the image
+RENDER_BYTES_PER_PIXEL = 4   # RGB pixmap + PNG encoding
+DETECT_BYTES_PER_PIXEL = 6   # Decoded image + model input
+WALLS_BYTES_PER_PIXEL = 16   # Gray, binary, float distance map, labels
+
+# Stage order within a page (priority tiebreak)
+_STAGES = ("parse", "scale", "rooms", "render", "detect", "walls")
+
+# Analysis type -> object types detected with YOLO
+DETECTION_TYPES = {
+    "doors": [ObjectType.DOOR],
+    "windows": [ObjectType.WINDOW],
+    "fixtures": [ObjectType.FIXTURE],
+}
+
+
+# =============================================================================
+# Data Models
+# =============================================================================
+
+@dataclass
+class ParsedPage:
+    """Page geometry and text, read once and shared by the page's tasks."""
+    page_number: int
+    page_info: PageInfo
+    text: PageText
+
+
+@dataclass
+class WallMaskStats:
+    """Wall mask summary of one page."""
+    page_number: int
+    wall_pixels: int
+    coverage_pct: float
+    wall_area_m2: Optional[float] = None  # Plan footprint, needs a scale
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "page_number": self.page_number,
+            "wall_pixels": self.wall_pixels,
+            "coverage_pct": round(self.coverage_pct, 2),
+            "wall_area_m2": round(self.wall_area_m2, 2) if self.wall_area_m2 is not None else None,
+        }
+
+
+@dataclass
+class PageAnalysis:
+    """All results of one page."""
+    page_number: int
+    scale: Optional[ScaleContext] = None
+    rooms: Optional[RoomAreaPage] = None
+    detections: Optional[DetectionResult] = None
+    walls: Optional[WallMaskStats] = None
+    warnings: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "page_number": self.page_number,
+            "scale": self.scale.to_dict() if self.scale else None,
+            "rooms": self.rooms.to_dict() if self.rooms else None,
+            "object_counts": self.detections.object_counts if self.detections else {},
+            "walls": self.walls.to_dict() if self.walls else None,
+            "warnings": self.warnings,
+        }
+
+
+@dataclass
+class PlanAnalysisResult:
+    """Consolidated analysis of a plan set."""
+    document_id: str
+    filename: str
+    total_pages: int
+    pages: List[PageAnalysis]
+    trades: Dict[str, Any]
+    scale: Optional[ScaleContext] = None
+    status: str = "completed"  # "completed" | "partial"
+    processing_time_ms: int = 0
+    task_timings_ms: Dict[str, int] = field(default_factory=dict)
+    warnings: List[str] = field(default_factory=list)
+
+    @property
+    def objects(self) -> List[Any]:
+        """All detected objects, in page order."""
+        return [obj for page in self.pages if page.detections for obj in page.detections.objects]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "document_id": self.document_id,
+            "filename": self.filename,
+            "status": self.status,
+            "total_pages": self.total_pages,
+            "scale": self.scale.to_dict() if self.scale else None,
+            "pages": [p.to_dict() for p in self.pages],
+            "trades": self.trades,
+            "processing_time_ms": self.processing_time_ms,
+            "warnings": self.warnings,
+        }
+
+
+# =============================================================================
+# Page Tasks
+# =============================================================================
+
+def _parse_page(doc: "fitz.Document", page_info: PageInfo) -> ParsedPage:
+    with PDF_LOCK:
+        page = doc[page_info.page_number - 1]
+        text = PageText(page)
+        text.text()
+        text.dict()
+        text.release_textpage()
+    return ParsedPage(page_info.page_number, page_info, text)
+
+
+def _detect_scale(parsed: ParsedPage, document_id: str) -> ScaleContext:
+    return scale_context_from_text(
+        parsed.text.text(), parsed.page_number, parsed.page_info, document_id
+    )
+
+
+def _extract_rooms(parsed: ParsedPage, balcony_factor: float) -> RoomAreaPage:
+    return extract_page_room_areas(
+        parsed.text, parsed.page_number - 1, default_balcony_factor=balcony_factor
+    )
+
+
+def _render_page(doc: "fitz.Document", parsed: ParsedPage, work_dir: str) -> str:
+    zoom = parsed.page_info.dpi / PDF_POINTS_PER_INCH
+    path = os.path.join(work_dir, f"page_{parsed.page_number}.png")
+    with PDF_LOCK:
+        page = doc[parsed.page_number - 1]
+        page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False).save(path)
+    return path
+
+
+def _remove_file(path: str) -> None:
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def _detect_objects(
+    image_path: str,
+    page_number: int,
+    document_id: str,
+    object_types: List[ObjectType],
+    confidence_threshold: float,
+) -> DetectionResult:
+    return run_object_detection_on_page(
+        image_path=image_path,
+        document_id=document_id,
+        page_number=page_number,
+        object_types=object_types,
+        confidence_threshold=confidence_threshold,
+    )
+
+
+def _measure_walls(image_path: str, scale: ScaleContext, page_number: int, dpi: int) -> WallMaskStats:
+    from .wall_opening_detector import extract_wall_mask
+
+    factor = dpi / WALL_MASK_REFERENCE_DPI
+    _, info = extract_wall_mask(
+        image_path,
+        wall_thickness_range=(max(2, round(8 * factor)), max(3, round(40 * factor))),
+        min_wall_length=max(10, round(100 * factor)),
+    )
+
+    wall_area_m2 = None
+    if scale.pixels_per_meter:
+        wall_area_m2 = info["wall_pixels"] / scale.pixels_per_meter ** 2
+
+    return WallMaskStats(
+        page_number=page_number,
+        wall_pixels=info["wall_pixels"],
+        coverage_pct=info["coverage_pct"],
+        wall_area_m2=wall_area_m2,
+    )
+
+
+# =============================================================================
+# Trade Aggregation
+# =============================================================================
+
+def aggregate_trades(pages: List[PageAnalysis]) -> Dict[str, Any]:
+    """
+    Sum the per-page results into trade totals.
+
+    Room ids are numbered across pages (room_001, ...) in page order, as in
+    ``extract_room_areas``.
+    """
+    trades: Dict[str, Any] = {}
+
+    room_pages = [p for p in pages if p.rooms is not None]
+    if room_pages:
+        rooms = [room for p in room_pages for room in p.rooms.rooms]
+        for number, room in enumerate(rooms, start=1):
+            room.room_id = f"room_{number:03d}"
+        trades["flooring"] = {
+            "room_count": len(rooms),
+            "total_area_m2": round(sum(r.area_m2 for r in rooms), 2),
+            "sum_counted_m2": round(sum(r.counted_m2 for r in rooms), 2),
+            "by_page": {str(p.page_number): p.rooms.counted_m2 for p in room_pages},
+            "rooms": [r.to_dict() for r in rooms],
+        }
+
+    detected_pages = [p for p in pages if p.detections is not None]
+    if detected_pages:
+        for trade, object_type in (("doors", ObjectType.DOOR), ("windows", ObjectType.WINDOW),
+                                   ("fixtures", ObjectType.FIXTURE)):
+            by_page = {
+                str(p.page_number): sum(1 for o in p.detections.objects if o.object_type == object_type)
+                for p in detected_pages
+            }
+            trades[trade] = {"count": sum(by_page.values()), "by_page": by_page}
+
+    wall_pages = [p for p in pages if p.walls is not None]
+    if wall_pages:
+        measured = [p.walls.wall_area_m2 for p in wall_pages if p.walls.wall_area_m2 is not None]
+        trades["walls"] = {
+            "wall_area_m2": round(sum(measured), 2) if measured else None,
+            "pages_without_scale": [p.page_number for p in wall_pages if p.walls.wall_area_m2 is None],
+            "by_page": {str(p.page_number): p.walls.to_dict() for p in wall_pages},
+        }
+
+    return trades
+
+
+def _best_scale(pages: List[PageAnalysis]) -> Optional[ScaleContext]:
+    """Highest-confidence page scale (first page wins ties)."""
+    best = None
+    for page in pages:
+        if page.scale is not None and page.scale.has_scale:
+            if best is None or page.scale.confidence > best.confidence:
+                best = page.scale
+    return best
+
+
+# =============================================================================
+# Orchestration
+# =============================================================================
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_analysis_executor(settings: Optional[Settings] = None) -> ThreadPoolExecutor:
+    """Get or initialize the thread pool shared by all plan analyses."""
+    global _executor
+
+    if settings is None:
+        settings = get_settings()
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.analysis_workers,
+                thread_name_prefix="plan-analysis",
+            )
+    return _executor
+
+
+def build_analysis_graph(
+    doc: "fitz.Document",
+    page_infos: List[PageInfo],
+    document_id: str,
+    work_dir: str,
+    analysis_types: List[str],
+    confidence_threshold: float,
+    balcony_factor: float,
+    detect: bool,
+    walls: bool,
+) -> TaskGraph:
+    """Task graph with the parse, scale, rooms, render, detect and walls tasks of each page."""
+    graph = TaskGraph()
+    object_types = [t for kind in analysis_types for t in DETECTION_TYPES.get(kind, [])]
+
+    for info in page_infos:
+        n = info.page_number
+        pixels = info.width_px * info.height_px
+
+        def key(stage: str) -> str:
+            return f"{stage}:{n}"
+
+        def priority(stage: str):
+            return (n, _STAGES.index(stage))
+
+        graph.add(Task(key("parse"), lambda i=info: _parse_page(doc, i),
+                       priority=priority("parse"), keep=False))
+        graph.add(Task(key("scale"), lambda p: _detect_scale(p, document_id),
+                       deps=(key("parse"),), priority=priority("scale")))
+
+        if "rooms" in analysis_types:
+            graph.add(Task(key("rooms"), lambda p: _extract_rooms(p, balcony_factor),
+                           deps=(key("parse"),), priority=priority("rooms")))
+
+        if (detect and object_types) or walls:
+            graph.add(Task(
+                key("render"), lambda p: _render_page(doc, p, work_dir),
+                deps=(key("parse"),), priority=priority("render"),
+                memory_bytes=pixels * RENDER_BYTES_PER_PIXEL,
+                keep=False, cleanup=_remove_file,
+            ))
+
+        if detect and object_types:
+            graph.add(Task(
+                key("detect"),
+                lambda image, n=n: _detect_objects(image, n, document_id, object_types, confidence_threshold),
+                deps=(key("render"),), priority=priority("detect"),
+                memory_bytes=pixels * DETECT_BYTES_PER_PIXEL,
+            ))
+
+        if walls:
+            graph.add(Task(
+                key("walls"),
+                lambda image, scale, n=n, dpi=info.dpi: _measure_walls(image, scale, n, dpi),
+                deps=(key("render"), key("scale")), priority=priority("walls"),
+                memory_bytes=pixels * WALLS_BYTES_PER_PIXEL,
+            ))
+
+    return graph
+
+
+def analyze_plan_set(
+    file_path: Union[str, Path],
+    pages: Optional[List[int]] = None,
+    analysis_types: Optional[List[str]] = None,
+    confidence_threshold: float = 0.5,
+    balcony_factor: float = 0.5,
+    dpi: int = DEFAULT_RENDER_DPI,
+    document_id: Optional[str] = None,
+    executor: Optional[Executor] = None,
+    settings: Optional[Settings] = None,
+) -> PlanAnalysisResult:
+    """
+    Analyze all (or selected) pages of a plan set in one pass.
+
+    Args:
+        file_path: Path to the PDF
+        pages: Page numbers to analyze (1-indexed, default: all;
+            duplicates are analyzed once)
+        analysis_types: Any of "rooms", "doors", "windows", "fixtures",
+            "walls" (default: all)
+        confidence_threshold: Minimum YOLO detection confidence
+        balcony_factor: Factor for balcony/terrace areas
+        dpi: Render resolution for detection and the wall mask
+        document_id: Id reported in results (generated if not provided)
+        executor: Executor for the page tasks (default: shared pool)
+        settings: Optional Settings instance
+
+    Returns:
+        PlanAnalysisResult with per-page results and trade totals
+
+    Raises:
+        FileNotFoundError: If the PDF does not exist
+        ValueError: If the PDF can't be opened or a page does not exist
+    """
+    start_time = time.time()
+    if settings is None:
+        settings = get_settings()
+    if analysis_types is None:
+        analysis_types = ["rooms", "doors", "windows", "fixtures", "walls"]
+
+    with PDF_LOCK:
+        document = load_plan_document(file_path, file_id=document_id, dpi=dpi)
+
+    if pages is not None:
+        page_numbers = list(dict.fromkeys(pages))
+    else:
+        page_numbers = list(range(1, document.total_pages + 1))
+    invalid = [n for n in page_numbers if document.get_page(n) is None]
+    if invalid:
+        raise ValueError(f"Pages {invalid} do not exist (document has {document.total_pages} pages)")
+
+    warnings: List[str] = []
+    detect = is_yolo_available(settings)
+    if not detect and any(kind in DETECTION_TYPES for kind in analysis_types):
+        warnings.append("YOLO not configured - doors, windows and fixtures were not detected")
+    walls = "walls" in analysis_types and CV2_AVAILABLE
+    if "walls" in analysis_types and not CV2_AVAILABLE:
+        warnings.append("OpenCV not installed - walls were not measured")
+
+    with PDF_LOCK:
+        doc = fitz.open(str(file_path))
+    work_dir = tempfile.mkdtemp(prefix="plan_analysis_")
+    try:
+        graph = build_analysis_graph(
+            doc,
+            [document.get_page(n) for n in page_numbers],
+            document.file_id,
+            work_dir,
+            analysis_types,
+            confidence_threshold,
+            balcony_factor,
+            detect,
+            walls,
+        )
+        outcome = graph.run(
+            executor or get_analysis_executor(settings),
+            max_in_flight=settings.analysis_workers,
+            memory_budget_bytes=settings.analysis_memory_budget_bytes,
+        )
+    finally:
+        with PDF_LOCK:
+            doc.close()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    page_results = _collect_pages(page_numbers, outcome)
+    for key, error in outcome.errors.items():
+        warnings.append(f"{key} failed: {error}")
+    if outcome.skipped:
+        warnings.append(f"Skipped after failures: {', '.join(sorted(outcome.skipped))}")
+
+    trades = aggregate_trades(page_results)
+
+    return PlanAnalysisResult(
+        document_id=document.file_id,
+        filename=document.filename,
+        total_pages=document.total_pages,
+        pages=page_results,
+        trades=trades,
+        scale=_best_scale(page_results),
+        status="completed" if outcome.ok else "partial",
+        processing_time_ms=int((time.time() - start_time) * 1000),
+        task_timings_ms=outcome.timings_ms,
+        warnings=warnings,
+    )
+
+
+def _collect_pages(page_numbers: List[int], outcome: GraphResult) -> List[PageAnalysis]:
+    pages = []
+    for n in page_numbers:
+        page = PageAnalysis(
+            page_number=n,
+            scale=outcome.results.get(f"scale:{n}"),
+            rooms=outcome.results.get(f"rooms:{n}"),
+            detections=outcome.results.get(f"detect:{n}"),
+            walls=outcome.results.get(f"walls:{n}"),
+        )
+        if page.rooms is not None:
+            page.warnings.extend(page.rooms.warnings)
+        if page.detections is not None:
+            page.warnings.extend(page.detections.warnings)
+        pages.append(page)
+    return pages
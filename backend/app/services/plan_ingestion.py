@@ -14,8 +14,10 @@ import uuid
 import tempfile
 import io
 
-import fitz  # PyMuPDF
-from PIL import Image
+from ..core.lazy_imports import lazy_import
+
+fitz = lazy_import("fitz")  # PyMuPDF
+Image = lazy_import("PIL.Image")
 
 
 # Constants
@@ -205,7 +207,7 @@ def render_page_to_image(
     file_path: Union[str, Path],
     page_number: int,
     dpi: int = DEFAULT_RENDER_DPI,
-) -> Image.Image:
+) -> "Image.Image":
     """
     Render a single PDF page to a PIL Image.
 
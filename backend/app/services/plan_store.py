@@ -0,0 +1,533 @@
+"""
+Content-Addressed Plan Store
+
+Keeps one local copy of every uploaded plan, keyed by the SHA-256 digest of
+its bytes. The digest is the plan's ``file_id``: clients upload a plan once
+and pass the ``file_id`` to later calls instead of sending the same 50 MB
+file again, and identical re-uploads are stored only once.
+
+Features:
+- Uploads are hashed (and optionally validated) while they are streamed to
+  disk (one pass, no second read)
+- Reference counting: plans in use by a request are never evicted
+- TTL expiry since last use, LRU size eviction of unused plans
+- Index and pins in a SQLite database in the store directory, shared by
+  all worker processes and kept across restarts (pins of exited processes
+  are dropped, also when their PID was reused)
+
+Layout: ``<directory>/<id[:2]>/<id><suffix>`` plus ``<directory>/index.sqlite3``.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, ContextManager, Dict, Iterator, Optional, Tuple, Union
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+
+from ..core.config import Settings, get_settings
+from .sqlite_utils import sqlite_connection
+
+if TYPE_CHECKING:
+    from .upload_validation import PlanUploadValidator
+
+logger = logging.getLogger(__name__)
+
+
+# Upload copy chunk size
+CHUNK_BYTES = 1024 * 1024
+
+_FILE_ID_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+def is_file_id(value: str) -> bool:
+    """Check whether a string has the form of a plan store file_id."""
+    return bool(_FILE_ID_RE.match(value or ""))
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process exists (pins of dead processes are dropped)."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _process_identity(pid: int) -> Optional[str]:
+    """
+    Identity of a running process that a later process reusing its PID
+    does not share: boot id and start time from ``/proc``.
+
+    Returns None if the process does not exist or ``/proc`` is unavailable
+    (pins then fall back to the PID alone).
+    """
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            stat = f.read()
+        with open("/proc/sys/kernel/random/boot_id") as f:
+            boot_id = f.read().strip()
+    except OSError:
+        return None
+    # Fields after the command name (which may contain spaces); start time is field 22
+    start_time = stat.rsplit(")", 1)[1].split()[19]
+    return f"{boot_id}:{start_time}"
+
+
+def _pin_owner_alive(pid: int, process: Optional[str]) -> bool:
+    """Check whether the process that recorded a pin is still running."""
+    if not _pid_alive(pid):
+        return False
+    if process is None:
+        return True
+    current = _process_identity(pid)
+    return current is None or current == process
+
+
+# =============================================================================
+# Data Models
+# =============================================================================
+
+@dataclass
+class StoredPlan:
+    """
+    A plan held in the store.
+
+    Attributes:
+        file_id: SHA-256 hex digest of the file's bytes
+        filename: Name of the first upload of these bytes
+        path: Local path of the stored file
+        size_bytes: File size
+        created_at: First upload time (epoch seconds)
+        accessed_at: Last upload or use
+        uploads: Number of times these bytes were uploaded
+        refs: Requests currently using the file (in all processes)
+    """
+
+    file_id: str
+    filename: str
+    path: Path
+    size_bytes: int
+    created_at: float
+    accessed_at: float
+    uploads: int = 1
+    refs: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for API response."""
+        return {
+            "file_id": self.file_id,
+            "filename": self.filename,
+            "size_bytes": self.size_bytes,
+            "created_at": self.created_at,
+            "accessed_at": self.accessed_at,
+            "uploads": self.uploads,
+            "refs": self.refs,
+        }
+
+
+@dataclass
+class PlanStoreStats:
+    """Counters describing store usage."""
+
+    uploads: int = 0
+    deduplicated: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+    in_use: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for API response."""
+        return {
+            "uploads": self.uploads,
+            "deduplicated": self.deduplicated,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "entries": self.entries,
+            "size_bytes": self.size_bytes,
+            "in_use": self.in_use,
+        }
+
+
+# =============================================================================
+# Plan Store
+# =============================================================================
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS plans (
+    file_id TEXT PRIMARY KEY,
+    filename TEXT NOT NULL,
+    suffix TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    uploads INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS plans_accessed ON plans (accessed_at);
+CREATE TABLE IF NOT EXISTS pins (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    file_id TEXT NOT NULL,
+    pid INTEGER NOT NULL,
+    process TEXT,
+    pinned_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pins_file ON pins (file_id);
+"""
+
+
+class PlanStore:
+    """
+    Local content-addressed store for uploaded plans.
+
+    ``put`` streams an upload into the store and returns its entry;
+    ``acquire``/``release`` (or the ``use`` context manager) pin a plan
+    while a request reads it, so eviction never deletes a file in use.
+
+    The index and the pins live in a SQLite database, so every worker
+    process sees the plans uploaded through the others, and a plan pinned
+    by one worker is not evicted by another. Pins record the owning
+    process (PID and start time, so a crashed worker's PID reused by a new
+    process is told apart); pins of processes that no longer exist are
+    dropped.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        ttl_seconds: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        self.directory = Path(directory)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.db_path = self.directory / "index.sqlite3"
+
+        # Counters of this process; sizes and entries come from the index
+        self._stats = PlanStoreStats()
+        self._stats_lock = threading.Lock()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self._connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+        with self._connection(immediate=True) as conn:
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(pins)")}
+            if "process" not in columns:
+                # Pins of older versions carry only a PID, which can't be
+                # told apart from a reused one; their processes are gone
+                conn.execute("ALTER TABLE pins ADD COLUMN process TEXT")
+                conn.execute("DELETE FROM pins")
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _connection(self, immediate: bool = False) -> ContextManager[sqlite3.Connection]:
+        """
+        Open a connection (autocommit), closed on exit.
+
+        With ``immediate`` the block runs in one write transaction, so
+        processes never evict or pin the same plan concurrently.
+        """
+        return sqlite_connection(self.db_path, immediate)
+
+    def _count(self, name: str, n: int = 1) -> None:
+        with self._stats_lock:
+            setattr(self._stats, name, getattr(self._stats, name) + n)
+
+    def _plan_path(self, file_id: str, suffix: str) -> Path:
+        return self.directory / file_id[:2] / (file_id + suffix)
+
+    def _plan(self, conn: sqlite3.Connection, row: sqlite3.Row) -> StoredPlan:
+        refs = conn.execute("SELECT COUNT(*) FROM pins WHERE file_id = ?", (row["file_id"],)).fetchone()[0]
+        return StoredPlan(
+            file_id=row["file_id"],
+            filename=row["filename"],
+            path=self._plan_path(row["file_id"], row["suffix"]),
+            size_bytes=row["size_bytes"],
+            created_at=row["created_at"],
+            accessed_at=row["accessed_at"],
+            uploads=row["uploads"],
+            refs=refs,
+        )
+
+    def _is_expired(self, plan: StoredPlan, now: float) -> bool:
+        return (
+            self.ttl_seconds is not None
+            and plan.refs == 0
+            and now - plan.accessed_at > self.ttl_seconds
+        )
+
+    def _prune_pins(self, conn: sqlite3.Connection) -> None:
+        """Drop pins held by processes that exited without releasing them."""
+        owners = conn.execute("SELECT DISTINCT pid, process FROM pins").fetchall()
+        for pid, process in owners:
+            if not _pin_owner_alive(pid, process):
+                conn.execute("DELETE FROM pins WHERE pid = ? AND process IS ?", (pid, process))
+
+    def _remove(self, conn: sqlite3.Connection, file_id: str, suffix: str) -> None:
+        conn.execute("DELETE FROM plans WHERE file_id = ?", (file_id,))
+        conn.execute("DELETE FROM pins WHERE file_id = ?", (file_id,))
+        try:
+            self._plan_path(file_id, suffix).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to remove stored plan {file_id}: {e}")
+
+    def _lookup(self, conn: sqlite3.Connection, file_id: str) -> Optional[StoredPlan]:
+        """Index entry of a plan; drops entries that expired or lost their file."""
+        row = conn.execute("SELECT * FROM plans WHERE file_id = ?", (file_id,)).fetchone()
+        if row is None:
+            return None
+        plan = self._plan(conn, row)
+        if not plan.path.exists():
+            conn.execute("DELETE FROM plans WHERE file_id = ?", (file_id,))
+            return None
+        if self._is_expired(plan, time.time()):
+            self._remove(conn, file_id, row["suffix"])
+            self._count("expirations")
+            return None
+        return plan
+
+    def _evict(self, conn: sqlite3.Connection, keep: Optional[str] = None, limit_size: bool = True) -> None:
+        """Expire idle plans, then evict least recently used until within size."""
+        self._prune_pins(conn)
+        pinned = {row[0] for row in conn.execute("SELECT DISTINCT file_id FROM pins")}
+        if keep is not None:
+            pinned.add(keep)
+
+        now = time.time()
+        rows = conn.execute(
+            "SELECT file_id, suffix, size_bytes, accessed_at FROM plans ORDER BY accessed_at"
+        ).fetchall()
+        size = sum(row["size_bytes"] for row in rows)
+        for row in rows:
+            if row["file_id"] in pinned:
+                continue
+            if self.ttl_seconds is not None and now - row["accessed_at"] > self.ttl_seconds:
+                self._count("expirations")
+            elif limit_size and self.max_bytes is not None and size > self.max_bytes:
+                self._count("evictions")
+            else:
+                continue
+            self._remove(conn, row["file_id"], row["suffix"])
+            size -= row["size_bytes"]
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def put(
+        self,
+        fileobj: BinaryIO,
+        filename: str,
+        validator: Optional["PlanUploadValidator"] = None,
+    ) -> Tuple[StoredPlan, bool]:
+        """
+        Stream a file into the store.
+
+        The bytes are hashed while they are written; if a plan with the same
+        digest is already stored, the new copy is discarded.
+
+        Args:
+            fileobj: Readable binary file (e.g. ``UploadFile.file``)
+            filename: Original file name (its suffix is kept)
+            validator: Checks every chunk and the complete file before it is
+                stored; its ``UploadRejected`` stops the copy early
+
+        Returns:
+            Tuple of (stored plan, whether it was already stored)
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        size = 0
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".upload")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in iter(lambda: fileobj.read(CHUNK_BYTES), b""):
+                    if validator is not None:
+                        validator.feed(chunk)
+                    digest.update(chunk)
+                    f.write(chunk)
+                    size += len(chunk)
+
+            if validator is not None:
+                validator.finish(Path(tmp_path))
+
+            file_id = digest.hexdigest()
+            now = time.time()
+            with self._connection(immediate=True) as conn:
+                self._count("uploads")
+                plan = self._lookup(conn, file_id)
+                if plan is not None:
+                    conn.execute(
+                        "UPDATE plans SET uploads = uploads + 1, accessed_at = ? WHERE file_id = ?",
+                        (now, file_id),
+                    )
+                    self._count("deduplicated")
+                    plan.uploads += 1
+                    plan.accessed_at = now
+                    return plan, True
+
+                suffix = Path(filename).suffix.lower()
+                path = self._plan_path(file_id, suffix)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(tmp_path, path)
+                conn.execute(
+                    "INSERT OR REPLACE INTO plans "
+                    "(file_id, filename, suffix, size_bytes, created_at, accessed_at, uploads) "
+                    "VALUES (?, ?, ?, ?, ?, ?, 1)",
+                    (file_id, filename, suffix, size, now, now),
+                )
+                # A store over its limit keeps the new plan
+                self._evict(conn, keep=file_id)
+                return StoredPlan(
+                    file_id=file_id,
+                    filename=filename,
+                    path=path,
+                    size_bytes=size,
+                    created_at=now,
+                    accessed_at=now,
+                ), False
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def get(self, file_id: str) -> Optional[StoredPlan]:
+        """Look up a plan (None if unknown or expired)."""
+        if not is_file_id(file_id):
+            return None
+        with self._connection(immediate=True) as conn:
+            return self._lookup(conn, file_id)
+
+    def acquire(self, file_id: str) -> Optional[StoredPlan]:
+        """
+        Pin a plan for use; it is not evicted (by any process) until ``release``.
+
+        Returns None if the plan is unknown or expired.
+        """
+        if not is_file_id(file_id):
+            return None
+        with self._connection(immediate=True) as conn:
+            plan = self._lookup(conn, file_id)
+            if plan is None:
+                return None
+            now = time.time()
+            pid = os.getpid()
+            conn.execute(
+                "INSERT INTO pins (file_id, pid, process, pinned_at) VALUES (?, ?, ?, ?)",
+                (file_id, pid, _process_identity(pid), now),
+            )
+            conn.execute("UPDATE plans SET accessed_at = ? WHERE file_id = ?", (now, file_id))
+            plan.refs += 1
+            plan.accessed_at = now
+            return plan
+
+    def release(self, file_id: str) -> None:
+        """Unpin a plan acquired with ``acquire``."""
+        with self._connection(immediate=True) as conn:
+            pid = os.getpid()
+            released = conn.execute(
+                "DELETE FROM pins WHERE id = "
+                "(SELECT id FROM pins WHERE file_id = ? AND pid = ? AND process IS ? LIMIT 1)",
+                (file_id, pid, _process_identity(pid)),
+            ).rowcount
+            if not released:
+                return
+            conn.execute("UPDATE plans SET accessed_at = ? WHERE file_id = ?", (time.time(), file_id))
+            if conn.execute("SELECT 1 FROM pins WHERE file_id = ?", (file_id,)).fetchone() is None:
+                self._evict(conn)
+
+    @contextmanager
+    def use(self, file_id: str) -> Iterator[Optional[StoredPlan]]:
+        """Context manager form of ``acquire``/``release``."""
+        plan = self.acquire(file_id)
+        try:
+            yield plan
+        finally:
+            if plan is not None:
+                self.release(file_id)
+
+    def delete(self, file_id: str) -> bool:
+        """
+        Remove a plan.
+
+        Returns:
+            False if the plan is unknown
+
+        Raises:
+            RuntimeError: If the plan is in use
+        """
+        if not is_file_id(file_id):
+            return False
+        with self._connection(immediate=True) as conn:
+            self._prune_pins(conn)
+            row = conn.execute("SELECT suffix FROM plans WHERE file_id = ?", (file_id,)).fetchone()
+            if row is None:
+                return False
+            if conn.execute("SELECT 1 FROM pins WHERE file_id = ?", (file_id,)).fetchone() is not None:
+                raise RuntimeError(f"Plan {file_id} is in use")
+            self._remove(conn, file_id, row["suffix"])
+            return True
+
+    def purge_expired(self) -> int:
+        """Remove all expired, unused plans. Returns the number removed."""
+        before = self._stats.expirations
+        with self._connection(immediate=True) as conn:
+            self._evict(conn, limit_size=False)
+        return self._stats.expirations - before
+
+    @property
+    def stats(self) -> PlanStoreStats:
+        """Snapshot of the store counters and current size."""
+        with self._connection() as conn:
+            entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM plans").fetchone()
+            in_use = conn.execute("SELECT COUNT(DISTINCT file_id) FROM pins").fetchone()[0]
+        with self._stats_lock:
+            return PlanStoreStats(
+                uploads=self._stats.uploads,
+                deduplicated=self._stats.deduplicated,
+                evictions=self._stats.evictions,
+                expirations=self._stats.expirations,
+                entries=entries,
+                size_bytes=size,
+                in_use=in_use,
+            )
+
+
+# =============================================================================
+# Global Store
+# =============================================================================
+
+_plan_store: Optional[PlanStore] = None
+_plan_store_lock = threading.Lock()
+
+
+def get_plan_store(settings: Optional[Settings] = None) -> PlanStore:
+    """Get or initialize the plan store for the configured directory."""
+    global _plan_store
+
+    if settings is None:
+        settings = get_settings()
+
+    store_dir = Path(settings.plan_store_dir)
+    with _plan_store_lock:
+        if _plan_store is None or _plan_store.directory != store_dir:
+            _plan_store = PlanStore(
+                directory=store_dir,
+                ttl_seconds=settings.plan_store_ttl_seconds,
+                max_bytes=settings.plan_store_max_bytes,
+            )
+    return _plan_store
@@ -0,0 +1,165 @@
+"""
+Batched Polygon Metrics
+
+Vectorized area, perimeter, centroid and bounding box computation for many
+polygons at once. Used for segmentation responses that carry hundreds of
+room masks with thousands of vertices each.
+
+Polygons are stored as a ragged array:
+- vertices: flat (N, 2) buffer of all vertices, polygon after polygon
+- offsets:  (P + 1,) start index of each polygon, offsets[-1] == N
+
+Every polygon is implicitly closed (last vertex connects to the first).
+All results are in the input coordinate units - no scale conversion.
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, List, Sequence, Tuple
+
+from ..core.lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+
+
+@dataclass
+class PolygonBatch:
+    """Ragged array of polygons (flat vertex buffer plus offsets)."""
+
+    vertices: "np.ndarray"  # (N, 2) float64
+    offsets: "np.ndarray"  # (P + 1,) int64
+
+    @classmethod
+    def from_polygons(cls, polygons: Iterable[Sequence[Tuple[float, float]]]) -> "PolygonBatch":
+        """Build a batch from a sequence of (x, y) point lists."""
+        counts: List[int] = []
+        flat: List[Tuple[float, float]] = []
+        for points in polygons:
+            counts.append(len(points))
+            flat.extend(points)
+
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        if counts:
+            np.cumsum(counts, out=offsets[1:])
+
+        vertices = np.asarray(flat, dtype=np.float64).reshape(-1, 2)
+        return cls(vertices=vertices, offsets=offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def counts(self) -> "np.ndarray":
+        """Number of vertices in each polygon."""
+        return np.diff(self.offsets)
+
+    def polygon_ids(self) -> "np.ndarray":
+        """Polygon index of every vertex in the flat buffer."""
+        return np.repeat(np.arange(len(self)), self.counts)
+
+    def next_indices(self) -> "np.ndarray":
+        """Index of the following vertex, wrapping within each polygon."""
+        n = len(self.vertices)
+        nxt = np.arange(1, n + 1, dtype=np.int64)
+        counts = self.counts
+        nonempty = counts > 0
+        last = self.offsets[1:][nonempty] - 1
+        nxt[last] = self.offsets[:-1][nonempty]
+        return nxt
+
+
+@dataclass
+class PolygonMetrics:
+    """Per-polygon metrics, one array entry per polygon in the batch."""
+
+    area: "np.ndarray"  # Absolute area
+    signed_area: "np.ndarray"  # Positive for counter-clockwise in y-up coordinates
+    perimeter: "np.ndarray"
+    centroid: "np.ndarray"  # (P, 2)
+    bbox_min: "np.ndarray"  # (P, 2) min x, min y
+    bbox_max: "np.ndarray"  # (P, 2) max x, max y
+
+    def bbox_dict(self, index: int) -> dict:
+        """Bounding box of one polygon as {x, y, width, height}."""
+        x0, y0 = self.bbox_min[index]
+        x1, y1 = self.bbox_max[index]
+        return {
+            "x": float(x0),
+            "y": float(y0),
+            "width": float(x1 - x0),
+            "height": float(y1 - y0),
+        }
+
+
+def compute_polygon_metrics(batch: PolygonBatch) -> PolygonMetrics:
+    """
+    Compute area, perimeter, centroid and bbox for every polygon.
+
+    Area uses the Shoelace formula, perimeter sums edge lengths including
+    the closing edge. Polygons with fewer than 3 vertices have zero area;
+    polygons with fewer than 2 vertices have zero perimeter. Degenerate
+    (zero-area) polygons use the vertex mean as centroid. Empty polygons
+    get NaN centroid and bbox.
+    """
+    p = len(batch)
+    v = batch.vertices
+    counts = batch.counts
+
+    if p == 0:
+        empty = np.zeros(0, dtype=np.float64)
+        empty2 = np.zeros((0, 2), dtype=np.float64)
+        return PolygonMetrics(empty, empty, empty, empty2, empty2, empty2)
+
+    ids = batch.polygon_ids()
+    nxt = batch.next_indices()
+
+    x, y = v[:, 0], v[:, 1]
+    xn, yn = x[nxt], y[nxt]
+
+    # Shoelace terms
+    cross = x * yn - xn * y
+    signed_area = np.bincount(ids, weights=cross, minlength=p) / 2.0
+    signed_area[counts < 3] = 0.0
+
+    # Edge lengths (a polygon with a single vertex has a zero-length edge)
+    edges = np.hypot(xn - x, yn - y)
+    perimeter = np.bincount(ids, weights=edges, minlength=p)
+
+    # Centroid of polygon area, falling back to vertex mean when degenerate
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cx_area = np.bincount(ids, weights=(x + xn) * cross, minlength=p) / (6.0 * signed_area)
+        cy_area = np.bincount(ids, weights=(y + yn) * cross, minlength=p) / (6.0 * signed_area)
+        cx_mean = np.bincount(ids, weights=x, minlength=p) / counts
+        cy_mean = np.bincount(ids, weights=y, minlength=p) / counts
+    degenerate = np.isclose(signed_area, 0.0)
+    centroid = np.column_stack([
+        np.where(degenerate, cx_mean, cx_area),
+        np.where(degenerate, cy_mean, cy_area),
+    ])
+
+    # Bounding boxes (reduceat is only defined for non-empty segments)
+    bbox_min = np.full((p, 2), np.nan)
+    bbox_max = np.full((p, 2), np.nan)
+    nonempty = counts > 0
+    if nonempty.any():
+        starts = batch.offsets[:-1][nonempty]
+        bbox_min[nonempty] = np.minimum.reduceat(v, starts, axis=0)
+        bbox_max[nonempty] = np.maximum.reduceat(v, starts, axis=0)
+
+    return PolygonMetrics(
+        area=np.abs(signed_area),
+        signed_area=signed_area,
+        perimeter=perimeter,
+        centroid=centroid,
+        bbox_min=bbox_min,
+        bbox_max=bbox_max,
+    )
+
+
+def polygon_area(points: Sequence[Tuple[float, float]]) -> float:
+    """Absolute Shoelace area of a single polygon."""
+    return float(compute_polygon_metrics(PolygonBatch.from_polygons([points])).area[0])
+
+
+def polygon_perimeter(points: Sequence[Tuple[float, float]]) -> float:
+    """Closed perimeter of a single polygon."""
+    return float(compute_polygon_metrics(PolygonBatch.from_polygons([points])).perimeter[0])
@@ -0,0 +1,318 @@
+"""
+Request Result Cache
+
+Caches the JSON results of idempotent analysis endpoints. These are pure
+functions of the plan bytes and the request parameters, yet the frontend
+calls them again whenever a user switches tabs on the results page.
+
+Keys combine:
+- the endpoint name
+- the plan's content digest (its plan store ``file_id``)
+- the normalized request parameters
+- the code version (digest of the ``app`` package sources) and the models
+  in use, so deploys and model swaps never serve stale results
+
+Tiers:
+- Memory: small LRU of recent results (no disk read or JSON parse)
+- Disk: ``DiskCache`` with TTL and size limits, shared across restarts
+
+Concurrent identical requests are coalesced: the first computes, the others
+wait for its result (single flight).
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, AsyncContextManager, Callable, Dict, Optional, Tuple
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import os
+import threading
+
+from ..core.config import Settings, get_settings
+from .disk_cache import DiskCache, make_cache_key
+
+logger = logging.getLogger(__name__)
+
+
+# Bump when the shape of cached values changes
+RESULT_CACHE_SCHEMA = 1
+
+_APP_DIR = Path(__file__).resolve().parent.parent
+
+
+@functools.lru_cache(maxsize=1)
+def code_version() -> str:
+    """Digest of the application sources (changes with every deploy)."""
+    digest = hashlib.sha256()
+    for path in sorted(_APP_DIR.rglob("*.py")):
+        digest.update(str(path.relative_to(_APP_DIR)).encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def model_versions(settings: Settings) -> Dict[str, Any]:
+    """Models and feature flags that change analysis results."""
+    yolo_weights = None
+    if settings.yolo_enabled and os.path.exists(settings.yolo_model_path):
+        stat = os.stat(settings.yolo_model_path)
+        yolo_weights = f"{settings.yolo_model_path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    return {
+        "yolo": yolo_weights,
+        "yolo_version": settings.yolo_model_version,
+        "roboflow": settings.roboflow_enabled,
+        "roboflow_rooms": settings.roboflow_room_segmentation_model,
+        "roboflow_doors": settings.roboflow_door_detection_model,
+    }
+
+
+@dataclass
+class ResultCacheStats:
+    """Counters describing result cache effectiveness."""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    not_modified: int = 0
+    stores: int = 0
+    memory_entries: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served without computing."""
+        hits = self.memory_hits + self.disk_hits + self.coalesced
+        lookups = hits + self.misses
+        return hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for API response."""
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "not_modified": self.not_modified,
+            "stores": self.stores,
+            "memory_entries": self.memory_entries,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class ResultCache:
+    """
+    Two-tier (memory, disk) cache of endpoint results with single flight.
+
+    Values must be JSON-serializable.
+    """
+
+    def __init__(self, disk: Optional[DiskCache] = None, memory_entries: int = 128):
+        self.disk = disk
+        self.memory_entries = memory_entries
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._inflight: Dict[str, "asyncio.Task[Any]"] = {}
+        self._stats = ResultCacheStats()
+
+    @staticmethod
+    def make_key(
+        endpoint: str,
+        file_digest: str,
+        params: Dict[str, Any],
+        version: Optional[str] = None,
+    ) -> str:
+        """
+        Build the cache key (also used as the response ETag).
+
+        Params are normalized by sorting keys, so the order of query
+        parameters does not matter.
+        """
+        normalized = json.dumps(params, sort_keys=True, default=str, separators=(",", ":"))
+        return make_cache_key(RESULT_CACHE_SCHEMA, endpoint, file_digest, normalized, version)
+
+    def _remember(self, key: str, value: Any) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _get_memory(self, key: str) -> Optional[Any]:
+        with self._lock:
+            if key not in self._memory:
+                return None
+            self._memory.move_to_end(key)
+            self._stats.memory_hits += 1
+            return self._memory[key]
+
+    def _get_disk(self, key: str) -> Tuple[Optional[Any], Optional[str]]:
+        value = self.disk.get(key) if self.disk is not None else None
+        with self._lock:
+            if value is not None:
+                self._remember(key, value)
+                self._stats.disk_hits += 1
+                return value, "disk"
+            self._stats.misses += 1
+        return None, None
+
+    def get(self, key: str) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        Look up a result.
+
+        Returns:
+            Tuple of (value, tier) where tier is "memory", "disk" or None on miss
+        """
+        value = self._get_memory(key)
+        if value is not None:
+            return value, "memory"
+        return self._get_disk(key)
+
+    def contains(self, key: str) -> bool:
+        """Check whether a result is cached (reads the disk tier; no counters)."""
+        with self._lock:
+            if key in self._memory:
+                return True
+        return self.disk is not None and self.disk.get(key) is not None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a result in both tiers."""
+        with self._lock:
+            self._remember(key, value)
+            self._stats.stores += 1
+        if self.disk is not None:
+            self.disk.set(key, value)
+
+    async def _compute(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        admit: Optional[Callable[[], AsyncContextManager[Any]]],
+    ) -> Any:
+        if admit is not None:
+            async with admit():
+                value = await asyncio.to_thread(compute)
+        else:
+            value = await asyncio.to_thread(compute)
+        await asyncio.to_thread(self.set, key, value)
+        return value
+
+    def _finished(self, key: str, task: "asyncio.Task[Any]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # Retrieved: no warning when nobody waited
+
+    def _pending(self, key: str) -> Optional["asyncio.Task[Any]"]:
+        task = self._inflight.get(key)
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            return task
+        return None
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        admit: Optional[Callable[[], AsyncContextManager[Any]]] = None,
+    ) -> Tuple[Any, str]:
+        """
+        Return the cached result, or compute it once for all concurrent callers.
+
+        ``compute`` runs in a worker thread, inside ``admit()`` when given
+        (cache hits and coalesced callers never wait for admission). The
+        disk tier is read and written in worker threads as well.
+
+        The computation runs in its own task: a caller that is cancelled
+        (e.g. the client disconnected) stops waiting, but the computation
+        goes on for the other callers and is still cached. Failures are
+        not cached; callers waiting on a failed computation receive the
+        same exception.
+
+        Returns:
+            Tuple of (value, source) where source is "memory", "disk",
+            "coalesced" (waited for a concurrent identical request) or "computed"
+        """
+        value = self._get_memory(key)
+        if value is not None:
+            return value, "memory"
+
+        task = self._pending(key)
+        if task is None:
+            value, tier = await asyncio.to_thread(self._get_disk, key)
+            if tier is not None:
+                return value, tier
+            task = self._pending(key)
+            if task is None:
+                task = asyncio.create_task(self._compute(key, compute, admit))
+                task.add_done_callback(functools.partial(self._finished, key))
+                self._inflight[key] = task
+                return await asyncio.shield(task), "computed"
+            with self._lock:
+                self._stats.misses -= 1  # Counted by the disk lookup
+
+        # Another request is computing this result
+        with self._lock:
+            self._stats.coalesced += 1
+        return await asyncio.shield(task), "coalesced"
+
+    def record_not_modified(self) -> None:
+        """Count a request answered with 304 Not Modified."""
+        with self._lock:
+            self._stats.not_modified += 1
+
+    def clear(self) -> int:
+        """Remove all results and reset counters. Returns entries removed."""
+        with self._lock:
+            removed = len(self._memory)
+            self._memory.clear()
+            self._stats = ResultCacheStats()
+        if self.disk is not None:
+            removed = max(removed, self.disk.clear())
+        return removed
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Counters of both tiers."""
+        with self._lock:
+            stats = replace(self._stats, memory_entries=len(self._memory)).to_dict()
+        stats["disk"] = self.disk.stats.to_dict() if self.disk is not None else None
+        stats["code_version"] = code_version()
+        return stats
+
+
+# =============================================================================
+# Global Cache
+# =============================================================================
+
+_result_cache: Optional[ResultCache] = None
+
+
+def get_result_cache(settings: Optional[Settings] = None) -> Optional[ResultCache]:
+    """
+    Get or initialize the request result cache.
+
+    Returns None if result caching is disabled.
+    """
+    global _result_cache
+
+    if settings is None:
+        settings = get_settings()
+
+    if not settings.result_cache_enabled:
+        return None
+
+    cache_dir = Path(settings.result_cache_dir)
+    if _result_cache is None or _result_cache.disk.directory != cache_dir:
+        _result_cache = ResultCache(
+            disk=DiskCache(
+                directory=cache_dir,
+                ttl_seconds=settings.result_cache_ttl_seconds,
+                max_bytes=settings.result_cache_max_bytes,
+            ),
+            memory_entries=settings.result_cache_memory_entries,
+        )
+
+    return _result_cache
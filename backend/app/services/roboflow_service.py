@@ -18,29 +18,43 @@ from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
+import io
 import logging
+import os
+import tempfile
 import time
 
 from ..core.config import Settings, get_settings
+from ..core.lazy_imports import is_available, lazy_import
+from .disk_cache import DiskCache, file_digest, make_cache_key
+from .polygon_metrics import PolygonBatch, compute_polygon_metrics
 
 logger = logging.getLogger(__name__)
 
-# Check for inference-sdk
-try:
-    from inference_sdk import InferenceHTTPClient
-    INFERENCE_SDK_AVAILABLE = True
-except ImportError:
-    INFERENCE_SDK_AVAILABLE = False
+# Optional imports (loaded on first use)
+inference_sdk = lazy_import("inference_sdk")
+INFERENCE_SDK_AVAILABLE = is_available("inference_sdk")
+if not INFERENCE_SDK_AVAILABLE:
     logger.warning("inference-sdk not installed - run: pip install inference-sdk")
 
-try:
-    import cv2
-    import numpy as np
-    CV2_AVAILABLE = True
-except ImportError:
-    CV2_AVAILABLE = False
+cv2 = lazy_import("cv2")
+np = lazy_import("numpy")
+CV2_AVAILABLE = is_available("cv2")
+if not CV2_AVAILABLE:
     logger.warning("OpenCV not installed - mask processing disabled")
 
+Image = lazy_import("PIL.Image")
+PIL_AVAILABLE = is_available("PIL")
+if not PIL_AVAILABLE:
+    logger.warning("Pillow not installed - upload payload optimization disabled")
+
+# Encoders tried for the upload payload, smallest output wins
+PAYLOAD_FORMATS: Dict[str, Dict[str, Any]] = {
+    "JPEG": {"suffix": ".jpg", "options": {"quality": 90, "optimize": True}},
+    "WEBP": {"suffix": ".webp", "options": {"quality": 90, "method": 4}},
+    "PNG": {"suffix": ".png", "options": {"optimize": True}},
+}
+
 
 class RoboflowModelType(Enum):
     """Types of Roboflow models for different detection tasks."""
@@ -134,6 +148,8 @@ class RoboflowResult:
     processing_time_ms: int = 0
     raw_response: Optional[Dict] = None
     warnings: List[str] = field(default_factory=list)
+    cache_hit: bool = False
+    upload_bytes: int = 0
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -145,6 +161,8 @@ class RoboflowResult:
             "segmentations": [s.to_dict() for s in self.segmentations],
             "processing_time_ms": self.processing_time_ms,
             "warnings": self.warnings,
+            "cache_hit": self.cache_hit,
+            "upload_bytes": self.upload_bytes,
         }
 
     @property
@@ -165,10 +183,13 @@ class RoboflowResult:
 
 
 # Global inference client instance
-_inference_client: Optional["InferenceHTTPClient"] = None
+_inference_client: Optional["inference_sdk.InferenceHTTPClient"] = None
+
+# Global response cache instance (lazy loaded)
+_response_cache: Optional[DiskCache] = None
 
 
-def get_roboflow_client(settings: Optional[Settings] = None) -> Optional["InferenceHTTPClient"]:
+def get_roboflow_client(settings: Optional[Settings] = None) -> Optional["inference_sdk.InferenceHTTPClient"]:
     """
     Get or initialize the Roboflow InferenceHTTPClient.
 
@@ -191,7 +212,7 @@ def get_roboflow_client(settings: Optional[Settings] = None) -> Optional["Infere
         return _inference_client
 
     try:
-        _inference_client = InferenceHTTPClient(
+        _inference_client = inference_sdk.InferenceHTTPClient(
             api_url="https://detect.roboflow.com",
             api_key=settings.roboflow_api_key,
         )
@@ -202,6 +223,40 @@ def get_roboflow_client(settings: Optional[Settings] = None) -> Optional["Infere
         return None
 
 
+def get_response_cache(settings: Optional[Settings] = None) -> Optional[DiskCache]:
+    """
+    Get or initialize the Roboflow response cache.
+
+    Raw API responses are cached on disk keyed by the exact image bytes,
+    model id and confidence threshold. Results are re-parsed on every hit,
+    so callers can apply a different scale or DPI to a cached response.
+
+    Returns None if caching is disabled.
+    """
+    global _response_cache
+
+    if settings is None:
+        settings = get_settings()
+
+    if not settings.roboflow_cache_enabled:
+        return None
+
+    cache_dir = Path(settings.roboflow_cache_dir)
+    if _response_cache is None or _response_cache.directory != cache_dir:
+        _response_cache = DiskCache(
+            directory=cache_dir,
+            ttl_seconds=settings.roboflow_cache_ttl_seconds,
+            max_bytes=settings.roboflow_cache_max_bytes,
+        )
+
+    return _response_cache
+
+
+def _response_cache_key(image_path: str, model_id: str, confidence_threshold: float) -> str:
+    """Build the cache key for an inference request."""
+    return make_cache_key(file_digest(image_path), model_id, f"{confidence_threshold:.4f}")
+
+
 def is_roboflow_available(settings: Optional[Settings] = None) -> bool:
     """Check if Roboflow is available and configured."""
     if settings is None:
@@ -224,6 +279,119 @@ def get_model_id(model_type: RoboflowModelType, settings: Optional[Settings] = N
     return model_map.get(model_type, settings.roboflow_floor_plan_model)
 
 
+@dataclass
+class InferencePayload:
+    """Image bytes prepared for upload to the Roboflow API."""
+    path: str
+    image_format: str
+    scale_factor: float  # Source pixels per payload pixel (>= 1.0)
+    source_size: Tuple[int, int]
+    payload_size: Tuple[int, int]
+    size_bytes: int
+    is_temporary: bool = True
+
+    def cleanup(self) -> None:
+        """Remove the temporary payload file."""
+        if self.is_temporary and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def prepare_inference_payload(
+    image_path: str,
+    max_side: int,
+    formats: Optional[List[str]] = None,
+) -> Optional[InferencePayload]:
+    """
+    Downscale an image to the model's input resolution and pick the
+    smallest encoding.
+
+    The hosted models resize every input to their native resolution, so
+    uploading a full-size blueprint render only costs transfer time.
+    Images are never upscaled. The returned scale_factor maps payload
+    coordinates back to source image pixels.
+
+    Args:
+        image_path: Path to the source image
+        max_side: Longest side of the payload in pixels
+        formats: Encoders to try (default: JPEG, WEBP, PNG)
+
+    Returns:
+        InferencePayload, or None if Pillow is unavailable or the image
+        cannot be read (callers should then upload the original file)
+    """
+    if not PIL_AVAILABLE:
+        return None
+
+    formats = formats or list(PAYLOAD_FORMATS)
+    source_bytes = os.path.getsize(image_path)
+
+    try:
+        with Image.open(image_path) as img:
+            source_size = img.size
+            source_format = (img.format or "").upper()
+            img.load()
+
+            scale_factor = max(source_size) / max_side if max_side > 0 else 1.0
+            if scale_factor > 1.0:
+                payload_size = (
+                    max(1, round(source_size[0] / scale_factor)),
+                    max(1, round(source_size[1] / scale_factor)),
+                )
+                work = img.resize(payload_size, Image.LANCZOS)
+            else:
+                scale_factor = 1.0
+                payload_size = source_size
+                work = img.copy()
+    except Exception as e:
+        logger.warning(f"Could not prepare payload for {image_path}: {e}")
+        return None
+
+    if work.mode not in ("RGB", "L"):
+        work = work.convert("RGB")
+
+    # Encode with each format and keep the smallest
+    best_format = None
+    best_bytes: Optional[bytes] = None
+    for fmt in formats:
+        spec = PAYLOAD_FORMATS.get(fmt)
+        if spec is None:
+            continue
+        buffer = io.BytesIO()
+        try:
+            work.save(buffer, format=fmt, **spec["options"])
+        except Exception as e:
+            logger.debug(f"Payload encoder {fmt} unavailable: {e}")
+            continue
+        encoded = buffer.getvalue()
+        if best_bytes is None or len(encoded) < len(best_bytes):
+            best_format, best_bytes = fmt, encoded
+
+    # Unchanged dimensions and nothing smaller: send the original file
+    if best_bytes is None or (scale_factor == 1.0 and source_bytes <= len(best_bytes)):
+        return InferencePayload(
+            path=image_path,
+            image_format=source_format or "ORIGINAL",
+            scale_factor=1.0,
+            source_size=source_size,
+            payload_size=source_size,
+            size_bytes=source_bytes,
+            is_temporary=False,
+        )
+
+    fd, payload_path = tempfile.mkstemp(suffix=PAYLOAD_FORMATS[best_format]["suffix"])
+    with os.fdopen(fd, "wb") as f:
+        f.write(best_bytes)
+
+    return InferencePayload(
+        path=payload_path,
+        image_format=best_format,
+        scale_factor=scale_factor,
+        source_size=source_size,
+        payload_size=payload_size,
+        size_bytes=len(best_bytes),
+    )
+
+
 def run_inference(
     image_path: str,
     model_type: RoboflowModelType = RoboflowModelType.FLOOR_PLAN,
@@ -233,6 +401,10 @@ def run_inference(
     """
     Run Roboflow inference on an image using inference-sdk.
 
+    The image is downscaled to the model's input resolution before upload
+    (see prepare_inference_payload). Returned coordinates are always in
+    source image pixels.
+
     Args:
         image_path: Path to the image file
         model_type: Type of model to use
@@ -279,6 +451,65 @@ def run_inference(
             warnings=["Roboflow not configured - set SNAPGRID_ROBOFLOW_API_KEY"],
         )
 
+    # Shrink the upload to the model's input resolution
+    payload = None
+    if settings.roboflow_payload_optimization:
+        payload = prepare_inference_payload(image_path, settings.roboflow_model_input_size)
+    upload_path = payload.path if payload is not None else image_path
+    coordinate_scale = payload.scale_factor if payload is not None else 1.0
+    upload_bytes = payload.size_bytes if payload is not None else os.path.getsize(image_path)
+
+    try:
+        return _run_inference_request(
+            upload_path=upload_path,
+            model_id=model_id,
+            model_type=model_type,
+            confidence_threshold=confidence_threshold,
+            coordinate_scale=coordinate_scale,
+            upload_bytes=upload_bytes,
+            start_time=start_time,
+            settings=settings,
+        )
+    finally:
+        if payload is not None:
+            payload.cleanup()
+
+
+def _run_inference_request(
+    upload_path: str,
+    model_id: str,
+    model_type: RoboflowModelType,
+    confidence_threshold: float,
+    coordinate_scale: float,
+    upload_bytes: int,
+    start_time: float,
+    settings: Settings,
+) -> RoboflowResult:
+    """Send a prepared payload to Roboflow (or the response cache)."""
+    # Serve identical requests from the response cache
+    cache = get_response_cache(settings)
+    cache_key = None
+    if cache is not None:
+        try:
+            cache_key = _response_cache_key(upload_path, model_id, confidence_threshold)
+            cached_response = cache.get(cache_key)
+        except OSError as e:
+            logger.warning(f"Roboflow cache lookup failed: {e}")
+            cached_response = None
+
+        if cached_response is not None:
+            logger.info(f"Roboflow cache hit for {model_id}")
+            result = _parse_roboflow_response(
+                response=cached_response,
+                model_id=model_id,
+                model_type=model_type,
+                confidence_threshold=confidence_threshold,
+                processing_time_ms=int((time.time() - start_time) * 1000),
+                coordinate_scale=coordinate_scale,
+            )
+            result.cache_hit = True
+            return result
+
     try:
         # Get inference client
         client = get_roboflow_client(settings)
@@ -292,17 +523,28 @@ def run_inference(
             )
 
         # Run inference using inference-sdk
-        result = client.infer(image_path, model_id=model_id)
+        result = client.infer(upload_path, model_id=model_id)
         processing_time = int((time.time() - start_time) * 1000)
 
+        logger.info(
+            f"Roboflow {model_id}: uploaded {upload_bytes} bytes "
+            f"(scale {coordinate_scale:.2f}x) in {processing_time} ms"
+        )
+
+        if cache is not None and cache_key is not None and isinstance(result, dict):
+            cache.set(cache_key, result)
+
         # Parse response (inference-sdk returns dict)
-        return _parse_roboflow_response(
+        parsed = _parse_roboflow_response(
             response=result,
             model_id=model_id,
             model_type=model_type,
             confidence_threshold=confidence_threshold,
             processing_time_ms=processing_time,
+            coordinate_scale=coordinate_scale,
         )
+        parsed.upload_bytes = upload_bytes
+        return parsed
 
     except Exception as e:
         logger.error(f"Roboflow inference failed: {e}")
@@ -374,17 +616,28 @@ def _parse_roboflow_response(
     model_type: RoboflowModelType,
     confidence_threshold: float,
     processing_time_ms: int,
+    coordinate_scale: float = 1.0,
 ) -> RoboflowResult:
-    """Parse Roboflow API response into RoboflowResult."""
+    """
+    Parse Roboflow API response into RoboflowResult.
+
+    coordinate_scale maps response coordinates (payload pixels) back to
+    source image pixels when the upload was downscaled.
+    """
+    k = coordinate_scale
 
-    # Get image dimensions
-    image_width = response.get("image", {}).get("width", 0)
-    image_height = response.get("image", {}).get("height", 0)
+    # Get image dimensions (in source pixels)
+    image_width = round(response.get("image", {}).get("width", 0) * k)
+    image_height = round(response.get("image", {}).get("height", 0) * k)
 
     detections = []
     segmentations = []
     warnings = []
 
+    # Segmentation polygons are collected first and measured in one batch
+    mask_predictions: List[Tuple[str, int, float]] = []
+    mask_polygons: List[List[Tuple[float, float]]] = []
+
     # Parse predictions
     predictions = response.get("predictions", [])
 
@@ -403,37 +656,15 @@ def _parse_roboflow_response(
 
         if points:
             # Segmentation mask
-            polygon_points = [(p.get("x", 0), p.get("y", 0)) for p in points]
-
-            # Calculate area and perimeter from polygon
-            area_px, perimeter_px = _calculate_polygon_metrics(polygon_points)
-
-            # Get bounding box
-            x_coords = [p[0] for p in polygon_points]
-            y_coords = [p[1] for p in polygon_points]
-            bbox = {
-                "x": min(x_coords),
-                "y": min(y_coords),
-                "width": max(x_coords) - min(x_coords),
-                "height": max(y_coords) - min(y_coords),
-            }
-
-            segmentations.append(SegmentationMask(
-                class_name=class_name,
-                class_id=class_id,
-                confidence=confidence,
-                points=polygon_points,
-                area_px=area_px,
-                perimeter_px=perimeter_px,
-                bbox=bbox,
-            ))
+            mask_predictions.append((class_name, class_id, confidence))
+            mask_polygons.append([(p.get("x", 0) * k, p.get("y", 0) * k) for p in points])
 
         else:
             # Object detection box
-            x = pred.get("x", 0)
-            y = pred.get("y", 0)
-            width = pred.get("width", 0)
-            height = pred.get("height", 0)
+            x = pred.get("x", 0) * k
+            y = pred.get("y", 0) * k
+            width = pred.get("width", 0) * k
+            height = pred.get("height", 0) * k
 
             detections.append(DetectionBox(
                 class_name=class_name,
@@ -445,6 +676,22 @@ def _parse_roboflow_response(
                 height=height,
             ))
 
+    if mask_polygons:
+        # Calculate area, perimeter and bounding box for all masks at once
+        metrics = compute_polygon_metrics(PolygonBatch.from_polygons(mask_polygons))
+        too_small = [len(poly) < 3 for poly in mask_polygons]
+
+        for i, (class_name, class_id, confidence) in enumerate(mask_predictions):
+            segmentations.append(SegmentationMask(
+                class_name=class_name,
+                class_id=class_id,
+                confidence=confidence,
+                points=mask_polygons[i],
+                area_px=0.0 if too_small[i] else float(metrics.area[i]),
+                perimeter_px=0.0 if too_small[i] else float(metrics.perimeter[i]),
+                bbox=metrics.bbox_dict(i),
+            ))
+
     return RoboflowResult(
         model_id=model_id,
         model_type=model_type,
@@ -463,6 +710,8 @@ def _calculate_polygon_metrics(points: List[Tuple[float, float]]) -> Tuple[float
     Calculate area and perimeter of a polygon.
 
     Uses the Shoelace formula for area and sum of edge lengths for perimeter.
+    Single-polygon wrapper around polygon_metrics; prefer the batched API
+    when measuring many masks.
 
     Args:
         points: List of (x, y) polygon vertices
@@ -473,27 +722,8 @@ def _calculate_polygon_metrics(points: List[Tuple[float, float]]) -> Tuple[float
     if len(points) < 3:
         return 0.0, 0.0
 
-    # Calculate area using Shoelace formula
-    n = len(points)
-    area = 0.0
-    perimeter = 0.0
-
-    for i in range(n):
-        j = (i + 1) % n
-        x1, y1 = points[i]
-        x2, y2 = points[j]
-
-        # Shoelace contribution
-        area += x1 * y2
-        area -= x2 * y1
-
-        # Edge length
-        edge_length = ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
-        perimeter += edge_length
-
-    area = abs(area) / 2.0
-
-    return area, perimeter
+    metrics = compute_polygon_metrics(PolygonBatch.from_polygons([points]))
+    return float(metrics.area[0]), float(metrics.perimeter[0])
 
 
 # =============================================================================
@@ -729,6 +959,7 @@ class RoboflowStatus:
     api_key_configured: bool
     client_available: bool
     models: Dict[str, str]
+    cache: Optional[Dict[str, Any]] = None
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -736,6 +967,7 @@ class RoboflowStatus:
             "api_key_configured": self.api_key_configured,
             "client_available": self.client_available,
             "models": self.models,
+            "cache": self.cache,
         }
 
 
@@ -744,6 +976,8 @@ def get_roboflow_status(settings: Optional[Settings] = None) -> RoboflowStatus:
     if settings is None:
         settings = get_settings()
 
+    cache = get_response_cache(settings)
+
     return RoboflowStatus(
         sdk_installed=INFERENCE_SDK_AVAILABLE,
         api_key_configured=bool(settings.roboflow_api_key),
@@ -754,4 +988,5 @@ def get_roboflow_status(settings: Optional[Settings] = None) -> RoboflowStatus:
             "door_detection": settings.roboflow_door_detection_model,
             "wall_floor": settings.roboflow_wall_floor_model,
         },
+        cache=cache.stats.to_dict() if cache is not None else None,
     )
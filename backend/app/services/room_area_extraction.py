@@ -15,13 +15,18 @@ Hard rules:
 3. Missing values are explicitly marked and excluded from totals
 """
 
-import re
-import fitz  # PyMuPDF
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple, Any, Union
+from typing import Iterator, List, Dict, Optional, Tuple, Any, Union
 from pathlib import Path
 import logging
 
+from ..core.lazy_imports import lazy_import
+from .annotation_tokens import Annotation, TokenKind, find_annotation, scan_annotations
+from .page_text import PageText, PageTextCache
+
+fitz = lazy_import("fitz")  # PyMuPDF
+
 logger = logging.getLogger(__name__)
 
 
@@ -229,7 +234,7 @@ class TextLine:
         }
 
 
-def extract_text_with_positions(page: fitz.Page) -> List[TextLine]:
+def extract_text_with_positions(page: Union["fitz.Page", PageText]) -> List[TextLine]:
     """
     Extract text from PDF page using dict, reconstructing logical lines.
 
@@ -240,13 +245,15 @@ def extract_text_with_positions(page: fitz.Page) -> List[TextLine]:
 
     Note: "dict" works more reliably than "rawdict" for CAD PDFs.
 
+    Pass a PageText to share its text page with other readers of the page.
+
     Returns logical lines sorted by y-position (top to bottom).
     """
     lines: List[TextLine] = []
 
     try:
         # Use "dict" instead of "rawdict" - more reliable for CAD PDFs
-        raw = page.get_text("dict")
+        raw = PageText.of(page).dict()
     except Exception as e:
         logger.error(f"Failed to extract dict: {e}")
         return lines
@@ -289,40 +296,14 @@ def extract_text_with_positions(page: fitz.Page) -> List[TextLine]:
     return lines
 
 
-# =============================================================================
-# REGEX PATTERNS FOR AREA EXTRACTION
-# =============================================================================
-
 # =============================================================================
 # GERMAN CAD AREA PATTERNS
 # =============================================================================
-# These patterns match German construction document area annotations.
-# Note: m²/m2/m at end - the ² may be in a separate span in CAD PDFs
-
-# Primary pattern: "NRF: 22,79 m" (Netto-Raumfläche - Net Room Floor area)
-# This is the standard annotation in German architectural CAD systems
-AREA_PATTERN = re.compile(
-    r'NRF\s*:\s*(\d+[,.]?\d*)\s*m[²2]?',
-    re.IGNORECASE
-)
-
-# Pattern for "50%: 1,15 m²" (explicit counted area for balconies)
-COUNTED_AREA_PATTERN = re.compile(
-    r'(\d+)\s*%\s*:\s*(\d+[,.]?\d*)\s*m[²2]?',
-    re.IGNORECASE
-)
-
-# Alternative German area patterns
-ALT_AREA_PATTERNS = [
-    # "BGF: 22,79 m²" (Bruttogrundfläche - Gross Floor Area)
-    re.compile(r'BGF\s*:\s*(\d+[,.]?\d*)\s*m[²2]?', re.IGNORECASE),
-    # "NGF: 22,79 m²" (Nettogrundfläche - Net Floor Area)
-    re.compile(r'NGF\s*:\s*(\d+[,.]?\d*)\s*m[²2]?', re.IGNORECASE),
-    # "Fläche: 22,79 m²" or "Fläche = 22,79 m²"
-    re.compile(r'Fl[äa]che\s*[:=]\s*(\d+[,.]?\d*)\s*m[²2]?', re.IGNORECASE),
-    # "WF: 22,79 m²" (Wohnfläche - Living Area)
-    re.compile(r'WF\s*:\s*(\d+[,.]?\d*)\s*m[²2]?', re.IGNORECASE),
-]
+
+# Labels accepted by extract_area_from_line, in priority order: "NRF: 22,79 m"
+# (Netto-Raumfläche), BGF, NGF, "Fläche: 22,79 m²", WF and "F:". Lines are
+# scanned once with the combined scanner in annotation_tokens.
+AREA_LABEL_PRIORITY = ("NRF", "BGF", "NGF", "FLAECHE", "WF", "F")
 
 # Balcony/terrace room types (German)
 BALCONY_KEYWORDS = [
@@ -336,34 +317,21 @@ def parse_german_decimal(value_str: str) -> float:
     return float(value_str.replace(",", "."))
 
 
+def _find_area_annotation(annotations: List[Annotation]) -> Optional[Annotation]:
+    return find_annotation(annotations, TokenKind.AREA, AREA_LABEL_PRIORITY)
+
+
 def extract_area_from_line(line: TextLine) -> Optional[Tuple[float, str]]:
     """
     Extract area value from a text line.
 
     Returns (area_m2, source_text) if found, None otherwise.
     """
-    text = line.text
-
-    # Try primary pattern first: "F: 22,79 m²"
-    match = AREA_PATTERN.search(text)
-    if match:
-        try:
-            area = parse_german_decimal(match.group(1))
-            return (area, match.group(0))
-        except ValueError:
-            pass
-
-    # Try alternative patterns
-    for pattern in ALT_AREA_PATTERNS:
-        match = pattern.search(text)
-        if match:
-            try:
-                area = parse_german_decimal(match.group(1))
-                return (area, match.group(0))
-            except ValueError:
-                pass
-
-    return None
+    # "NRF: 22,79 m" first, then BGF / NGF / Fläche / WF / F
+    annotation = _find_area_annotation(scan_annotations(line.text))
+    if annotation is None:
+        return None
+    return (annotation.value, annotation.source)
 
 
 def extract_counted_area_from_line(line: TextLine) -> Optional[Tuple[float, float, str]]:
@@ -372,16 +340,10 @@ def extract_counted_area_from_line(line: TextLine) -> Optional[Tuple[float, floa
 
     Returns (percentage, area_m2, source_text) if found, None otherwise.
     """
-    match = COUNTED_AREA_PATTERN.search(line.text)
-    if match:
-        try:
-            percentage = float(match.group(1)) / 100.0
-            area = parse_german_decimal(match.group(2))
-            return (percentage, area, match.group(0))
-        except ValueError:
-            pass
-
-    return None
+    annotation = find_annotation(scan_annotations(line.text), TokenKind.PERCENT)
+    if annotation is None:
+        return None
+    return (annotation.factor, annotation.value, annotation.source)
 
 
 def is_balcony_type(text: str) -> Tuple[bool, str]:
@@ -401,11 +363,125 @@ def is_balcony_type(text: str) -> Tuple[bool, str]:
 # ROOM NAME ASSOCIATION
 # =============================================================================
 
+def _is_area_annotated(annotations: List[Annotation]) -> bool:
+    """True if a line holds an area or counted-area value (not a room name)."""
+    return bool(_find_area_annotation(annotations) or find_annotation(annotations, TokenKind.PERCENT))
+
+
+@dataclass
+class _NameCandidate:
+    """A line that may be a room name, with its geometry cached."""
+    line: TextLine
+    text: str
+    y1: float
+    center_x: float
+    order: int  # Position on the page, for stable tie-breaking
+
+
+class RoomNameIndex:
+    """
+    Spatial index of candidate room-name lines on one page.
+
+    Lines are classified once (area values, percentages, very short text
+    and pure numbers are dropped) and kept sorted by their bottom edge, so
+    the "above and nearby" window of an area line is found by bisection in
+    O(log n + k) instead of scanning the whole page.
+
+    Args:
+        lines: All text lines on the page
+        annotations: Pre-scanned annotations per line (scanned here if None)
+    """
+
+    def __init__(
+        self,
+        lines: List[TextLine],
+        annotations: Optional[List[List[Annotation]]] = None,
+    ):
+        if annotations is None:
+            annotations = [scan_annotations(line.text) for line in lines]
+
+        candidates = []
+        for order, (line, line_annotations) in enumerate(zip(lines, annotations)):
+            # Skip lines that contain area values (not room names)
+            if _is_area_annotated(line_annotations):
+                continue
+
+            # Filter out very short text (likely symbols) and pure numbers
+            text = line.text.strip()
+            if len(text) < 2:
+                continue
+            if text.replace(",", "").replace(".", "").isdigit():
+                continue
+
+            candidates.append(_NameCandidate(
+                line=line,
+                text=text,
+                y1=line.bbox.y1,
+                center_x=(line.bbox.x0 + line.bbox.x1) / 2,
+                order=order,
+            ))
+
+        candidates.sort(key=lambda c: (c.y1, c.order))
+        self._candidates = candidates
+        self._y1 = [c.y1 for c in candidates]
+
+    def __len__(self) -> int:
+        return len(self._candidates)
+
+    def nearest(
+        self,
+        area_line: TextLine,
+        max_y_distance: float = 50.0,
+        max_x_distance: float = 150.0,
+    ) -> Optional[Tuple[str, Dict]]:
+        """Nearest candidate above/near an area line (see find_nearest_room_name)."""
+        area_center_x = area_line.bbox.center()[0]
+        area_y = area_line.bbox.y0
+
+        # Lines whose bottom lies within [area_y - max_y_distance, area_y].
+        # The lower bound is widened slightly; exact checks below decide.
+        lo = bisect_left(self._y1, area_y - max_y_distance - 1.0)
+        hi = bisect_right(self._y1, area_y)
+
+        best = None
+        best_key = None
+        for candidate in self._candidates[lo:hi]:
+            if candidate.line is area_line:
+                continue
+
+            y_distance = area_y - candidate.y1
+            if y_distance < 0 or y_distance > max_y_distance:
+                continue
+
+            x_distance = abs(candidate.center_x - area_center_x)
+            if x_distance > max_x_distance:
+                continue
+
+            # Smaller y_distance first (closer above), then x_distance, then page order
+            key = (y_distance, x_distance, candidate.order)
+            if best_key is None or key < best_key:
+                best, best_key = candidate, key
+
+        if best is None:
+            return None
+
+        return (
+            best.text,
+            {
+                "source_text": best.text,
+                "bbox": best.line.bbox.to_dict(),
+                "y_distance": best_key[0],
+                "x_distance": best_key[1]
+            }
+        )
+
+
 def find_nearest_room_name(
     area_line: TextLine,
     all_lines: List[TextLine],
     max_y_distance: float = 50.0,  # Points (~17mm at 72 DPI)
-    max_x_distance: float = 150.0  # Points (~53mm)
+    max_x_distance: float = 150.0,  # Points (~53mm)
+    index: Optional[RoomNameIndex] = None,
 ) -> Optional[Tuple[str, Dict]]:
     """
     Find the nearest room name label above/near the area line.
@@ -416,72 +492,256 @@ def find_nearest_room_name(
     3. Then prefer lines with smaller x-distance (closer horizontally)
     4. Skip lines that are themselves area values
 
+    Pass a prebuilt ``index`` when looking up many area lines on the same
+    page; ``all_lines`` is only used to build one otherwise.
+
     Returns (room_name, source_info) if found, None otherwise.
     """
-    area_center = area_line.bbox.center()
-    area_y = area_line.bbox.y0
+    if index is None:
+        index = RoomNameIndex(all_lines)
+    return index.nearest(area_line, max_y_distance, max_x_distance)
 
-    candidates = []
 
-    for line in all_lines:
-        if line is area_line:
-            continue
+# =============================================================================
+# MAIN EXTRACTION FUNCTION
+# =============================================================================
 
-        # Skip lines that contain area patterns (not room names)
-        if AREA_PATTERN.search(line.text) or COUNTED_AREA_PATTERN.search(line.text):
-            continue
+@dataclass
+class RoomAreaPage:
+    """Rooms and missing values extracted from a single page."""
+    page: int
+    rooms: List[RoomAreaItem] = field(default_factory=list)
+    missing: List[MissingValue] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+    @property
+    def area_m2(self) -> float:
+        return round(sum(r.area_m2 for r in self.rooms), 2)
 
-        # Skip lines below the area line
-        line_y = line.bbox.y1  # Bottom of potential label
-        y_distance = area_y - line_y
+    @property
+    def counted_m2(self) -> float:
+        return round(sum(r.counted_m2 for r in self.rooms), 2)
 
-        if y_distance < 0:  # Line is below area
-            continue
-        if y_distance > max_y_distance:
-            continue
+    def to_dict(self) -> Dict:
+        return {
+            "page": self.page,
+            "rooms": [r.to_dict() for r in self.rooms],
+            "area_m2": self.area_m2,
+            "counted_m2": self.counted_m2,
+            "missing": [m.to_dict() for m in self.missing],
+            "warnings": self.warnings,
+        }
 
-        # Calculate horizontal distance
-        line_center_x = (line.bbox.x0 + line.bbox.x1) / 2
-        x_distance = abs(line_center_x - area_center[0])
 
-        if x_distance > max_x_distance:
-            continue
+def extract_page_room_areas(
+    page: Union["fitz.Page", PageText],
+    page_idx: int,
+    default_balcony_factor: float = 0.5,
+    first_room_number: int = 1,
+) -> RoomAreaPage:
+    """
+    Extract room areas from one page.
 
-        # Filter out very short text (likely symbols) and pure numbers
-        text = line.text.strip()
-        if len(text) < 2:
-            continue
-        if text.replace(",", "").replace(".", "").isdigit():
+    Args:
+        page: PyMuPDF page or its shared PageText
+        page_idx: Page index (0-based)
+        default_balcony_factor: Factor for balcony/terrace if no explicit % given
+        first_room_number: Number of the first room id on this page (room_001, ...)
+    """
+    rooms: List[RoomAreaItem] = []
+    missing: List[MissingValue] = []
+
+    lines = extract_text_with_positions(page)
+
+    # Classify every line once; all passes below reuse the annotations
+    line_annotations = [scan_annotations(line.text) for line in lines]
+    name_index = RoomNameIndex(lines, line_annotations)
+
+    # Track which lines have been processed as area values
+    processed_lines = set()
+
+    # First pass: Find all area values
+    area_lines = []
+    for i, line in enumerate(lines):
+        area = _find_area_annotation(line_annotations[i])
+        if area:
+            area_lines.append((i, line, (area.value, area.source)))
+            processed_lines.add(i)
+
+    # Second pass: Find associated counted areas (50%: X m²)
+    counted_areas = {}  # Maps area_line_idx to counted info
+    for i, line in enumerate(lines):
+        if i in processed_lines:
             continue
+        counted = find_annotation(line_annotations[i], TokenKind.PERCENT)
+        if counted:
+            percentage, counted_m2, source = counted.factor, counted.value, counted.source
+            # Find nearest area line above or at same level
+            for area_idx, area_line, _ in area_lines:
+                if abs(area_line.bbox.y_center() - line.bbox.y_center()) < 30:
+                    counted_areas[area_idx] = {
+                        "percentage": percentage,
+                        "counted_m2": counted_m2,
+                        "source_text": source,
+                        "bbox": line.bbox
+                    }
+                    break
+
+    # Third pass: Build room items
+    for area_idx, area_line, (area_m2, area_source) in area_lines:
+        room_id = f"room_{first_room_number + len(rooms):03d}"
+
+        # Find room name
+        name_result = find_nearest_room_name(area_line, lines, index=name_index)
+        room_name = name_result[0] if name_result else None
+        name_source = name_result[1] if name_result else None
+
+        # Check if balcony type
+        is_balcony, room_type = False, "standard"
+        if room_name:
+            is_balcony, room_type = is_balcony_type(room_name)
+
+        # Determine factor and counted_m2
+        factor = 1.0
+        counted_m2 = area_m2
+        factor_source = None
+
+        if area_idx in counted_areas:
+            # Explicit counted area found (e.g., "50%: 1,15 m²")
+            info = counted_areas[area_idx]
+            factor = info["percentage"]
+            counted_m2 = info["counted_m2"]
+            factor_source = {
+                "source_text": info["source_text"],
+                "bbox": info["bbox"].to_dict(),
+                "method": "explicit_percentage"
+            }
+        elif is_balcony:
+            # Apply default balcony factor
+            factor = default_balcony_factor
+            counted_m2 = round(area_m2 * factor, 2)
+            factor_source = {
+                "method": "default_balcony_factor",
+                "factor": default_balcony_factor,
+                "reason": f"Room type '{room_type}' matched balcony keywords"
+            }
+
+        rooms.append(RoomAreaItem(
+            room_id=room_id,
+            name=room_name,
+            area_m2=area_m2,
+            counted_m2=counted_m2,
+            factor=factor,
+            page=page_idx,
+            source_text=area_source,
+            bbox=area_line.bbox,
+            room_type=room_type,
+            name_source=name_source,
+            factor_source=factor_source
+        ))
+
+    # Track pages with no areas found
+    if not area_lines:
+        # Get some sample text for debugging
+        sample_text = " ".join(line.text[:50] for line in lines[:5])
+        missing.append(MissingValue(
+            page=page_idx,
+            reason="No area patterns found on page",
+            nearby_text=sample_text[:200] if sample_text else None,
+            bbox=None
+        ))
+
+    return RoomAreaPage(page=page_idx, rooms=rooms, missing=missing)
+
+
+class RoomAreaStream:
+    """
+    Page-by-page room area extraction.
 
-        candidates.append({
-            "text": text,
-            "y_distance": y_distance,
-            "x_distance": x_distance,
-            "bbox": line.bbox
-        })
+    Yields one RoomAreaPage per requested page as soon as it is done. Room
+    ids are numbered across pages as in ``extract_room_areas``, which
+    collects the stream into a RoomAreaResult.
 
-    if not candidates:
-        return None
+    Args:
+        pdf_path: Path to PDF file
+        pages: Optional list of page numbers (0-indexed). None = all pages.
+        default_balcony_factor: Factor for balcony/terrace if no explicit % given
+    """
 
-    # Sort by y_distance first (closer above), then x_distance
-    candidates.sort(key=lambda c: (c["y_distance"], c["x_distance"]))
-
-    best = candidates[0]
-    return (
-        best["text"],
-        {
-            "source_text": best["text"],
-            "bbox": best["bbox"].to_dict(),
-            "y_distance": best["y_distance"],
-            "x_distance": best["x_distance"]
-        }
-    )
+    def __init__(
+        self,
+        pdf_path: Union[str, Path],
+        pages: Optional[List[int]] = None,
+        default_balcony_factor: float = 0.5,
+    ):
+        path = Path(pdf_path)
+        if not path.exists():
+            raise FileNotFoundError(f"PDF not found: {path}")
 
+        try:
+            self._doc = fitz.open(str(path))
+        except Exception as e:
+            raise ValueError(f"Failed to open PDF: {e}")
+
+        self.page_count = len(self._doc)
+        self.pages = list(pages) if pages is not None else list(range(self.page_count))
+        self.default_balcony_factor = default_balcony_factor
+        self.texts = PageTextCache(self._doc)
+        self.rooms: List[RoomAreaItem] = []
+        self.missing: List[MissingValue] = []
+        self.warnings: List[str] = []
+
+    def __enter__(self) -> "RoomAreaStream":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._doc is not None:
+            self.texts.clear()
+            self._doc.close()
+            self._doc = None
+
+    def __iter__(self) -> Iterator[RoomAreaPage]:
+        if self._doc is None:
+            raise ValueError("Extraction stream is closed")
+
+        for page_idx in self.pages:
+            if page_idx >= self.page_count:
+                page = RoomAreaPage(
+                    page=page_idx,
+                    warnings=[f"Page {page_idx} does not exist (PDF has {self.page_count} pages)"],
+                )
+            else:
+                page = extract_page_room_areas(
+                    self.texts.get(page_idx),
+                    page_idx,
+                    default_balcony_factor=self.default_balcony_factor,
+                    first_room_number=len(self.rooms) + 1,
+                )
+
+            self.rooms.extend(page.rooms)
+            self.missing.extend(page.missing)
+            self.warnings.extend(page.warnings)
+            yield page
+
+    def result(self) -> RoomAreaResult:
+        """Collect the pages extracted so far into a RoomAreaResult."""
+        # Calculate totals (only from successfully extracted values)
+        total_area_m2 = round(sum(r.area_m2 for r in self.rooms), 2)
+        sum_counted_m2 = round(sum(r.counted_m2 for r in self.rooms), 2)
+
+        return RoomAreaResult(
+            rooms=list(self.rooms),
+            total_area_m2=total_area_m2,
+            sum_counted_m2=sum_counted_m2,
+            missing=list(self.missing),
+            page_count=self.page_count,
+            extraction_method="pymupdf_rawdict",
+            warnings=list(self.warnings)
+        )
 
-# =============================================================================
-# MAIN EXTRACTION FUNCTION
-# =============================================================================
 
 def extract_room_areas(
     pdf_path: Union[str, Path],
@@ -504,142 +764,10 @@ def extract_room_areas(
     - Every extracted number includes source_text and bbox
     - Missing values are explicitly tracked and excluded from totals
     """
-    path = Path(pdf_path)
-    if not path.exists():
-        raise FileNotFoundError(f"PDF not found: {path}")
-
-    rooms: List[RoomAreaItem] = []
-    missing: List[MissingValue] = []
-    warnings: List[str] = []
-
-    try:
-        doc = fitz.open(str(path))
-    except Exception as e:
-        raise ValueError(f"Failed to open PDF: {e}")
-
-    page_indices = pages if pages is not None else range(len(doc))
-    room_counter = 0
-
-    for page_idx in page_indices:
-        if page_idx >= len(doc):
-            warnings.append(f"Page {page_idx} does not exist (PDF has {len(doc)} pages)")
-            continue
-
-        page = doc[page_idx]
-        lines = extract_text_with_positions(page)
-
-        # Track which lines have been processed as area values
-        processed_lines = set()
-
-        # First pass: Find all area values
-        area_lines = []
-        for i, line in enumerate(lines):
-            area_result = extract_area_from_line(line)
-            if area_result:
-                area_lines.append((i, line, area_result))
-                processed_lines.add(i)
-
-        # Second pass: Find associated counted areas (50%: X m²)
-        counted_areas = {}  # Maps area_line_idx to counted info
-        for i, line in enumerate(lines):
-            if i in processed_lines:
-                continue
-            counted_result = extract_counted_area_from_line(line)
-            if counted_result:
-                percentage, counted_m2, source = counted_result
-                # Find nearest area line above or at same level
-                for area_idx, area_line, _ in area_lines:
-                    if abs(area_line.bbox.y_center() - line.bbox.y_center()) < 30:
-                        counted_areas[area_idx] = {
-                            "percentage": percentage,
-                            "counted_m2": counted_m2,
-                            "source_text": source,
-                            "bbox": line.bbox
-                        }
-                        break
-
-        # Third pass: Build room items
-        for area_idx, area_line, (area_m2, area_source) in area_lines:
-            room_counter += 1
-            room_id = f"room_{room_counter:03d}"
-
-            # Find room name
-            name_result = find_nearest_room_name(area_line, lines)
-            room_name = name_result[0] if name_result else None
-            name_source = name_result[1] if name_result else None
-
-            # Check if balcony type
-            is_balcony, room_type = False, "standard"
-            if room_name:
-                is_balcony, room_type = is_balcony_type(room_name)
-
-            # Determine factor and counted_m2
-            factor = 1.0
-            counted_m2 = area_m2
-            factor_source = None
-
-            if area_idx in counted_areas:
-                # Explicit counted area found (e.g., "50%: 1,15 m²")
-                info = counted_areas[area_idx]
-                factor = info["percentage"]
-                counted_m2 = info["counted_m2"]
-                factor_source = {
-                    "source_text": info["source_text"],
-                    "bbox": info["bbox"].to_dict(),
-                    "method": "explicit_percentage"
-                }
-            elif is_balcony:
-                # Apply default balcony factor
-                factor = default_balcony_factor
-                counted_m2 = round(area_m2 * factor, 2)
-                factor_source = {
-                    "method": "default_balcony_factor",
-                    "factor": default_balcony_factor,
-                    "reason": f"Room type '{room_type}' matched balcony keywords"
-                }
-
-            rooms.append(RoomAreaItem(
-                room_id=room_id,
-                name=room_name,
-                area_m2=area_m2,
-                counted_m2=counted_m2,
-                factor=factor,
-                page=page_idx,
-                source_text=area_source,
-                bbox=area_line.bbox,
-                room_type=room_type,
-                name_source=name_source,
-                factor_source=factor_source
-            ))
-
-        # Track pages with no areas found
-        if not area_lines:
-            # Get some sample text for debugging
-            sample_text = " ".join(line.text[:50] for line in lines[:5])
-            missing.append(MissingValue(
-                page=page_idx,
-                reason="No area patterns found on page",
-                nearby_text=sample_text[:200] if sample_text else None,
-                bbox=None
-            ))
-
-    # Store page count before closing
-    page_count = len(doc)
-    doc.close()
-
-    # Calculate totals (only from successfully extracted values)
-    total_area_m2 = round(sum(r.area_m2 for r in rooms), 2)
-    sum_counted_m2 = round(sum(r.counted_m2 for r in rooms), 2)
-
-    return RoomAreaResult(
-        rooms=rooms,
-        total_area_m2=total_area_m2,
-        sum_counted_m2=sum_counted_m2,
-        missing=missing,
-        page_count=page_count,
-        extraction_method="pymupdf_rawdict",
-        warnings=warnings
-    )
+    with RoomAreaStream(pdf_path, pages=pages, default_balcony_factor=default_balcony_factor) as stream:
+        for _ in stream:
+            pass
+        return stream.result()
 
 
 # =============================================================================
@@ -698,24 +826,22 @@ def extract_room_areas_pdfplumber(
             # Find area patterns
             full_text = " ".join(w["text"] for w in text_items)
 
-            for match in AREA_PATTERN.finditer(full_text):
-                try:
-                    room_counter += 1
-                    area_m2 = parse_german_decimal(match.group(1))
-
-                    rooms.append(RoomAreaItem(
-                        room_id=f"room_{room_counter:03d}",
-                        name=None,  # pdfplumber fallback doesn't do name association
-                        area_m2=area_m2,
-                        counted_m2=area_m2,
-                        factor=1.0,
-                        page=page_idx,
-                        source_text=match.group(0),
-                        bbox=BoundingBox(0, 0, 0, 0),  # Approximate
-                        room_type="standard"
-                    ))
-                except ValueError:
-                    pass
+            for annotation in scan_annotations(full_text):
+                if annotation.kind != TokenKind.AREA or annotation.label != "NRF":
+                    continue
+                room_counter += 1
+
+                rooms.append(RoomAreaItem(
+                    room_id=f"room_{room_counter:03d}",
+                    name=None,  # pdfplumber fallback doesn't do name association
+                    area_m2=annotation.value,
+                    counted_m2=annotation.value,
+                    factor=1.0,
+                    page=page_idx,
+                    source_text=annotation.source,
+                    bbox=BoundingBox(0, 0, 0, 0),  # Approximate
+                    room_type="standard"
+                ))
 
             if not any(r.page == page_idx for r in rooms):
                 missing.append(MissingValue(
@@ -14,22 +14,20 @@ import logging
 import uuid
 import math
 
+from ..core.lazy_imports import is_available, lazy_import
+
 logger = logging.getLogger(__name__)
 
-# Optional imports
-try:
-    import cv2
-    import numpy as np
-    CV2_AVAILABLE = True
-except ImportError:
-    CV2_AVAILABLE = False
+# Optional imports (loaded on first use)
+cv2 = lazy_import("cv2")
+np = lazy_import("numpy")
+CV2_AVAILABLE = is_available("cv2")
+if not CV2_AVAILABLE:
     logger.warning("OpenCV not available - room detection disabled")
 
-try:
-    import fitz
-    FITZ_AVAILABLE = True
-except ImportError:
-    FITZ_AVAILABLE = False
+fitz = lazy_import("fitz")
+FITZ_AVAILABLE = is_available("fitz")
+if not FITZ_AVAILABLE:
     logger.warning("PyMuPDF not available - PDF rendering disabled")
 
 
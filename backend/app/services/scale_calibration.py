@@ -323,6 +323,31 @@ def detect_scale_from_page(
             notes=[f"Failed to extract text: {e}"],
         )
 
+    return scale_context_from_text(page_text, page_number, page_info, file_id, ctx_id)
+
+
+def scale_context_from_text(
+    page_text: str,
+    page_number: int,
+    page_info: PageInfo,
+    file_id: Optional[str] = None,
+    ctx_id: Optional[str] = None,
+) -> ScaleContext:
+    """
+    Build a ScaleContext from already extracted page text.
+
+    Args:
+        page_text: Plain text of the page
+        page_number: Page number (1-indexed)
+        page_info: PageInfo for the page (contains dimensions, DPI)
+        file_id: Optional file ID for tracking
+        ctx_id: Context ID (generated if not provided)
+
+    Returns:
+        ScaleContext with detected scale or no-scale result
+    """
+    ctx_id = ctx_id or str(uuid.uuid4())
+
     # Try to detect scale from text
     result = detect_scale_from_text(page_text)
 
@@ -7,17 +7,40 @@ Implements deterministic extraction with full auditability - NO hallucinated val
 Every extracted value traces back to a specific location in the source PDF.
 """
 
+import math
 import re
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 from uuid import uuid4
 
-import pdfplumber
-
+from ..core.config import PDF_EXTRACTION_METHODS, get_settings
+from ..core.lazy_imports import is_available, lazy_import
+from .page_pool import map_pages, page_pool_size, use_page_pool
 from .pdf_utils import validate_pdf_path
 
+pdfplumber = lazy_import("pdfplumber")
+fitz = lazy_import("fitz")  # PyMuPDF
+FITZ_AVAILABLE = is_available("fitz")
+
+
+# Page slices per worker; smaller slices balance uneven pages better
+SLICES_PER_WORKER = 4
+
+# Table backends (Settings.pdf_extraction_method)
+METHOD_PDFPLUMBER = "pdfplumber"
+METHOD_PYMUPDF = "pymupdf"
+METHOD_AUTO = "auto"  # PyMuPDF first, pdfplumber for low-confidence pages
+EXTRACTION_METHODS = PDF_EXTRACTION_METHODS  # Also validated in Settings
+
+# PyMuPDF tables below this confidence are re-extracted with pdfplumber (auto mode)
+PYMUPDF_MIN_CONFIDENCE = 0.8
+
+# Rulings closer than this (pt) count as the same column/row boundary
+LAYOUT_TOLERANCE = 2.0
+
 
 # German header mappings to normalized English field names
 GERMAN_HEADER_MAP = {
@@ -77,6 +100,7 @@ class ExtractedTable:
     extraction_method: str = "pdfplumber"
     confidence: float = 1.0
     warnings: list[str] = field(default_factory=list)
+    column_edges: list[float] = field(default_factory=list)  # Column x-boundaries (not serialized)
 
     def to_dict(self) -> dict:
         return {
@@ -210,7 +234,7 @@ def is_data_row(row: list, headers: list) -> bool:
 
 
 def extract_table_from_page(
-    page: pdfplumber.page.Page,
+    page: "pdfplumber.page.Page",
     page_number: int,
     table_index: int = 0,
 ) -> Optional[ExtractedTable]:
@@ -225,30 +249,107 @@ def extract_table_from_page(
     Returns:
         ExtractedTable or None if no valid table found
     """
-    # Extract tables from page
-    tables = page.extract_tables()
+    # Find tables on page
+    tables = page.find_tables()
 
     if not tables or table_index >= len(tables):
         return None
 
-    raw_table = tables[table_index]
+    found = tables[table_index]
+    table = build_schedule_table(found.extract(), page_number, table_index)
+    if table is not None:
+        table.column_edges = _column_edges(found.cells)
+    return table
+
+
+def extract_table_from_fitz_page(
+    page: "fitz.Page",
+    page_number: int,
+    table_index: int = 0,
+) -> Optional[ExtractedTable]:
+    """
+    Extract a single table from a PDF page with PyMuPDF's table finder.
+
+    Much faster than pdfplumber on ruled schedules. The confidence reflects
+    how complete the header and cells are, so callers can fall back to
+    pdfplumber for doubtful pages.
+
+    Args:
+        page: PyMuPDF page object
+        page_number: 1-indexed page number
+        table_index: Index of table on page (0-indexed)
+
+    Returns:
+        ExtractedTable or None if no valid table found
+    """
+    tables = page.find_tables().tables
+
+    if not tables or table_index >= len(tables):
+        return None
 
+    found = tables[table_index]
+    table = build_schedule_table(found.extract(), page_number, table_index, extraction_method=METHOD_PYMUPDF)
+    if table is not None:
+        table.confidence = _pymupdf_confidence(table)
+        table.column_edges = _column_edges(found.cells)
+    return table
+
+
+def _pymupdf_confidence(table: ExtractedTable) -> float:
+    """
+    Confidence of a PyMuPDF table: penalize empty headers and cells that
+    failed to parse (signs of misdetected columns or split cells).
+    """
+    if not table.headers:
+        return 0.0
+    header_ratio = sum(1 for h in table.headers if h) / len(table.headers)
+    parse_failures = len(table.warnings) / max(1, table.row_count)
+    return round(0.95 * header_ratio * max(0.0, 1.0 - parse_failures), 3)
+
+
+def build_schedule_table(
+    raw_table: list[list[Optional[str]]],
+    page_number: int,
+    table_index: int = 0,
+    extraction_method: str = METHOD_PDFPLUMBER,
+    normalized_headers: Optional[list[str]] = None,
+) -> Optional[ExtractedTable]:
+    """
+    Turn a raw table (list of rows of cell strings) into an ExtractedTable.
+
+    The first row is taken as the header row and mapped with
+    ``normalize_header``; tables without schedule columns are rejected.
+
+    Args:
+        raw_table: Rows of cell values as returned by a table finder
+        page_number: 1-indexed page number
+        table_index: Index of table on page (0-indexed)
+        extraction_method: Backend that produced the table
+        normalized_headers: Headers already normalized and checked on an
+            earlier page with the same layout (skips both steps)
+
+    Returns:
+        ExtractedTable or None if this is not a schedule table
+    """
     if not raw_table or len(raw_table) < 2:
         return None
 
     # First row should be headers
     raw_headers = [str(h).strip() if h else "" for h in raw_table[0]]
 
-    # Normalize headers
-    normalized = [normalize_header(h) for h in raw_headers]
+    if normalized_headers is not None:
+        normalized = list(normalized_headers)
+    else:
+        # Normalize headers
+        normalized = [normalize_header(h) for h in raw_headers]
 
-    # Check if this looks like a schedule table (has expected columns)
-    expected_cols = {"pos", "door_number", "room", "type"}
-    found_cols = set(normalized)
+        # Check if this looks like a schedule table (has expected columns)
+        expected_cols = {"pos", "door_number", "room", "type"}
+        found_cols = set(normalized)
 
-    if not expected_cols.intersection(found_cols):
-        # This might be a summary table, not the main schedule
-        return None
+        if not expected_cols.intersection(found_cols):
+            # This might be a summary table, not the main schedule
+            return None
 
     # Extract data rows
     extracted_rows = []
@@ -300,13 +401,341 @@ def extract_table_from_page(
         normalized_headers=normalized,
         rows=extracted_rows,
         row_count=len(extracted_rows),
-        extraction_method="pdfplumber",
+        extraction_method=extraction_method,
         confidence=0.95,  # High confidence for clean table extraction
         warnings=warnings,
     )
 
 
-def extract_schedules_from_pdf(path: str | Path) -> ExtractionResult:
+@dataclass
+class TableLayout:
+    """
+    Column layout of a schedule table, fingerprinted on its first page.
+
+    Multi-page schedules repeat the same ruled grid and header row on every
+    page. Pages whose vertical rulings match ``column_edges`` are read by
+    bucketing words into the cached columns (``extract_table_with_layout``)
+    instead of running full table detection and header normalization again.
+    """
+
+    column_edges: tuple[float, ...]
+    headers: list[str]
+    normalized_headers: list[str]
+    extraction_method: str
+
+    @classmethod
+    def from_table(cls, table: ExtractedTable) -> Optional["TableLayout"]:
+        """Layout of a detected table, or None if its columns are irregular."""
+        if len(table.column_edges) != len(table.headers) + 1:
+            return None
+        return cls(
+            column_edges=tuple(table.column_edges),
+            headers=list(table.headers),
+            normalized_headers=list(table.normalized_headers),
+            extraction_method=table.extraction_method,
+        )
+
+
+def _cluster_positions(values: list[float], tolerance: float = LAYOUT_TOLERANCE) -> list[float]:
+    """Merge positions closer than ``tolerance``; returns sorted cluster means."""
+    clusters: list[list[float]] = []
+    for value in sorted(values):
+        if clusters and value - clusters[-1][-1] <= tolerance:
+            clusters[-1].append(value)
+        else:
+            clusters.append([value])
+    return [sum(c) / len(c) for c in clusters]
+
+
+def _column_edges(cells: list) -> list[float]:
+    """Column x-boundaries of a detected table from its cell bboxes."""
+    xs = [x for cell in cells if cell for x in (cell[0], cell[2])]
+    return _cluster_positions(xs)
+
+
+# Page geometry for the layout path:
+#   rulings: (vertical, position, start, end) - x/top/bottom of a vertical
+#            line, y/left/right of a horizontal one
+#   words:   (x0, top, x1, bottom, text)
+
+def _ruling(x0: float, y0: float, x1: float, y1: float) -> Optional[tuple]:
+    if abs(x0 - x1) <= LAYOUT_TOLERANCE:
+        return (True, (x0 + x1) / 2, min(y0, y1), max(y0, y1))
+    if abs(y0 - y1) <= LAYOUT_TOLERANCE:
+        return (False, (y0 + y1) / 2, min(x0, x1), max(x0, x1))
+    return None  # Diagonal
+
+
+def _fitz_page_geometry(page: "fitz.Page") -> tuple[list[tuple], list[tuple]]:
+    """Rulings (lines and rectangle edges) and words of a PyMuPDF page."""
+    rulings = []
+    for path in page.get_drawings():
+        for item in path["items"]:
+            if item[0] == "l":
+                segments = [(item[1].x, item[1].y, item[2].x, item[2].y)]
+            elif item[0] == "re":
+                r = item[1]
+                segments = [
+                    (r.x0, r.y0, r.x0, r.y1), (r.x1, r.y0, r.x1, r.y1),
+                    (r.x0, r.y0, r.x1, r.y0), (r.x0, r.y1, r.x1, r.y1),
+                ]
+            else:
+                continue
+            rulings.extend(r for r in (_ruling(*seg) for seg in segments) if r)
+
+    words = [(w[0], w[1], w[2], w[3], w[4]) for w in page.get_text("words")]
+    return rulings, words
+
+
+def _plumber_page_geometry(page: "pdfplumber.page.Page") -> tuple[list[tuple], list[tuple]]:
+    """Rulings (line, rect and curve edges) and words of a pdfplumber page."""
+    rulings = [
+        (True, e["x0"], e["top"], e["bottom"]) if e["orientation"] == "v"
+        else (False, e["top"], e["x0"], e["x1"])
+        for e in page.edges
+    ]
+    words = [(w["x0"], w["top"], w["x1"], w["bottom"], w["text"]) for w in page.extract_words()]
+    return rulings, words
+
+
+def _row_boundaries(rulings: list[tuple], left: float, right: float, top: float, bottom: float) -> list[float]:
+    """
+    Y positions of horizontal rulings spanning the table width.
+
+    Rulings drawn per cell are merged: a row boundary only needs its
+    segments to cover [left, right] without gaps.
+    """
+    tol = LAYOUT_TOLERANCE
+    horizontals = sorted(
+        (r[1], r[2], r[3]) for r in rulings
+        if not r[0] and top - tol <= r[1] <= bottom + tol and r[3] > left and r[2] < right
+    )
+
+    boundaries = []
+    i = 0
+    while i < len(horizontals):
+        j = i
+        while j + 1 < len(horizontals) and horizontals[j + 1][0] - horizontals[j][0] <= tol:
+            j += 1
+        group = horizontals[i:j + 1]
+
+        reach = left + tol
+        for _, start, end in sorted(group, key=lambda h: h[1]):
+            if start > reach:
+                break
+            reach = max(reach, end + tol)
+        if reach >= right:
+            boundaries.append(sum(h[0] for h in group) / len(group))
+        i = j + 1
+    return boundaries
+
+
+def _cell_text(words: list[tuple]) -> str:
+    """Join a cell's words into lines (by top) and lines with newlines."""
+    lines: list[list[tuple]] = []
+    for word in sorted(words, key=lambda w: (w[1], w[0])):
+        if lines and abs(word[1] - lines[-1][0][1]) <= LAYOUT_TOLERANCE:
+            lines[-1].append(word)
+        else:
+            lines.append([word])
+    return "\n".join(" ".join(w[4] for w in sorted(line)) for line in lines)
+
+
+def extract_table_with_layout(
+    rulings: list[tuple],
+    words: list[tuple],
+    layout: TableLayout,
+    page_number: int,
+    table_index: int = 0,
+) -> Optional[ExtractedTable]:
+    """
+    Extract a table from a page that shares a cached column layout.
+
+    The page's vertical rulings must match the layout's column edges and
+    its first row must repeat the cached header; words are then assigned
+    to cells by their center, between the column edges and the horizontal
+    rulings. No table detection runs.
+
+    Args:
+        rulings: Ruling segments of the page (see ``_fitz_page_geometry``)
+        words: Words of the page as (x0, top, x1, bottom, text)
+        layout: Layout fingerprinted on an earlier page
+        page_number: 1-indexed page number
+        table_index: Index of table on page (0-indexed)
+
+    Returns:
+        ExtractedTable, or None if the layout does not match (the caller
+        falls back to full table detection)
+    """
+    edges = layout.column_edges
+    tol = LAYOUT_TOLERANCE
+
+    verticals = [r for r in rulings if r[0] and edges[0] - tol <= r[1] <= edges[-1] + tol]
+    columns = _cluster_positions([r[1] for r in verticals])
+    if len(columns) != len(edges) or any(abs(a - b) > tol for a, b in zip(columns, edges)):
+        return None  # Layout changed (moved, added or removed columns)
+
+    top = min(r[2] for r in verticals)
+    bottom = max(r[3] for r in verticals)
+    rows = _row_boundaries(rulings, edges[0], edges[-1], top, bottom)
+    if len(rows) < 3:
+        return None  # Needs a header and at least one data row
+
+    cells: list[list[list[tuple]]] = [[[] for _ in range(len(edges) - 1)] for _ in range(len(rows) - 1)]
+    for word in words:
+        col = bisect_right(edges, (word[0] + word[2]) / 2) - 1
+        row = bisect_right(rows, (word[1] + word[3]) / 2) - 1
+        if 0 <= col < len(edges) - 1 and 0 <= row < len(rows) - 1:
+            cells[row][col].append(word)
+
+    raw_table = [[_cell_text(cell) for cell in row] for row in cells]
+    if raw_table[0] != layout.headers:
+        return None  # Not a continuation of the same schedule
+
+    table = build_schedule_table(
+        raw_table,
+        page_number,
+        table_index,
+        extraction_method=layout.extraction_method,
+        normalized_headers=layout.normalized_headers,
+    )
+    if table is not None:
+        if layout.extraction_method == METHOD_PYMUPDF:
+            table.confidence = _pymupdf_confidence(table)
+        table.column_edges = list(edges)
+    return table
+
+
+class _PageSource:
+    """Lazily opened PyMuPDF and pdfplumber handles for one PDF."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fitz_doc = None
+        self._plumber_pdf = None
+
+    @property
+    def plumber(self) -> "pdfplumber.PDF":
+        if self._plumber_pdf is None:
+            self._plumber_pdf = pdfplumber.open(self.path)
+        return self._plumber_pdf
+
+    @property
+    def fitz_doc(self) -> "fitz.Document":
+        if self._fitz_doc is None:
+            self._fitz_doc = fitz.open(self.path)
+        return self._fitz_doc
+
+    def page_count(self, method: str) -> int:
+        if method != METHOD_PDFPLUMBER:
+            return len(self.fitz_doc)
+        return len(self.plumber.pages)
+
+    def close(self) -> None:
+        if self._fitz_doc is not None:
+            self._fitz_doc.close()
+        if self._plumber_pdf is not None:
+            self._plumber_pdf.close()
+
+
+def _extract_page(source: _PageSource, page_idx: int, method: str) -> Optional[ExtractedTable]:
+    """Extract the schedule table of one page with the selected backend."""
+    # Most schedule PDFs have one main table per page
+    if method != METHOD_PDFPLUMBER:
+        table = extract_table_from_fitz_page(source.fitz_doc[page_idx], page_idx + 1, table_index=0)
+        if method == METHOD_PYMUPDF:
+            return table
+        if table is not None and table.confidence >= PYMUPDF_MIN_CONFIDENCE:
+            return table
+
+    page = source.plumber.pages[page_idx]
+    try:
+        return extract_table_from_page(page, page_idx + 1, table_index=0)
+    finally:
+        # Flush the page's layout caches so memory stays bounded by one page
+        page.close()
+
+
+def _extract_page_with_layout(
+    source: _PageSource,
+    page_idx: int,
+    method: str,
+    layout: TableLayout,
+) -> Optional[ExtractedTable]:
+    """Extract one page through a cached layout; None means detect in full."""
+    if layout.extraction_method == METHOD_PYMUPDF:
+        rulings, words = _fitz_page_geometry(source.fitz_doc[page_idx])
+    else:
+        page = source.plumber.pages[page_idx]
+        try:
+            rulings, words = _plumber_page_geometry(page)
+        finally:
+            page.close()
+
+    table = extract_table_with_layout(rulings, words, layout, page_idx + 1, table_index=0)
+    if table is not None and method == METHOD_AUTO and table.confidence < PYMUPDF_MIN_CONFIDENCE:
+        return None
+    return table
+
+
+def _extract_page_range(
+    source: _PageSource,
+    start: int,
+    stop: int,
+    method: str,
+    layout_cache: bool = True,
+) -> list[ExtractedTable]:
+    """
+    Extract the schedule tables from pages [start, stop).
+
+    The layout of the last fully detected table is reused for the following
+    pages until a page no longer matches it.
+    """
+    tables = []
+    layout = None
+    for page_idx in range(start, stop):
+        table = None
+        if layout is not None:
+            table = _extract_page_with_layout(source, page_idx, method, layout)
+        if table is None:
+            table = _extract_page(source, page_idx, method)
+            layout = TableLayout.from_table(table) if layout_cache and table else None
+        if table:
+            tables.append(table)
+    return tables
+
+
+def _extract_page_slice(task: tuple[str, int, int, str, bool]) -> list[ExtractedTable]:
+    """Worker entry point: open the PDF and extract one slice of pages."""
+    path, start, stop, method, layout_cache = task
+    source = _PageSource(path)
+    try:
+        return _extract_page_range(source, start, stop, method, layout_cache)
+    finally:
+        source.close()
+
+
+def _resolve_method(method: Optional[str]) -> str:
+    method = (method or get_settings().pdf_extraction_method or METHOD_AUTO).lower()
+    if method not in EXTRACTION_METHODS:
+        raise ValueError(f"Unknown extraction method: {method}. Use one of: {', '.join(EXTRACTION_METHODS)}")
+    if method != METHOD_PDFPLUMBER and not FITZ_AVAILABLE:
+        return METHOD_PDFPLUMBER
+    return method
+
+
+def _page_slices(page_count: int, workers: int) -> list[tuple[int, int]]:
+    """Split pages into contiguous (start, stop) slices, in page order."""
+    size = max(1, math.ceil(page_count / (workers * SLICES_PER_WORKER)))
+    return [(start, min(start + size, page_count)) for start in range(0, page_count, size)]
+
+
+def extract_schedules_from_pdf(
+    path: str | Path,
+    max_workers: Optional[int] = None,
+    method: Optional[str] = None,
+    layout_cache: bool = True,
+) -> ExtractionResult:
     """
     Extract all schedule tables from a PDF file.
 
@@ -314,8 +743,20 @@ def extract_schedules_from_pdf(path: str | Path) -> ExtractionResult:
     each page, identifies tables, and returns structured data with
     full auditability.
 
+    Long schedules are split into contiguous page slices that the shared
+    page pool (see ``page_pool``) extracts in parallel (pdfplumber is pure
+    Python, so threads would not help); tables are merged back in page order.
+
     Args:
         path: Path to the PDF file
+        max_workers: Page slices of this extraction in the shared page
+            pool at a time (default: the pool size; 1 extracts in-process)
+        method: Table backend - "pdfplumber", "pymupdf", or "auto"
+            (PyMuPDF first, pdfplumber for low-confidence pages).
+            Default: Settings.pdf_extraction_method
+        layout_cache: Reuse the column layout of a detected table for
+            following pages with the same ruled grid and header (skips
+            table detection on continuation pages)
 
     Returns:
         ExtractionResult containing all extracted tables and metadata
@@ -345,14 +786,25 @@ def extract_schedules_from_pdf(path: str | Path) -> ExtractionResult:
         )
 
     try:
-        with pdfplumber.open(path) as pdf:
-            for page_num, page in enumerate(pdf.pages, start=1):
-                # Try to extract tables from each page
-                # Most schedule PDFs have one main table per page
-                table = extract_table_from_page(page, page_num, table_index=0)
-
-                if table:
-                    tables.append(table)
+        method = _resolve_method(method)
+
+        source = _PageSource(str(path))
+        try:
+            page_count = source.page_count(method)
+            parallel = use_page_pool(page_count, max_workers)
+            if not parallel:
+                tables.extend(_extract_page_range(source, 0, page_count, method, layout_cache))
+        finally:
+            source.close()
+
+        if parallel:
+            workers = min(max_workers or page_pool_size(), page_pool_size(), page_count)
+            tasks = [
+                (str(path), start, stop, method, layout_cache)
+                for start, stop in _page_slices(page_count, workers)
+            ]
+            for slice_tables in map_pages(_extract_page_slice, tasks, max_workers):
+                tables.extend(slice_tables)
 
     except Exception as e:
         errors.append(f"PDF processing error: {str(e)}")
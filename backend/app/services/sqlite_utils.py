@@ -0,0 +1,41 @@
+"""
+SQLite Utilities
+
+Connection handling shared by the SQLite-backed stores (job queue, plan
+store index) that several worker processes use at the same time.
+"""
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Union
+import sqlite3
+
+
+@contextmanager
+def sqlite_connection(db_path: Union[str, Path], immediate: bool = False) -> Iterator[sqlite3.Connection]:
+    """
+    Open a connection (autocommit, rows as ``sqlite3.Row``), closed on exit.
+
+    With ``immediate`` the block runs in one write transaction (``BEGIN
+    IMMEDIATE``), so concurrent read-modify-write blocks of several
+    processes never interleave; it is rolled back if the block raises.
+
+    Args:
+        db_path: Database file
+        immediate: Run the block in a write transaction
+    """
+    conn = sqlite3.connect(str(db_path), timeout=30.0, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    try:
+        if immediate:
+            conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except Exception:
+            if immediate:
+                conn.execute("ROLLBACK")
+            raise
+        if immediate:
+            conn.execute("COMMIT")
+    finally:
+        conn.close()
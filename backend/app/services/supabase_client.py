@@ -15,17 +15,13 @@ from functools import lru_cache
 from typing import Optional
 
 from ..core.config import Settings, get_settings
+from ..core.lazy_imports import is_available, lazy_import
 
-# Lazy import to avoid errors if supabase is not installed
-_supabase_client = None
-_supabase_import_error = None
+# Lazy import to avoid errors (and startup cost) if supabase is not installed
+supabase = lazy_import("supabase")
+SUPABASE_AVAILABLE = is_available("supabase")
 
-try:
-    from supabase import Client, create_client
-except ImportError as e:
-    _supabase_import_error = e
-    Client = None
-    create_client = None
+_supabase_client = None
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +31,7 @@ class SupabaseNotConfiguredError(Exception):
     pass
 
 
-def get_supabase_client(settings: Optional[Settings] = None) -> Optional["Client"]:
+def get_supabase_client(settings: Optional[Settings] = None) -> Optional["supabase.Client"]:
     """
     Get a configured Supabase client instance.
 
@@ -55,7 +51,7 @@ def get_supabase_client(settings: Optional[Settings] = None) -> Optional["Client
         settings = get_settings()
 
     # Check if supabase package is available
-    if _supabase_import_error is not None:
+    if not SUPABASE_AVAILABLE:
         logger.warning(
             "supabase-py package not installed. Install with: pip install supabase"
         )
@@ -72,7 +68,7 @@ def get_supabase_client(settings: Optional[Settings] = None) -> Optional["Client
     # Create client if not already cached
     if _supabase_client is None:
         try:
-            _supabase_client = create_client(
+            _supabase_client = supabase.create_client(
                 settings.supabase_url,
                 settings.supabase_service_key
             )
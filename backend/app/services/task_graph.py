@@ -0,0 +1,204 @@
+"""
+Task Graph Scheduler
+
+Runs a DAG of tasks on a shared executor. A task starts once all its
+dependencies have finished; its function is called with their results in
+dependency order.
+
+Scheduling:
+- Ready tasks start in priority order (lowest first). Giving downstream
+  tasks of a page a lower priority than the next page's first task makes
+  pages finish one after another instead of all advancing in lockstep.
+- At most ``max_in_flight`` tasks are submitted at once, so priorities
+  still apply when the executor is shared with other graphs.
+- Each task declares an estimated memory cost; tasks only start while the
+  in-flight total stays within ``memory_budget_bytes`` (a task that alone
+  exceeds the budget still runs, but on its own).
+- Intermediate results are dropped (and their ``cleanup`` run) as soon as
+  every dependent task has finished; only ``keep`` results are returned.
+
+A failed task does not stop the graph: its dependents are skipped and the
+failure is reported in the result.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+import heapq
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Task:
+    """
+    One node of a task graph.
+
+    Attributes:
+        key: Unique task name (e.g. "render:3")
+        fn: Called with the dependency results, in ``deps`` order
+        deps: Keys of the tasks this one needs
+        priority: Sort key among ready tasks (lowest runs first)
+        memory_bytes: Estimated peak memory while the task runs
+        keep: Return the result from ``TaskGraph.run``
+        cleanup: Called with the result once it is no longer needed
+    """
+
+    key: str
+    fn: Callable[..., Any]
+    deps: Tuple[str, ...] = ()
+    priority: Tuple = ()
+    memory_bytes: int = 0
+    keep: bool = True
+    cleanup: Optional[Callable[[Any], None]] = None
+
+
+@dataclass
+class GraphResult:
+    """Outcome of a task graph run."""
+
+    results: Dict[str, Any] = field(default_factory=dict)
+    errors: Dict[str, Exception] = field(default_factory=dict)
+    skipped: Set[str] = field(default_factory=set)
+    timings_ms: Dict[str, int] = field(default_factory=dict)
+    peak_memory_bytes: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors and not self.skipped
+
+
+class TaskGraph:
+    """A DAG of tasks, built with ``add`` and executed with ``run``."""
+
+    def __init__(self):
+        self.tasks: Dict[str, Task] = {}
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.tasks
+
+    def add(self, task: Task) -> str:
+        """Add a task; its dependencies must already be in the graph."""
+        if task.key in self.tasks:
+            raise ValueError(f"Duplicate task: {task.key}")
+        missing = [dep for dep in task.deps if dep not in self.tasks]
+        if missing:
+            raise ValueError(f"Task {task.key} depends on unknown tasks: {missing}")
+        self.tasks[task.key] = task
+        return task.key
+
+    def run(
+        self,
+        executor: Executor,
+        max_in_flight: int = 4,
+        memory_budget_bytes: Optional[int] = None,
+    ) -> GraphResult:
+        """
+        Execute the graph and wait for it to finish.
+
+        Args:
+            executor: Executor the tasks run on (may be shared)
+            max_in_flight: Maximum tasks submitted at the same time
+            memory_budget_bytes: Limit on the summed ``memory_bytes`` of
+                running tasks (None: unlimited)
+        """
+        outcome = GraphResult()
+        dependents: Dict[str, List[str]] = {key: [] for key in self.tasks}
+        waiting_on: Dict[str, int] = {}
+        for key, task in self.tasks.items():
+            waiting_on[key] = len(task.deps)
+            for dep in task.deps:
+                dependents[dep].append(key)
+        consumers_left = {key: len(dependents[key]) for key in self.tasks}
+
+        values: Dict[str, Any] = {}
+        ready: List[Tuple[Tuple, int, str]] = []
+        order = {key: i for i, key in enumerate(self.tasks)}
+        for key, count in waiting_on.items():
+            if count == 0:
+                heapq.heappush(ready, (self.tasks[key].priority, order[key], key))
+
+        running: Dict[Future, Tuple[str, float]] = {}
+        memory_in_flight = 0
+
+        def release(key: str) -> None:
+            if key not in values:
+                return
+            task = self.tasks[key]
+            value = values.pop(key)
+            if task.keep:
+                outcome.results[key] = value
+            elif task.cleanup is not None and value is not None:
+                try:
+                    task.cleanup(value)
+                except Exception as e:
+                    logger.warning(f"Cleanup of {key} failed: {e}")
+
+        def consumed(key: str) -> None:
+            for dep in self.tasks[key].deps:
+                consumers_left[dep] -= 1
+                if consumers_left[dep] == 0:
+                    release(dep)
+
+        def skip(key: str) -> None:
+            # A skipped task no longer needs its inputs
+            for dependent in dependents[key]:
+                if dependent not in outcome.skipped:
+                    outcome.skipped.add(dependent)
+                    consumed(dependent)
+                    skip(dependent)
+
+        try:
+            while ready or running:
+                # Start ready tasks while slots and memory allow
+                while ready and len(running) < max_in_flight:
+                    key = ready[0][2]
+                    task = self.tasks[key]
+                    if (
+                        memory_budget_bytes is not None
+                        and running
+                        and memory_in_flight + task.memory_bytes > memory_budget_bytes
+                    ):
+                        break
+                    heapq.heappop(ready)
+                    args = [values[dep] for dep in task.deps]
+                    future = executor.submit(task.fn, *args)
+                    running[future] = (key, time.time())
+                    memory_in_flight += task.memory_bytes
+                    outcome.peak_memory_bytes = max(outcome.peak_memory_bytes, memory_in_flight)
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    key, started = running.pop(future)
+                    task = self.tasks[key]
+                    memory_in_flight -= task.memory_bytes
+                    outcome.timings_ms[key] = int((time.time() - started) * 1000)
+
+                    error = future.exception()
+                    if error is not None:
+                        logger.error(f"Task {key} failed: {error}")
+                        outcome.errors[key] = error
+                        skip(key)
+                    else:
+                        values[key] = future.result()
+                        for dependent in dependents[key]:
+                            waiting_on[dependent] -= 1
+                            if waiting_on[dependent] == 0 and dependent not in outcome.skipped:
+                                heapq.heappush(
+                                    ready,
+                                    (self.tasks[dependent].priority, order[dependent], dependent),
+                                )
+                        if consumers_left[key] == 0:
+                            release(key)
+                    consumed(key)
+        finally:
+            # Results still held after an aborted run
+            for key in list(values):
+                release(key)
+
+        return outcome
@@ -17,13 +17,21 @@ Hard Rules:
 """
 
 import re
-import fitz  # PyMuPDF
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple, Any, Union
+from typing import Callable, Iterator, List, Dict, Optional, Tuple, Any, Union
 from pathlib import Path
 from enum import Enum
 import logging
 
+from ..core.config import Settings, get_settings
+from ..core.lazy_imports import lazy_import
+from .annotation_tokens import RoomScheme, Token, TokenKind, tokenize_lines
+from .disk_cache import DiskCache, make_cache_key
+from .page_fingerprint import PageFingerprinter
+from .page_pool import map_pages, use_page_pool, worker_document
+
+fitz = lazy_import("fitz")  # PyMuPDF
+
 logger = logging.getLogger(__name__)
 
 
@@ -131,6 +139,25 @@ class ExtractedRoom:
             result["factor_source"] = self.factor_source
         return result
 
+    @classmethod
+    def from_dict(cls, d: Dict) -> "ExtractedRoom":
+        bbox = d.get("bbox")
+        return cls(
+            room_number=d["room_number"],
+            room_name=d["room_name"],
+            area_m2=d["area_m2"],
+            counted_m2=d["counted_m2"],
+            factor=d["factor"],
+            page=d["page"],
+            source_text=d["source_text"],
+            bbox=BoundingBox(**bbox) if bbox else None,
+            category=RoomCategory(d.get("category", RoomCategory.OTHER.value)),
+            perimeter_m=d.get("perimeter_m"),
+            height_m=d.get("height_m"),
+            factor_source=d.get("factor_source"),
+            extraction_pattern=d.get("extraction_pattern", ""),
+        )
+
 
 @dataclass
 class ExtractionResult:
@@ -147,6 +174,10 @@ class ExtractionResult:
     # Grouped totals
     totals_by_category: Dict[str, float] = field(default_factory=dict)
 
+    # Incremental extraction: pages extracted now vs. taken from the page cache
+    recomputed_pages: List[int] = field(default_factory=list)
+    reused_pages: List[int] = field(default_factory=list)
+
     def to_dict(self) -> Dict:
         return {
             "rooms": [r.to_dict() for r in self.rooms],
@@ -158,6 +189,35 @@ class ExtractionResult:
             "extraction_method": self.extraction_method,
             "warnings": self.warnings,
             "totals_by_category": self.totals_by_category,
+            "recomputed_pages": self.recomputed_pages,
+            "reused_pages": self.reused_pages,
+        }
+
+
+@dataclass
+class PageExtraction:
+    """Rooms and warnings extracted from a single page."""
+    page: int
+    rooms: List[ExtractedRoom]
+    warnings: List[str] = field(default_factory=list)
+    reused: bool = False  # Taken from the page cache (page content unchanged)
+
+    @property
+    def area_m2(self) -> float:
+        return round(sum(r.area_m2 for r in self.rooms), 2)
+
+    @property
+    def counted_m2(self) -> float:
+        return round(sum(r.counted_m2 for r in self.rooms), 2)
+
+    def to_dict(self) -> Dict:
+        return {
+            "page": self.page,
+            "rooms": [r.to_dict() for r in self.rooms],
+            "area_m2": self.area_m2,
+            "counted_m2": self.counted_m2,
+            "warnings": self.warnings,
+            "reused": self.reused,
         }
 
 
@@ -200,6 +260,12 @@ PATTERNS = {
     },
 }
 
+# Lines following a room number that are labels/values rather than names
+_HAARDTRING_NOT_NAME = re.compile(r'^(F:|BA:|B:|W:|D:|[\d,]+)')
+_LEIQ_NOT_NAME = re.compile(r'^(NRF|U:|LH:|B\.|[\d,]+)')
+_OMNITURM_NOT_NAME = re.compile(r'^(NGF|UKRD|UKFD|OKFF|OKRF|LRH|[\d,]+\s*m|Schacht)')
+_SCHACHT_NAME = PATTERNS["omniturm"]["schacht_name"]
+
 
 # =============================================================================
 # UTILITY FUNCTIONS
@@ -242,6 +308,93 @@ def is_outdoor_room(room_name: str) -> bool:
 # STYLE DETECTION
 # =============================================================================
 
+_STYLE_MARKERS = {
+    "has_f": re.compile(r'\bF:\s*\d'),
+    "has_nrf": re.compile(r'\bNRF:\s*\d', re.IGNORECASE),
+    "has_ngf": re.compile(r'\bNGF:\s*\d', re.IGNORECASE),
+    "has_r_pattern": re.compile(r'\bR\d+\.E\d+\.\d+\.\d+\b'),
+    "has_b_pattern": re.compile(r'\bB\.\d+\.\d+\.\d+\b'),
+    "has_grid_pattern": re.compile(r'\b\d+_[a-z]\d+\.\d+\b'),
+}
+
+
+class StyleDetector:
+    """
+    Incremental blueprint style detection.
+
+    Feed page texts in order with ``add_text``. The detector tracks which
+    characteristic patterns have been seen so far and reports ``is_confirmed``
+    once more text cannot change the answer (Haardtring markers seen) or the
+    same style's area label and room number markers have both appeared on
+    ``confirm_pages`` separate pages.
+
+    Args:
+        confirm_pages: Pages with a full style signature needed to stop
+            early (None: only stop when the result is final)
+    """
+
+    def __init__(self, confirm_pages: Optional[int] = None):
+        self.confirm_pages = confirm_pages
+        self.flags = {name: False for name in _STYLE_MARKERS}
+        self.pages_seen = 0
+        self._signature_pages: Dict[BlueprintStyle, int] = {}
+
+    @staticmethod
+    def _style_for(flags: Dict[str, bool]) -> BlueprintStyle:
+        # Determine style based on combinations
+        if flags["has_f"] and flags["has_r_pattern"]:
+            return BlueprintStyle.HAARDTRING
+        elif flags["has_nrf"] and flags["has_b_pattern"]:
+            return BlueprintStyle.LEIQ
+        elif flags["has_ngf"] and (flags["has_grid_pattern"] or flags["has_b_pattern"]):
+            return BlueprintStyle.OMNITURM
+        elif flags["has_ngf"]:
+            return BlueprintStyle.OMNITURM
+        elif flags["has_nrf"]:
+            return BlueprintStyle.LEIQ
+        elif flags["has_f"]:
+            return BlueprintStyle.HAARDTRING
+        else:
+            return BlueprintStyle.UNKNOWN
+
+    def add_text(self, text: str) -> None:
+        """Record the markers found in one page's text."""
+        page_flags = {name: bool(pattern.search(text)) for name, pattern in _STYLE_MARKERS.items()}
+        for name, found in page_flags.items():
+            self.flags[name] = self.flags[name] or found
+        self.pages_seen += 1
+
+        page_style = self._style_for(page_flags)
+        if self._has_signature(page_flags, page_style):
+            self._signature_pages[page_style] = self._signature_pages.get(page_style, 0) + 1
+
+    @staticmethod
+    def _has_signature(flags: Dict[str, bool], style: BlueprintStyle) -> bool:
+        """Area label and room number marker of the style both present."""
+        if style == BlueprintStyle.HAARDTRING:
+            return flags["has_f"] and flags["has_r_pattern"]
+        if style == BlueprintStyle.LEIQ:
+            return flags["has_nrf"] and flags["has_b_pattern"]
+        if style == BlueprintStyle.OMNITURM:
+            return flags["has_ngf"] and (flags["has_grid_pattern"] or flags["has_b_pattern"])
+        return False
+
+    @property
+    def style(self) -> BlueprintStyle:
+        """Style for the text seen so far."""
+        return self._style_for(self.flags)
+
+    @property
+    def is_confirmed(self) -> bool:
+        """True once further pages are not expected to change the style."""
+        # Highest-priority combination: nothing can override it
+        if self.flags["has_f"] and self.flags["has_r_pattern"]:
+            return True
+        if self.confirm_pages:
+            return self._signature_pages.get(self.style, 0) >= self.confirm_pages
+        return False
+
+
 def detect_blueprint_style(text: str) -> BlueprintStyle:
     """
     Auto-detect blueprint style from PDF text content.
@@ -251,206 +404,198 @@ def detect_blueprint_style(text: str) -> BlueprintStyle:
     - LeiQ: NRF: + B.00.x.x room numbers
     - Omniturm: NGF: + 33_xx.xx room numbers
     """
-    # Count pattern matches
-    has_f = bool(re.search(r'\bF:\s*\d', text))
-    has_nrf = bool(re.search(r'\bNRF:\s*\d', text, re.IGNORECASE))
-    has_ngf = bool(re.search(r'\bNGF:\s*\d', text, re.IGNORECASE))
-
-    has_r_pattern = bool(re.search(r'\bR\d+\.E\d+\.\d+\.\d+\b', text))
-    has_b_pattern = bool(re.search(r'\bB\.\d+\.\d+\.\d+\b', text))
-    has_grid_pattern = bool(re.search(r'\b\d+_[a-z]\d+\.\d+\b', text))
-
-    # Determine style based on combinations
-    if has_f and has_r_pattern:
-        return BlueprintStyle.HAARDTRING
-    elif has_nrf and has_b_pattern:
-        return BlueprintStyle.LEIQ
-    elif has_ngf and (has_grid_pattern or has_b_pattern):
-        return BlueprintStyle.OMNITURM
-    elif has_ngf:
-        return BlueprintStyle.OMNITURM
-    elif has_nrf:
-        return BlueprintStyle.LEIQ
-    elif has_f:
-        return BlueprintStyle.HAARDTRING
-    else:
-        return BlueprintStyle.UNKNOWN
+    detector = StyleDetector()
+    detector.add_text(text)
+    return detector.style
 
 
 # =============================================================================
 # EXTRACTION FUNCTIONS BY STYLE
 # =============================================================================
 
-def extract_haardtring(lines: List[str], page_idx: int) -> List[ExtractedRoom]:
+def extract_haardtring(
+    lines: List[str],
+    page_idx: int,
+    tokens: Optional[List[Token]] = None,
+) -> List[ExtractedRoom]:
     """
     Extract rooms from Haardtring-style blueprints.
 
     Pattern: Room number (R2.E5.3.5) -> Room name -> F: XX,XX m2
     Special: 50%: XX,XX m2 for balcony counted area
+
+    Args:
+        lines: Page text lines
+        page_idx: Page index (0-based)
+        tokens: Pre-tokenized lines (tokenized here if None)
     """
-    rooms = []
-    i = 0
+    if tokens is None:
+        tokens = tokenize_lines(lines)
+
+    def balcony_at(k: int) -> Optional[float]:
+        if k < len(tokens) and tokens[k].kind == TokenKind.PERCENT and tokens[k].label == "50%":
+            return tokens[k].value
+        return None
 
-    while i < len(lines):
-        line = lines[i].strip()
+    rooms = []
 
+    for i, token in enumerate(tokens):
         # Look for room number pattern
-        room_match = re.match(r'^(R\d+\.E\d+\.\d+\.\d+)$', line)
-        if room_match:
-            room_num = room_match.group(1)
-            room_name = None
-            area = None
-            balcony_area = None
-
-            # Look for room name on next line
-            if i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
-                if next_line and not re.match(r'^(F:|BA:|B:|W:|D:|[\d,]+)', next_line):
-                    room_name = next_line
-
-            # Look for area value
-            for j in range(i + 1, min(len(lines), i + 15)):
-                curr = lines[j].strip()
-
-                # F: XX,XX m2 on same line
-                f_match = re.match(r'^F:\s*([\d,]+)\s*m[²2]?$', curr, re.IGNORECASE)
-                if f_match:
-                    area = parse_german_number(f_match.group(1))
-                    # Check for 50% on next line
-                    if j + 1 < len(lines):
-                        b_match = re.match(r'^50%:\s*([\d,]+)\s*m[²2]?$', lines[j + 1].strip())
-                        if b_match:
-                            balcony_area = parse_german_number(b_match.group(1))
-                    break
+        if not (token.is_room_id and token.scheme == RoomScheme.HAARDTRING):
+            continue
 
-                # F: split across lines
-                if curr == 'F:' and j + 1 < len(lines):
-                    area_match = re.match(r'^([\d,]+)\s*m[²2]?$', lines[j + 1].strip())
-                    if area_match:
-                        area = parse_german_number(area_match.group(1))
-                        if j + 2 < len(lines):
-                            b_match = re.match(r'^50%:\s*([\d,]+)\s*m[²2]?$', lines[j + 2].strip())
-                            if b_match:
-                                balcony_area = parse_german_number(b_match.group(1))
-                        break
+        room_num = token.text
+        room_name = None
+        area = None
+        balcony_area = None
+
+        # Look for room name on next line
+        if i + 1 < len(tokens):
+            next_line = tokens[i + 1].text
+            if next_line and not _HAARDTRING_NOT_NAME.match(next_line):
+                room_name = next_line
+
+        # Look for area value
+        for j in range(i + 1, min(len(tokens), i + 15)):
+            curr = tokens[j]
+
+            # F: XX,XX m2 on same line (check for 50% on next line)
+            if curr.kind == TokenKind.AREA and curr.label == "F":
+                area = curr.value
+                balcony_area = balcony_at(j + 1)
+                break
 
-                # Stop if we hit another room number
-                if re.match(r'^R\d+\.E\d+\.\d+\.\d+$', curr):
-                    break
+            # F: split across lines
+            if curr.is_label("F") and j + 1 < len(tokens) and tokens[j + 1].is_area_value:
+                area = tokens[j + 1].value
+                balcony_area = balcony_at(j + 2)
+                break
 
-            if area:
-                # Determine factor
-                if balcony_area:
-                    factor = 0.5
-                    counted = balcony_area
-                    factor_source = "explicit_50%"
-                elif room_name and is_outdoor_room(room_name):
-                    factor = 0.5
-                    counted = round(area * 0.5, 2)
-                    factor_source = "default_outdoor"
-                else:
-                    factor = 1.0
-                    counted = area
-                    factor_source = None
-
-                rooms.append(ExtractedRoom(
-                    room_number=room_num,
-                    room_name=room_name or "Unknown",
-                    area_m2=area,
-                    counted_m2=counted,
-                    factor=factor,
-                    page=page_idx,
-                    source_text=f"F: {area}",
-                    category=categorize_room(room_name or ""),
-                    factor_source=factor_source,
-                    extraction_pattern="F:",
-                ))
-        i += 1
+            # Stop if we hit another room number
+            if curr.is_room_id and curr.scheme == RoomScheme.HAARDTRING:
+                break
+
+        if area:
+            # Determine factor
+            if balcony_area:
+                factor = 0.5
+                counted = balcony_area
+                factor_source = "explicit_50%"
+            elif room_name and is_outdoor_room(room_name):
+                factor = 0.5
+                counted = round(area * 0.5, 2)
+                factor_source = "default_outdoor"
+            else:
+                factor = 1.0
+                counted = area
+                factor_source = None
+
+            rooms.append(ExtractedRoom(
+                room_number=room_num,
+                room_name=room_name or "Unknown",
+                area_m2=area,
+                counted_m2=counted,
+                factor=factor,
+                page=page_idx,
+                source_text=f"F: {area}",
+                category=categorize_room(room_name or ""),
+                factor_source=factor_source,
+                extraction_pattern="F:",
+            ))
 
     return rooms
 
 
-def extract_leiq(lines: List[str], page_idx: int) -> List[ExtractedRoom]:
+def extract_leiq(
+    lines: List[str],
+    page_idx: int,
+    tokens: Optional[List[Token]] = None,
+) -> List[ExtractedRoom]:
     """
     Extract rooms from LeiQ-style blueprints.
 
     Pattern: Room number (B.00.2.002) -> Room name -> NRF: XX,XX m2
     Additional: U: (perimeter), LH: (height)
+
+    Args:
+        lines: Page text lines
+        page_idx: Page index (0-based)
+        tokens: Pre-tokenized lines (tokenized here if None)
     """
-    rooms = []
-    i = 0
+    if tokens is None:
+        tokens = tokenize_lines(lines)
 
-    while i < len(lines):
-        line = lines[i].strip()
+    rooms = []
 
+    for i, token in enumerate(tokens):
         # Look for room number pattern
-        room_match = re.match(r'^(B\.\d+\.[0-9A-Z]+\.[A-Z]?\d+)$', line)
-        if room_match:
-            room_num = room_match.group(1)
-            room_name = None
-            area = None
-            perimeter = None
-            height = None
-
-            # Look for room name
-            if i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
-                if next_line and not re.match(r'^(NRF|U:|LH:|B\.|[\d,]+)', next_line):
-                    room_name = next_line
-
-            # Look for values
-            for j in range(i + 1, min(len(lines), i + 15)):
-                curr = lines[j].strip()
-
-                # NRF: XX,XX m2 on same line
-                nrf_match = re.match(r'^NRF:\s*([\d,]+)\s*m[²2]?$', curr, re.IGNORECASE)
-                if nrf_match and area is None:
-                    area = parse_german_number(nrf_match.group(1))
-                    continue
+        if not (token.is_room_id and token.scheme == RoomScheme.LEIQ):
+            continue
 
-                # NRF: split across lines
-                if curr == 'NRF:' and j + 1 < len(lines):
-                    area_match = re.match(r'^([\d,]+)\s*m[²2]?$', lines[j + 1].strip())
-                    if area_match and area is None:
-                        area = parse_german_number(area_match.group(1))
-                        continue
-
-                # U: perimeter
-                u_match = re.match(r'^U:\s*([\d,]+)\s*m$', curr, re.IGNORECASE)
-                if u_match:
-                    perimeter = parse_german_number(u_match.group(1))
-                    continue
+        room_num = token.text
+        room_name = None
+        area = None
+        perimeter = None
+        height = None
+
+        # Look for room name
+        if i + 1 < len(tokens):
+            next_line = tokens[i + 1].text
+            if next_line and not _LEIQ_NOT_NAME.match(next_line):
+                room_name = next_line
+
+        # Look for values
+        for j in range(i + 1, min(len(tokens), i + 15)):
+            curr = tokens[j]
+
+            # NRF: XX,XX m2 on same line
+            if curr.kind == TokenKind.AREA and curr.label == "NRF" and area is None:
+                area = curr.value
+                continue
 
-                # LH: height
-                lh_match = re.match(r'^LH:\s*([\d,]+)\s*m$', curr, re.IGNORECASE)
-                if lh_match:
-                    height = parse_german_number(lh_match.group(1))
+            # NRF: split across lines
+            if curr.is_label("NRF") and j + 1 < len(tokens):
+                if tokens[j + 1].is_area_value and area is None:
+                    area = tokens[j + 1].value
                     continue
 
-                # Stop if we hit another room number
-                if re.match(r'^B\.\d+\.[0-9A-Z]+\.[A-Z]?\d+$', curr):
-                    break
+            # U: perimeter
+            if curr.kind == TokenKind.PERIMETER:
+                perimeter = curr.value
+                continue
+
+            # LH: height
+            if curr.kind == TokenKind.HEIGHT:
+                height = curr.value
+                continue
+
+            # Stop if we hit another room number
+            if curr.is_room_id and curr.scheme == RoomScheme.LEIQ:
+                break
 
-            if area:
-                rooms.append(ExtractedRoom(
-                    room_number=room_num,
-                    room_name=room_name or "Unknown",
-                    area_m2=area,
-                    counted_m2=area,  # LeiQ doesn't have balcony factor
-                    factor=1.0,
-                    page=page_idx,
-                    source_text=f"NRF: {area}",
-                    category=categorize_room(room_name or ""),
-                    perimeter_m=perimeter,
-                    height_m=height,
-                    extraction_pattern="NRF:",
-                ))
-        i += 1
+        if area:
+            rooms.append(ExtractedRoom(
+                room_number=room_num,
+                room_name=room_name or "Unknown",
+                area_m2=area,
+                counted_m2=area,  # LeiQ doesn't have balcony factor
+                factor=1.0,
+                page=page_idx,
+                source_text=f"NRF: {area}",
+                category=categorize_room(room_name or ""),
+                perimeter_m=perimeter,
+                height_m=height,
+                extraction_pattern="NRF:",
+            ))
 
     return rooms
 
 
-def extract_omniturm(lines: List[str], page_idx: int) -> List[ExtractedRoom]:
+def extract_omniturm(
+    lines: List[str],
+    page_idx: int,
+    tokens: Optional[List[Token]] = None,
+) -> List[ExtractedRoom]:
     """
     Extract rooms from Omniturm-style blueprints.
 
@@ -458,78 +603,75 @@ def extract_omniturm(lines: List[str], page_idx: int) -> List[ExtractedRoom]:
     Pattern 2 (Schacht): Schacht XX -> Type -> XX,XX m2 -> Room number
 
     Note: Schacht pattern is REVERSED - room number comes after area!
+
+    Args:
+        lines: Page text lines
+        page_idx: Page index (0-based)
+        tokens: Pre-tokenized lines (tokenized here if None)
     """
+    if tokens is None:
+        tokens = tokenize_lines(lines)
+
     rooms = []
     processed = set()
-    i = 0
-
-    while i < len(lines):
-        line = lines[i].strip()
 
+    for i, token in enumerate(tokens):
         # Pattern 1: Standard room number first
-        room_match = re.match(r'^(\d+_[a-z]\d+\.\d+|BT\d+\.[A-Z]+\.\d+)$', line)
-        if room_match and line not in processed:
-            room_num = line
-            room_name = None
-            area = None
+        if not (token.is_room_id and token.scheme == RoomScheme.OMNITURM) or token.text in processed:
+            continue
 
-            # Look for room name and area
-            for j in range(i + 1, min(len(lines), i + 15)):
-                curr = lines[j].strip()
+        room_num = token.text
+        room_name = None
+        area = None
 
-                # Stop if we hit another room number
-                if re.match(r'^(\d+_[a-z]\d+\.\d+|BT\d+\.[A-Z]+\.\d+)$', curr):
-                    break
+        # Look for room name and area
+        for j in range(i + 1, min(len(tokens), i + 15)):
+            curr = tokens[j]
 
-                # Get room name (first non-technical line)
-                if room_name is None and curr and not re.match(
-                    r'^(NGF|UKRD|UKFD|OKFF|OKRF|LRH|[\d,]+\s*m|Schacht)', curr
-                ):
-                    room_name = curr
+            # Stop if we hit another room number
+            if curr.is_room_id and curr.scheme == RoomScheme.OMNITURM:
+                break
 
-                # NGF: XX,XX m2 on same line (handles thousands: 1.070,55)
-                ngf_match = re.match(r'^NGF:\s*([\d.,]+)\s*m[²2]?$', curr, re.IGNORECASE)
-                if ngf_match:
-                    area = parse_german_number(ngf_match.group(1))
-                    break
+            # Get room name (first non-technical line)
+            if room_name is None and curr.text and not _OMNITURM_NOT_NAME.match(curr.text):
+                room_name = curr.text
 
-                # NGF: split across lines
-                if curr == 'NGF:' and j + 1 < len(lines):
-                    area_match = re.match(r'^([\d.,]+)\s*m[²2]?$', lines[j + 1].strip())
-                    if area_match:
-                        area = parse_german_number(area_match.group(1))
+            # NGF: XX,XX m2 on same line (handles thousands: 1.070,55)
+            if curr.kind == TokenKind.AREA and curr.label == "NGF":
+                area = curr.value
+                break
+
+            # NGF: split across lines
+            if curr.is_label("NGF") and j + 1 < len(tokens) and tokens[j + 1].is_area_value:
+                area = tokens[j + 1].value
+                break
+
+            # Special: Schacht pattern (name -> type -> area)
+            schacht_match = _SCHACHT_NAME.match(curr.text)
+            if schacht_match:
+                room_name = schacht_match.group(1)
+                # Type is next, then area
+                if j + 2 < len(tokens):
+                    type_line = tokens[j + 1].text
+                    if not type_line[:1].isdigit() and not type_line.startswith(','):
+                        room_name = f"{schacht_match.group(1)} ({type_line})"
+                    if tokens[j + 2].is_area_value:
+                        area = tokens[j + 2].value
                         break
 
-                # Special: Schacht pattern (name -> type -> area)
-                schacht_match = re.match(r'^(Schacht \d+)$', curr)
-                if schacht_match:
-                    room_name = schacht_match.group(1)
-                    # Type is next, then area
-                    if j + 2 < len(lines):
-                        type_line = lines[j + 1].strip()
-                        area_line = lines[j + 2].strip()
-                        if not re.match(r'^[\d,]', type_line):
-                            room_name = f"{schacht_match.group(1)} ({type_line})"
-                        area_match = re.match(r'^([\d,]+)\s*m[²2]?$', area_line)
-                        if area_match:
-                            area = parse_german_number(area_match.group(1))
-                            break
-
-            if area:
-                rooms.append(ExtractedRoom(
-                    room_number=room_num,
-                    room_name=room_name or "Unknown",
-                    area_m2=area,
-                    counted_m2=area,
-                    factor=1.0,
-                    page=page_idx,
-                    source_text=f"NGF: {area}",
-                    category=categorize_room(room_name or ""),
-                    extraction_pattern="NGF:",
-                ))
-                processed.add(room_num)
-
-        i += 1
+        if area:
+            rooms.append(ExtractedRoom(
+                room_number=room_num,
+                room_name=room_name or "Unknown",
+                area_m2=area,
+                counted_m2=area,
+                factor=1.0,
+                page=page_idx,
+                source_text=f"NGF: {area}",
+                category=categorize_room(room_name or ""),
+                extraction_pattern="NGF:",
+            ))
+            processed.add(room_num)
 
     return rooms
 
@@ -538,34 +680,18 @@ def extract_omniturm(lines: List[str], page_idx: int) -> List[ExtractedRoom]:
 # GENERIC FLEXIBLE EXTRACTOR
 # =============================================================================
 
-# Flexible area patterns that match many German blueprint formats
-FLEXIBLE_AREA_PATTERNS = [
-    # Standard German patterns
-    re.compile(r'(?:NRF|NGF|BGF|Fläche|F|Fl|FL|A|Area|GF|WF|NF)\s*[=:]\s*([\d.,]+)\s*m[²2]?', re.IGNORECASE),
-    # Area on its own line with m² suffix
-    re.compile(r'^([\d.,]+)\s*m[²2]$', re.IGNORECASE),
-    # Area with qm suffix (common in German)
-    re.compile(r'([\d.,]+)\s*qm\b', re.IGNORECASE),
-    # Area after colon or equals
-    re.compile(r'[=:]\s*([\d.,]+)\s*m[²2]?$', re.IGNORECASE),
-]
+# Candidate room-name lines that are really numbers, labels or values
+_GENERIC_NUMERIC_LINE = re.compile(r'^[\d,.\s]+$')
+_GENERIC_VALUE_LINE = re.compile(r'^[\d.,]+\s*m[²2]?$')
+_GENERIC_LABEL_LINE = re.compile(r'^(NRF|NGF|F|U|LH|BA|B|W|D|OK|UK|UKRD|OKFF)[\s:=]', re.IGNORECASE)
+_GENERIC_AREA_LABEL_LINE = re.compile(r'^(NRF|NGF|F|U|LH)[\s:=]', re.IGNORECASE)
 
-# Flexible room identifier patterns
-FLEXIBLE_ROOM_PATTERNS = [
-    # German style: R2.E5.3.5, B.00.2.002, BT1.EG.001
-    re.compile(r'^([A-Z]+\d*[\._][A-Z0-9]+[\._][A-Z0-9]+[\._][A-Z0-9]+)$', re.IGNORECASE),
-    # Grid style: 33_b6.12
-    re.compile(r'^(\d+_[a-z]\d+\.\d+)$'),
-    # Simple numbered rooms: R001, Room-001, Raum 001
-    re.compile(r'^((?:R(?:aum|oom)?[\s\-_]?)?\d{2,4})$', re.IGNORECASE),
-    # Room with floor: EG.001, OG1.002, UG.003
-    re.compile(r'^([A-Z]{2}\d*[\._]\d{3})$', re.IGNORECASE),
-    # Any alphanumeric with dots/dashes that looks like a room ID
-    re.compile(r'^([A-Z0-9]{1,4}[\.\-_][A-Z0-9]+[\.\-_][A-Z0-9]+)$', re.IGNORECASE),
-]
 
-
-def extract_generic(lines: List[str], page_idx: int) -> List[ExtractedRoom]:
+def extract_generic(
+    lines: List[str],
+    page_idx: int,
+    tokens: Optional[List[Token]] = None,
+) -> List[ExtractedRoom]:
     """
     Generic flexible extractor for any blueprint format.
 
@@ -576,43 +702,40 @@ def extract_generic(lines: List[str], page_idx: int) -> List[ExtractedRoom]:
     1. Find all area values with m² in the text
     2. Look backwards and forwards for room identifiers
     3. Associate each area with the nearest room label
+
+    Args:
+        lines: Page text lines
+        page_idx: Page index (0-based)
+        tokens: Pre-tokenized lines (tokenized here if None)
     """
+    if tokens is None:
+        tokens = tokenize_lines(lines)
+
     rooms = []
     found_areas = []
     found_room_ids = {}
 
-    # First pass: find all area values and their positions
-    for i, line in enumerate(lines):
-        line = line.strip()
-
-        # Try each area pattern
-        for pattern in FLEXIBLE_AREA_PATTERNS:
-            match = pattern.search(line)
-            if match:
-                try:
-                    area = parse_german_number(match.group(1))
-                    if 0.5 <= area <= 10000:  # Reasonable room area range
-                        found_areas.append({
-                            'line_idx': i,
-                            'area': area,
-                            'source_line': line,
-                            'pattern': pattern.pattern[:30],
-                        })
-                except (ValueError, IndexError):
-                    pass
-                break  # Only match first pattern per line
-
-    # Second pass: find all room identifiers
-    for i, line in enumerate(lines):
-        line = line.strip()
-
-        for pattern in FLEXIBLE_ROOM_PATTERNS:
-            match = pattern.match(line)
-            if match:
-                room_id = match.group(1)
-                if room_id not in found_room_ids:
-                    found_room_ids[room_id] = i
-                break
+    for i, token in enumerate(tokens):
+        # Area values: first area annotation on the line, or a bare m²/qm value
+        annotation = token.find(TokenKind.AREA)
+        if annotation is not None:
+            area, pattern = annotation.value, annotation.label or annotation.unit
+        elif token.kind == TokenKind.VALUE and token.unit in ("m2", "qm"):
+            area, pattern = token.value, token.unit
+        else:
+            area = None
+
+        if area is not None and 0.5 <= area <= 10000:  # Reasonable room area range
+            found_areas.append({
+                'line_idx': i,
+                'area': area,
+                'source_line': token.text,
+                'pattern': pattern,
+            })
+
+        # Room identifiers
+        if token.is_room_id and token.text not in found_room_ids:
+            found_room_ids[token.text] = i
 
     # Third pass: associate areas with nearest room IDs
     used_areas = set()
@@ -651,9 +774,9 @@ def extract_generic(lines: List[str], page_idx: int) -> List[ExtractedRoom]:
                     # Skip technical lines, numbers, and common labels
                     if (candidate and
                         len(candidate) > 1 and
-                        not re.match(r'^[\d,.\s]+$', candidate) and
-                        not re.match(r'^(NRF|NGF|F|U|LH|BA|B|W|D|OK|UK|UKRD|OKFF)[\s:=]', candidate, re.IGNORECASE) and
-                        not re.match(r'^[\d.,]+\s*m[²2]?$', candidate)):
+                        not _GENERIC_NUMERIC_LINE.match(candidate) and
+                        not _GENERIC_LABEL_LINE.match(candidate) and
+                        not _GENERIC_VALUE_LINE.match(candidate)):
                         room_name = candidate
                         break
 
@@ -685,9 +808,9 @@ def extract_generic(lines: List[str], page_idx: int) -> List[ExtractedRoom]:
                     candidate = lines[j].strip()
                     if (candidate and
                         len(candidate) > 2 and
-                        not re.match(r'^[\d,.\s]+$', candidate) and
-                        not re.match(r'^(NRF|NGF|F|U|LH)[\s:=]', candidate, re.IGNORECASE) and
-                        not re.match(r'^[\d.,]+\s*m[²2]?$', candidate)):
+                        not _GENERIC_NUMERIC_LINE.match(candidate) and
+                        not _GENERIC_AREA_LABEL_LINE.match(candidate) and
+                        not _GENERIC_VALUE_LINE.match(candidate)):
                         room_name = candidate
                         break
 
@@ -711,114 +834,364 @@ def extract_generic(lines: List[str], page_idx: int) -> List[ExtractedRoom]:
 # MAIN EXTRACTION FUNCTION
 # =============================================================================
 
+# Pages with a full style signature needed before style detection stops early
+STYLE_CONFIRM_PAGES = 3
+
+# Part of every page cache key; bump when extractor output changes
+PAGE_CACHE_VERSION = 1
+
+# Global page cache instance (lazy loaded)
+_extraction_cache: Optional[DiskCache] = None
+
+
+def get_extraction_cache(settings: Optional[Settings] = None) -> Optional[DiskCache]:
+    """
+    Get or initialize the per-page extraction cache.
+
+    Page results are stored under the page's content fingerprint and the
+    extractor style, so a plan revision only re-extracts changed sheets.
+
+    Returns None if caching is disabled.
+    """
+    global _extraction_cache
+
+    if settings is None:
+        settings = get_settings()
+
+    if not settings.extraction_cache_enabled:
+        return None
+
+    cache_dir = Path(settings.extraction_cache_dir)
+    if _extraction_cache is None or _extraction_cache.directory != cache_dir:
+        _extraction_cache = DiskCache(
+            directory=cache_dir,
+            ttl_seconds=settings.extraction_cache_ttl_seconds,
+            max_bytes=settings.extraction_cache_max_bytes,
+        )
+
+    return _extraction_cache
+
+
+# Extractor signature: (lines, page_idx, tokens=None) -> rooms
+_PageExtractor = Callable[..., List[ExtractedRoom]]
+
+_FALLBACK_EXTRACTORS: List[Tuple[BlueprintStyle, _PageExtractor]] = [
+    (BlueprintStyle.HAARDTRING, extract_haardtring),
+    (BlueprintStyle.LEIQ, extract_leiq),
+    (BlueprintStyle.OMNITURM, extract_omniturm),
+]
+
+
+def _page_lines(doc: "fitz.Document", page_idx: int) -> List[str]:
+    """Extract a page's text once as a list of lines."""
+    return doc[page_idx].get_text().split('\n')
+
+
+def _extract_page(
+    lines: List[str],
+    page_idx: int,
+    extract_fn: _PageExtractor,
+) -> Tuple[List[ExtractedRoom], List[str]]:
+    """
+    Extract rooms from one page's lines, with fallback extractors.
+
+    Returns:
+        (rooms, warnings) for the page
+    """
+    rooms: List[ExtractedRoom] = []
+    warnings: List[str] = []
+
+    # Classify every line once; all extractors (incl. fallbacks) share the tokens
+    tokens = tokenize_lines(lines)
+
+    page_rooms = extract_fn(lines, page_idx, tokens)
+    rooms.extend(page_rooms)
+
+    if not page_rooms:
+        # Try other extractors as fallback (known patterns first)
+        for alt_style, alt_fn in _FALLBACK_EXTRACTORS:
+            if alt_fn != extract_fn:
+                alt_rooms = alt_fn(lines, page_idx, tokens)
+                if alt_rooms:
+                    rooms.extend(alt_rooms)
+                    warnings.append(f"Page {page_idx}: Used {alt_style.value} pattern as fallback")
+                    break
+
+        # If still no rooms, try the generic flexible extractor
+        if not page_rooms and extract_fn != extract_generic:
+            generic_rooms = extract_generic(lines, page_idx, tokens)
+            if generic_rooms:
+                rooms.extend(generic_rooms)
+                warnings.append(f"Page {page_idx}: Used generic flexible extraction")
+
+    return rooms, warnings
+
+
+def _extract_page_in_worker(
+    task: Tuple[str, int, Optional[List[str]], _PageExtractor],
+) -> Tuple[List[ExtractedRoom], List[str]]:
+    pdf_path, page_idx, lines, extract_fn = task
+    if lines is None:
+        lines = _page_lines(worker_document(pdf_path), page_idx)
+    return _extract_page(lines, page_idx, extract_fn)
+
+
+class RoomExtractionStream:
+    """
+    Page-by-page room extraction.
+
+    Opens the PDF and detects the blueprint style up front, then yields one
+    PageExtraction per requested page, in request order, as soon as it is
+    done. Used directly by streaming endpoints; ``extract_room_areas``
+    collects it into a single ExtractionResult.
+
+    Each page's text is read once. Style detection reads pages in order and
+    stops as soon as the style is confirmed; those pages' lines are reused
+    for extraction. Pages are extracted in the shared page pool (see
+    ``page_pool``) when enough pages are requested.
+
+    With a ``cache``, each page is fingerprinted from its content stream and
+    resources (see page_fingerprint); pages seen before with the same style
+    are taken from the cache instead of being extracted again.
+
+    Args:
+        pdf_path: Path to PDF file
+        style: Optional blueprint style (auto-detected if None)
+        pages: Optional list of page indices (all pages if None)
+        max_workers: Pages of this extraction in the shared page pool at
+            a time (default: the pool size; 1 extracts in-process)
+        cache: Optional page cache (see ``get_extraction_cache``)
+
+    Example:
+        >>> with RoomExtractionStream("plan.pdf") as stream:
+        ...     for page in stream:
+        ...         print(page.page, len(page.rooms))
+        ...     result = stream.result()
+    """
+
+    def __init__(
+        self,
+        pdf_path: Union[str, Path],
+        style: Optional[BlueprintStyle] = None,
+        pages: Optional[List[int]] = None,
+        max_workers: Optional[int] = None,
+        cache: Optional[DiskCache] = None,
+    ):
+        self.path = Path(pdf_path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"PDF not found: {self.path}")
+
+        try:
+            self._doc = fitz.open(str(self.path))
+        except Exception as e:
+            raise ValueError(f"Failed to open PDF: {e}")
+
+        self.page_count = len(self._doc)
+        self.pages = list(pages) if pages is not None else list(range(self.page_count))
+        self.max_workers = max_workers
+        self.cache = cache
+        self.recomputed_pages: List[int] = []
+        self.reused_pages: List[int] = []
+        self.warnings: List[str] = []  # Document-level warnings
+        self.rooms: List[ExtractedRoom] = []
+        self._page_warnings: List[str] = []
+        self._page_cache: Dict[int, List[str]] = {}
+
+        try:
+            # Detect or use provided style
+            if style is not None:
+                self.blueprint_style = style
+            else:
+                detector = StyleDetector(confirm_pages=STYLE_CONFIRM_PAGES)
+                for page_idx in range(self.page_count):
+                    self._page_cache[page_idx] = _page_lines(self._doc, page_idx)
+                    detector.add_text('\n'.join(self._page_cache[page_idx]))
+                    if detector.is_confirmed:
+                        break
+                self.blueprint_style = detector.style
+                logger.debug(
+                    f"Detected style {self.blueprint_style.value} after "
+                    f"{detector.pages_seen}/{self.page_count} pages"
+                )
+
+            # Select extraction function
+            self._extract_fn = {
+                BlueprintStyle.HAARDTRING: extract_haardtring,
+                BlueprintStyle.LEIQ: extract_leiq,
+                BlueprintStyle.OMNITURM: extract_omniturm,
+            }.get(self.blueprint_style)
+
+            if not self._extract_fn:
+                self.warnings.append(f"Unknown blueprint style, trying flexible extraction")
+                self._extract_fn = extract_generic  # Use flexible extractor for unknown styles
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self) -> "RoomExtractionStream":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
+
+    def _iter_results(
+        self, tasks: List[Tuple[int, Optional[List[str]], _PageExtractor]],
+    ) -> Iterator[Tuple[List[ExtractedRoom], List[str]]]:
+        """Extract tasks in order, in the shared page pool for larger documents."""
+        if use_page_pool(len(tasks), self.max_workers):
+            # Yields in task order while later pages keep running; a closed
+            # stream (e.g. client disconnect) cancels the queued pages
+            pool_tasks = [(str(self.path), *task) for task in tasks]
+            yield from map_pages(_extract_page_in_worker, pool_tasks, self.max_workers)
+        else:
+            for page_idx, lines, fn in tasks:
+                if lines is None:
+                    lines = _page_lines(self._doc, page_idx)
+                yield _extract_page(lines, page_idx, fn)
+
+    def _page_cache_keys(self) -> Dict[int, str]:
+        """Cache key per requested page (empty without a cache)."""
+        if self.cache is None:
+            return {}
+        fingerprint = PageFingerprinter(self._doc)
+        return {
+            page_idx: make_cache_key(
+                "unified_page", PAGE_CACHE_VERSION, self.blueprint_style.value, fingerprint(page_idx)
+            )
+            for page_idx in dict.fromkeys(self.pages)
+            if page_idx < self.page_count
+        }
+
+    def _cached_page(self, key: Optional[str], page_idx: int) -> Optional[PageExtraction]:
+        entry = self.cache.get(key) if key else None
+        if entry is None:
+            return None
+        # Cached under the page's index in an earlier revision (or another
+        # identical sheet): the page index is part of warnings and of the
+        # IDs generated for area-only rooms ("Room_3_001")
+        old_page = entry["page"]
+        old_prefix, new_prefix = f"Page {old_page}:", f"Page {page_idx}:"
+        old_id, new_id = f"Room_{old_page}_", f"Room_{page_idx}_"
+        rooms = []
+        for room in entry["rooms"]:
+            room = {**room, "page": page_idx}
+            if room["extraction_pattern"] == "generic_area_only" and room["room_number"].startswith(old_id):
+                room["room_number"] = new_id + room["room_number"][len(old_id):]
+            rooms.append(ExtractedRoom.from_dict(room))
+        return PageExtraction(
+            page=page_idx,
+            rooms=rooms,
+            warnings=[w.replace(old_prefix, new_prefix, 1) for w in entry["warnings"]],
+            reused=True,
+        )
+
+    def __iter__(self) -> Iterator[PageExtraction]:
+        if self._doc is None:
+            raise ValueError("Extraction stream is closed")
+
+        keys = self._page_cache_keys()
+        cached: Dict[int, PageExtraction] = {}
+        tasks: List[Tuple[int, Optional[List[str]], _PageExtractor]] = []
+        for page_idx in self.pages:
+            if page_idx >= self.page_count or page_idx in cached:
+                continue
+            hit = self._cached_page(keys.get(page_idx), page_idx)
+            if hit is not None:
+                cached[page_idx] = hit
+            else:
+                tasks.append((page_idx, self._page_cache.get(page_idx), self._extract_fn))
+
+        results = self._iter_results(tasks)
+        try:
+            for page_idx in self.pages:
+                if page_idx >= self.page_count:
+                    page = PageExtraction(page=page_idx, rooms=[], warnings=[f"Page {page_idx} does not exist"])
+                elif page_idx in cached:
+                    page = cached[page_idx]
+                    self.reused_pages.append(page_idx)
+                else:
+                    page_rooms, page_warnings = next(results)
+                    page = PageExtraction(page=page_idx, rooms=page_rooms, warnings=page_warnings)
+                    self.recomputed_pages.append(page_idx)
+                    if page_idx in keys:
+                        self.cache.set(keys[page_idx], {
+                            "page": page_idx,
+                            "rooms": [r.to_dict() for r in page_rooms],
+                            "warnings": page_warnings,
+                        })
+
+                self.rooms.extend(page.rooms)
+                self._page_warnings.extend(page.warnings)
+                yield page
+        finally:
+            results.close()
+
+    def result(self) -> ExtractionResult:
+        """Collect the pages extracted so far into an ExtractionResult."""
+        rooms = self.rooms
+
+        # Calculate totals
+        total_area = round(sum(r.area_m2 for r in rooms), 2)
+        total_counted = round(sum(r.counted_m2 for r in rooms), 2)
+
+        # Calculate totals by category
+        totals_by_category = {}
+        for room in rooms:
+            cat = room.category.value
+            totals_by_category[cat] = totals_by_category.get(cat, 0) + room.counted_m2
+        totals_by_category = {k: round(v, 2) for k, v in totals_by_category.items()}
+
+        return ExtractionResult(
+            rooms=list(rooms),
+            total_area_m2=total_area,
+            total_counted_m2=total_counted,
+            room_count=len(rooms),
+            page_count=self.page_count,
+            blueprint_style=self.blueprint_style,
+            extraction_method="unified_extraction",
+            warnings=self.warnings + self._page_warnings,
+            totals_by_category=totals_by_category,
+            recomputed_pages=list(self.recomputed_pages),
+            reused_pages=list(self.reused_pages),
+        )
+
+
 def extract_room_areas(
     pdf_path: Union[str, Path],
     style: Optional[BlueprintStyle] = None,
     pages: Optional[List[int]] = None,
+    max_workers: Optional[int] = None,
+    cache: Optional[DiskCache] = None,
 ) -> ExtractionResult:
     """
     Extract room areas from PDF with automatic style detection.
 
+    Runs a RoomExtractionStream to completion; pages are merged in the
+    requested order.
+
     Args:
         pdf_path: Path to PDF file
         style: Optional blueprint style (auto-detected if None)
         pages: Optional list of page indices (all pages if None)
+        max_workers: Pages of this extraction in the shared page pool at
+            a time (default: the pool size; 1 extracts in-process)
+        cache: Optional page cache; unchanged pages of a plan revision are
+            reused (see ``ExtractionResult.reused_pages``)
 
     Returns:
         ExtractionResult with rooms, totals, and metadata
     """
-    path = Path(pdf_path)
-    if not path.exists():
-        raise FileNotFoundError(f"PDF not found: {path}")
-
-    try:
-        doc = fitz.open(str(path))
-    except Exception as e:
-        raise ValueError(f"Failed to open PDF: {e}")
-
-    # Get full text for style detection
-    full_text = ""
-    for page in doc:
-        full_text += page.get_text()
-
-    # Detect or use provided style
-    detected_style = style or detect_blueprint_style(full_text)
-
-    # Select extraction function
-    extract_fn = {
-        BlueprintStyle.HAARDTRING: extract_haardtring,
-        BlueprintStyle.LEIQ: extract_leiq,
-        BlueprintStyle.OMNITURM: extract_omniturm,
-    }.get(detected_style)
-
-    rooms: List[ExtractedRoom] = []
-    warnings: List[str] = []
-
-    if not extract_fn:
-        warnings.append(f"Unknown blueprint style, trying flexible extraction")
-        extract_fn = extract_generic  # Use flexible extractor for unknown styles
-
-    # Process pages
-    page_indices = pages if pages is not None else range(len(doc))
-
-    for page_idx in page_indices:
-        if page_idx >= len(doc):
-            warnings.append(f"Page {page_idx} does not exist")
-            continue
-
-        page = doc[page_idx]
-        text = page.get_text()
-        lines = text.split('\n')
-
-        page_rooms = extract_fn(lines, page_idx)
-        rooms.extend(page_rooms)
-
-        if not page_rooms:
-            # Try other extractors as fallback (known patterns first)
-            for alt_style, alt_fn in [
-                (BlueprintStyle.HAARDTRING, extract_haardtring),
-                (BlueprintStyle.LEIQ, extract_leiq),
-                (BlueprintStyle.OMNITURM, extract_omniturm),
-            ]:
-                if alt_fn != extract_fn:
-                    alt_rooms = alt_fn(lines, page_idx)
-                    if alt_rooms:
-                        rooms.extend(alt_rooms)
-                        warnings.append(f"Page {page_idx}: Used {alt_style.value} pattern as fallback")
-                        break
-
-            # If still no rooms, try the generic flexible extractor
-            if not page_rooms and extract_fn != extract_generic:
-                generic_rooms = extract_generic(lines, page_idx)
-                if generic_rooms:
-                    rooms.extend(generic_rooms)
-                    warnings.append(f"Page {page_idx}: Used generic flexible extraction")
-
-    page_count = len(doc)
-    doc.close()
-
-    # Calculate totals
-    total_area = round(sum(r.area_m2 for r in rooms), 2)
-    total_counted = round(sum(r.counted_m2 for r in rooms), 2)
-
-    # Calculate totals by category
-    totals_by_category = {}
-    for room in rooms:
-        cat = room.category.value
-        totals_by_category[cat] = totals_by_category.get(cat, 0) + room.counted_m2
-    totals_by_category = {k: round(v, 2) for k, v in totals_by_category.items()}
-
-    return ExtractionResult(
-        rooms=rooms,
-        total_area_m2=total_area,
-        total_counted_m2=total_counted,
-        room_count=len(rooms),
-        page_count=page_count,
-        blueprint_style=detected_style,
-        extraction_method="unified_extraction",
-        warnings=warnings,
-        totals_by_category=totals_by_category,
-    )
+    with RoomExtractionStream(
+        pdf_path, style=style, pages=pages, max_workers=max_workers, cache=cache,
+    ) as stream:
+        for _ in stream:
+            pass
+        return stream.result()
 
 
 # =============================================================================
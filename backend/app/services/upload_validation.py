@@ -0,0 +1,192 @@
+"""
+Upload Validation
+
+Checks plan uploads while they are copied into the plan store, chunk by
+chunk, instead of after the whole file is on disk:
+
+- Magic bytes: ``%PDF-`` (or the PNG/JPEG/TIFF signature) in the first chunk
+- Size limit: enforced on the running byte count
+- Page count: from the linearization dictionary or the root page tree
+  (``/Type /Pages ... /Count N``) as soon as they pass by, then from the
+  document itself once the upload is complete
+- Trailer: ``%%EOF`` near the end (truncated uploads are rejected)
+
+Invalid uploads raise ``UploadRejected`` and never enter the store.
+"""
+
+from pathlib import Path
+from typing import Optional
+import logging
+import re
+
+from ..core.config import Settings, get_settings
+from ..core.lazy_imports import is_available, lazy_import
+
+fitz = lazy_import("fitz")  # PyMuPDF
+PYMUPDF_AVAILABLE = is_available("fitz")
+
+logger = logging.getLogger(__name__)
+
+
+# The PDF header may be preceded by junk within the first 1024 bytes
+PDF_HEADER_WINDOW = 1024
+
+# %%EOF must appear this close to the end of the file
+PDF_TRAILER_WINDOW = 4096
+
+# Bytes kept from the previous chunk so tokens split across chunks are found
+_OVERLAP_BYTES = 256
+
+IMAGE_SIGNATURES = {
+    ".png": (b"\x89PNG\r\n\x1a\n",),
+    ".jpg": (b"\xff\xd8\xff",),
+    ".jpeg": (b"\xff\xd8\xff",),
+    ".tif": (b"II*\x00", b"MM\x00*"),
+    ".tiff": (b"II*\x00", b"MM\x00*"),
+}
+
+_LINEARIZED_PAGES_RE = re.compile(rb"/Linearized\b[^>]*?/N\s+(\d+)", re.DOTALL)
+_PAGES_TYPE_RE = re.compile(rb"/Type\s*/Pages\b")
+_COUNT_RE = re.compile(rb"/Count\s+(\d+)")
+
+# Page tree nodes are small objects; don't search further for their /Count
+_PAGE_NODE_WINDOW = 4096
+
+
+class UploadRejected(Exception):
+    """An upload failed validation (``status_code`` is 400 or 413)."""
+
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class PlanUploadValidator:
+    """
+    Incremental validator for one plan upload.
+
+    Call ``feed`` with every chunk as it is written and ``finish`` with the
+    complete file before it is committed.
+    """
+
+    def __init__(self, filename: str, max_bytes: int, max_pages: int):
+        self.filename = filename
+        self.suffix = Path(filename).suffix.lower()
+        self.max_bytes = max_bytes
+        self.max_pages = max_pages
+
+        self.size = 0
+        self.page_count: Optional[int] = None
+        self._head = b""
+        self._tail = b""
+        self._header_checked = False
+
+    @property
+    def is_pdf(self) -> bool:
+        return self.suffix == ".pdf"
+
+    def feed(self, chunk: bytes) -> None:
+        """
+        Validate the next chunk of the upload.
+
+        Raises:
+            UploadRejected: On a wrong signature (400), or when the size or
+                an announced page count exceeds the limits (413)
+        """
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise UploadRejected(
+                f"Upload exceeds the limit of {self.max_bytes // (1024 * 1024)} MB",
+                status_code=413,
+            )
+
+        if not self._header_checked:
+            self._head += chunk
+            if len(self._head) < PDF_HEADER_WINDOW:
+                return
+            chunk = self._check_header()
+
+        if self.is_pdf:
+            self._scan_page_count(self._tail[-_OVERLAP_BYTES:] + chunk)
+        self._tail = (self._tail + chunk)[-PDF_TRAILER_WINDOW:]
+
+    def _check_header(self) -> bytes:
+        """Check the signature; returns the buffered head for further scanning."""
+        head, self._head = self._head, b""
+        self._header_checked = True
+        if self.is_pdf:
+            if b"%PDF-" not in head[:PDF_HEADER_WINDOW]:
+                raise UploadRejected(f"Not a PDF file (missing %PDF header): {self.filename}")
+            return head
+        signatures = IMAGE_SIGNATURES.get(self.suffix)
+        if signatures and not head.startswith(signatures):
+            raise UploadRejected(f"File content does not match its type: {self.filename}")
+        return head
+
+    def _scan_page_count(self, data: bytes) -> None:
+        """Pick up the page count from dictionaries passing by in the stream."""
+        counts = [int(m.group(1)) for m in _LINEARIZED_PAGES_RE.finditer(data)]
+        for node in _PAGES_TYPE_RE.finditer(data):
+            start = data.rfind(b" obj", max(0, node.start() - _PAGE_NODE_WINDOW), node.start())
+            end = data.find(b"endobj", node.end(), node.end() + _PAGE_NODE_WINDOW)
+            if start < 0 or end < 0:
+                continue
+            count = _COUNT_RE.search(data, start, end)
+            if count:
+                counts.append(int(count.group(1)))
+        if counts:
+            # The root of the page tree has the largest count
+            self.page_count = max(counts + [self.page_count or 0])
+            self._check_pages(self.page_count)
+
+    def _check_pages(self, pages: int) -> None:
+        if pages > self.max_pages:
+            raise UploadRejected(
+                f"PDF has {pages} pages, the limit is {self.max_pages}",
+                status_code=413,
+            )
+
+    def finish(self, path: Path) -> None:
+        """
+        Validate the complete upload.
+
+        Raises:
+            UploadRejected: If the file is empty, truncated, unreadable or
+                has no pages / too many pages
+        """
+        if not self._header_checked:
+            if not self._head:
+                raise UploadRejected(f"Empty upload: {self.filename}")
+            head = self._check_header()
+            if self.is_pdf:
+                self._scan_page_count(head)
+            self._tail = head[-PDF_TRAILER_WINDOW:]
+
+        if not self.is_pdf:
+            return
+
+        if b"%%EOF" not in self._tail:
+            raise UploadRejected(f"PDF is truncated (no %%EOF trailer): {self.filename}")
+
+        if not PYMUPDF_AVAILABLE:
+            return
+        try:
+            with fitz.open(str(path)) as doc:
+                pages = doc.page_count
+        except Exception as e:
+            raise UploadRejected(f"Unreadable PDF {self.filename}: {e}")
+        if pages == 0:
+            raise UploadRejected(f"PDF has no pages: {self.filename}")
+        self.page_count = pages
+        self._check_pages(pages)
+
+
+def plan_upload_validator(filename: str, settings: Optional[Settings] = None) -> PlanUploadValidator:
+    """Validator configured with the upload limits from settings."""
+    if settings is None:
+        settings = get_settings()
+    return PlanUploadValidator(
+        filename,
+        max_bytes=settings.upload_max_bytes,
+        max_pages=settings.upload_max_pages,
+    )
@@ -14,14 +14,13 @@ import math
 import uuid
 import logging
 
+from ..core.lazy_imports import is_available, lazy_import
+
 logger = logging.getLogger(__name__)
 
-# Try to import PyMuPDF for vector extraction
-try:
-    import fitz
-    FITZ_AVAILABLE = True
-except ImportError:
-    FITZ_AVAILABLE = False
+fitz = lazy_import("fitz")
+FITZ_AVAILABLE = is_available("fitz")
+if not FITZ_AVAILABLE:
     logger.warning("PyMuPDF (fitz) not available - vector extraction disabled")
 
 
@@ -28,6 +28,8 @@ from pathlib import Path
 from typing import List, Optional, Dict, Any, Tuple, Set
 import uuid
 
+from ..core.lazy_imports import is_available, lazy_import
+
 logger = logging.getLogger(__name__)
 
 
@@ -51,20 +53,16 @@ DETECTION_MODE_CONFIGS = {
     DetectionMode.SENSITIVE: {"dpi": 100, "confidence": 0.08},
 }
 
-# Optional imports
-try:
-    import cv2
-    import numpy as np
-    CV2_AVAILABLE = True
-except ImportError:
-    CV2_AVAILABLE = False
+# Optional imports (loaded on first use)
+cv2 = lazy_import("cv2")
+np = lazy_import("numpy")
+CV2_AVAILABLE = is_available("cv2")
+if not CV2_AVAILABLE:
     logger.warning("OpenCV not available - wall opening detection disabled")
 
-try:
-    import fitz
-    FITZ_AVAILABLE = True
-except ImportError:
-    FITZ_AVAILABLE = False
+fitz = lazy_import("fitz")
+FITZ_AVAILABLE = is_available("fitz")
+if not FITZ_AVAILABLE:
     logger.warning("PyMuPDF not available - PDF rendering disabled")
 
 
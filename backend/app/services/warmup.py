@@ -0,0 +1,240 @@
+"""
+Worker Warm-Up
+
+Heavy dependencies are imported lazily and YOLO weights are loaded on the
+first detection request, which keeps startup fast but makes the first
+requests of every worker slow. Warm-up does that work ahead of time:
+
+- Imports every heavy module the application binds lazily
+- Loads the configured YOLO model into the shared model registry
+
+Pre-fork serving (``gunicorn -c gunicorn.conf.py app.main:app``) warms the
+master process before the workers are forked, so all workers share the
+imported modules and model weights copy-on-write; ``freeze=True`` moves the
+warmed objects out of the garbage collector's reach so collections in the
+workers do not touch (and thereby copy) those pages. A forked worker only
+keeps the thread that forked it, so a pre-fork warm-up loads models with
+PyTorch limited to one thread (no OpenMP pool is started) and records any
+threads still running in ``threads`` and ``errors``.
+
+Without pre-forking, ``SNAPGRID_WARMUP_ENABLED`` warms each worker in a
+background thread at startup. ``/health`` answers 503 until warm-up
+completes and ``/ready`` reports the warm state.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+import gc
+import logging
+import os
+import sys
+import threading
+import time
+
+from ..core.config import Settings, get_settings
+from ..core.lazy_imports import ensure_loaded, is_available, lazy_modules
+from .cv_pipeline import get_yolo_model
+
+logger = logging.getLogger(__name__)
+
+
+# Package whose lazily bound modules are imported during warm-up
+APP_PACKAGE = __name__.split(".")[0]
+
+
+@dataclass
+class WarmupState:
+    """Warm state of this process (inherited by forked workers)."""
+
+    status: str = "cold"  # cold (not requested), warming, ready
+    pid: Optional[int] = None  # Process that ran the warm-up
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    modules: List[str] = field(default_factory=list)
+    models: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    frozen: bool = False
+    threads: Optional[int] = None  # Threads running after a pre-fork warm-up
+
+    @property
+    def ready(self) -> bool:
+        """True unless a warm-up is still running."""
+        return self.status != "warming"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for API response."""
+        return {
+            "status": self.status,
+            "ready": self.ready,
+            "pid": self.pid,
+            "inherited": self.pid is not None and self.pid != os.getpid(),
+            "duration_ms": (
+                int((self.finished_at - self.started_at) * 1000)
+                if self.started_at is not None and self.finished_at is not None
+                else None
+            ),
+            "modules": self.modules,
+            "models": self.models,
+            "errors": self.errors,
+            "gc_frozen": self.frozen,
+            "threads": self.threads,
+        }
+
+
+# Global warm state of this process
+_state = WarmupState()
+_state_lock = threading.Lock()
+
+
+def get_warmup_state() -> WarmupState:
+    """Get the warm state of this process."""
+    return _state
+
+
+def _begin() -> bool:
+    """Mark warm-up as running; False if it already ran or is running."""
+    with _state_lock:
+        if _state.status != "cold":
+            return False
+        _state.status = "warming"
+        _state.pid = os.getpid()
+        _state.started_at = time.time()
+        return True
+
+
+def _import_modules(state: WarmupState) -> None:
+    for name, module in sorted(lazy_modules(APP_PACKAGE).items()):
+        if not is_available(name):
+            continue
+        try:
+            ensure_loaded(module)
+            state.modules.append(name)
+        except Exception as e:
+            logger.warning(f"Warm-up: importing {name} failed: {e}")
+            state.errors.append(f"{name}: {e}")
+
+
+def _load_models(state: WarmupState, settings: Settings) -> None:
+    if not settings.yolo_enabled:
+        return
+    if get_yolo_model(settings) is None:
+        state.errors.append(f"YOLO model could not be loaded: {settings.yolo_model_path}")
+    else:
+        state.models.append(settings.yolo_model_path)
+
+
+@contextmanager
+def _single_threaded() -> Iterator[None]:
+    """
+    Keep PyTorch on the calling thread (no OpenMP pool) while loading models.
+
+    OpenMP thread pools do not survive a fork; the thread count is restored
+    afterwards, so forked workers start their own pool on first use.
+    """
+    torch = sys.modules.get("torch")
+    if torch is None:
+        yield
+        return
+
+    threads = torch.get_num_threads()
+    torch.set_num_threads(1)
+    try:
+        yield
+    finally:
+        torch.set_num_threads(threads)
+
+
+def _native_thread_count() -> Optional[int]:
+    """Threads of this process including native ones (None if unknown)."""
+    try:
+        return len(os.listdir("/proc/self/task"))
+    except OSError:
+        return None
+
+
+def _check_threads(state: WarmupState) -> None:
+    """Record threads that would not survive a fork of this process."""
+    others = [t.name for t in threading.enumerate() if t is not threading.current_thread()]
+    native = _native_thread_count()
+    state.threads = native if native is not None else len(others) + 1
+    if state.threads > 1:
+        message = f"{state.threads} threads running before fork"
+        if others:
+            message += f" ({', '.join(others)})"
+        logger.warning(f"Warm-up: {message}")
+        state.errors.append(message)
+
+
+def _run(settings: Settings, freeze: bool) -> WarmupState:
+    logger.info("Warm-up started")
+    try:
+        _import_modules(_state)
+        if freeze:
+            with _single_threaded():
+                _load_models(_state, settings)
+        else:
+            _load_models(_state, settings)
+    except Exception as e:
+        # Never leave the worker stuck in "warming" (health checks would fail)
+        logger.exception("Warm-up failed")
+        _state.errors.append(str(e))
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
+        _state.frozen = True
+        _check_threads(_state)
+
+    _state.finished_at = time.time()
+    _state.status = "ready"
+    logger.info(
+        f"Warm-up finished in {_state.finished_at - _state.started_at:.1f}s: "
+        f"{len(_state.modules)} modules, {len(_state.models)} models, {len(_state.errors)} errors"
+    )
+    return _state
+
+
+def warm_up(settings: Optional[Settings] = None, freeze: bool = False) -> WarmupState:
+    """
+    Import heavy modules and load model weights now.
+
+    Runs once per process; forked workers inherit the ready state. Failures
+    are recorded in the state - the affected features fall back as they
+    would on a cold worker - and do not keep the worker from serving.
+
+    Args:
+        settings: Optional Settings instance
+        freeze: Freeze the collected heap (``gc.freeze``) afterwards, for a
+            master process that is about to fork workers
+
+    Returns:
+        The warm state of this process
+    """
+    if settings is None:
+        settings = get_settings()
+
+    if not _begin():
+        return _state
+    return _run(settings, freeze)
+
+
+def start_warmup(settings: Optional[Settings] = None) -> Optional[threading.Thread]:
+    """
+    Warm up this process in a background thread.
+
+    The state is "warming" when this returns, so health checks fail from
+    the first request on until warm-up completes.
+
+    Returns:
+        The warm-up thread, or None if the process is already warm
+    """
+    if settings is None:
+        settings = get_settings()
+
+    if not _begin():
+        return None
+
+    thread = threading.Thread(target=_run, args=(settings, False), name="warmup", daemon=True)
+    thread.start()
+    return thread
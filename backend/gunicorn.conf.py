@@ -0,0 +1,71 @@
+"""
+Gunicorn configuration for pre-fork serving.
+
+    gunicorn -c gunicorn.conf.py app.main:app
+
+The master process imports the app and warms it up - heavy modules and
+YOLO weights - before forking the workers (uvicorn workers running the
+FastAPI app). Workers start warm and share those pages copy-on-write
+instead of each loading its own copy on the first request.
+
+Background jobs are served by a single job process (``python -m
+app.api.job_queue``, with ``SNAPGRID_JOB_WORKERS`` worker processes) that
+the master starts next to the HTTP workers and stops on shutdown. The HTTP
+workers only queue jobs: their ``job_workers`` is set to 0 before they
+fork, so the lifespan does not start another pool in every worker. To run
+the job process separately (e.g. its own container), set
+``SNAPGRID_JOB_WORKERS=0`` for gunicorn and start it there instead.
+
+Environment:
+    WEB_CONCURRENCY: Number of workers (default: number of CPUs)
+    PORT: Port to bind (default: 8000)
+"""
+
+import multiprocessing
+import os
+import subprocess
+import sys
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Import the app in the master so the workers inherit it
+preload_app = True
+
+# Plan analysis requests can run for minutes
+timeout = 300
+graceful_timeout = 30
+
+# Job process started by the master (None if job workers are disabled)
+job_process = None
+
+
+def when_ready(server):
+    """Start the job process and warm up the master before workers fork."""
+    global job_process
+    from app.core.config import get_settings
+    from app.services.warmup import warm_up
+
+    settings = get_settings()
+    if settings.job_workers > 0:
+        # Started with exec, not forked: it inherits no state of the master
+        job_process = subprocess.Popen([sys.executable, "-m", "app.api.job_queue"])
+        server.log.info(f"Job process {job_process.pid} serving {settings.job_workers} job workers")
+        settings.job_workers = 0
+
+    state = warm_up(freeze=True)
+    server.log.info(
+        f"Warm-up {state.status}: {len(state.modules)} modules, "
+        f"{len(state.models)} models, errors: {state.errors or 'none'}"
+    )
+
+
+def on_exit(server):
+    """Stop the job process; running jobs finish or are re-queued later."""
+    if job_process is not None and job_process.poll() is None:
+        job_process.terminate()
+        try:
+            job_process.wait(graceful_timeout)
+        except subprocess.TimeoutExpired:
+            job_process.kill()
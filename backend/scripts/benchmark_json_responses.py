@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+JSON Response Benchmark
+
+Compares the cost of turning an extraction result with many rooms into a
+response body (``/extraction/rooms``):
+
+- before: validated response models (``ExtractedRoomResponse(...)``),
+  ``jsonable_encoder`` and Starlette's ``JSONResponse`` (``json.dumps``)
+- after:  ``model_construct`` response models, pydantic-core
+  ``to_jsonable`` and ``FastJSONResponse`` (orjson)
+
+The rooms are synthetic, so no PDF is needed. Stages are timed separately
+(build, convert, encode) to show where the time goes.
+
+Usage:
+    python benchmark_json_responses.py [--rooms 10000] [--repeat 5]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.api.extraction import (
+    ExtractedRoomResponse,
+    ExtractionSummaryResponse,
+    RoomExtractionResponse,
+    _room_response,
+    _summary_response,
+)
+from app.api.responses import ORJSON_AVAILABLE, FastJSONResponse, to_jsonable
+from app.services.unified_extraction import (
+    BlueprintStyle,
+    BoundingBox,
+    ExtractedRoom,
+    ExtractionResult,
+    RoomCategory,
+)
+
+
+def make_result(count: int) -> ExtractionResult:
+    """Extraction result with ``count`` LeiQ-style rooms."""
+    categories = list(RoomCategory)
+    rooms = []
+    for i in range(count):
+        area = round(5.0 + (i % 400) * 0.37, 2)
+        rooms.append(ExtractedRoom(
+            room_number=f"B.{i // 1000:02d}.2.{i % 1000:03d}",
+            room_name="Büro",
+            area_m2=area,
+            counted_m2=area,
+            factor=1.0,
+            page=i // 500,
+            source_text=f"NRF: {area:.2f} m2".replace(".", ","),
+            bbox=BoundingBox(100.0 + i % 50, 200.0, 180.0 + i % 50, 240.0),
+            category=categories[i % len(categories)],
+            perimeter_m=round(area * 1.4, 2),
+            height_m=2.6,
+            extraction_pattern="leiq_nrf",
+        ))
+
+    totals: Dict[str, float] = {}
+    for room in rooms:
+        totals[room.category.value] = round(totals.get(room.category.value, 0.0) + room.counted_m2, 2)
+
+    return ExtractionResult(
+        blueprint_style=BlueprintStyle.LEIQ,
+        rooms=rooms,
+        total_area_m2=round(sum(r.area_m2 for r in rooms), 2),
+        total_counted_m2=round(sum(r.counted_m2 for r in rooms), 2),
+        room_count=len(rooms),
+        page_count=rooms[-1].page + 1 if rooms else 0,
+        totals_by_category=totals,
+    )
+
+
+def build_validated(result: ExtractionResult) -> RoomExtractionResponse:
+    """Response as built before: every model validated from the same values."""
+    return RoomExtractionResponse(
+        extraction_id="ext_benchmark",
+        source_file="benchmark.pdf",
+        extracted_at="2025-01-01T00:00:00Z",
+        summary=ExtractionSummaryResponse(**vars(_summary_response(result))),
+        rooms=[ExtractedRoomResponse(**vars(_room_response(room))) for room in result.rooms],
+        warnings=[],
+    )
+
+
+def build_constructed(result: ExtractionResult) -> RoomExtractionResponse:
+    """Response as built now: model_construct, values already typed."""
+    return RoomExtractionResponse.model_construct(
+        extraction_id="ext_benchmark",
+        source_file="benchmark.pdf",
+        extracted_at="2025-01-01T00:00:00Z",
+        summary=_summary_response(result),
+        rooms=[_room_response(room) for room in result.rooms],
+        warnings=[],
+        recomputed_pages=[],
+        reused_pages=[],
+    )
+
+
+def best_of(repeat: int, fn: Callable[[], object]) -> float:
+    """Best wall time of ``repeat`` calls, in seconds."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def time_path(result: ExtractionResult, build, convert, response_class, repeat: int) -> List[float]:
+    model = build(result)
+    content = convert(model)
+    return [
+        best_of(repeat, lambda: build(result)),
+        best_of(repeat, lambda: convert(model)),
+        best_of(repeat, lambda: response_class(content)),
+    ]
+
+
+def benchmark(rooms: int, repeat: int) -> None:
+    result = make_result(rooms)
+    print(f"Rooms: {rooms}, repeats: {repeat}, orjson: {'yes' if ORJSON_AVAILABLE else 'no'}\n")
+
+    before = time_path(result, build_validated, jsonable_encoder, JSONResponse, repeat)
+    after = time_path(result, build_constructed, to_jsonable, FastJSONResponse, repeat)
+
+    # Both paths must produce the same document
+    old_body = JSONResponse(jsonable_encoder(build_validated(result))).body
+    new_body = FastJSONResponse(to_jsonable(build_constructed(result))).body
+    assert json.loads(old_body) == json.loads(new_body), "Responses differ"
+
+    print(f"{'stage':<10} {'before ms':>10} {'after ms':>10} {'speedup':>8}")
+    for stage, old, new in zip(["build", "convert", "encode"], before, after):
+        print(f"{stage:<10} {old * 1000:>10.1f} {new * 1000:>10.1f} {old / new:>7.1f}x")
+    print(f"{'total':<10} {sum(before) * 1000:>10.1f} {sum(after) * 1000:>10.1f} "
+          f"{sum(before) / sum(after):>7.1f}x")
+    print(f"\nBody: {len(new_body) / 1024:.0f} KB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark room extraction response serialization")
+    parser.add_argument("--rooms", type=int, default=10000, help="Number of rooms (default: 10000)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per stage (default: 5)")
+    args = parser.parse_args()
+
+    benchmark(args.rooms, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Page Text Benchmark
+
+Compares the per-page cost of reading a page's text in the formats the
+extractors use (dict for room areas, plain text for scale detection,
+blocks for room labels):
+
+- before: one ``page.get_text(...)`` call per format, each rebuilding
+  PyMuPDF's text page (dict also preserves images)
+- after:  one shared text page per page (``PageText``), images skipped
+
+Usage:
+    python benchmark_page_text.py [pdf_path] [--repeat 3] [--pages 20]
+
+Example:
+    python benchmark_page_text.py ../Grundriss_EG.pdf --repeat 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import fitz
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import get_sample_pdf_path
+from app.services.page_text import PageText
+
+
+def read_separately(page: fitz.Page) -> None:
+    page.get_text("dict")
+    page.get_text()
+    page.get_text("blocks")
+
+
+def read_shared(page: fitz.Page) -> None:
+    text = PageText(page)
+    text.dict()
+    text.text()
+    text.blocks()
+
+
+def time_pages(doc: fitz.Document, pages: list, reader, repeat: int) -> float:
+    """Best total time over ``repeat`` runs of ``reader`` on all pages."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for page_idx in pages:
+            reader(doc[page_idx])
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def benchmark(pdf_path: Path, repeat: int, max_pages: int) -> None:
+    doc = fitz.open(str(pdf_path))
+    try:
+        pages = list(range(min(len(doc), max_pages)))
+        print(f"PDF: {pdf_path}")
+        print(f"Pages: {len(pages)}, repeats: {repeat}\n")
+
+        before = time_pages(doc, pages, read_separately, repeat)
+        after = time_pages(doc, pages, read_shared, repeat)
+
+        per_page = 1000.0 / len(pages)
+        print(f"{'mode':<10} {'total s':>9} {'ms/page':>9}")
+        print(f"{'separate':<10} {before:>9.3f} {before * per_page:>9.2f}")
+        print(f"{'shared':<10} {after:>9.3f} {after * per_page:>9.2f}")
+        print(f"\nSpeedup: {before / after:.2f}x")
+    finally:
+        doc.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark shared PyMuPDF text pages")
+    parser.add_argument("pdf", nargs="?", type=Path, default=None,
+                        help="PDF to read (default: sample Türenliste)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per mode (default: 3)")
+    parser.add_argument("--pages", type=int, default=20, help="Maximum pages to read (default: 20)")
+    args = parser.parse_args()
+
+    pdf_path = args.pdf or get_sample_pdf_path()
+    if not pdf_path.exists():
+        print(f"ERROR: PDF not found: {pdf_path}")
+        sys.exit(1)
+
+    benchmark(pdf_path, args.repeat, args.pages)
+
+
+if __name__ == "__main__":
+    main()
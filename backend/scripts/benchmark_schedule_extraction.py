@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Schedule Extraction Benchmark
+
+Times door schedule extraction with each table backend (pdfplumber,
+PyMuPDF find_tables, auto) on the sample Türenliste or any other PDF, and
+checks that the backends extract the same rows.
+
+Usage:
+    python benchmark_schedule_extraction.py [pdf_path] [--repeat 3] [--workers 1] [--no-layout-cache]
+
+Example:
+    python benchmark_schedule_extraction.py ../Tuerenliste_Bauteil_B_OG1.pdf --repeat 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import get_sample_pdf_path
+from app.services.schedule_extraction import EXTRACTION_METHODS, extract_schedules_from_pdf
+
+
+def row_values(result) -> list:
+    """Normalized (header -> value) rows, for comparing backends."""
+    return [
+        {key: cell.value for key, cell in row.items()}
+        for table in result.tables
+        for row in table.rows
+    ]
+
+
+def benchmark(pdf_path: Path, repeat: int, workers: int, layout_cache: bool = True) -> int:
+    print(f"PDF: {pdf_path}")
+    print(f"Workers: {workers}, repeats: {repeat}, layout cache: {'on' if layout_cache else 'off'}\n")
+    print(f"{'method':<12} {'best s':>8} {'mean s':>8} {'tables':>7} {'rows':>6}  backends")
+
+    reference = None
+    mismatches = []
+
+    for method in EXTRACTION_METHODS:
+        timings = []
+        result = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = extract_schedules_from_pdf(
+                pdf_path, max_workers=workers, method=method, layout_cache=layout_cache
+            )
+            timings.append(time.perf_counter() - start)
+
+        if result.status == "error":
+            print(f"{method:<12} ERROR: {'; '.join(result.errors)}")
+            continue
+
+        backends = sorted({t.extraction_method for t in result.tables})
+        print(
+            f"{method:<12} {min(timings):>8.3f} {sum(timings) / len(timings):>8.3f} "
+            f"{len(result.tables):>7} {result.total_rows:>6}  {', '.join(backends)}"
+        )
+
+        rows = row_values(result)
+        if reference is None:
+            reference = rows
+        elif rows != reference:
+            mismatches.append(method)
+
+    if mismatches:
+        print(f"\nWARNING: rows differ from pdfplumber for: {', '.join(mismatches)}")
+        return 1
+    print("\nAll backends extracted identical rows.")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark schedule table backends")
+    parser.add_argument("pdf", nargs="?", type=Path, default=None,
+                        help="Schedule PDF (default: sample Türenliste)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per backend (default: 3)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes (default: 1, measures per-page cost)")
+    parser.add_argument("--no-layout-cache", action="store_true",
+                        help="Run full table detection on every page")
+    args = parser.parse_args()
+
+    pdf_path = args.pdf or get_sample_pdf_path()
+    if not pdf_path.exists():
+        print(f"ERROR: PDF not found: {pdf_path}")
+        sys.exit(1)
+
+    sys.exit(benchmark(pdf_path, args.repeat, args.workers, layout_cache=not args.no_layout_cache))
+
+
+if __name__ == "__main__":
+    main()
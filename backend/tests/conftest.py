@@ -13,8 +13,44 @@ from starlette.testclient import TestClient
 backend_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_dir))
 
-from app.core.config import get_sample_pdf_path
+from app.core.config import get_sample_pdf_path, get_settings
 from app.main import app
+from app.services.page_pool import shutdown_page_pool
+
+
+@pytest.fixture(autouse=True, scope="session")
+def page_pool():
+    """Two page pool workers whatever the CPU count, so the parallel paths run."""
+    settings = get_settings()
+    workers, settings.page_workers = settings.page_workers, 2
+    yield
+    shutdown_page_pool()
+    settings.page_workers = workers
+
+
+@pytest.fixture(autouse=True)
+def isolated_extraction_cache(tmp_path, monkeypatch):
+    """Keep the per-page extraction cache out of the project data dir."""
+    monkeypatch.setattr(get_settings(), "extraction_cache_dir", tmp_path / "extraction_cache")
+
+
+@pytest.fixture(autouse=True)
+def isolated_job_queue(tmp_path, monkeypatch):
+    """Keep background jobs out of the project data dir."""
+    monkeypatch.setattr(get_settings(), "job_queue_db", tmp_path / "jobs" / "queue.sqlite3")
+    monkeypatch.setattr(get_settings(), "job_work_dir", tmp_path / "jobs" / "work")
+
+
+@pytest.fixture(autouse=True)
+def isolated_plan_store(tmp_path, monkeypatch):
+    """Keep stored plan uploads out of the project data dir."""
+    monkeypatch.setattr(get_settings(), "plan_store_dir", tmp_path / "plans")
+
+
+@pytest.fixture(autouse=True)
+def isolated_result_cache(tmp_path, monkeypatch):
+    """Keep cached endpoint results out of the project data dir."""
+    monkeypatch.setattr(get_settings(), "result_cache_dir", tmp_path / "result_cache")
 
 
 @pytest.fixture
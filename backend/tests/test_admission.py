@@ -0,0 +1,143 @@
+"""
+Tests for admission control of rendering / inference endpoints.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core.config import get_settings
+from app.main import app
+from app.services.admission import (
+    AdmissionController,
+    AdmissionRejected,
+    RequestCost,
+    get_admission_controller,
+    render_cost,
+)
+
+
+def controller(**kwargs) -> AdmissionController:
+    options = {"memory_budget_bytes": 100, "cpu_slots": 2, "inference_slots": 1,
+               "max_queue": 4, "max_wait_seconds": 1.0}
+    options.update(kwargs)
+    return AdmissionController(**options)
+
+
+class TestRequestCost:
+    """Tests for cost estimates."""
+
+    def test_memory_grows_with_pages_and_dpi_squared(self):
+        base = render_cost(pages=1, dpi=150)
+        assert render_cost(pages=2, dpi=150).memory_bytes == 2 * base.memory_bytes
+        assert render_cost(pages=1, dpi=300).memory_bytes == pytest.approx(4 * base.memory_bytes, rel=1e-6)
+        assert render_cost(pages=1, dpi=150, inference=True).inference_slots == 1
+
+
+class TestAdmissionController:
+    """Tests for budgets, bounded waits and rejection."""
+
+    def test_waiter_admitted_on_release(self):
+        admission = controller()
+        big = RequestCost(memory_bytes=80)
+
+        async def run():
+            await admission.acquire(big)
+            waiting = asyncio.create_task(admission.acquire(big))
+            await asyncio.sleep(0.05)
+            assert not waiting.done()
+            assert admission.utilization()["queued"] == 1
+
+            admission.release(big)
+            await asyncio.wait_for(waiting, 1)
+
+        asyncio.run(run())
+        usage = admission.utilization()
+        assert usage["active"] == 1
+        assert usage["memory_in_use_bytes"] == 80
+        assert usage["admitted"] == 2
+        assert usage["queued"] == 0
+
+    def test_inference_slots_limit_concurrency(self):
+        admission = controller()
+        model = RequestCost(memory_bytes=1, inference_slots=1)
+
+        assert admission.try_acquire(model)
+        assert not admission.try_acquire(model)
+        assert admission.try_acquire(RequestCost(memory_bytes=1))
+
+    def test_oversized_request_runs_alone(self):
+        admission = controller()
+        huge = RequestCost(memory_bytes=1000)
+
+        assert admission.try_acquire(huge)
+        assert not admission.try_acquire(RequestCost(memory_bytes=1))
+        admission.release(huge)
+        assert admission.try_acquire(RequestCost(memory_bytes=1))
+
+    def test_full_queue_rejected_with_retry_after(self):
+        admission = controller(max_queue=0)
+        assert admission.try_acquire(RequestCost(memory_bytes=100))
+
+        with pytest.raises(AdmissionRejected) as excinfo:
+            asyncio.run(admission.acquire(RequestCost(memory_bytes=1)))
+        assert excinfo.value.retry_after >= 1
+        assert admission.utilization()["rejected"] == 1
+
+    def test_bounded_wait_times_out(self):
+        admission = controller(max_wait_seconds=0.05)
+        assert admission.try_acquire(RequestCost(memory_bytes=100))
+
+        with pytest.raises(AdmissionRejected):
+            asyncio.run(admission.acquire(RequestCost(memory_bytes=1)))
+        usage = admission.utilization()
+        assert usage["timed_out"] == 1
+        assert usage["queued"] == 0
+
+
+class TestAdmissionEndpoints:
+    """Tests for 429 responses and /health utilization."""
+
+    @pytest.fixture
+    def client(self):
+        return TestClient(app)
+
+    @pytest.fixture
+    def plan_pdf(self, tmp_path) -> Path:
+        fitz = pytest.importorskip("fitz")
+        doc = fitz.open()
+        doc.new_page().insert_text((50, 50), "M 1:100")
+        path = tmp_path / "plan.pdf"
+        doc.save(str(path))
+        doc.close()
+        return path
+
+    def test_busy_server_answers_429(self, client, plan_pdf, monkeypatch):
+        monkeypatch.setattr(get_settings(), "admission_max_wait_seconds", 0.0)
+        admission = get_admission_controller()
+        held = RequestCost(memory_bytes=admission.memory_budget_bytes)
+        assert admission.try_acquire(held)
+        try:
+            with open(plan_pdf, "rb") as f:
+                response = client.post(
+                    "/api/v1/gewerke/flooring/geometry",
+                    files={"file": ("plan.pdf", f, "application/pdf")},
+                )
+            assert response.status_code == 429
+            assert int(response.headers["retry-after"]) >= 1
+
+            health = client.get("/health").json()["admission"]
+            assert health["active"] == 1
+            assert health["memory_utilization"] == 1.0
+            assert health["rejected"] == 1
+        finally:
+            admission.release(held)
+
+        assert client.get("/health").json()["admission"]["active"] == 0
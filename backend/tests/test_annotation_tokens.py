@@ -0,0 +1,143 @@
+"""
+Tests for the German area annotation tokenizer.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.services.annotation_tokens import (
+    RoomScheme,
+    TokenKind,
+    parse_number,
+    scan_annotations,
+    tokenize_line,
+    tokenize_text,
+)
+
+
+class TestParseNumber:
+    """Tests for German number parsing."""
+
+    def test_decimal_comma(self):
+        assert parse_number("22,79") == 22.79
+
+    def test_thousands_separator(self):
+        assert parse_number("1.070,55") == 1070.55
+
+    def test_dot_decimal(self):
+        assert parse_number("42.18") == 42.18
+
+    def test_invalid(self):
+        assert parse_number("1,2,3") is None
+
+
+class TestTokenizeLine:
+    """Tests for whole-line classification."""
+
+    @pytest.mark.parametrize("text,scheme", [
+        ("R2.E5.3.5", RoomScheme.HAARDTRING),
+        ("B.00.2.002", RoomScheme.LEIQ),
+        ("33_b6.12", RoomScheme.OMNITURM),
+        ("BT1.EG.001", RoomScheme.OMNITURM),
+        ("EG.001", RoomScheme.GENERIC),
+        ("Raum 101", RoomScheme.GENERIC),
+    ])
+    def test_room_ids(self, text, scheme):
+        """Room numbers should be classified with their numbering scheme."""
+        token = tokenize_line(text)
+        assert token.kind == TokenKind.ROOM_ID
+        assert token.scheme == scheme
+
+    @pytest.mark.parametrize("text,kind,label,value", [
+        ("NRF: 12,34 m²", TokenKind.AREA, "NRF", 12.34),
+        ("NGF: 1.070,55 m2", TokenKind.AREA, "NGF", 1070.55),
+        ("F: 22,79 m", TokenKind.AREA, "F", 22.79),
+        ("BGF = 100 m2", TokenKind.AREA, "BGF", 100.0),
+        ("U: 14,20 m", TokenKind.PERIMETER, "U", 14.2),
+        ("LH: 2,60 m", TokenKind.HEIGHT, "LH", 2.6),
+    ])
+    def test_annotations(self, text, kind, label, value):
+        """A line holding one annotation takes its kind and value."""
+        token = tokenize_line(text)
+        assert token.kind == kind
+        assert token.label == label
+        assert token.value == pytest.approx(value)
+
+    def test_percent(self):
+        """Counted areas carry their factor."""
+        token = tokenize_line("50%: 1,15 m²")
+        assert token.kind == TokenKind.PERCENT
+        assert token.factor == 0.5
+        assert token.value == 1.15
+
+    def test_split_label_and_value(self):
+        """Labels and values split across lines are separate tokens."""
+        label, value, length = tokenize_text("NRF:\n12,34 m2\n14,20 m")
+        assert label.is_label("NRF")
+        assert value.is_area_value and value.value == 12.34
+        assert length.is_length_value
+
+    def test_single_letter_needs_separator(self):
+        """'F' and 'U' without ':' or '=' are not labels."""
+        assert tokenize_line("F").kind == TokenKind.TEXT
+        assert tokenize_line("U 14,20 m").find(TokenKind.PERIMETER) is None
+
+    def test_perimeter_needs_metres(self):
+        """'U: ... m²' is not a perimeter."""
+        assert tokenize_line("U: 14,20 m²").find(TokenKind.PERIMETER) is None
+
+    def test_text(self):
+        assert tokenize_line("Büro").kind == TokenKind.TEXT
+
+
+class TestScanAnnotations:
+    """Tests for inline annotation scanning."""
+
+    def test_multiple_annotations_in_order(self):
+        """Several annotations on one line are returned left to right."""
+        token = tokenize_line("B.01.1.002 Büro NRF: 12,34 m² U: 14,00 m LH: 2,60 m")
+
+        assert token.kind == TokenKind.TEXT
+        kinds = [a.kind for a in token.annotations]
+        assert kinds == [TokenKind.ROOM_ID, TokenKind.AREA, TokenKind.PERIMETER, TokenKind.HEIGHT]
+        assert token.find(TokenKind.ROOM_ID).source == "B.01.1.002"
+        assert token.find(TokenKind.AREA, ("NRF",)).value == 12.34
+
+    def test_label_priority(self):
+        """Earlier labels in the priority list win regardless of position."""
+        token = tokenize_line("BGF: 50 m2 NRF: 40 m2")
+        assert len(token.annotations) == 2
+        assert token.find(TokenKind.AREA, ("NRF", "BGF")).value == 40.0
+
+    def test_label_inside_word_ignored(self):
+        """Labels must not match inside words ('Schacht-F: ...' is fine, 'ELF' is not)."""
+        assert scan_annotations("ELF: 3 m2")[0].label is None
+        assert scan_annotations("Schacht-F: 3 m2")[0].label == "F"
+
+    def test_unlabelled_areas(self):
+        """'12 qm' and trailing ': 54,20 m²' are areas without a label."""
+        qm = scan_annotations("Wohnen 12 qm")[0]
+        tail = scan_annotations("Whg 3: 54,20 m²")[0]
+        assert (qm.kind, qm.label, qm.value) == (TokenKind.AREA, None, 12.0)
+        assert (tail.kind, tail.label, tail.value) == (TokenKind.AREA, None, 54.2)
+
+    def test_open_label_at_end_of_line(self):
+        """A label with its value on the next line is a LABEL annotation."""
+        annotation = scan_annotations("Büro NRF:")[-1]
+        assert annotation.kind == TokenKind.LABEL
+        assert annotation.label == "NRF"
+
+
+class TestTokenizeText:
+    """Tests for page tokenization."""
+
+    def test_indices_follow_lines(self):
+        tokens = tokenize_text("R2.E5.3.5\nWohnen\nF: 24,50 m2")
+        assert [t.index for t in tokens] == [0, 1, 2]
+        assert [t.kind for t in tokens] == [TokenKind.ROOM_ID, TokenKind.TEXT, TokenKind.AREA]
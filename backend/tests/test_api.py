@@ -4,6 +4,7 @@ Tests for FastAPI endpoints.
 These tests verify the API layer works correctly.
 """
 
+import asyncio
 import sys
 from pathlib import Path
 
@@ -14,6 +15,7 @@ from fastapi.testclient import TestClient
 backend_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_dir))
 
+from app.core.config import get_settings
 from app.main import app
 
 
@@ -142,3 +144,142 @@ class TestScheduleEndpoints:
                     assert "raw" in cell
                     assert "confidence" in cell
                     assert "page" in cell
+
+
+class TestRoomStreaming:
+    """Tests for the page-by-page streaming extraction endpoints."""
+
+    @pytest.fixture
+    def leiq_pdf(self, tmp_path) -> Path:
+        fitz = pytest.importorskip("fitz")
+        doc = fitz.open()
+        for floor in range(3):
+            page = doc.new_page()
+            y = 50
+            for line in [f"B.0{floor}.2.001", "Büro", f"NRF: 1{floor},50 m2", "U: 14,20 m"]:
+                page.insert_text((50, y), line)
+                y += 14
+        path = tmp_path / "leiq.pdf"
+        doc.save(str(path))
+        doc.close()
+        return path
+
+    @staticmethod
+    def _ndjson(response):
+        import json
+        return [json.loads(line) for line in response.text.splitlines() if line]
+
+    def test_rooms_stream_ndjson(self, client, leiq_pdf):
+        """Pages arrive in order with running totals, then a summary."""
+        with open(leiq_pdf, "rb") as f:
+            response = client.post(
+                "/api/v1/extraction/rooms/stream",
+                files={"file": ("leiq.pdf", f, "application/pdf")},
+            )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        events = self._ndjson(response)
+
+        assert [e["event"] for e in events] == ["start", "page", "page", "page", "summary"]
+        assert events[0]["blueprint_style"] == "leiq"
+        assert [e["page"] for e in events[1:4]] == [0, 1, 2]
+        assert [e["totals"]["area_m2"] for e in events[1:4]] == [10.5, 22.0, 34.5]
+        assert events[-1]["summary"]["total_area_m2"] == 34.5
+
+    def test_rooms_stream_matches_batch_endpoint(self, client, leiq_pdf):
+        """Streamed rooms and summary equal the non-streaming response."""
+        with open(leiq_pdf, "rb") as f:
+            batch = client.post(
+                "/api/v1/extraction/rooms",
+                files={"file": ("leiq.pdf", f, "application/pdf")},
+            ).json()
+        with open(leiq_pdf, "rb") as f:
+            events = self._ndjson(client.post(
+                "/api/v1/extraction/rooms/stream",
+                files={"file": ("leiq.pdf", f, "application/pdf")},
+            ))
+
+        streamed_rooms = [room for e in events if e["event"] == "page" for room in e["rooms"]]
+        assert streamed_rooms == batch["rooms"]
+        assert events[-1]["summary"] == batch["summary"]
+
+    def test_rooms_reports_reused_pages(self, client, leiq_pdf, monkeypatch):
+        """A re-uploaded plan reuses every unchanged page."""
+        # Bypass the response cache so the second call reaches the page cache
+        monkeypatch.setattr(get_settings(), "result_cache_enabled", False)
+        responses = []
+        for _ in range(2):
+            with open(leiq_pdf, "rb") as f:
+                responses.append(client.post(
+                    "/api/v1/extraction/rooms",
+                    files={"file": ("leiq.pdf", f, "application/pdf")},
+                ).json())
+
+        first, second = responses
+        assert (first["recomputed_pages"], first["reused_pages"]) == ([0, 1, 2], [])
+        assert (second["recomputed_pages"], second["reused_pages"]) == ([], [0, 1, 2])
+        assert second["rooms"] == first["rooms"]
+
+    def test_rooms_stream_sse(self, client, leiq_pdf):
+        """SSE framing uses event:/data: fields."""
+        with open(leiq_pdf, "rb") as f:
+            response = client.post(
+                "/api/v1/extraction/rooms/stream?format=sse&pages=0",
+                files={"file": ("leiq.pdf", f, "application/pdf")},
+            )
+
+        assert response.headers["content-type"].startswith("text/event-stream")
+        blocks = [b for b in response.text.split("\n\n") if b]
+        assert [b.split("\n")[0] for b in blocks] == ["event: start", "event: page", "event: summary"]
+
+    def test_rooms_stream_rejects_bad_input(self, client, leiq_pdf):
+        """Validation errors are returned before streaming starts."""
+        with open(leiq_pdf, "rb") as f:
+            response = client.post(
+                "/api/v1/extraction/rooms/stream?pages=a",
+                files={"file": ("leiq.pdf", f, "application/pdf")},
+            )
+        assert response.status_code == 400
+
+    def test_stream_opened_in_threadpool(self, client, leiq_pdf, monkeypatch):
+        """Opening the stream does not block the event loop; failures release the plan."""
+        from app.api import extraction
+        from app.services.plan_store import get_plan_store
+
+        calls = []
+
+        def open_stream(*args, **kwargs):
+            try:
+                asyncio.get_running_loop()
+                calls.append("event loop")
+            except RuntimeError:
+                calls.append("thread")
+            raise ValueError("Failed to open PDF")
+
+        monkeypatch.setattr(extraction, "RoomExtractionStream", open_stream)
+        with open(leiq_pdf, "rb") as f:
+            response = client.post(
+                "/api/v1/extraction/rooms/stream",
+                files={"file": ("leiq.pdf", f, "application/pdf")},
+            )
+
+        assert response.status_code == 400
+        assert calls == ["thread"]
+        assert get_plan_store().stats.in_use == 0
+
+    def test_nrf_stream(self, client, leiq_pdf):
+        """The NRF flooring stream numbers rooms across pages."""
+        with open(leiq_pdf, "rb") as f:
+            response = client.post(
+                "/api/v1/gewerke/flooring/nrf/stream?pages=0,2,9",
+                files={"file": ("leiq.pdf", f, "application/pdf")},
+            )
+
+        events = self._ndjson(response)
+        pages = [e for e in events if e["event"] == "page"]
+        assert [p["page"] for p in pages] == [0, 2, 9]
+        assert [r["room_id"] for p in pages for r in p["rooms"]] == ["room_001", "room_002"]
+        assert pages[-1]["warnings"] == ["Page 9 does not exist (PDF has 3 pages)"]
+        assert events[-1]["event"] == "summary"
+        assert events[-1]["total_area_m2"] == 23.0
@@ -0,0 +1,191 @@
+"""
+Tests for project batch analysis.
+"""
+
+import io
+import json
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.main import app
+from app.services.batch_analysis import (
+    ProjectAggregate,
+    floor_from_filename,
+    floor_from_room_numbers,
+    floor_sort_key,
+)
+
+
+def rooms_result(area: float, perimeter: float, category: str = "office") -> dict:
+    return {
+        "summary": {
+            "total_rooms": 1,
+            "total_area_m2": area,
+            "total_counted_m2": area,
+            "by_category": [{"category": category, "area_m2": area, "room_count": 1}],
+        },
+        "rooms": [{"room_number": "B.00.2.001", "perimeter_m": perimeter}],
+    }
+
+
+def doors_result(t90: int = 0, t30: int = 0, standard: int = 0) -> dict:
+    return {
+        "total_doors": t90 + t30 + standard,
+        "by_fire_rating": {"count_t90": t90, "count_t30": t30, "count_dss": 0, "count_standard": standard},
+    }
+
+
+class TestFloors:
+    """Tests for floor detection and ordering."""
+
+    @pytest.mark.parametrize("filename, floor", [
+        ("LeiQ_B_EG.pdf", "EG"),
+        ("Haus2_1.OG_Nord.pdf", "1.OG"),
+        ("Grundriss 03 OG.pdf", "3.OG"),
+        ("OG2-Sued.pdf", "2.OG"),
+        ("Plan_Untergeschoss.pdf", "UG"),
+        ("2.UG Tiefgarage.pdf", "2.UG"),
+        ("dachgeschoss.pdf", "DG"),
+        ("Schnitt_A-A.pdf", None),
+        ("LEGENDE.pdf", None),
+    ])
+    def test_floor_from_filename(self, filename, floor):
+        assert floor_from_filename(filename) == floor
+
+    def test_floor_from_room_numbers(self):
+        assert floor_from_room_numbers(["B.01.2.001", "B.01.2.002", "B.00.1.001"]) == "01"
+        assert floor_from_room_numbers(["Room_1"]) is None
+
+    def test_floors_ordered_bottom_to_top(self):
+        floors = ["DG", "2.OG", "EG", "UG", "Schnitt", "2.UG", "10.OG", "1.OG"]
+        assert sorted(floors, key=floor_sort_key) == [
+            "2.UG", "UG", "EG", "1.OG", "2.OG", "10.OG", "DG", "Schnitt",
+        ]
+
+
+class TestProjectAggregate:
+    """Tests for project and per-floor totals."""
+
+    def test_totals_per_floor(self):
+        aggregate = ProjectAggregate(wall_height_m=2.5)
+        aggregate.add("EG_Nord.pdf", "EG", rooms_result(10.0, 14.0), doors_result(t90=1, standard=2))
+        aggregate.add("EG_Sued.pdf", "EG", rooms_result(20.0, 18.0), doors_result(t30=1))
+        aggregate.add("1.OG.pdf", "1.OG", rooms_result(5.0, 10.0, "wc"), doors_result(standard=1))
+        aggregate.add_failure()
+
+        project = aggregate.to_dict()
+        assert project["files"] == 4
+        assert project["files_failed"] == 1
+        assert project["rooms"]["total_area_m2"] == 35.0
+        assert project["rooms"]["by_category"] == {"office": 30.0, "wc": 5.0}
+        assert project["doors"]["by_fire_rating"] == {"T90": 1, "T30": 1, "DSS": 0, "Standard": 3}
+        assert project["drywall"]["total_drywall_area_m2"] == 105.0
+
+        eg, og = project["floors"]
+        assert eg["floor"] == "EG"
+        assert eg["files"] == ["EG_Nord.pdf", "EG_Sued.pdf"]
+        assert eg["wall_length_m"] == 32.0
+        assert og["doors"] == 1
+
+
+class TestBatchEndpoint:
+    """Tests for /batch/analyze."""
+
+    @pytest.fixture
+    def client(self):
+        return TestClient(app)
+
+    @staticmethod
+    def plan_bytes(floor: int, area: str) -> bytes:
+        fitz = pytest.importorskip("fitz")
+        doc = fitz.open()
+        page = doc.new_page()
+        for i, line in enumerate([f"B.0{floor}.2.001", "Büro", f"NRF: {area} m2", "U: 14,20 m"]):
+            page.insert_text((50, 50 + 14 * i), line)
+        data = doc.tobytes()
+        doc.close()
+        return data
+
+    @staticmethod
+    def events(response) -> list:
+        return [json.loads(line) for line in response.text.splitlines() if line]
+
+    def test_files_and_zip_aggregated_per_floor(self, client):
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("plans/Haus_1.OG.pdf", self.plan_bytes(1, "20,00"))
+            zf.writestr("plans/readme.txt", "not a plan")
+
+        response = client.post(
+            "/api/v1/batch/analyze?include_doors=false&wall_height_m=2.5",
+            files=[
+                ("files", ("Haus_EG.pdf", self.plan_bytes(0, "12,50"), "application/pdf")),
+                ("files", ("plans.zip", archive.getvalue(), "application/zip")),
+                ("files", ("broken.pdf", b"not a pdf", "application/pdf")),
+            ],
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        events = self.events(response)
+        assert events[0]["event"] == "start"
+        assert events[0]["files_total"] == 3
+        assert events[-1]["event"] == "project"
+
+        files = {e["source_file"]: e for e in events if e["event"] == "file"}
+        assert "error" in files["broken.pdf"]
+        assert files["Haus_1.OG.pdf"]["rooms"]["summary"]["total_area_m2"] == 20.0
+
+        project = events[-1]
+        assert project["files_failed"] == 1
+        assert project["rooms"]["total_area_m2"] == 32.5
+        assert project["doors"] is None
+        assert [f["floor"] for f in project["floors"]] == ["EG", "1.OG"]
+        assert project["drywall"]["total_drywall_area_m2"] == pytest.approx(2 * 14.2 * 2.5)
+
+    def test_shares_result_cache_with_single_endpoint(self, client):
+        data = self.plan_bytes(0, "12,50")
+        file_id = client.post(
+            "/api/v1/files", files={"file": ("EG.pdf", data, "application/pdf")}
+        ).json()["file_id"]
+
+        batch = self.events(client.post(
+            f"/api/v1/batch/analyze?include_doors=false&file_ids={file_id}"
+        ))
+        assert batch[1]["cache"]["rooms"] == "computed"
+
+        single = client.post(f"/api/v1/extraction/rooms?file_id={file_id}")
+        assert single.headers["x-cache"] == "memory"
+
+    def test_file_limit_checked_before_storing(self, client, monkeypatch):
+        from app.core.config import get_settings
+        from app.services.plan_store import get_plan_store
+
+        monkeypatch.setattr(get_settings(), "batch_max_files", 2)
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("EG.pdf", self.plan_bytes(0, "12,50"))
+            zf.writestr("OG.pdf", self.plan_bytes(1, "20,00"))
+            zf.writestr("readme.txt", "not a plan")
+
+        response = client.post(
+            "/api/v1/batch/analyze?include_doors=false",
+            files=[
+                ("files", ("DG.pdf", self.plan_bytes(2, "8,00"), "application/pdf")),
+                ("files", ("plans.zip", archive.getvalue(), "application/zip")),
+            ],
+        )
+        assert response.status_code == 400
+        assert "3 files" in response.json()["detail"]
+        assert get_plan_store().stats.entries == 0
+
+    def test_requires_input(self, client):
+        assert client.post("/api/v1/batch/analyze").status_code == 400
@@ -12,7 +12,10 @@ These tests validate:
 
 import sys
 import tempfile
+import threading
+import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -32,10 +35,13 @@ from app.services.cv_pipeline import (
     is_yolo_available,
     run_object_detection_on_page,
     _map_yolo_class_to_object_type,
+    detect_doors_hybrid,
     CV2_AVAILABLE,
     YOLO_AVAILABLE,
 )
 from app.core.config import Settings
+from app.services import cv_pipeline
+from app.services.door_labels import parse_door_labels_and_fire_ratings
 
 
 class TestObjectType:
@@ -436,6 +442,131 @@ class TestRunObjectDetection:
         assert isinstance(result.warnings, list)
 
 
+class TestHybridDoorDetection:
+    """Tests for the parallel vector/YOLO/text fan-out."""
+
+    @staticmethod
+    def _door(object_id, x, method, confidence=0.9):
+        return DetectedObject(
+            object_id, ObjectType.DOOR, BoundingBox(x=x, y=0, width=50, height=50),
+            confidence, 1, attributes={"detection_method": method},
+        )
+
+    def test_stages_run_concurrently(self):
+        """Vector, YOLO and text stages should overlap in time."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def vector_stage(*args):
+            barrier.wait()
+            return [self._door("v1", 0, "vector")], []
+
+        def yolo_stage(*args):
+            barrier.wait()
+            return [self._door("y1", 500, "yolo", 0.8)], ["yolo warning"]
+
+        def text_stage(*args):
+            barrier.wait()
+            return {"B.01.1.001-1": {"fire_rating": "T 30-RS", "category": "T30"}}
+
+        with patch.object(cv_pipeline, "_run_vector_door_stage", vector_stage), \
+             patch.object(cv_pipeline, "_run_yolo_door_stage", yolo_stage), \
+             patch.object(cv_pipeline, "is_yolo_available", return_value=True), \
+             patch("app.services.door_labels.extract_door_labels_and_fire_ratings", text_stage):
+            result = detect_doors_hybrid("plan.pdf", extract_labels=True)
+
+        assert [o.object_id for o in result.objects] == ["v1", "y1"]
+        assert result.door_labels["B.01.1.001-1"]["category"] == "T30"
+        assert result.warnings == ["yolo warning"]
+        assert set(result.stage_timings_ms) == {"vector", "yolo", "text", "merge"}
+
+    def test_pdf_access_serialized(self):
+        """Stages must not call PyMuPDF at the same time; inference may overlap."""
+        active = []
+        overlaps = []
+
+        def pdf_call(result):
+            def call(*args, **kwargs):
+                active.append(1)
+                overlaps.append(len(active))
+                time.sleep(0.02)
+                active.pop()
+                return result
+            return call
+
+        yolo_result = DetectionResult(
+            document_id="plan", page_number=1, objects=[], processing_time_ms=0, model_version="test"
+        )
+        with patch("app.services.vector_measurement.measure_doors_on_page", pdf_call([])), \
+             patch.object(cv_pipeline, "render_pdf_page_to_image", pdf_call("page.png")), \
+             patch.object(cv_pipeline, "run_object_detection_on_page", return_value=yolo_result), \
+             patch.object(cv_pipeline, "is_yolo_available", return_value=True), \
+             patch("app.services.door_labels.extract_door_labels_and_fire_ratings", pdf_call({})):
+            result = detect_doors_hybrid("plan.pdf", extract_labels=True)
+
+        assert overlaps == [1, 1, 1]
+        assert result.warnings == []
+
+    def test_merge_order_independent_of_completion(self):
+        """Results should merge in stage order even if vector finishes last."""
+
+        def slow_vector(*args):
+            time.sleep(0.05)
+            return [self._door("v1", 0, "vector", 0.9)], []
+
+        def fast_yolo(*args):
+            return [self._door("y1", 0, "yolo", 0.9)], []
+
+        with patch.object(cv_pipeline, "_run_vector_door_stage", slow_vector), \
+             patch.object(cv_pipeline, "_run_yolo_door_stage", fast_yolo), \
+             patch.object(cv_pipeline, "is_yolo_available", return_value=True):
+            result = detect_doors_hybrid("plan.pdf")
+
+        # Equal confidence overlap: the vector detection is kept
+        assert [o.object_id for o in result.objects] == ["v1"]
+        assert result.stage_timings_ms["vector"] >= 40
+
+    def test_stage_failure_becomes_warning(self):
+        """A failing stage should not discard the other stages' results."""
+
+        def broken_vector(*args):
+            raise RuntimeError("bad drawing")
+
+        with patch.object(cv_pipeline, "_run_vector_door_stage", broken_vector), \
+             patch.object(cv_pipeline, "_run_yolo_door_stage", return_value=([self._door("y1", 0, "yolo")], [])), \
+             patch.object(cv_pipeline, "is_yolo_available", return_value=True):
+            result = detect_doors_hybrid("plan.pdf")
+
+        assert [o.object_id for o in result.objects] == ["y1"]
+        assert result.warnings == ["Vector detection failed: bad drawing"]
+        assert "vector" in result.stage_timings_ms
+
+    def test_yolo_unavailable_skips_stage(self):
+        """Without a YOLO model only the vector stage should run."""
+        with patch.object(cv_pipeline, "_run_vector_door_stage", return_value=([], [])):
+            result = detect_doors_hybrid("plan.pdf", settings=Settings(yolo_model_path=None))
+
+        assert "yolo" not in result.stage_timings_ms
+        assert any("YOLO not available" in w for w in result.warnings)
+
+
+class TestDoorLabelParsing:
+    """Tests for door label and fire rating parsing."""
+
+    def test_fire_rating_applies_to_previous_label(self):
+        """A rating line belongs to the door label directly above it."""
+        text = "B.06.1.001-1\nT 30-RS\nB.06.1.002-1\n-\nB.06.1.003-1\nT90\nB.06.1.004-1\nDSS\n"
+        labels = parse_door_labels_and_fire_ratings(text)
+
+        assert labels["B.06.1.001-1"]["category"] == "T30"
+        assert labels["B.06.1.002-1"]["category"] == "Standard"
+        assert labels["B.06.1.003-1"] == {"fire_rating": "T 90-RS", "category": "T90"}
+        assert labels["B.06.1.004-1"]["category"] == "DSS"
+
+    def test_no_labels(self):
+        """Text without door labels yields an empty result."""
+        assert parse_door_labels_and_fire_ratings("Wohnen 24,5 m2\nT30") == {}
+
+
 class TestEdgeCases:
     """Tests for edge cases and boundary conditions."""
 
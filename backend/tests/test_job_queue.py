@@ -0,0 +1,250 @@
+"""
+Tests for the durable background job queue.
+"""
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.api import job_queue as job_queue_api
+from app.api.job_queue import JOB_HANDLERS, run_worker_pool
+from app.main import app
+from app.services.job_queue import (
+    COMPLETED,
+    FAILED,
+    QUEUED,
+    RUNNING,
+    JobError,
+    JobQueue,
+    JobWorkerPool,
+    get_job_queue,
+    run_next_job,
+)
+
+
+# Handlers referenced by "module:function", as the worker processes see them
+def echo_job(work_dir: Path, params):
+    return {"echo": params["value"]}
+
+
+def invalid_job(work_dir: Path, params):
+    raise JobError("Invalid page", status_code=400)
+
+
+def crash_once_job(work_dir: Path, params):
+    """Kills its worker process on the first attempt."""
+    marker = work_dir / "attempted"
+    if not marker.exists():
+        marker.touch()
+        os._exit(1)
+    return {"recovered": True}
+
+
+HANDLERS = {
+    "echo": f"{__name__}:echo_job",
+    "invalid": f"{__name__}:invalid_job",
+    "crash_once": f"{__name__}:crash_once_job",
+}
+
+
+@pytest.fixture
+def queue(tmp_path) -> JobQueue:
+    return JobQueue(tmp_path / "queue.sqlite3", tmp_path / "work", lease_seconds=60, max_attempts=2)
+
+
+def wait_for(predicate, timeout: float = 60.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.1)
+    return False
+
+
+class TestJobQueue:
+    """Tests for the SQLite queue lifecycle."""
+
+    def test_lifecycle(self, queue):
+        job = queue.submit("echo", {"value": 1})
+        assert job.status == QUEUED
+
+        claimed = queue.claim("w1")
+        assert claimed.id == job.id
+        assert claimed.status == RUNNING
+        assert claimed.attempts == 1
+
+        queue.complete(job.id, "w1", {"echo": 1})
+        done = queue.get(job.id)
+        assert done.status == COMPLETED
+        assert done.result == {"echo": 1}
+        assert done.finished_at is not None
+
+    def test_claims_oldest_first_and_once(self, queue):
+        first = queue.submit("echo", {"value": 1})
+        second = queue.submit("echo", {"value": 2})
+
+        assert queue.claim("w1").id == first.id
+        assert queue.claim("w2").id == second.id
+        assert queue.claim("w3") is None
+
+    def test_expired_lease_requeued_then_failed(self, queue):
+        job = queue.submit("echo", {"value": 1})
+        queue.lease_seconds = -1  # Leases expire immediately
+
+        queue.claim("w1")
+        assert queue.recover_expired() == [job.id]
+        assert queue.get(job.id).status == QUEUED
+
+        queue.claim("w2")
+        assert queue.recover_expired() == []
+        failed = queue.get(job.id)
+        assert failed.status == FAILED
+        assert failed.attempts == 2
+
+    def test_stale_worker_cannot_finish(self, queue):
+        job = queue.submit("echo", {"value": 1})
+        queue.lease_seconds = -1
+        queue.claim("w1")
+        queue.recover_expired()
+        queue.lease_seconds = 60
+        queue.claim("w2")
+
+        assert not queue.heartbeat(job.id, "w1")
+        queue.complete(job.id, "w1", {"echo": "stale"})
+        assert queue.get(job.id).status == RUNNING
+
+    def test_purge_removes_work_dir(self, queue):
+        job = queue.submit("echo", {"value": 1})
+        run_next_job(queue, HANDLERS)
+        assert queue.job_dir(job.id).exists()
+
+        assert queue.purge(older_than_seconds=-1) == 1
+        assert queue.get(job.id) is None
+        assert not queue.job_dir(job.id).exists()
+
+
+class TestRunJob:
+    """Tests for in-process job execution."""
+
+    def test_handler_result_stored(self, queue):
+        queue.submit("echo", {"value": "a"})
+        job = run_next_job(queue, HANDLERS)
+        assert job.status == COMPLETED
+        assert job.result == {"echo": "a"}
+
+    def test_handler_error_fails_without_retry(self, queue):
+        queue.submit("invalid", {})
+        job = run_next_job(queue, HANDLERS)
+        assert job.status == FAILED
+        assert job.error == "Invalid page"
+        assert job.error_status == 400
+        assert queue.claim("w1") is None
+
+    def test_unknown_kind_fails(self, queue):
+        queue.submit("nope", {})
+        assert run_next_job(queue, HANDLERS).status == FAILED
+
+
+class TestWorkerPool:
+    """Tests for the worker processes."""
+
+    def test_workers_drain_queue_and_retry_crash(self, queue):
+        queue.lease_seconds = 1
+        jobs = [queue.submit("echo", {"value": i}) for i in range(3)]
+        crashing = queue.submit("crash_once", {})
+
+        pool = JobWorkerPool(queue, HANDLERS, workers=2, poll_interval=0.1)
+        pool.start()
+        try:
+            assert wait_for(lambda: all(queue.get(j.id).finished for j in jobs + [crashing]))
+        finally:
+            pool.stop()
+
+        assert [queue.get(j.id).result for j in jobs] == [{"echo": i} for i in range(3)]
+        recovered = queue.get(crashing.id)
+        assert recovered.status == COMPLETED
+        assert recovered.attempts == 2
+
+
+    def test_job_process_runs_pool_until_stopped(self, monkeypatch):
+        calls = []
+
+        class FakePool:
+            def start(self):
+                calls.append("start")
+
+            def stop(self):
+                calls.append("stop")
+
+        monkeypatch.setattr(job_queue_api, "create_worker_pool", lambda settings: FakePool())
+        stop = threading.Event()
+        stop.set()
+        run_worker_pool(stop=stop)
+        assert calls == ["start", "stop"]
+
+        monkeypatch.setattr(job_queue_api, "create_worker_pool", lambda settings: None)
+        run_worker_pool(stop=stop)
+        assert calls == ["start", "stop"]
+
+
+class TestQueueEndpoints:
+    """Tests for submitting and polling background jobs over HTTP."""
+
+    @pytest.fixture
+    def client(self):
+        return TestClient(app)
+
+    @pytest.fixture
+    def plan_pdf(self, tmp_path) -> Path:
+        fitz = pytest.importorskip("fitz")
+        doc = fitz.open()
+        page = doc.new_page()
+        for i, line in enumerate(["B.00.2.001", "Büro", "NRF: 12,50 m2"]):
+            page.insert_text((50, 50 + 14 * i), line)
+        path = tmp_path / "plan.pdf"
+        doc.save(str(path))
+        doc.close()
+        return path
+
+    def test_export_job_round_trip(self, client, plan_pdf):
+        with open(plan_pdf, "rb") as f:
+            response = client.post(
+                "/api/v1/extraction/extract-and-export/jobs?format=csv",
+                files={"file": ("plan.pdf", f, "application/pdf")},
+            )
+
+        assert response.status_code == 202
+        submitted = response.json()
+        assert submitted["status"] == QUEUED
+        assert client.get(submitted["result_url"]).status_code == 409
+
+        run_next_job(get_job_queue(), JOB_HANDLERS)
+
+        status = client.get(submitted["status_url"]).json()
+        assert status["status"] == COMPLETED
+        result = client.get(submitted["result_url"])
+        assert result.status_code == 200
+        assert result.headers["content-type"].startswith("text/csv")
+        assert "B.00.2.001" in result.text
+
+    def test_invalid_parameters_rejected_before_queueing(self, client, plan_pdf):
+        with open(plan_pdf, "rb") as f:
+            response = client.post(
+                "/api/v1/extraction/extract-and-export/jobs?format=pdf",
+                files={"file": ("plan.pdf", f, "application/pdf")},
+            )
+
+        assert response.status_code == 400
+        assert get_job_queue().counts()[QUEUED] == 0
+
+    def test_unknown_job(self, client):
+        assert client.get("/api/v1/jobs/queue/unknown").status_code == 404
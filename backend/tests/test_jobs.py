@@ -0,0 +1,211 @@
+"""
+Tests for the /jobs worker endpoints.
+"""
+
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+fitz = pytest.importorskip("fitz")
+
+from app.api import jobs
+from app.api.jobs import extract_areas_from_pages, parse_page_selection, resolve_page_workers
+from app.core.config import get_settings
+from app.main import app
+
+
+def plan_pdf(page_count: int) -> bytes:
+    """One room per page; page n has NRF n,00 m²."""
+    doc = fitz.open()
+    for n in range(1, page_count + 1):
+        page = doc.new_page()
+        page.insert_text((50, 50), f"B.00.2.{n:03d} Büro")
+        page.insert_text((50, 64), f"NRF: {n},00 m2")
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+@pytest.fixture
+def served(monkeypatch):
+    """Serve PDFs by URL through a mock transport; records clients and requests."""
+    files = {}
+    requests = []
+    clients = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(str(request.url))
+        data = files.get(str(request.url))
+        if data is None:
+            return httpx.Response(404)
+        return httpx.Response(200, content=data)
+
+    def create_client() -> httpx.AsyncClient:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr(jobs, "create_http_client", create_client)
+    return {"files": files, "requests": requests, "clients": clients}
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+class TestPageSelection:
+    """Tests for page selection parsing."""
+
+    def test_all(self):
+        assert parse_page_selection("all", 3) == [1, 2, 3]
+
+    def test_ranges_and_singles(self):
+        assert parse_page_selection("1-3, 5", 6) == [1, 2, 3, 5]
+
+    def test_list_and_int(self):
+        assert parse_page_selection([3, 1, 3], 4) == [3, 1]
+        assert parse_page_selection(2, 4) == [2]
+
+    @pytest.mark.parametrize("selection", ["0", "1-9", "a-b", "3-1", [], [1.5], True, None])
+    def test_invalid(self, selection):
+        with pytest.raises(ValueError):
+            parse_page_selection(selection, 4)
+
+
+class TestExtractAreasFromPages:
+    """Tests for multi-page extraction."""
+
+    def test_workers_clamped(self, monkeypatch):
+        monkeypatch.setattr(get_settings(), "page_workers", 8)
+        assert resolve_page_workers(None) == 8
+        assert resolve_page_workers(10_000) == 8
+        assert resolve_page_workers(-3) == 1
+        assert resolve_page_workers(2) == 2
+
+    @pytest.mark.parametrize("max_workers", ["4", 2.5, True, [2]])
+    def test_invalid_workers(self, max_workers):
+        with pytest.raises(ValueError):
+            resolve_page_workers(max_workers)
+
+    def test_parallel_matches_serial(self, tmp_path):
+        path = tmp_path / "plan.pdf"
+        path.write_bytes(plan_pdf(6))
+
+        serial = extract_areas_from_pages(str(path), "all", max_workers=1)
+        parallel = extract_areas_from_pages(str(path), "all", max_workers=2)
+
+        assert serial == parallel
+        assert parallel["pages"] == [1, 2, 3, 4, 5, 6]
+        assert [r["source_page"] for r in parallel["rooms"]] == [1, 2, 3, 4, 5, 6]
+
+
+class TestProcessJob:
+    """Tests for POST /jobs/process."""
+
+    def test_page_range(self, client, served):
+        served["files"]["https://files.test/plan.pdf"] = plan_pdf(4)
+
+        response = client.post("/api/v1/jobs/process", json={
+            "job_id": "job-1",
+            "file_url": "https://files.test/plan.pdf",
+            "config": {"pages": "2-3"},
+        })
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["pages"] == [2, 3]
+        assert data["total_area_m2"] == 5.0
+
+    def test_legacy_page_number(self, client, served):
+        served["files"]["https://files.test/plan.pdf"] = plan_pdf(3)
+
+        response = client.post("/api/v1/jobs/process", json={
+            "job_id": "job-1",
+            "file_url": "https://files.test/plan.pdf",
+            "config": {"page_number": 3},
+        })
+
+        assert response.status_code == 200
+        assert response.json()["pages"] == [3]
+
+    def test_invalid_pages_is_client_error(self, client, served):
+        served["files"]["https://files.test/plan.pdf"] = plan_pdf(2)
+
+        response = client.post("/api/v1/jobs/process", json={
+            "job_id": "job-1",
+            "file_url": "https://files.test/plan.pdf",
+            "config": {"pages": "1-5"},
+        })
+
+        assert response.status_code == 400
+
+    def test_invalid_max_workers_is_client_error(self, client, served):
+        served["files"]["https://files.test/plan.pdf"] = plan_pdf(2)
+
+        response = client.post("/api/v1/jobs/process", json={
+            "job_id": "job-1",
+            "file_url": "https://files.test/plan.pdf",
+            "config": {"pages": "all", "max_workers": "many"},
+        })
+
+        assert response.status_code == 400
+        assert "max_workers" in response.json()["detail"]
+
+    def test_download_streamed_in_chunks(self, client, served, monkeypatch):
+        """A small chunk size still reassembles the whole file on disk."""
+        monkeypatch.setattr(jobs, "DOWNLOAD_CHUNK_BYTES", 256)
+        served["files"]["https://files.test/plan.pdf"] = plan_pdf(5)
+
+        response = client.post("/api/v1/jobs/process", json={
+            "job_id": "job-1",
+            "file_url": "https://files.test/plan.pdf",
+            "config": {"pages": "all"},
+        })
+
+        assert response.status_code == 200
+        assert response.json()["total_rooms"] == 5
+
+
+class TestProcessBatch:
+    """Tests for POST /jobs/process-batch."""
+
+    def test_jobs_share_one_client(self, client, served):
+        served["files"]["https://files.test/a.pdf"] = plan_pdf(2)
+        served["files"]["https://files.test/b.pdf"] = plan_pdf(3)
+
+        response = client.post("/api/v1/jobs/process-batch", json={"jobs": [
+            {"job_id": "a", "file_url": "https://files.test/a.pdf", "config": {"pages": "all"}},
+            {"job_id": "b", "file_url": "https://files.test/b.pdf", "config": {"pages": [3]}},
+        ]})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["job_id"] for r in data["results"]] == ["a", "b"]
+        assert data["results"][0]["total_area_m2"] == 3.0
+        assert data["results"][1]["pages"] == [3]
+        assert data["completed"] == 2 and data["failed"] == 0
+        assert len(served["clients"]) == 1
+        assert len(served["requests"]) == 2
+
+    def test_failed_job_does_not_fail_batch(self, client, served):
+        served["files"]["https://files.test/a.pdf"] = plan_pdf(1)
+
+        response = client.post("/api/v1/jobs/process-batch", json={"jobs": [
+            {"job_id": "a", "file_url": "https://files.test/a.pdf"},
+            {"job_id": "missing", "file_url": "https://files.test/missing.pdf"},
+        ]})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["completed"] == 1 and data["failed"] == 1
+        failed = data["results"][1]
+        assert failed["status"] == "failed"
+        assert "Failed to download PDF" in failed["error"]
@@ -0,0 +1,97 @@
+"""
+Tests for lazy heavy-dependency imports and worker startup time.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core.lazy_imports import LazyModule, is_available, lazy_import
+
+
+# Summed self time of the app.* modules when importing app.main, measured
+# with `python -X importtime`. About 0.25 s on a developer machine; third-
+# party imports (FastAPI, pydantic) are excluded, so the budget can leave
+# generous headroom for slow CI machines and still catch app modules doing
+# real work at import time (eager heavy imports: see HEAVY_MODULES).
+APP_IMPORT_BUDGET_SECONDS = 1.5
+
+HEAVY_MODULES = ["fitz", "cv2", "numpy", "pdfplumber", "openpyxl", "PIL", "ultralytics", "supabase"]
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=backend_dir,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+
+class TestLazyModule:
+    """Tests for lazy_import and is_available."""
+
+    def test_loaded_on_first_attribute_access(self):
+        module = lazy_import("json")
+        assert isinstance(module, LazyModule)
+        assert "not loaded" in repr(module)
+
+        assert module.dumps({"a": 1}) == '{"a": 1}'
+        assert "loaded" in repr(module) and "not loaded" not in repr(module)
+        assert "dumps" in module.__dict__
+
+    def test_missing_attribute_after_load(self):
+        module = lazy_import("json")
+        module.loads("{}")
+        with pytest.raises(AttributeError):
+            module.no_such_function
+
+    def test_missing_module_fails_on_use(self):
+        module = lazy_import("snapgrid_no_such_module")
+        with pytest.raises(ImportError):
+            module.anything
+
+    def test_is_available(self):
+        assert is_available("json")
+        assert not is_available("snapgrid_no_such_module")
+        assert not is_available("snapgrid_no_such_package.sub")
+
+
+class TestStartup:
+    """Tests for the import cost of the application."""
+
+    def test_heavy_dependencies_not_imported(self):
+        result = run_python(
+            "-c",
+            "import sys, app.main; "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))",
+        )
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == ""
+
+    def test_import_time_budget(self):
+        result = run_python("-X", "importtime", "-c", "import app.main")
+        assert result.returncode == 0, result.stderr
+
+        # Lines: "import time: self [us] | cumulative | module"
+        app_self_us = {}
+        for line in result.stderr.splitlines():
+            parts = [p.strip() for p in line.split("|")]
+            if len(parts) != 3 or not parts[0].startswith("import time:"):
+                continue
+            self_us = parts[0].rsplit(":", 1)[1].strip()
+            if self_us.isdigit() and (parts[2] == "app" or parts[2].startswith("app.")):
+                app_self_us[parts[2]] = int(self_us)
+
+        assert "app.main" in app_self_us
+        slowest = sorted(app_self_us, key=app_self_us.get, reverse=True)[:5]
+        assert sum(app_self_us.values()) / 1e6 < APP_IMPORT_BUDGET_SECONDS, (
+            f"Slowest app modules: {[(m, app_self_us[m]) for m in slowest]}"
+        )
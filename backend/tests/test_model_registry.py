@@ -0,0 +1,232 @@
+"""
+Tests for the CV model registry.
+
+Uses a fake loader so no YOLO weights or ultralytics install are needed.
+"""
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core.config import Settings
+from app.services import cv_pipeline
+from app.services.model_registry import ModelRegistry, estimate_model_memory
+
+
+class FakeModel:
+    """Stand-in for a loaded model."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.content = Path(path).read_text()
+
+
+@pytest.fixture
+def weights(tmp_path):
+    """Three fake weight files of different sizes."""
+    paths = {}
+    for name, size in [("v1", 100), ("v2", 200), ("v3", 300)]:
+        path = tmp_path / f"{name}.pt"
+        path.write_text("x" * size)
+        paths[name] = str(path)
+    return paths
+
+
+def make_registry(**kwargs) -> ModelRegistry:
+    loads = []
+
+    def loader(path):
+        loads.append(path)
+        return FakeModel(path)
+
+    registry = ModelRegistry(
+        loader=loader,
+        memory_estimator=lambda model, path: len(model.content),
+        **kwargs,
+    )
+    registry.load_calls = loads
+    return registry
+
+
+class TestModelRegistry:
+    """Tests for loading, eviction and hot reload."""
+
+    def test_lazy_load_and_reuse(self, weights):
+        """A model should be loaded once and then served from memory."""
+        registry = make_registry()
+        first = registry.get(weights["v1"])
+        second = registry.get(weights["v1"])
+
+        assert first is second
+        assert len(registry.load_calls) == 1
+        assert first.version == "v1"
+
+    def test_alternating_versions_stay_resident(self, weights):
+        """Switching between two versions should not reload either."""
+        registry = make_registry(max_models=2)
+        for _ in range(5):
+            registry.get(weights["v1"])
+            registry.get(weights["v2"])
+
+        assert len(registry.load_calls) == 2
+
+    def test_same_path_different_versions(self, weights):
+        """Version labels are part of the key."""
+        registry = make_registry()
+        a = registry.get(weights["v1"], version="tenant-a")
+        b = registry.get(weights["v1"], version="tenant-b")
+
+        assert a is not b
+        assert len(registry.resident_models()) == 2
+
+    def test_lru_eviction_by_count(self, weights):
+        """The least recently used model should be evicted first."""
+        registry = make_registry(max_models=2)
+        registry.get(weights["v1"])
+        registry.get(weights["v2"])
+        registry.get(weights["v1"])  # v2 is now least recently used
+        registry.get(weights["v3"])
+
+        versions = [m.version for m in registry.resident_models()]
+        assert versions == ["v1", "v3"]
+        assert registry.evictions == 1
+
+    def test_lru_eviction_by_memory(self, weights):
+        """Total memory should stay within the budget."""
+        registry = make_registry(max_memory_bytes=450)
+        registry.get(weights["v1"])
+        registry.get(weights["v2"])
+        registry.get(weights["v3"])
+
+        assert registry.memory_bytes <= 450
+        assert [m.version for m in registry.resident_models()] == ["v3"]
+
+    def test_oversized_model_still_served(self, weights):
+        """A model larger than the budget is kept rather than thrashing."""
+        registry = make_registry(max_memory_bytes=50)
+        entry = registry.get(weights["v3"])
+
+        assert entry.model.content == "x" * 300
+        assert len(registry.resident_models()) == 1
+
+    def test_hot_reload_on_mtime_change(self, weights):
+        """A changed weight file should be reloaded on next use."""
+        registry = make_registry()
+        old = registry.get(weights["v1"])
+
+        Path(weights["v1"]).write_text("y" * 100)
+        stat = os.stat(weights["v1"])
+        os.utime(weights["v1"], (stat.st_atime, stat.st_mtime + 10))
+
+        new = registry.get(weights["v1"])
+        assert new is not old
+        assert new.model.content == "y" * 100
+        assert registry.reloads == 1
+
+    def test_hot_reload_disabled(self, weights):
+        """With hot reload off the resident model is kept."""
+        registry = make_registry(hot_reload=False)
+        old = registry.get(weights["v1"])
+        stat = os.stat(weights["v1"])
+        os.utime(weights["v1"], (stat.st_atime, stat.st_mtime + 10))
+
+        assert registry.get(weights["v1"]) is old
+
+    def test_concurrent_get_loads_once(self, weights):
+        """Threads racing on a cold key should share one load."""
+        started = threading.Event()
+
+        def slow_loader(path):
+            started.set()
+            time.sleep(0.05)
+            return FakeModel(path)
+
+        registry = ModelRegistry(loader=slow_loader)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(registry.get(weights["v1"])))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len({id(r) for r in results}) == 1
+        assert registry.loads == 1
+
+    def test_acquire_serializes_inference(self, weights):
+        """Only one thread at a time may hold a model's inference lock."""
+        registry = make_registry()
+        active = []
+        overlap = []
+
+        def infer():
+            with registry.acquire(weights["v1"]):
+                active.append(1)
+                overlap.append(len(active))
+                time.sleep(0.01)
+                active.pop()
+
+        threads = [threading.Thread(target=infer) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert max(overlap) == 1
+        assert registry.get(weights["v1"]).inference_count == 4
+
+    def test_missing_file_raises(self, tmp_path):
+        """Unknown weight files should raise FileNotFoundError."""
+        registry = make_registry()
+        with pytest.raises(FileNotFoundError):
+            registry.get(str(tmp_path / "missing.pt"))
+
+    def test_status(self, weights):
+        """Status should list resident models with memory footprint."""
+        registry = make_registry()
+        registry.get(weights["v1"])
+        registry.get(weights["v2"])
+
+        status = registry.status()
+        assert status["memory_bytes"] == 300
+        assert [m["memory_bytes"] for m in status["resident_models"]] == [100, 200]
+        assert status["loads"] == 2
+
+    def test_estimate_falls_back_to_file_size(self, weights):
+        """Objects without parameters use the weight file size."""
+        assert estimate_model_memory(object(), weights["v2"]) == 200
+
+
+class TestYoloRegistryIntegration:
+    """Tests for get_yolo_model using the registry."""
+
+    def test_get_yolo_model_uses_registry(self, weights):
+        """Different configured versions should both stay resident."""
+        registry = make_registry(max_models=4)
+        with patch.object(cv_pipeline, "YOLO_AVAILABLE", True), \
+             patch.object(cv_pipeline, "_yolo_registry", registry):
+            for _ in range(3):
+                a = cv_pipeline.get_yolo_model(Settings(yolo_model_path=weights["v1"]))
+                b = cv_pipeline.get_yolo_model(Settings(yolo_model_path=weights["v2"]))
+
+            status = cv_pipeline.get_cv_pipeline_status(Settings(yolo_model_path=weights["v1"]))
+
+        assert a.path.endswith("v1.pt") and b.path.endswith("v2.pt")
+        assert len(registry.load_calls) == 2
+        assert len(status.model_registry["resident_models"]) == 2
+
+    def test_get_yolo_model_without_config(self):
+        """No configured model path should return None."""
+        with patch.object(cv_pipeline, "YOLO_AVAILABLE", True):
+            assert cv_pipeline.get_yolo_model(Settings(yolo_model_path=None)) is None
@@ -0,0 +1,56 @@
+"""
+Tests for page content fingerprints.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+fitz = pytest.importorskip("fitz")
+
+from app.services.page_fingerprint import page_fingerprints
+
+
+def fingerprints(path: Path, pages, **save_options):
+    """Write one page per list of text lines and fingerprint the saved file."""
+    doc = fitz.open()
+    for lines in pages:
+        page = doc.new_page()
+        for i, line in enumerate(lines):
+            page.insert_text((50, 50 + 14 * i), line)
+    doc.save(str(path), **save_options)
+    doc.close()
+
+    with fitz.open(str(path)) as saved:
+        return page_fingerprints(saved)
+
+
+class TestPageFingerprints:
+    """Tests for revision-stable page fingerprints."""
+
+    def test_identical_pages_match(self, tmp_path):
+        a = fingerprints(tmp_path / "a.pdf", [["B.00.2.001", "NRF: 12,50 m2"]])
+        b = fingerprints(tmp_path / "b.pdf", [["B.00.2.001", "NRF: 12,50 m2"]])
+        assert a == b
+
+    def test_changed_page_differs(self, tmp_path):
+        a = fingerprints(tmp_path / "a.pdf", [["NRF: 12,50 m2"], ["Flur"]])
+        b = fingerprints(tmp_path / "b.pdf", [["NRF: 13,50 m2"], ["Flur"]])
+        assert a[0] != b[0]
+        assert a[1] == b[1]
+
+    def test_stable_across_inserted_pages_and_renumbering(self, tmp_path):
+        """Unchanged sheets keep their fingerprint when objects are renumbered."""
+        a = fingerprints(tmp_path / "a.pdf", [["A"], ["B"], ["C"]])
+        b = fingerprints(tmp_path / "b.pdf", [["Deckblatt"], ["A"], ["B"], ["C"]], garbage=3, deflate=True)
+        assert b[1:] == a
+
+    def test_same_text_on_different_pages_can_match(self, tmp_path):
+        """Fingerprints depend on content only, not on the page position."""
+        prints = fingerprints(tmp_path / "a.pdf", [["Legende"], ["Legende"]])
+        assert prints[0] == prints[1]
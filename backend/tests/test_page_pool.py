@@ -0,0 +1,104 @@
+"""
+Tests for the shared page worker pool.
+"""
+
+import os
+import sys
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core.config import get_settings
+from app.services import page_pool
+from app.services.page_pool import get_page_pool, map_pages, use_page_pool, worker_document
+
+
+class TestPagePool:
+    """Tests for the shared pool and its callers' threshold."""
+
+    def test_threshold_and_opt_out(self, monkeypatch):
+        monkeypatch.setattr(get_settings(), "parallel_min_pages", 4)
+        assert use_page_pool(4)
+        assert not use_page_pool(3)
+        assert not use_page_pool(10, max_workers=1)
+
+        monkeypatch.setattr(get_settings(), "page_workers", 1)
+        assert not use_page_pool(10)
+
+    def test_one_pool_for_all_callers(self):
+        pool = get_page_pool()
+        assert list(map_pages(abs, [-3, -1, -2])) == [3, 1, 2]
+        assert get_page_pool() is pool
+        assert pool._mp_context.get_start_method() in ("forkserver", "spawn")
+
+    def test_results_in_order_with_bounded_window(self, monkeypatch):
+        submitted = []
+        submit = get_page_pool().submit
+
+        def record(fn, task):
+            submitted.append(task)
+            return submit(fn, task)
+
+        monkeypatch.setattr(get_page_pool(), "submit", record)
+        results = map_pages(abs, [-1, -2, -3, -4, -5], max_workers=2)
+
+        assert next(results) == 1
+        assert submitted == [-1, -2]
+        assert list(results) == [2, 3, 4, 5]
+
+    def test_closed_iterator_stops_submitting(self, monkeypatch):
+        futures = []
+        submit = get_page_pool().submit
+
+        def record(fn, task):
+            futures.append(submit(fn, task))
+            return futures[-1]
+
+        monkeypatch.setattr(get_page_pool(), "submit", record)
+        results = map_pages(abs, range(-10, 0), max_workers=2)
+        next(results)
+        results.close()
+
+        # Only the window was submitted; the rest of the document never is
+        assert len(futures) == 2
+
+    def test_broken_pool_replaced(self):
+        pool = get_page_pool()
+        with pytest.raises(BrokenProcessPool):
+            list(map_pages(os._exit, [1]))
+
+        assert get_page_pool() is not pool
+        assert list(map_pages(abs, [-1])) == [1]
+
+
+class TestWorkerDocument:
+    """Tests for the per-worker document handle."""
+
+    @pytest.fixture
+    def pdfs(self, tmp_path):
+        fitz = pytest.importorskip("fitz")
+        paths = []
+        for name, pages in (("a.pdf", 1), ("b.pdf", 2)):
+            doc = fitz.open()
+            for _ in range(pages):
+                doc.new_page()
+            path = tmp_path / name
+            doc.save(str(path))
+            doc.close()
+            paths.append(str(path))
+        return paths
+
+    def test_handle_reused_per_file(self, pdfs, monkeypatch):
+        monkeypatch.setattr(page_pool, "_worker_doc", None)
+        a, b = pdfs
+
+        doc = worker_document(a)
+        assert worker_document(a) is doc
+        assert len(worker_document(b)) == 2
+        assert doc.is_closed
+        worker_document(b).close()
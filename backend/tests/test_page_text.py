@@ -0,0 +1,94 @@
+"""
+Tests for shared per-page PyMuPDF text extraction.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+fitz = pytest.importorskip("fitz")
+
+from app.services.page_text import PageText, PageTextCache
+
+
+@pytest.fixture
+def doc(tmp_path):
+    """Three pages of room annotations, one with an embedded image."""
+    pdf = fitz.open()
+    for n in range(3):
+        page = pdf.new_page()
+        page.insert_text((50, 50), f"B.0{n}.2.001 Büro")
+        page.insert_text((50, 64), "NRF: 12,50 m2")
+        if n == 0:
+            pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 20, 20), False)
+            page.insert_image(fitz.Rect(200, 200, 240, 240), pixmap=pix)
+    path = tmp_path / "plan.pdf"
+    pdf.save(str(path))
+    pdf.close()
+
+    opened = fitz.open(str(path))
+    yield opened
+    opened.close()
+
+
+class TestPageText:
+    """Tests for the shared text page."""
+
+    def test_formats_match_get_text(self, doc):
+        """Every format equals a separate get_text() call."""
+        page = doc[1]
+        text = PageText(page)
+
+        assert text.text() == page.get_text()
+        assert text.blocks() == page.get_text("blocks")
+        assert text.words() == page.get_text("words")
+        assert text.dict() == page.get_text("dict")
+        assert text.lines() == page.get_text().split("\n")
+
+    def test_text_page_built_once(self, doc):
+        """All formats are served from one get_textpage() call."""
+        from unittest.mock import patch
+
+        page = doc[0]
+        with patch.object(page, "get_textpage", wraps=page.get_textpage) as get_textpage:
+            text = PageText(page)
+            text.dict()
+            text.text()
+            text.blocks()
+            text.text()
+
+        assert get_textpage.call_count == 1
+
+    def test_images_skipped(self, doc):
+        """The dict output has no image blocks."""
+        blocks = PageText(doc[0]).dict()["blocks"]
+        assert blocks and all(b["type"] == 0 for b in blocks)
+        assert any(b["type"] == 1 for b in doc[0].get_text("dict")["blocks"])
+
+    def test_of_returns_existing(self, doc):
+        text = PageText(doc[0])
+        assert PageText.of(text) is text
+
+
+class TestPageTextCache:
+    """Tests for the per-document cache."""
+
+    def test_same_handle_per_page(self, doc):
+        cache = PageTextCache(doc)
+        assert cache.get(1) is cache.get(1)
+
+    def test_evicts_least_recently_used(self, doc):
+        cache = PageTextCache(doc, max_pages=2)
+        first = cache.get(0)
+        cache.get(1)
+        cache.get(0)
+        cache.get(2)
+
+        assert len(cache) == 2
+        assert cache.get(0) is first  # Recently used, kept
+        assert cache.get(1) is not None  # Rebuilt after eviction
@@ -0,0 +1,148 @@
+"""
+Tests for one-pass plan set analysis (/plans/analyze).
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+fitz = pytest.importorskip("fitz")
+
+from app.main import app
+from app.services.cv_pipeline import CV2_AVAILABLE
+from app.services.plan_analysis import analyze_plan_set
+
+
+ROOMS = [
+    ("B.00.2.001", "Büro", "NRF: 12,50 m2"),
+    ("B.00.2.002", "Flur", "NRF: 7,25 m2"),
+]
+
+
+@pytest.fixture
+def plan_set(tmp_path) -> Path:
+    """Two-page plan set: one room and a wall outline per page, scale 1:100."""
+    doc = fitz.open()
+    for room in ROOMS:
+        page = doc.new_page()
+        page.insert_text((50, 780), "M 1:100")
+        for i, line in enumerate(room):
+            page.insert_text((150, 200 + 14 * i), line)
+        page.draw_rect(fitz.Rect(100, 100, 500, 500), color=(0, 0, 0), width=6)
+    path = tmp_path / "plan_set.pdf"
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        yield pool
+
+
+class TestAnalyzePlanSet:
+    """Tests for the per-page task graph and trade aggregation."""
+
+    def test_rooms_and_scale_per_page(self, plan_set, executor):
+        result = analyze_plan_set(plan_set, analysis_types=["rooms"], executor=executor)
+
+        assert result.status == "completed"
+        assert [p.page_number for p in result.pages] == [1, 2]
+        assert all(p.scale.scale_string == "1:100" for p in result.pages)
+        assert result.scale.scale_string == "1:100"
+
+        flooring = result.trades["flooring"]
+        assert flooring["room_count"] == 2
+        assert flooring["total_area_m2"] == 19.75
+        assert [r["room_id"] for r in flooring["rooms"]] == ["room_001", "room_002"]
+        assert set(flooring["by_page"]) == {"1", "2"}
+
+    def test_selected_pages(self, plan_set, executor):
+        result = analyze_plan_set(plan_set, pages=[2], analysis_types=["rooms"], executor=executor)
+
+        assert [p.page_number for p in result.pages] == [2]
+        assert result.trades["flooring"]["total_area_m2"] == 7.25
+
+    def test_duplicate_pages_analyzed_once(self, plan_set, executor):
+        result = analyze_plan_set(plan_set, pages=[2, 1, 2], analysis_types=["rooms"], executor=executor)
+
+        assert [p.page_number for p in result.pages] == [2, 1]
+        assert result.trades["flooring"]["total_area_m2"] == 19.75
+
+    def test_invalid_page_rejected(self, plan_set, executor):
+        with pytest.raises(ValueError):
+            analyze_plan_set(plan_set, pages=[3], executor=executor)
+
+    @pytest.mark.skipif(not CV2_AVAILABLE, reason="OpenCV not installed")
+    def test_walls_measured_with_scale(self, plan_set, executor):
+        result = analyze_plan_set(plan_set, analysis_types=["walls"], executor=executor)
+
+        walls = result.trades["walls"]
+        assert set(walls["by_page"]) == {"1", "2"}
+        assert walls["pages_without_scale"] == []
+        assert walls["wall_area_m2"] > 0
+        assert "flooring" not in result.trades
+
+    def test_missing_yolo_reported(self, plan_set, executor):
+        result = analyze_plan_set(plan_set, analysis_types=["doors"], executor=executor)
+
+        assert "doors" not in result.trades
+        assert any("YOLO" in w for w in result.warnings)
+
+
+class TestAnalyzeEndpoint:
+    """Tests for POST /plans/analyze."""
+
+    @pytest.fixture
+    def client(self):
+        return TestClient(app)
+
+    def test_analyze_returns_trades(self, client, plan_set):
+        with open(plan_set, "rb") as f:
+            response = client.post(
+                "/api/v1/plans/analyze?analysis_types=rooms",
+                files={"file": ("plan_set.pdf", f, "application/pdf")},
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_pages"] == 2
+        assert data["scale_detected"]["scale_string"] == "1:100"
+        assert len(data["pages"]) == 2
+        assert data["trades"]["flooring"]["total_area_m2"] == 19.75
+
+    def test_invalid_page_is_bad_request(self, client, plan_set):
+        with open(plan_set, "rb") as f:
+            response = client.post(
+                "/api/v1/plans/analyze?pages=5",
+                files={"file": ("plan_set.pdf", f, "application/pdf")},
+            )
+
+        assert response.status_code == 400
+
+    def test_duplicate_pages(self, client, plan_set):
+        with open(plan_set, "rb") as f:
+            response = client.post(
+                "/api/v1/plans/analyze?analysis_types=rooms&pages=1,1",
+                files={"file": ("plan_set.pdf", f, "application/pdf")},
+            )
+
+        assert response.status_code == 200
+        assert [p["page_number"] for p in response.json()["pages"]] == [1]
+
+    def test_unknown_analysis_type(self, client, plan_set):
+        with open(plan_set, "rb") as f:
+            response = client.post(
+                "/api/v1/plans/analyze?analysis_types=plumbing",
+                files={"file": ("plan_set.pdf", f, "application/pdf")},
+            )
+
+        assert response.status_code == 400
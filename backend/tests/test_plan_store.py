@@ -0,0 +1,255 @@
+"""
+Tests for the content-addressed plan store and file_id inputs.
+"""
+
+import hashlib
+import io
+import os
+import sqlite3
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.api.job_queue import JOB_HANDLERS
+from app.main import app
+from app.services.job_queue import COMPLETED, get_job_queue, run_next_job
+from app.services.plan_store import PlanStore, get_plan_store
+
+
+@pytest.fixture
+def store(tmp_path) -> PlanStore:
+    return PlanStore(tmp_path / "plans", ttl_seconds=3600, max_bytes=100)
+
+
+def age(store: PlanStore, file_id: str, seconds: float) -> None:
+    """Move a plan's last use back in the shared index."""
+    with sqlite3.connect(str(store.db_path)) as conn:
+        conn.execute(
+            "UPDATE plans SET accessed_at = accessed_at - ? WHERE file_id = ?", (seconds, file_id)
+        )
+
+
+class TestPlanStore:
+    """Tests for storing, pinning and evicting plans."""
+
+    def test_put_hashes_content(self, store):
+        data = b"%PDF-1.4 plan"
+        plan, deduplicated = store.put(io.BytesIO(data), "plan.pdf")
+
+        assert not deduplicated
+        assert plan.file_id == hashlib.sha256(data).hexdigest()
+        assert plan.path.read_bytes() == data
+        assert plan.path.suffix == ".pdf"
+        assert plan.size_bytes == len(data)
+
+    def test_identical_upload_deduplicated(self, store):
+        first, _ = store.put(io.BytesIO(b"same"), "a.pdf")
+        second, deduplicated = store.put(io.BytesIO(b"same"), "b.pdf")
+
+        assert deduplicated
+        assert second.file_id == first.file_id
+        assert second.filename == "a.pdf"
+        assert second.uploads == 2
+        assert store.stats.entries == 1
+        assert store.stats.deduplicated == 1
+        assert [p.name for p in store.directory.rglob("*.upload")] == []
+
+    def test_index_survives_restart(self, store):
+        plan, _ = store.put(io.BytesIO(b"persisted"), "plan.pdf")
+
+        reopened = PlanStore(store.directory)
+        found = reopened.get(plan.file_id)
+        assert found.filename == "plan.pdf"
+        assert found.path == plan.path
+
+    def test_size_eviction_skips_plans_in_use(self, store):
+        pinned, _ = store.put(io.BytesIO(b"a" * 60), "a.pdf")
+        assert store.acquire(pinned.file_id) is not None
+
+        newer, _ = store.put(io.BytesIO(b"b" * 60), "b.pdf")
+        assert store.get(pinned.file_id) is not None
+        assert store.get(newer.file_id) is not None
+
+        # Released plans count as just used: the other one is now least recent
+        store.release(pinned.file_id)
+        assert store.get(pinned.file_id) is not None
+        assert store.get(newer.file_id) is None
+        assert not newer.path.exists()
+        assert store.stats.size_bytes <= 100
+
+    def test_idle_plans_expire(self, store):
+        plan, _ = store.put(io.BytesIO(b"old"), "old.pdf")
+        age(store, plan.file_id, 7200)
+
+        assert store.acquire(plan.file_id) is None
+        assert not plan.path.exists()
+        assert store.stats.expirations == 1
+
+    def test_delete_refused_while_in_use(self, store):
+        plan, _ = store.put(io.BytesIO(b"busy"), "busy.pdf")
+
+        with store.use(plan.file_id):
+            with pytest.raises(RuntimeError):
+                store.delete(plan.file_id)
+        assert store.delete(plan.file_id)
+        assert not store.delete(plan.file_id)
+
+    def test_rejects_malformed_ids(self, store):
+        assert store.get("../../etc/passwd") is None
+        assert store.acquire("abc") is None
+
+
+class TestSharedPlanStore:
+    """Tests for several processes (store instances) on one directory."""
+
+    def test_upload_visible_to_other_worker(self, store):
+        other = PlanStore(store.directory, ttl_seconds=3600, max_bytes=100)
+        plan, _ = store.put(io.BytesIO(b"from worker A"), "a.pdf")
+
+        assert other.get(plan.file_id).path == plan.path
+        assert other.acquire(plan.file_id) is not None
+        assert store.get(plan.file_id).refs == 1
+        other.release(plan.file_id)
+
+        _, deduplicated = other.put(io.BytesIO(b"from worker A"), "a.pdf")
+        assert deduplicated
+        assert store.get(plan.file_id).uploads == 2
+
+    def test_pin_protects_against_other_workers_eviction(self, store):
+        other = PlanStore(store.directory, ttl_seconds=3600, max_bytes=100)
+        pinned, _ = store.put(io.BytesIO(b"a" * 60), "a.pdf")
+        assert store.acquire(pinned.file_id) is not None
+
+        other.put(io.BytesIO(b"b" * 60), "b.pdf")
+        other.put(io.BytesIO(b"c" * 60), "c.pdf")
+        assert pinned.path.exists()
+        assert other.get(pinned.file_id) is not None
+
+        with pytest.raises(RuntimeError):
+            other.delete(pinned.file_id)
+        store.release(pinned.file_id)
+
+    def test_pins_of_exited_process_dropped(self, store):
+        plan, _ = store.put(io.BytesIO(b"a" * 60), "a.pdf")
+        exited = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"],
+                                capture_output=True, text=True)
+        with sqlite3.connect(str(store.db_path)) as conn:
+            conn.execute(
+                "INSERT INTO pins (file_id, pid, pinned_at) VALUES (?, ?, ?)",
+                (plan.file_id, int(exited.stdout), time.time()),
+            )
+
+        assert store.delete(plan.file_id)
+
+    def test_pins_of_crashed_process_with_reused_pid_dropped(self, store):
+        from app.services.plan_store import _process_identity
+
+        if _process_identity(os.getpid()) is None:
+            pytest.skip("Process start times not available")
+        plan, _ = store.put(io.BytesIO(b"a" * 60), "a.pdf")
+        # Left behind by an earlier process whose PID this one now has
+        with sqlite3.connect(str(store.db_path)) as conn:
+            conn.execute(
+                "INSERT INTO pins (file_id, pid, process, pinned_at) VALUES (?, ?, ?, ?)",
+                (plan.file_id, os.getpid(), "old-boot:1", time.time()),
+            )
+
+        assert store.acquire(plan.file_id).refs == 2
+        store.release(plan.file_id)
+        assert store.delete(plan.file_id)
+
+    def test_pins_without_process_identity_cleared_on_upgrade(self, tmp_path):
+        directory = tmp_path / "plans"
+        directory.mkdir()
+        with sqlite3.connect(str(directory / "index.sqlite3")) as conn:
+            conn.execute(
+                "CREATE TABLE pins (id INTEGER PRIMARY KEY AUTOINCREMENT, file_id TEXT NOT NULL, "
+                "pid INTEGER NOT NULL, pinned_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "INSERT INTO pins (file_id, pid, pinned_at) VALUES (?, ?, ?)",
+                ("a" * 64, os.getpid(), time.time()),
+            )
+
+        PlanStore(directory)
+        with sqlite3.connect(str(directory / "index.sqlite3")) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM pins").fetchone()[0] == 0
+
+
+class TestPlanFileEndpoints:
+    """Tests for uploading once and passing file_id to endpoints."""
+
+    @pytest.fixture
+    def client(self):
+        return TestClient(app)
+
+    @pytest.fixture
+    def plan_pdf(self, tmp_path) -> Path:
+        fitz = pytest.importorskip("fitz")
+        doc = fitz.open()
+        page = doc.new_page()
+        for i, line in enumerate(["B.00.2.001", "Büro", "NRF: 12,50 m2"]):
+            page.insert_text((50, 50 + 14 * i), line)
+        path = tmp_path / "plan.pdf"
+        doc.save(str(path))
+        doc.close()
+        return path
+
+    def upload(self, client, path: Path):
+        with open(path, "rb") as f:
+            return client.post("/api/v1/files", files={"file": (path.name, f, "application/pdf")})
+
+    def test_upload_returns_digest_and_deduplicates(self, client, plan_pdf):
+        first = self.upload(client, plan_pdf)
+        second = self.upload(client, plan_pdf)
+
+        assert first.status_code == 201
+        assert first.json()["file_id"] == hashlib.sha256(plan_pdf.read_bytes()).hexdigest()
+        assert not first.json()["deduplicated"]
+        assert second.json()["file_id"] == first.json()["file_id"]
+        assert second.json()["deduplicated"]
+        assert client.get("/api/v1/files/stats").json()["entries"] == 1
+
+    def test_endpoints_accept_file_id(self, client, plan_pdf):
+        file_id = self.upload(client, plan_pdf).json()["file_id"]
+
+        rooms = client.post(f"/api/v1/extraction/rooms?file_id={file_id}")
+        assert rooms.status_code == 200
+        assert rooms.json()["source_file"] == "plan.pdf"
+        assert rooms.json()["summary"]["total_rooms"] == 1
+
+        nrf = client.post(f"/api/v1/gewerke/flooring/nrf?file_id={file_id}")
+        assert nrf.status_code == 200
+        assert nrf.json()["total_area_m2"] == 12.5
+
+        stream = client.post(f"/api/v1/gewerke/flooring/nrf/stream?file_id={file_id}")
+        assert stream.status_code == 200
+        assert get_plan_store().get(file_id).refs == 0
+
+    def test_queued_job_from_file_id(self, client, plan_pdf):
+        file_id = self.upload(client, plan_pdf).json()["file_id"]
+
+        response = client.post(
+            f"/api/v1/extraction/extract-and-export/jobs?format=csv&file_id={file_id}"
+        )
+        assert response.status_code == 202
+
+        job = run_next_job(get_job_queue(), JOB_HANDLERS)
+        assert job.status == COMPLETED
+        # The job has its own link, so removing the stored plan is safe
+        assert client.delete(f"/api/v1/files/{file_id}").status_code == 204
+        assert os.listdir(get_job_queue().job_dir(job.id))
+
+    def test_missing_input(self, client):
+        unknown = "0" * 64
+        assert client.post("/api/v1/extraction/rooms").status_code == 400
+        assert client.post(f"/api/v1/extraction/rooms?file_id={unknown}").status_code == 404
+        assert client.get(f"/api/v1/files/{unknown}").status_code == 404
@@ -0,0 +1,192 @@
+"""
+Tests for batched polygon metrics.
+
+These tests validate:
+- Known shapes (squares, triangles, degenerate polygons)
+- Ragged batches including empty and short polygons
+- Randomized property checks against the reference per-polygon loops
+"""
+
+import math
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.services.polygon_metrics import (
+    PolygonBatch,
+    compute_polygon_metrics,
+    polygon_area,
+    polygon_perimeter,
+)
+from app.services.measurement_engine import shoelace_area_pixels, shoelace_perimeter_pixels
+from app.services.roboflow_service import _calculate_polygon_metrics
+
+
+# =============================================================================
+# Reference implementations (the original per-polygon loops)
+# =============================================================================
+
+
+def reference_area(points):
+    n = len(points)
+    area = 0.0
+    for i in range(n):
+        j = (i + 1) % n
+        xi, yi = points[i]
+        xj, yj = points[j]
+        area += xi * yj
+        area -= xj * yi
+    return abs(area) / 2.0
+
+
+def reference_perimeter(points):
+    n = len(points)
+    perimeter = 0.0
+    for i in range(n):
+        j = (i + 1) % n
+        xi, yi = points[i]
+        xj, yj = points[j]
+        perimeter += math.sqrt((xj - xi) ** 2 + (yj - yi) ** 2)
+    return perimeter
+
+
+def random_polygons(rng, count, max_vertices=50):
+    """Random star-shaped and arbitrary polygons with varying vertex counts."""
+    polygons = []
+    for _ in range(count):
+        n = int(rng.integers(3, max_vertices))
+        cx, cy = rng.uniform(-1000, 1000, size=2)
+        angles = np.sort(rng.uniform(0, 2 * np.pi, size=n))
+        radii = rng.uniform(1, 500, size=n)
+        xs = cx + radii * np.cos(angles)
+        ys = cy + radii * np.sin(angles)
+        polygons.append(list(zip(xs.tolist(), ys.tolist())))
+    return polygons
+
+
+class TestKnownShapes:
+    """Tests with hand-computed results."""
+
+    def test_unit_square(self):
+        """Unit square: area 1, perimeter 4, centroid at the center."""
+        metrics = compute_polygon_metrics(PolygonBatch.from_polygons([[(0, 0), (1, 0), (1, 1), (0, 1)]]))
+        assert metrics.area[0] == pytest.approx(1.0)
+        assert metrics.perimeter[0] == pytest.approx(4.0)
+        assert tuple(metrics.centroid[0]) == pytest.approx((0.5, 0.5))
+        assert metrics.bbox_dict(0) == {"x": 0.0, "y": 0.0, "width": 1.0, "height": 1.0}
+
+    def test_orientation_sign(self):
+        """Clockwise and counter-clockwise give opposite signed area."""
+        ccw = [(0, 0), (4, 0), (4, 3), (0, 3)]
+        metrics = compute_polygon_metrics(PolygonBatch.from_polygons([ccw, ccw[::-1]]))
+        assert metrics.signed_area[0] == pytest.approx(12.0)
+        assert metrics.signed_area[1] == pytest.approx(-12.0)
+        assert metrics.area.tolist() == pytest.approx([12.0, 12.0])
+
+    def test_triangle_centroid(self):
+        """Triangle centroid is the mean of its vertices."""
+        metrics = compute_polygon_metrics(PolygonBatch.from_polygons([[(0, 0), (6, 0), (0, 3)]]))
+        assert tuple(metrics.centroid[0]) == pytest.approx((2.0, 1.0))
+
+    def test_collinear_polygon_uses_vertex_mean(self):
+        """Zero-area polygons fall back to the vertex mean."""
+        metrics = compute_polygon_metrics(PolygonBatch.from_polygons([[(0, 0), (2, 0), (4, 0)]]))
+        assert metrics.area[0] == pytest.approx(0.0)
+        assert tuple(metrics.centroid[0]) == pytest.approx((2.0, 0.0))
+
+    def test_single_polygon_helpers(self):
+        """polygon_area/polygon_perimeter wrap the batch computation."""
+        square = [(0, 0), (10, 0), (10, 10), (0, 10)]
+        assert polygon_area(square) == pytest.approx(100.0)
+        assert polygon_perimeter(square) == pytest.approx(40.0)
+
+
+class TestRaggedBatches:
+    """Tests for the flat buffer plus offsets layout."""
+
+    def test_offsets_layout(self):
+        """Offsets should delimit each polygon in the flat buffer."""
+        batch = PolygonBatch.from_polygons([[(0, 0), (1, 0), (1, 1)], [(5, 5), (6, 5), (6, 6), (5, 6)]])
+        assert batch.offsets.tolist() == [0, 3, 7]
+        assert batch.vertices.shape == (7, 2)
+        assert len(batch) == 2
+
+    def test_empty_batch(self):
+        """An empty batch yields empty arrays."""
+        metrics = compute_polygon_metrics(PolygonBatch.from_polygons([]))
+        assert len(metrics.area) == 0
+
+    def test_empty_and_short_polygons(self):
+        """Empty and short polygons must not disturb their neighbours."""
+        polygons = [
+            [],
+            [(0, 0), (3, 0), (3, 4)],
+            [(1, 1)],
+            [(0, 0), (3, 4)],
+            [(0, 0), (2, 0), (2, 2), (0, 2)],
+        ]
+        metrics = compute_polygon_metrics(PolygonBatch.from_polygons(polygons))
+
+        assert metrics.area.tolist() == pytest.approx([0.0, 6.0, 0.0, 0.0, 4.0])
+        assert metrics.perimeter.tolist() == pytest.approx([0.0, 12.0, 0.0, 10.0, 8.0])
+        assert np.isnan(metrics.bbox_min[0]).all()
+        assert metrics.bbox_dict(4) == {"x": 0.0, "y": 0.0, "width": 2.0, "height": 2.0}
+
+
+class TestPropertiesAgainstReference:
+    """Randomized checks against the original loop implementations."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_area_and_perimeter_match_reference(self, seed):
+        """Batched results should match the per-polygon loops."""
+        rng = np.random.default_rng(seed)
+        polygons = random_polygons(rng, count=200)
+        metrics = compute_polygon_metrics(PolygonBatch.from_polygons(polygons))
+
+        for i, poly in enumerate(polygons):
+            assert metrics.area[i] == pytest.approx(reference_area(poly), rel=1e-9, abs=1e-6)
+            assert metrics.perimeter[i] == pytest.approx(reference_perimeter(poly), rel=1e-9)
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_bbox_matches_reference(self, seed):
+        """Bounding boxes should match min/max over the vertices."""
+        rng = np.random.default_rng(seed)
+        polygons = random_polygons(rng, count=50)
+        metrics = compute_polygon_metrics(PolygonBatch.from_polygons(polygons))
+
+        for i, poly in enumerate(polygons):
+            xs = [p[0] for p in poly]
+            ys = [p[1] for p in poly]
+            bbox = metrics.bbox_dict(i)
+            assert bbox["x"] == pytest.approx(min(xs))
+            assert bbox["y"] == pytest.approx(min(ys))
+            assert bbox["width"] == pytest.approx(max(xs) - min(xs))
+            assert bbox["height"] == pytest.approx(max(ys) - min(ys))
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_centroid_invariant_under_translation(self, seed):
+        """Translating a polygon translates its centroid by the same offset."""
+        rng = np.random.default_rng(seed)
+        polygons = random_polygons(rng, count=20)
+        shifted = [[(x + 123.0, y - 45.0) for x, y in poly] for poly in polygons]
+
+        a = compute_polygon_metrics(PolygonBatch.from_polygons(polygons))
+        b = compute_polygon_metrics(PolygonBatch.from_polygons(shifted))
+        np.testing.assert_allclose(b.centroid - a.centroid, [[123.0, -45.0]] * 20, atol=1e-6)
+        np.testing.assert_allclose(b.area, a.area, rtol=1e-9)
+
+    def test_call_sites_match_reference(self):
+        """measurement_engine and roboflow_service wrappers keep their results."""
+        rng = np.random.default_rng(42)
+        for poly in random_polygons(rng, count=30):
+            assert shoelace_area_pixels(poly) == pytest.approx(reference_area(poly), rel=1e-9)
+            assert shoelace_perimeter_pixels(poly) == pytest.approx(reference_perimeter(poly), rel=1e-9)
+            area, perimeter = _calculate_polygon_metrics(poly)
+            assert area == pytest.approx(reference_area(poly), rel=1e-9)
+            assert perimeter == pytest.approx(reference_perimeter(poly), rel=1e-9)
@@ -0,0 +1,165 @@
+"""
+Tests for fast JSON responses.
+"""
+
+import json
+import math
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.api import responses
+from app.api.extraction import RoomExtractionResponse, _room_response, _summary_response
+from app.api.responses import FastJSONResponse, dumps, to_jsonable
+from app.main import app
+from app.services.unified_extraction import (
+    BlueprintStyle,
+    BoundingBox,
+    ExtractedRoom,
+    ExtractionResult,
+    RoomCategory,
+    extract_room_areas,
+)
+
+
+def extraction_result() -> ExtractionResult:
+    rooms = [
+        ExtractedRoom(
+            room_number="B.00.2.001",
+            room_name="Büro",
+            area_m2=12.5,
+            counted_m2=12.5,
+            factor=1.0,
+            page=0,
+            source_text="NRF: 12,50 m2",
+            bbox=BoundingBox(10.0, 20.0, 30.0, 40.0),
+            category=RoomCategory.OFFICE,
+            perimeter_m=14.2,
+            height_m=2.6,
+            extraction_pattern="leiq_nrf",
+        ),
+        ExtractedRoom(
+            room_number="B.00.2.002",
+            room_name="Balkon",
+            area_m2=6.0,
+            counted_m2=3.0,
+            factor=0.5,
+            page=1,
+            source_text="F: 6,00 m2",
+            category=RoomCategory.OUTDOOR,
+            factor_source="default_outdoor",
+        ),
+    ]
+    return ExtractionResult(
+        rooms=rooms,
+        total_area_m2=18.5,
+        total_counted_m2=15.5,
+        room_count=2,
+        page_count=2,
+        blueprint_style=BlueprintStyle.LEIQ,
+        totals_by_category={"office": 12.5, "outdoor": 3.0},
+    )
+
+
+class TestEncoding:
+    """Tests for to_jsonable, dumps and FastJSONResponse."""
+
+    def test_constructed_response_matches_validated(self):
+        result = extraction_result()
+        constructed = RoomExtractionResponse.model_construct(
+            extraction_id="ext_1",
+            source_file="plan.pdf",
+            extracted_at="2025-01-01T00:00:00Z",
+            summary=_summary_response(result),
+            rooms=[_room_response(room) for room in result.rooms],
+            warnings=[],
+            recomputed_pages=[0, 1],
+            reused_pages=[],
+        )
+        validated = RoomExtractionResponse.model_validate(to_jsonable(constructed))
+
+        assert to_jsonable(constructed) == jsonable_encoder(validated)
+        assert to_jsonable(constructed)["rooms"][1]["bbox"] is None
+
+    def test_constructed_response_from_real_extraction_validates(self, tmp_path):
+        fitz = pytest.importorskip("fitz")
+        doc = fitz.open()
+        for floor, rooms in enumerate([
+            [("B.00.2.001", "Büro", "12,50"), ("B.00.2.002", "Balkon", "6,00")],
+            [("B.01.2.001", "Flur", "8,25")],
+        ]):
+            page = doc.new_page()
+            y = 50
+            for number, name, area in rooms:
+                for line in [number, name, f"NRF: {area} m2", "U: 14,20 m"]:
+                    page.insert_text((50, y), line)
+                    y += 14
+        path = tmp_path / "plan.pdf"
+        doc.save(str(path))
+        doc.close()
+
+        result = extract_room_areas(path)
+        assert result.room_count == 3
+
+        constructed = RoomExtractionResponse.model_construct(
+            extraction_id="ext_1",
+            source_file="plan.pdf",
+            extracted_at="2025-01-01T00:00:00Z",
+            summary=_summary_response(result),
+            rooms=[_room_response(room) for room in result.rooms],
+            warnings=[],
+            recomputed_pages=[0, 1],
+            reused_pages=[],
+        )
+        # Strict: the extractor's values must already have the declared types
+        validated = RoomExtractionResponse.model_validate(constructed.model_dump(), strict=True)
+
+        assert to_jsonable(constructed) == jsonable_encoder(validated)
+
+    def test_response_body_matches_json_response(self):
+        content = {"rooms": [{"room_name": "Büro", "area_m2": 12.5}], "total": 1}
+        body = FastJSONResponse(content).body
+        assert json.loads(body) == json.loads(JSONResponse(content).body)
+        assert "Büro".encode() in body
+
+    def test_orjson_extras(self):
+        np = pytest.importorskip("numpy")
+        if not responses.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+
+        data = json.loads(dumps({1: np.float32(0.5), "nan": math.nan, "a": np.arange(3)}))
+        assert data == {"1": 0.5, "nan": None, "a": [0, 1, 2]}
+
+    def test_standard_encoder_fallback(self, monkeypatch):
+        content = {"rooms": [{"room_name": "Büro", "area_m2": 12.5}]}
+        fast = dumps(content)
+
+        monkeypatch.setattr(responses, "ORJSON_AVAILABLE", False)
+        assert dumps(content) == fast
+
+
+class TestApp:
+    """Tests for the application's default response class."""
+
+    @pytest.fixture
+    def client(self):
+        return TestClient(app)
+
+    def test_default_response_class(self, client):
+        response = client.get("/")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert b": " not in response.content  # compact encoding
+
+    def test_response_model_endpoints(self, client):
+        response = client.get("/api/v1/extraction/health")
+        assert response.status_code == 200
+        assert response.json()["status"] == "ok"
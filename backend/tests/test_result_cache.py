@@ -0,0 +1,194 @@
+"""
+Tests for the request result cache and ETag revalidation.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.main import app
+from app.services.disk_cache import DiskCache
+from app.services.result_cache import ResultCache
+
+
+@pytest.fixture
+def cache(tmp_path) -> ResultCache:
+    return ResultCache(disk=DiskCache(tmp_path / "results"), memory_entries=2)
+
+
+class TestResultCache:
+    """Tests for tiers, keys and single flight."""
+
+    def test_key_ignores_param_order(self):
+        a = ResultCache.make_key("rooms", "abc", {"pages": [1], "style": None}, "v1")
+        b = ResultCache.make_key("rooms", "abc", {"style": None, "pages": [1]}, "v1")
+        assert a == b
+        assert a != ResultCache.make_key("rooms", "abc", {"pages": [2], "style": None}, "v1")
+        assert a != ResultCache.make_key("rooms", "abc", {"pages": [1], "style": None}, "v2")
+
+    def test_memory_then_disk_tier(self, cache):
+        cache.set("k", {"value": 1})
+        assert cache.get("k") == ({"value": 1}, "memory")
+
+        # Push "k" out of the memory tier
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("k") == ({"value": 1}, "disk")
+        assert cache.get("k") == ({"value": 1}, "memory")
+        assert cache.get("missing") == (None, None)
+
+    def test_concurrent_requests_computed_once(self, cache):
+        calls = []
+        lock = threading.Lock()
+
+        def compute():
+            with lock:
+                calls.append(1)
+            time.sleep(0.1)
+            return {"rooms": 3}
+
+        async def run():
+            return await asyncio.gather(*(cache.get_or_compute("k", compute) for _ in range(4)))
+
+        results = asyncio.run(run())
+
+        assert len(calls) == 1
+        assert [value for value, _ in results] == [{"rooms": 3}] * 4
+        assert sorted(source for _, source in results) == ["coalesced"] * 3 + ["computed"]
+        assert cache.stats["coalesced"] == 3
+
+    def test_cancelled_caller_does_not_cancel_others(self, cache):
+        started = threading.Event()
+
+        def compute():
+            started.set()
+            time.sleep(0.2)
+            return {"rooms": 3}
+
+        async def run():
+            first = asyncio.create_task(cache.get_or_compute("k", compute))
+            await asyncio.to_thread(started.wait, 5)
+            second = asyncio.create_task(cache.get_or_compute("k", compute))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return await second
+
+        assert asyncio.run(run()) == ({"rooms": 3}, "coalesced")
+        assert cache.get("k") == ({"rooms": 3}, "memory")
+
+    def test_disk_tier_off_event_loop(self, cache, monkeypatch):
+        loop_threads = []
+        disk_threads = []
+
+        def recorded(fn):
+            def call(*args):
+                disk_threads.append(threading.get_ident())
+                return fn(*args)
+            return call
+
+        monkeypatch.setattr(cache.disk, "get", recorded(cache.disk.get))
+        monkeypatch.setattr(cache.disk, "set", recorded(cache.disk.set))
+
+        async def run():
+            loop_threads.append(threading.get_ident())
+            return await cache.get_or_compute("k", lambda: 1)
+
+        assert asyncio.run(run()) == (1, "computed")
+        assert len(disk_threads) == 2
+        assert loop_threads[0] not in disk_threads
+
+    def test_failures_not_cached(self, cache):
+        def fail():
+            raise ValueError("bad page")
+
+        with pytest.raises(ValueError):
+            asyncio.run(cache.get_or_compute("k", fail))
+        assert cache.get("k") == (None, None)
+
+    def test_clear(self, cache):
+        cache.set("k", 1)
+        assert cache.clear() == 1
+        assert cache.get("k") == (None, None)
+        assert cache.stats["stores"] == 0
+
+
+class TestCachedEndpoints:
+    """Tests for ETag / If-None-Match on cached endpoints."""
+
+    @pytest.fixture
+    def client(self):
+        return TestClient(app)
+
+    @pytest.fixture
+    def plan_pdf(self, tmp_path) -> Path:
+        fitz = pytest.importorskip("fitz")
+        doc = fitz.open()
+        page = doc.new_page()
+        for i, line in enumerate(["B.00.2.001", "Büro", "NRF: 12,50 m2"]):
+            page.insert_text((50, 50 + 14 * i), line)
+        path = tmp_path / "plan.pdf"
+        doc.save(str(path))
+        doc.close()
+        return path
+
+    def extract(self, client, plan_pdf, query: str = "", headers=None):
+        with open(plan_pdf, "rb") as f:
+            return client.post(
+                f"/api/v1/extraction/rooms{query}",
+                files={"file": ("plan.pdf", f, "application/pdf")},
+                headers=headers or {},
+            )
+
+    def test_repeat_served_from_cache(self, client, plan_pdf):
+        first = self.extract(client, plan_pdf)
+        second = self.extract(client, plan_pdf)
+
+        assert first.headers["x-cache"] == "computed"
+        assert second.headers["x-cache"] == "memory"
+        assert second.headers["etag"] == first.headers["etag"]
+        assert second.json() == first.json()
+
+    def test_if_none_match_returns_304(self, client, plan_pdf):
+        etag = self.extract(client, plan_pdf).headers["etag"]
+
+        response = self.extract(client, plan_pdf, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+        other = self.extract(client, plan_pdf, "?pages=0", headers={"If-None-Match": etag})
+        assert other.status_code == 200
+        assert other.headers["etag"] != etag
+
+    def test_wildcard_if_none_match_needs_cached_result(self, client, plan_pdf):
+        first = self.extract(client, plan_pdf, headers={"If-None-Match": "*"})
+        assert first.status_code == 200
+        assert first.headers["x-cache"] == "computed"
+
+        second = self.extract(client, plan_pdf, headers={"If-None-Match": "*"})
+        assert second.status_code == 304
+        assert second.headers["etag"] == first.headers["etag"]
+
+    def test_admin_reports_and_clears(self, client, plan_pdf):
+        self.extract(client, plan_pdf)
+        self.extract(client, plan_pdf)
+
+        stats = client.get("/api/v1/admin/cache").json()
+        assert stats["results"]["memory_hits"] == 1
+        assert stats["results"]["stores"] == 1
+        assert stats["plan_store"]["entries"] == 1
+
+        cleared = client.delete("/api/v1/admin/cache").json()
+        assert cleared["cleared"]["results"] == 1
+        assert self.extract(client, plan_pdf).headers["x-cache"] == "computed"
+        assert client.delete("/api/v1/admin/cache?caches=bogus").status_code == 400
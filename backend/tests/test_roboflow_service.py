@@ -0,0 +1,340 @@
+"""
+Tests for Roboflow service and its response cache.
+
+Uses mocks to avoid requiring the inference-sdk or a Roboflow API key.
+"""
+
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core.config import Settings
+from app.services import roboflow_service
+from app.services.disk_cache import DiskCache, make_cache_key
+from app.services.roboflow_service import (
+    RoboflowModelType,
+    detect_rooms,
+    get_response_cache,
+    run_inference,
+)
+
+
+SAMPLE_RESPONSE = {
+    "image": {"width": 200, "height": 100},
+    "predictions": [
+        {
+            "class": "room",
+            "class_id": 0,
+            "confidence": 0.9,
+            "points": [
+                {"x": 0, "y": 0},
+                {"x": 59.055, "y": 0},
+                {"x": 59.055, "y": 59.055},
+                {"x": 0, "y": 59.055},
+            ],
+        },
+        {"class": "door", "class_id": 1, "confidence": 0.2, "x": 5, "y": 5, "width": 2, "height": 2},
+    ],
+}
+
+
+@pytest.fixture
+def image_path(tmp_path) -> str:
+    """A small fake image file."""
+    path = tmp_path / "page.png"
+    path.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 64)
+    return str(path)
+
+
+@pytest.fixture
+def cache_settings(tmp_path) -> Settings:
+    """Settings with Roboflow configured and the cache in a temp directory."""
+    return Settings(
+        roboflow_api_key="test-key",
+        roboflow_cache_enabled=True,
+        roboflow_cache_dir=tmp_path / "cache",
+    )
+
+
+@pytest.fixture
+def mock_client():
+    """Mocked InferenceHTTPClient returning a fixed response."""
+    client = MagicMock()
+    client.infer.return_value = SAMPLE_RESPONSE
+    with patch.object(roboflow_service, "INFERENCE_SDK_AVAILABLE", True), \
+         patch.object(roboflow_service, "get_roboflow_client", return_value=client), \
+         patch.object(roboflow_service, "_response_cache", None):
+        yield client
+
+
+class TestDiskCache:
+    """Tests for the generic disk cache."""
+
+    def test_set_and_get(self, tmp_path):
+        """Stored values should be returned on lookup."""
+        cache = DiskCache(tmp_path)
+        cache.set("abc123", {"value": 1})
+        assert cache.get("abc123") == {"value": 1}
+
+    def test_miss_returns_none(self, tmp_path):
+        """Unknown keys should return None and count as a miss."""
+        cache = DiskCache(tmp_path)
+        assert cache.get("missing") is None
+        assert cache.stats.misses == 1
+
+    def test_hit_miss_counters(self, tmp_path):
+        """Hits and misses should be tracked."""
+        cache = DiskCache(tmp_path)
+        cache.set("k1", [1, 2, 3])
+        cache.get("k1")
+        cache.get("k1")
+        cache.get("k2")
+
+        stats = cache.stats
+        assert stats.hits == 2
+        assert stats.misses == 1
+        assert stats.stores == 1
+        assert stats.entries == 1
+        assert stats.hit_rate == pytest.approx(2 / 3)
+
+    def test_ttl_expiry(self, tmp_path):
+        """Expired entries should be treated as misses."""
+        cache = DiskCache(tmp_path, ttl_seconds=60)
+        cache.set("k1", "v")
+
+        with patch("app.services.disk_cache.time.time", return_value=time.time() + 120):
+            assert cache.get("k1") is None
+
+        assert cache.stats.expirations == 1
+        assert cache.stats.entries == 0
+
+    def test_max_entries_evicts_least_recently_used(self, tmp_path):
+        """Oldest-accessed entries should be evicted first."""
+        cache = DiskCache(tmp_path, max_entries=2)
+        cache.set("a", 1)
+        time.sleep(0.01)
+        cache.set("b", 2)
+        time.sleep(0.01)
+        cache.get("a")  # a is now more recent than b
+        time.sleep(0.01)
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert cache.stats.evictions == 1
+
+    def test_max_bytes_eviction(self, tmp_path):
+        """Total size should stay within max_bytes."""
+        cache = DiskCache(tmp_path, max_bytes=500)
+        for i in range(10):
+            cache.set(f"key{i}", "x" * 100)
+
+        assert cache.stats.size_bytes <= 500
+        assert cache.stats.evictions > 0
+
+    def test_persists_across_instances(self, tmp_path):
+        """A new cache on the same directory should see existing entries."""
+        DiskCache(tmp_path).set("k1", {"a": 1})
+        assert DiskCache(tmp_path).get("k1") == {"a": 1}
+
+    def test_limits_shared_between_processes(self, tmp_path):
+        """Entries written by another instance count against the limits."""
+        first = DiskCache(tmp_path, max_entries=2)
+        second = DiskCache(tmp_path, max_entries=2)
+        first.set("a", 1)
+        time.sleep(0.01)
+        second.set("b", 2)
+        assert first.get("b") == 2
+
+        time.sleep(0.01)
+        first.set("c", 3)
+        assert len(list(tmp_path.glob("*/*.json"))) == 2
+        assert second.get("a") is None
+        assert first.stats.entries == 2
+
+    def test_clear(self, tmp_path):
+        """clear should remove all entries."""
+        cache = DiskCache(tmp_path)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.clear() == 2
+        assert cache.stats.entries == 0
+
+    def test_make_cache_key_is_stable(self):
+        """Keys should be deterministic and depend on every part."""
+        assert make_cache_key("a", 1) == make_cache_key("a", 1)
+        assert make_cache_key("a", 1) != make_cache_key("a", 2)
+
+
+class TestRoboflowResponseCache:
+    """Tests for caching raw Roboflow responses."""
+
+    def test_second_call_served_from_cache(self, image_path, cache_settings, mock_client):
+        """Identical requests should only hit the API once."""
+        first = run_inference(image_path, RoboflowModelType.ROOM_SEGMENTATION, settings=cache_settings)
+        second = run_inference(image_path, RoboflowModelType.ROOM_SEGMENTATION, settings=cache_settings)
+
+        assert mock_client.infer.call_count == 1
+        assert first.cache_hit is False
+        assert second.cache_hit is True
+        assert len(second.segmentations) == len(first.segmentations) == 1
+
+    def test_different_model_is_cache_miss(self, image_path, cache_settings, mock_client):
+        """The model id is part of the key."""
+        run_inference(image_path, RoboflowModelType.ROOM_SEGMENTATION, settings=cache_settings)
+        run_inference(image_path, RoboflowModelType.DOOR_DETECTION, settings=cache_settings)
+
+        assert mock_client.infer.call_count == 2
+
+    def test_different_threshold_is_cache_miss(self, image_path, cache_settings, mock_client):
+        """The confidence threshold is part of the key."""
+        run_inference(image_path, confidence_threshold=0.3, settings=cache_settings)
+        result = run_inference(image_path, confidence_threshold=0.1, settings=cache_settings)
+
+        assert mock_client.infer.call_count == 2
+        assert len(result.detections) == 1
+
+    def test_different_image_bytes_is_cache_miss(self, tmp_path, cache_settings, mock_client):
+        """Changed image content should not be served from cache."""
+        path = tmp_path / "page.png"
+        path.write_bytes(b"first")
+        run_inference(str(path), settings=cache_settings)
+        path.write_bytes(b"second")
+        run_inference(str(path), settings=cache_settings)
+
+        assert mock_client.infer.call_count == 2
+
+    def test_cached_response_reparsed_with_new_scale(self, image_path, cache_settings, mock_client):
+        """A cached response should be converted with the caller's scale."""
+        at_100 = detect_rooms(image_path, scale=100, dpi=150, settings=cache_settings)
+        at_50 = detect_rooms(image_path, scale=50, dpi=150, settings=cache_settings)
+
+        assert mock_client.infer.call_count == 1
+        assert at_100["total_area_m2"] == pytest.approx(1.0, abs=0.01)
+        assert at_50["total_area_m2"] == pytest.approx(0.25, abs=0.01)
+
+    def test_cache_disabled(self, image_path, tmp_path, mock_client):
+        """With caching disabled every call goes to the API."""
+        settings = Settings(roboflow_api_key="test-key", roboflow_cache_enabled=False)
+        run_inference(image_path, settings=settings)
+        run_inference(image_path, settings=settings)
+
+        assert get_response_cache(settings) is None
+        assert mock_client.infer.call_count == 2
+
+    def test_status_includes_cache_stats(self, image_path, cache_settings, mock_client):
+        """Roboflow status should report cache metrics."""
+        run_inference(image_path, settings=cache_settings)
+        run_inference(image_path, settings=cache_settings)
+
+        status = roboflow_service.get_roboflow_status(cache_settings)
+        assert status.cache["hits"] == 1
+        assert status.cache["misses"] == 1
+
+
+class TestInferencePayload:
+    """Tests for upload payload preparation."""
+
+    @pytest.fixture
+    def blueprint_png(self, tmp_path) -> str:
+        """A 2000x1000 white image with black lines, like a rendered plan."""
+        from PIL import Image, ImageDraw
+
+        img = Image.new("RGB", (2000, 1000), "white")
+        draw = ImageDraw.Draw(img)
+        for x in range(0, 2000, 100):
+            draw.line([(x, 0), (x, 1000)], fill="black", width=3)
+        path = tmp_path / "plan.png"
+        img.save(path, format="PNG")
+        return str(path)
+
+    def test_downscales_to_model_input_size(self, blueprint_png):
+        """Longest side should match the model input size."""
+        payload = roboflow_service.prepare_inference_payload(blueprint_png, max_side=640)
+        try:
+            assert payload.payload_size == (640, 320)
+            assert payload.scale_factor == pytest.approx(2000 / 640)
+            assert payload.image_format in roboflow_service.PAYLOAD_FORMATS
+        finally:
+            payload.cleanup()
+
+    def test_picks_smallest_format(self, blueprint_png):
+        """The chosen encoding should not be larger than any candidate."""
+        payload = roboflow_service.prepare_inference_payload(blueprint_png, max_side=640)
+        try:
+            assert payload.size_bytes == Path(payload.path).stat().st_size
+            assert payload.size_bytes < Path(blueprint_png).stat().st_size
+        finally:
+            payload.cleanup()
+        assert not Path(payload.path).exists()
+
+    def test_never_upscales(self, blueprint_png):
+        """Images smaller than the model input keep their size."""
+        payload = roboflow_service.prepare_inference_payload(blueprint_png, max_side=4000)
+        try:
+            assert payload.scale_factor == 1.0
+            assert payload.payload_size == (2000, 1000)
+        finally:
+            payload.cleanup()
+
+    def test_unreadable_image_returns_none(self, image_path):
+        """Files Pillow cannot decode fall back to the original upload."""
+        assert roboflow_service.prepare_inference_payload(image_path, max_side=640) is None
+
+    def test_coordinates_rescaled_to_source_pixels(self):
+        """Polygons and boxes should be mapped back before metrics."""
+        response = {
+            "image": {"width": 640, "height": 320},
+            "predictions": [
+                {"class": "room", "confidence": 0.9,
+                 "points": [{"x": 0, "y": 0}, {"x": 10, "y": 0}, {"x": 10, "y": 10}, {"x": 0, "y": 10}]},
+                {"class": "door", "confidence": 0.9, "x": 10, "y": 20, "width": 4, "height": 2},
+            ],
+        }
+        result = roboflow_service._parse_roboflow_response(
+            response=response,
+            model_id="m/1",
+            model_type=RoboflowModelType.FLOOR_PLAN,
+            confidence_threshold=0.3,
+            processing_time_ms=0,
+            coordinate_scale=2.0,
+        )
+
+        assert (result.image_width, result.image_height) == (1280, 640)
+        seg = result.segmentations[0]
+        assert seg.area_px == pytest.approx(400.0)
+        assert seg.perimeter_px == pytest.approx(80.0)
+        assert seg.bbox["width"] == pytest.approx(20.0)
+        det = result.detections[0]
+        assert (det.x, det.y, det.width, det.height) == (20, 40, 8, 4)
+
+    def test_run_inference_uploads_payload(self, blueprint_png, cache_settings, mock_client):
+        """run_inference should send the downscaled payload and rescale results."""
+        sent = {}
+
+        def fake_infer(path, model_id):
+            from PIL import Image
+            with Image.open(path) as img:
+                sent["size"] = img.size
+            return {
+                "image": {"width": 640, "height": 320},
+                "predictions": [
+                    {"class": "door", "confidence": 0.9, "x": 320, "y": 160, "width": 64, "height": 32},
+                ],
+            }
+
+        mock_client.infer.side_effect = fake_infer
+        result = run_inference(blueprint_png, settings=cache_settings)
+
+        assert sent["size"] == (640, 320)
+        assert result.upload_bytes > 0
+        assert result.detections[0].x == pytest.approx(1000.0)
+        assert result.detections[0].width == pytest.approx(200.0)
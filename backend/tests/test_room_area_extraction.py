@@ -15,6 +15,7 @@ from app.services.room_area_extraction import (
     extract_area_from_line,
     extract_counted_area_from_line,
     find_nearest_room_name,
+    RoomNameIndex,
     is_balcony_type,
     parse_german_decimal,
     BoundingBox,
@@ -22,10 +23,9 @@ from app.services.room_area_extraction import (
     TextLine,
     RoomAreaItem,
     RoomAreaResult,
-    AREA_PATTERN,
-    COUNTED_AREA_PATTERN,
-    ALT_AREA_PATTERNS,
+    AREA_LABEL_PRIORITY,
 )
+from app.services.annotation_tokens import TokenKind, find_annotation, scan_annotations
 
 
 # =============================================================================
@@ -68,64 +68,73 @@ def sample_pdf_eg():
 # =============================================================================
 
 class TestRegexPatterns:
-    """Test regex pattern matching for NRF area values."""
+    """Test the annotation scanner on NRF and other area values."""
+
+    @staticmethod
+    def area(text):
+        return find_annotation(scan_annotations(text), TokenKind.AREA, AREA_LABEL_PRIORITY)
+
+    @staticmethod
+    def counted(text):
+        return find_annotation(scan_annotations(text), TokenKind.PERCENT)
 
     def test_nrf_pattern_basic(self):
         """Test 'NRF: 10,90 m' pattern (primary German CAD format)."""
-        match = AREA_PATTERN.search("NRF: 10,90 m")
+        match = self.area("NRF: 10,90 m")
         assert match is not None
-        assert match.group(1) == "10,90"
+        assert match.label == "NRF"
+        assert match.value == 10.90
 
     def test_nrf_pattern_german_comma(self):
         """Test German decimal comma format."""
-        match = AREA_PATTERN.search("NRF: 22,79 m")
+        match = self.area("NRF: 22,79 m")
         assert match is not None
-        assert match.group(1) == "22,79"
+        assert match.value == 22.79
 
     def test_nrf_pattern_decimal_point(self):
         """Test decimal point format."""
-        match = AREA_PATTERN.search("NRF: 22.79 m²")
+        match = self.area("NRF: 22.79 m²")
         assert match is not None
-        assert match.group(1) == "22.79"
+        assert match.value == 22.79
 
     def test_nrf_pattern_three_decimals(self):
         """Test NRF with three decimal places (common in CAD)."""
-        match = AREA_PATTERN.search("NRF: 42,180 m")
+        match = self.area("NRF: 42,180 m")
         assert match is not None
-        assert match.group(1) == "42,180"
+        assert match.value == 42.18
 
     def test_nrf_pattern_no_space(self):
         """Test 'NRF:22,79m²' pattern without spaces."""
-        match = AREA_PATTERN.search("NRF:22,79m²")
+        match = self.area("NRF:22,79m²")
         assert match is not None
-        assert match.group(1) == "22,79"
+        assert match.value == 22.79
 
     def test_nrf_pattern_with_superscript(self):
         """Test NRF with m² superscript."""
-        match = AREA_PATTERN.search("NRF: 10,90 m²")
+        match = self.area("NRF: 10,90 m²")
         assert match is not None
-        assert match.group(1) == "10,90"
+        assert match.value == 10.90
 
     def test_bgf_pattern(self):
         """Test 'BGF: 100,00 m' pattern (Bruttogrundfläche)."""
-        bgf_pattern = ALT_AREA_PATTERNS[0]  # BGF is first alt pattern
-        match = bgf_pattern.search("BGF: 100,00 m")
+        match = self.area("BGF: 100,00 m")
         assert match is not None
-        assert match.group(1) == "100,00"
+        assert match.label == "BGF"
+        assert match.value == 100.0
 
     def test_counted_area_pattern(self):
         """Test '50%: 1,15 m²' pattern."""
-        match = COUNTED_AREA_PATTERN.search("50%: 1,15 m²")
+        match = self.counted("50%: 1,15 m²")
         assert match is not None
-        assert match.group(1) == "50"
-        assert match.group(2) == "1,15"
+        assert match.factor == 0.5
+        assert match.value == 1.15
 
     def test_counted_area_pattern_other_percentages(self):
         """Test other percentage values."""
         for pct in ["25", "30", "75", "100"]:
-            match = COUNTED_AREA_PATTERN.search(f"{pct}%: 5,00 m²")
+            match = self.counted(f"{pct}%: 5,00 m²")
             assert match is not None
-            assert match.group(1) == pct
+            assert match.factor == int(pct) / 100
 
 
 class TestGermanDecimalParsing:
@@ -265,6 +274,52 @@ class TestRoomNameAssociation:
         name, _ = result
         assert name == "Schlafzimmer"
 
+    @staticmethod
+    def _line(text: str, x0: float, y0: float, x1: float, y1: float) -> TextLine:
+        bbox = BoundingBox(x0, y0, x1, y1)
+        return TextLine(spans=[TextSpan(text, bbox, "helv", 10)], bbox=bbox)
+
+    def test_tie_breaking_by_x_then_page_order(self):
+        """Equal y-distance prefers the closer line, then the earlier one."""
+        area_line = self._line("NRF: 10,00 m", 100, 250, 200, 265)
+        far = self._line("Abstellraum", 200, 230, 300, 245)
+        first = self._line("Kind 1", 100, 230, 200, 245)
+        second = self._line("Kind 2", 100, 230, 200, 245)
+
+        result = find_nearest_room_name(area_line, [far, first, second, area_line])
+        assert result[0] == "Kind 1"
+        assert result[1]["x_distance"] == 0
+
+    def test_index_matches_brute_force(self):
+        """Indexed lookup should match a full scan of all lines."""
+        import random
+
+        rng = random.Random(7)
+        texts = ["Büro", "Flur", "NRF: 12,3 m", "50%: 3 m2", "7", "x", "Bad"]
+        lines = []
+        for _ in range(400):
+            x, y = rng.randrange(0, 1000, 10), rng.randrange(0, 1000, 5)
+            lines.append(self._line(rng.choice(texts), x, y, x + 60, y + 12))
+
+        def brute_force(area_line):
+            best = None
+            for order, line in enumerate(lines):
+                text = line.text.strip()
+                if line is area_line or "NRF" in text or "%" in text or len(text) < 2 or text.isdigit():
+                    continue
+                y_distance = area_line.bbox.y0 - line.bbox.y1
+                x_distance = abs((line.bbox.x0 + line.bbox.x1) / 2 - area_line.bbox.center()[0])
+                if 0 <= y_distance <= 50 and x_distance <= 150:
+                    key = (y_distance, x_distance, order)
+                    if best is None or key < best[0]:
+                        best = (key, text)
+            return best[1] if best else None
+
+        index = RoomNameIndex(lines)
+        for area_line in (l for l in lines if "NRF" in l.text):
+            result = find_nearest_room_name(area_line, lines, index=index)
+            assert (result[0] if result else None) == brute_force(area_line)
+
 
 # =============================================================================
 # INTEGRATION TESTS: REAL BLUEPRINT EXTRACTION
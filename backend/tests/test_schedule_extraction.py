@@ -13,6 +13,7 @@ Test philosophy:
 
 import sys
 from pathlib import Path
+from typing import Optional
 
 import pytest
 
@@ -271,3 +272,193 @@ class TestEdgeCases:
                 for field_name, cell in row.items():
                     if cell.value is None or cell.raw == "":
                         assert cell.confidence == 0.0
+
+
+def write_schedule_pdf(
+    path: Path,
+    page_count: int,
+    rows_per_page: int = 3,
+    column_widths: Optional[list[int]] = None,
+) -> str:
+    """
+    Write a ruled door schedule table on every page (pdfplumber needs grid lines).
+
+    ``column_widths`` optionally sets the column width per page (default 90).
+    """
+    fitz = pytest.importorskip("fitz")
+    doc = fitz.open()
+    headers = ["Pos", "Türnummer", "Raum", "Typ", "B [m]"]
+    row_h, x0, y0 = 20, 40, 40
+    pos = 1
+    for page_idx in range(page_count):
+        col_w = column_widths[page_idx] if column_widths else 90
+        page = doc.new_page()
+        rows = [headers]
+        for _ in range(rows_per_page):
+            rows.append([str(pos), f"B.01.{pos:03d}", "Flur", "T1", "1,01"])
+            pos += 1
+        for r in range(len(rows) + 1):
+            page.draw_line((x0, y0 + r * row_h), (x0 + col_w * len(headers), y0 + r * row_h))
+        for c in range(len(headers) + 1):
+            page.draw_line((x0 + c * col_w, y0), (x0 + c * col_w, y0 + row_h * len(rows)))
+        for r, row in enumerate(rows):
+            for c, text in enumerate(row):
+                page.insert_text((x0 + c * col_w + 4, y0 + r * row_h + 14), text)
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+class TestParallelExtraction:
+    """Tests for multi-process page extraction."""
+
+    def test_parallel_matches_sequential(self, tmp_path):
+        """Worker slices are merged back in page order."""
+        pdf_path = write_schedule_pdf(tmp_path / "schedule.pdf", page_count=10)
+
+        sequential = extract_schedules_from_pdf(pdf_path, max_workers=1)
+        parallel = extract_schedules_from_pdf(pdf_path, max_workers=3)
+
+        assert sequential.status == "ok"
+        assert [t.page_number for t in parallel.tables] == list(range(1, 11))
+        assert [t.to_dict() for t in parallel.tables] == [t.to_dict() for t in sequential.tables]
+        assert parallel.total_rows == 30
+
+    def test_page_slices_cover_all_pages(self):
+        """Slices are contiguous, ordered and cover every page once."""
+        from app.services.schedule_extraction import _page_slices
+
+        slices = _page_slices(53, workers=4)
+        assert slices[0][0] == 0 and slices[-1][1] == 53
+        assert all(a[1] == b[0] for a, b in zip(slices, slices[1:]))
+
+
+class TestPyMuPDFBackend:
+    """Tests for the PyMuPDF find_tables backend."""
+
+    @pytest.fixture
+    def schedule_pdf(self, tmp_path) -> str:
+        return write_schedule_pdf(tmp_path / "schedule.pdf", page_count=3)
+
+    def test_same_rows_as_pdfplumber(self, schedule_pdf):
+        """Both backends produce identical normalized rows."""
+        plumber = extract_schedules_from_pdf(schedule_pdf, max_workers=1, method="pdfplumber")
+        pymupdf = extract_schedules_from_pdf(schedule_pdf, max_workers=1, method="pymupdf")
+
+        assert pymupdf.total_rows == plumber.total_rows == 9
+        for a, b in zip(pymupdf.tables, plumber.tables):
+            assert a.extraction_method == "pymupdf"
+            assert a.normalized_headers == b.normalized_headers
+            assert [{k: c.to_dict() for k, c in row.items()} for row in a.rows] == \
+                [{k: c.to_dict() for k, c in row.items()} for row in b.rows]
+
+    def test_auto_uses_pymupdf_when_confident(self, schedule_pdf):
+        result = extract_schedules_from_pdf(schedule_pdf, max_workers=1, method="auto")
+        assert {t.extraction_method for t in result.tables} == {"pymupdf"}
+
+    def test_auto_falls_back_on_low_confidence(self, schedule_pdf):
+        """Low-confidence PyMuPDF pages are re-extracted with pdfplumber."""
+        from unittest.mock import patch
+        from app.services import schedule_extraction
+
+        original = schedule_extraction.extract_table_from_fitz_page
+
+        def doubtful(page, page_number, table_index=0):
+            table = original(page, page_number, table_index)
+            if page_number == 2:
+                table.confidence = 0.1
+            return table
+
+        with patch.object(schedule_extraction, "extract_table_from_fitz_page", doubtful):
+            result = extract_schedules_from_pdf(schedule_pdf, max_workers=1, method="auto", layout_cache=False)
+
+        assert [t.extraction_method for t in result.tables] == ["pymupdf", "pdfplumber", "pymupdf"]
+
+    def test_unknown_method_reports_error(self, schedule_pdf):
+        result = extract_schedules_from_pdf(schedule_pdf, method="camelot")
+        assert result.status == "error"
+
+
+class TestExtractionMethodSetting:
+    """Tests for SNAPGRID_PDF_EXTRACTION_METHOD."""
+
+    def test_legacy_camelot_uses_pdfplumber(self, monkeypatch):
+        from app.core.config import Settings
+
+        monkeypatch.setenv("SNAPGRID_PDF_EXTRACTION_METHOD", "camelot")
+        assert Settings().pdf_extraction_method == "pdfplumber"
+
+    def test_unknown_method_fails_at_startup(self, monkeypatch):
+        from pydantic import ValidationError
+        from app.core.config import Settings
+
+        monkeypatch.setenv("SNAPGRID_PDF_EXTRACTION_METHOD", "tabula")
+        with pytest.raises(ValidationError, match="Unknown PDF extraction method"):
+            Settings()
+
+        monkeypatch.setenv("SNAPGRID_PDF_EXTRACTION_METHOD", "PyMuPDF")
+        assert Settings().pdf_extraction_method == "pymupdf"
+
+
+class TestLayoutCache:
+    """Tests for reusing a table's column layout on continuation pages."""
+
+    @staticmethod
+    def rows(result: ExtractionResult) -> list:
+        return [t.to_dict() for t in result.tables]
+
+    @pytest.mark.parametrize("method,detector", [
+        ("pymupdf", "extract_table_from_fitz_page"),
+        ("pdfplumber", "extract_table_from_page"),
+    ])
+    def test_cached_layout_skips_detection(self, tmp_path, method, detector):
+        """Only the first page runs table detection; the rows are unchanged."""
+        from unittest.mock import patch
+        from app.services import schedule_extraction
+
+        pdf_path = write_schedule_pdf(tmp_path / "schedule.pdf", page_count=4)
+        full = extract_schedules_from_pdf(pdf_path, max_workers=1, method=method, layout_cache=False)
+
+        original = getattr(schedule_extraction, detector)
+        with patch.object(schedule_extraction, detector, side_effect=original) as detect:
+            cached = extract_schedules_from_pdf(pdf_path, max_workers=1, method=method)
+
+        assert detect.call_count == 1
+        assert cached.total_rows == 12
+        assert self.rows(cached) == self.rows(full)
+
+    def test_layout_change_redetects(self, tmp_path):
+        """A page with different column boundaries goes through full detection."""
+        from unittest.mock import patch
+        from app.services import schedule_extraction
+
+        pdf_path = write_schedule_pdf(
+            tmp_path / "schedule.pdf", page_count=4, column_widths=[90, 90, 100, 100]
+        )
+        original = schedule_extraction.extract_table_from_fitz_page
+        with patch.object(schedule_extraction, "extract_table_from_fitz_page", side_effect=original) as detect:
+            result = extract_schedules_from_pdf(pdf_path, max_workers=1, method="pymupdf")
+
+        assert [call.args[1] for call in detect.call_args_list] == [1, 3]
+        assert result.total_rows == 12
+        assert [row["door_number"].value for row in result.tables[2].rows] == ["B.01.007", "B.01.008", "B.01.009"]
+
+    def test_header_mismatch_returns_none(self):
+        """Matching rulings with a different header row are not a continuation."""
+        from app.services.schedule_extraction import TableLayout, extract_table_with_layout
+
+        layout = TableLayout(
+            column_edges=(0.0, 50.0, 100.0),
+            headers=["Pos", "Raum"],
+            normalized_headers=["pos", "room"],
+            extraction_method="pymupdf",
+        )
+        rulings = [(True, x, 0.0, 40.0) for x in (0.0, 50.0, 100.0)]
+        rulings += [(False, y, 0.0, 100.0) for y in (0.0, 20.0, 40.0)]
+        words = [(5, 5, 20, 15, "Nr"), (55, 5, 80, 15, "Raum"), (5, 25, 10, 35, "1"), (55, 25, 80, 35, "Flur")]
+
+        assert extract_table_with_layout(rulings, words, layout, page_number=2) is None
+
+        words[0] = (5, 5, 20, 15, "Pos")
+        table = extract_table_with_layout(rulings, words, layout, page_number=2)
+        assert table.rows[0]["room"].value == "Flur"
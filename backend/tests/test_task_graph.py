@@ -0,0 +1,150 @@
+"""
+Tests for the task graph scheduler.
+"""
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.services.task_graph import Task, TaskGraph
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        yield pool
+
+
+class TestTaskGraph:
+    """Tests for dependency order, priorities and failures."""
+
+    def test_dependencies_receive_results(self, executor):
+        graph = TaskGraph()
+        graph.add(Task("a", lambda: 2))
+        graph.add(Task("b", lambda: 3))
+        graph.add(Task("sum", lambda a, b: a + b, deps=("a", "b")))
+
+        outcome = graph.run(executor)
+
+        assert outcome.ok
+        assert outcome.results == {"a": 2, "b": 3, "sum": 5}
+        assert set(outcome.timings_ms) == {"a", "b", "sum"}
+
+    def test_unknown_dependency_rejected(self):
+        graph = TaskGraph()
+        with pytest.raises(ValueError):
+            graph.add(Task("b", lambda a: a, deps=("a",)))
+
+    def test_ready_tasks_start_in_priority_order(self, executor):
+        started = []
+        graph = TaskGraph()
+        for priority in (3, 1, 2):
+            graph.add(Task(f"t{priority}", lambda p=priority: started.append(p), priority=(priority,)))
+
+        graph.run(executor, max_in_flight=1)
+
+        assert started == [1, 2, 3]
+
+    def test_failure_skips_dependents(self, executor):
+        def fail():
+            raise RuntimeError("boom")
+
+        graph = TaskGraph()
+        graph.add(Task("bad", fail))
+        graph.add(Task("child", lambda x: x, deps=("bad",)))
+        graph.add(Task("grandchild", lambda x: x, deps=("child",)))
+        graph.add(Task("other", lambda: "ok"))
+
+        outcome = graph.run(executor)
+
+        assert not outcome.ok
+        assert str(outcome.errors["bad"]) == "boom"
+        assert sorted(outcome.skipped) == ["child", "grandchild"]
+        assert outcome.results == {"other": "ok"}
+
+
+class TestMemoryBudget:
+    """Tests for bounded in-flight memory and early release."""
+
+    def test_budget_limits_concurrent_tasks(self, executor):
+        lock = threading.Lock()
+        running = [0, 0]  # current, peak
+
+        def work():
+            with lock:
+                running[0] += 1
+                running[1] = max(running[1], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+
+        graph = TaskGraph()
+        for i in range(6):
+            graph.add(Task(f"t{i}", work, memory_bytes=40))
+
+        outcome = graph.run(executor, max_in_flight=4, memory_budget_bytes=100)
+
+        assert running[1] == 2
+        assert outcome.peak_memory_bytes == 80
+
+    def test_oversized_task_runs_alone(self, executor):
+        graph = TaskGraph()
+        graph.add(Task("big", lambda: "done", memory_bytes=500))
+
+        outcome = graph.run(executor, memory_budget_bytes=100)
+
+        assert outcome.results == {"big": "done"}
+
+    def test_intermediate_results_cleaned_up_when_consumed(self, executor):
+        cleaned = []
+        graph = TaskGraph()
+        graph.add(Task("image", lambda: "page.png", keep=False, cleanup=cleaned.append))
+        graph.add(Task("detect", lambda image: f"detected {image}", deps=("image",)))
+        graph.add(Task("walls", lambda image: f"walls {image}", deps=("image",)))
+
+        outcome = graph.run(executor)
+
+        assert cleaned == ["page.png"]
+        assert outcome.results == {"detect": "detected page.png", "walls": "walls page.png"}
+
+    def test_cleanup_runs_when_dependents_skipped(self, executor):
+        cleaned = []
+
+        def fail(image):
+            raise RuntimeError("boom")
+
+        graph = TaskGraph()
+        graph.add(Task("image", lambda: "page.png", keep=False, cleanup=cleaned.append))
+        graph.add(Task("detect", fail, deps=("image",)))
+        graph.add(Task("report", lambda d, image: d, deps=("detect", "image")))
+
+        graph.run(executor)
+
+        assert cleaned == ["page.png"]
+
+    def test_skipped_dependents_release_inputs_early(self, executor):
+        cleaned = []
+        seen = []
+
+        def fail(image):
+            raise RuntimeError("boom")
+
+        graph = TaskGraph()
+        graph.add(Task("image", lambda: "page.png", priority=(0,), keep=False, cleanup=cleaned.append))
+        graph.add(Task("detect", fail, deps=("image",), priority=(1,)))
+        graph.add(Task("report", lambda d, image: d, deps=("detect", "image"), priority=(1,)))
+        graph.add(Task("next_page", lambda: seen.extend(cleaned), priority=(2,)))
+
+        outcome = graph.run(executor, max_in_flight=1)
+
+        # Released when "report" was skipped, not when the run ended
+        assert seen == ["page.png"]
+        assert outcome.skipped == {"report"}
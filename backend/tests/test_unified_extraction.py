@@ -0,0 +1,228 @@
+"""
+Tests for unified room area extraction.
+
+Builds small synthetic PDFs with PyMuPDF so no sample plans are needed.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+fitz = pytest.importorskip("fitz")
+
+from app.services.unified_extraction import (
+    BlueprintStyle,
+    StyleDetector,
+    detect_blueprint_style,
+    extract_generic,
+    extract_omniturm,
+    extract_room_areas,
+)
+
+
+def write_pdf(path: Path, pages) -> str:
+    """Write one page per list of text lines."""
+    doc = fitz.open()
+    for lines in pages:
+        page = doc.new_page()
+        y = 50
+        for line in lines:
+            page.insert_text((50, y), line)
+            y += 14
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+def leiq_page(floor: int, count: int = 3):
+    lines = []
+    for n in range(1, count + 1):
+        lines += [f"B.0{floor}.2.{n:03d}", "Büro", f"NRF: {10 + n},50 m2", "U: 14,20 m", "LH: 2,80 m"]
+    return lines
+
+
+def area_only_page(base: int):
+    """Sheet with areas but no room IDs (generic fallback generates them)."""
+    lines = []
+    for name, n in (("Küche", 1), ("Lager", 2), ("Flur", 3)):
+        lines += [name, f"Fläche: {base + n},50 m²"]
+    return lines
+
+
+HAARDTRING_PAGE = ["R2.E5.3.5", "Wohnen", "F: 24,50 m2", "R2.E5.3.6", "Balkon", "F: 8,00 m2", "50%: 4,00 m2"]
+
+
+class TestStyleDetection:
+    """Tests for (incremental) blueprint style detection."""
+
+    def test_detect_each_style(self):
+        """Characteristic markers should select the matching style."""
+        assert detect_blueprint_style("R2.E5.3.5\nF: 24,50 m2") == BlueprintStyle.HAARDTRING
+        assert detect_blueprint_style("B.00.2.002\nNRF: 12,00 m2") == BlueprintStyle.LEIQ
+        assert detect_blueprint_style("33_b6.12\nNGF: 12,00 m2") == BlueprintStyle.OMNITURM
+        assert detect_blueprint_style("no markers here") == BlueprintStyle.UNKNOWN
+
+    def test_incremental_matches_full_text(self):
+        """Feeding pages one by one should match detection on the joined text."""
+        pages = ["NRF: 12,00 m2", "B.00.2.002", "R2.E5.3.5", "F: 3,00 m2"]
+        detector = StyleDetector()
+        for text in pages:
+            detector.add_text(text)
+        assert detector.style == detect_blueprint_style("\n".join(pages))
+
+    def test_haardtring_confirms_immediately(self):
+        """The highest-priority combination is final."""
+        detector = StyleDetector()
+        detector.add_text("\n".join(HAARDTRING_PAGE))
+        assert detector.is_confirmed
+
+    def test_confirm_after_signature_pages(self):
+        """Other styles are confirmed after enough pages carry their signature."""
+        detector = StyleDetector(confirm_pages=2)
+        detector.add_text("\n".join(leiq_page(1)))
+        assert not detector.is_confirmed
+        detector.add_text("plan legend")
+        assert not detector.is_confirmed
+        detector.add_text("\n".join(leiq_page(2)))
+        assert detector.is_confirmed
+        assert detector.style == BlueprintStyle.LEIQ
+
+
+class TestExtractRoomAreas:
+    """Tests for page-parallel extraction."""
+
+    @pytest.fixture
+    def leiq_pdf(self, tmp_path) -> str:
+        pages = [leiq_page(floor) for floor in range(6)]
+        pages.insert(3, HAARDTRING_PAGE)  # Page without LeiQ rooms -> fallback
+        return write_pdf(tmp_path / "leiq.pdf", pages)
+
+    def test_parallel_matches_sequential(self, leiq_pdf):
+        """The worker pool should produce identical, ordered output."""
+        sequential = extract_room_areas(leiq_pdf, max_workers=1).to_dict()
+        parallel = extract_room_areas(leiq_pdf, max_workers=3).to_dict()
+
+        assert parallel == sequential
+        assert [r["page"] for r in parallel["rooms"]] == sorted(r["page"] for r in parallel["rooms"])
+
+    def test_fallback_extractor_used(self, leiq_pdf):
+        """A page without the detected style falls back to other extractors."""
+        result = extract_room_areas(leiq_pdf, max_workers=1)
+
+        assert result.blueprint_style == BlueprintStyle.LEIQ
+        assert "Page 3: Used haardtring pattern as fallback" in result.warnings
+        page3 = [r for r in result.rooms if r.page == 3]
+        assert page3[0].room_number == "R2.E5.3.5"
+
+    def test_values_extracted(self, leiq_pdf):
+        """Areas, perimeter and height should be parsed from the text."""
+        result = extract_room_areas(leiq_pdf, pages=[0], max_workers=1)
+
+        assert result.room_count == 3
+        assert result.rooms[0].area_m2 == pytest.approx(11.5)
+        assert result.rooms[0].perimeter_m == pytest.approx(14.2)
+        assert result.rooms[0].height_m == pytest.approx(2.8)
+
+    def test_page_selection_order_and_missing_pages(self, leiq_pdf):
+        """Requested pages are merged in request order; missing pages warn."""
+        result = extract_room_areas(leiq_pdf, pages=[5, 0, 1, 2, 99], max_workers=2)
+
+        assert [r.page for r in result.rooms][:3] == [5, 5, 5]
+        assert result.rooms[3].page == 0
+        assert result.warnings[-1] == "Page 99 does not exist"
+
+    def test_explicit_style(self, leiq_pdf):
+        """A provided style skips detection."""
+        result = extract_room_areas(leiq_pdf, style=BlueprintStyle.LEIQ, pages=[0], max_workers=1)
+        assert result.blueprint_style == BlueprintStyle.LEIQ
+        assert result.room_count == 3
+
+
+class TestTokenExtractors:
+    """Tests for extractors walking the annotation token stream."""
+
+    def test_omniturm_thousands_and_split_label(self):
+        """NGF values with thousands separators and split labels are parsed."""
+        lines = ["33_b6.12", "Halle", "NGF: 1.070,55 m2", "BT1.EG.001", "Lager", "NGF:", "4,00 m2"]
+        rooms = extract_omniturm(lines, 0)
+
+        assert [(r.room_number, r.room_name, r.area_m2) for r in rooms] == [
+            ("33_b6.12", "Halle", 1070.55),
+            ("BT1.EG.001", "Lager", 4.0),
+        ]
+
+    def test_generic_ignores_perimeter_and_height(self):
+        """U:/LH: lines are not taken as room areas."""
+        lines = ["EG.001", "U: 14,20 m", "LH: 2,60 m", "Küche", "Fläche: 12,3 m²"]
+        rooms = extract_generic(lines, 0)
+
+        assert len(rooms) == 1
+        assert rooms[0].area_m2 == 12.3
+
+
+class TestIncrementalExtraction:
+    """Tests for re-extracting only the changed pages of a plan revision."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        from app.services.disk_cache import DiskCache
+        return DiskCache(tmp_path / "pages")
+
+    def test_revision_reuses_unchanged_pages(self, tmp_path, cache):
+        """Only changed or new pages are extracted again; output is unchanged."""
+        index_a = write_pdf(tmp_path / "a.pdf", [leiq_page(floor) for floor in range(3)])
+        revised = [leiq_page(floor) for floor in range(3)]
+        revised[1] = leiq_page(1, count=4)
+        index_b = write_pdf(tmp_path / "b.pdf", [leiq_page(9)] + revised)
+
+        first = extract_room_areas(index_a, max_workers=1, cache=cache)
+        assert first.recomputed_pages == [0, 1, 2]
+        assert first.reused_pages == []
+
+        second = extract_room_areas(index_b, max_workers=1, cache=cache)
+        uncached = extract_room_areas(index_b, max_workers=1)
+
+        assert second.recomputed_pages == [0, 2]
+        assert second.reused_pages == [1, 3]
+        assert second.to_dict()["rooms"] == uncached.to_dict()["rooms"]
+        assert [r.page for r in second.rooms if r.room_number.startswith("B.02")] == [3, 3, 3]
+
+    def test_fallback_warnings_follow_page_index(self, tmp_path, cache):
+        """Cached page warnings are renumbered to the page's new index."""
+        pages = [leiq_page(0), leiq_page(1), leiq_page(2), HAARDTRING_PAGE]
+        write_pdf(tmp_path / "a.pdf", pages)
+        write_pdf(tmp_path / "b.pdf", [leiq_page(5)] + pages)
+
+        extract_room_areas(str(tmp_path / "a.pdf"), max_workers=1, cache=cache)
+        result = extract_room_areas(str(tmp_path / "b.pdf"), max_workers=1, cache=cache)
+
+        assert 4 in result.reused_pages
+        assert "Page 4: Used haardtring pattern as fallback" in result.warnings
+
+    def test_generated_room_ids_follow_page_index(self, tmp_path, cache):
+        """IDs generated from the page index match a fresh extraction."""
+        write_pdf(tmp_path / "a.pdf", [area_only_page(10), area_only_page(20)])
+        index_b = write_pdf(
+            tmp_path / "b.pdf",
+            [area_only_page(30), area_only_page(10), area_only_page(20), area_only_page(20)],
+        )
+
+        extract_room_areas(str(tmp_path / "a.pdf"), max_workers=1, cache=cache)
+        result = extract_room_areas(index_b, max_workers=1, cache=cache)
+        uncached = extract_room_areas(index_b, max_workers=1)
+
+        assert result.reused_pages == [1, 2, 3]
+        assert result.to_dict()["rooms"] == uncached.to_dict()["rooms"]
+        assert [r.room_number for r in result.rooms if r.page == 3][0] == "Room_3_001"
+
+    def test_style_is_part_of_the_key(self, tmp_path, cache):
+        """A page extracted with another style is not reused."""
+        pdf_path = write_pdf(tmp_path / "a.pdf", [leiq_page(0)])
+        extract_room_areas(pdf_path, style=BlueprintStyle.LEIQ, max_workers=1, cache=cache)
+        result = extract_room_areas(pdf_path, style=BlueprintStyle.HAARDTRING, max_workers=1, cache=cache)
+        assert result.reused_pages == []
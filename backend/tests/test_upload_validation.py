@@ -0,0 +1,132 @@
+"""
+Tests for streaming upload validation.
+"""
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core.config import get_settings
+from app.main import app
+from app.services.plan_store import PlanStore, get_plan_store
+from app.services.upload_validation import PlanUploadValidator, UploadRejected
+
+fitz = pytest.importorskip("fitz")
+
+
+def pdf_bytes(pages: int) -> bytes:
+    doc = fitz.open()
+    for i in range(pages):
+        doc.new_page().insert_text((50, 50), f"Sheet {i + 1}")
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def feed_all(validator: PlanUploadValidator, data: bytes, chunk: int = 64) -> None:
+    for i in range(0, len(data), chunk):
+        validator.feed(data[i:i + chunk])
+
+
+class TestPlanUploadValidator:
+    """Tests for signature, trailer, size and page checks."""
+
+    def test_valid_pdf(self, tmp_path):
+        data = pdf_bytes(3)
+        path = tmp_path / "plan.pdf"
+        path.write_bytes(data)
+
+        validator = PlanUploadValidator("plan.pdf", max_bytes=10**7, max_pages=10)
+        feed_all(validator, data)
+        validator.finish(path)
+        assert validator.page_count == 3
+
+    def test_rejects_wrong_signature_in_first_chunk(self):
+        validator = PlanUploadValidator("plan.pdf", max_bytes=10**7, max_pages=10)
+        with pytest.raises(UploadRejected) as excinfo:
+            validator.feed(b"<html>" + b" " * 2048)
+        assert excinfo.value.status_code == 400
+
+        image = PlanUploadValidator("plan.png", max_bytes=10**7, max_pages=10)
+        with pytest.raises(UploadRejected):
+            image.feed(b"%PDF-1.7" + b" " * 2048)
+
+    def test_page_limit_hit_before_upload_ends(self):
+        data = pdf_bytes(3)
+        validator = PlanUploadValidator("plan.pdf", max_bytes=10**7, max_pages=2)
+
+        fed = 0
+        with pytest.raises(UploadRejected) as excinfo:
+            for i in range(0, len(data), 64):
+                validator.feed(data[i:i + 64])
+                fed = i + 64
+        assert excinfo.value.status_code == 413
+        assert fed < len(data)
+
+    def test_size_limit(self):
+        validator = PlanUploadValidator("plan.pdf", max_bytes=100, max_pages=10)
+        with pytest.raises(UploadRejected) as excinfo:
+            feed_all(validator, b"%PDF-1.7\n" + b"0" * 200)
+        assert excinfo.value.status_code == 413
+
+    def test_truncated_pdf(self, tmp_path):
+        data = pdf_bytes(1)[:-200]
+        path = tmp_path / "plan.pdf"
+        path.write_bytes(data)
+
+        validator = PlanUploadValidator("plan.pdf", max_bytes=10**7, max_pages=10)
+        feed_all(validator, data)
+        with pytest.raises(UploadRejected, match="truncated"):
+            validator.finish(path)
+
+    def test_rejected_upload_not_stored(self, tmp_path):
+        store = PlanStore(tmp_path / "plans")
+        validator = PlanUploadValidator("plan.pdf", max_bytes=10**7, max_pages=10)
+
+        with pytest.raises(UploadRejected):
+            store.put(io.BytesIO(b"not a pdf" * 200), "plan.pdf", validator)
+        assert store.stats.entries == 0
+        assert list(store.directory.rglob("*.upload")) == []
+
+
+class TestUploadEndpoints:
+    """Tests for 400/413 responses on plan uploads."""
+
+    @pytest.fixture
+    def client(self):
+        return TestClient(app)
+
+    def test_malformed_pdf_rejected(self, client):
+        response = client.post(
+            "/api/v1/files",
+            files={"file": ("plan.pdf", b"GIF89a" + b"\0" * 2048, "application/pdf")},
+        )
+        assert response.status_code == 400
+        assert "PDF" in response.json()["detail"]
+        assert get_plan_store().stats.entries == 0
+
+    def test_oversized_body_refused_early(self, client, monkeypatch):
+        monkeypatch.setattr(get_settings(), "upload_max_bytes", 1024)
+        body = b"%PDF-1.7\n" + b"0" * (2 * 1024 * 1024)
+
+        response = client.post(
+            "/api/v1/files",
+            files={"file": ("plan.pdf", body, "application/pdf")},
+        )
+        assert response.status_code == 413
+        assert get_plan_store().stats.entries == 0
+
+    def test_page_limit(self, client, monkeypatch):
+        monkeypatch.setattr(get_settings(), "upload_max_pages", 1)
+        response = client.post(
+            "/api/v1/files",
+            files={"file": ("plan.pdf", pdf_bytes(2), "application/pdf")},
+        )
+        assert response.status_code == 413
@@ -0,0 +1,182 @@
+"""
+Tests for worker warm-up and readiness.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core.config import get_settings
+from app.main import app
+from app.services import warmup
+from app.services.warmup import WarmupState, get_warmup_state, start_warmup, warm_up
+
+
+@pytest.fixture
+def cold_state(monkeypatch):
+    """Fresh warm state, so tests do not depend on each other."""
+    state = WarmupState()
+    monkeypatch.setattr(warmup, "_state", state)
+    return state
+
+
+class TestWarmUp:
+    """Tests for warming a process."""
+
+    def test_imports_lazy_modules_and_runs_once(self, cold_state):
+        state = warm_up()
+        assert state is cold_state
+        assert state.status == "ready"
+        assert state.pid == os.getpid()
+        assert state.to_dict()["inherited"] is False
+        if "fitz" in sys.modules:
+            assert "fitz" in state.modules
+
+        started = state.started_at
+        assert warm_up() is state
+        assert state.started_at == started
+
+    def test_model_failure_recorded_but_ready(self, cold_state, monkeypatch, tmp_path):
+        weights = tmp_path / "doors.pt"
+        monkeypatch.setattr(get_settings(), "yolo_model_path", str(weights))
+        monkeypatch.setattr(get_settings(), "cv_pipeline_enabled", True)
+        monkeypatch.setattr(warmup, "get_yolo_model", lambda settings: None)
+
+        state = warm_up()
+        assert state.ready
+        assert state.models == []
+        assert any("YOLO" in error for error in state.errors)
+
+    def test_model_loaded(self, cold_state, monkeypatch, tmp_path):
+        weights = tmp_path / "doors.pt"
+        monkeypatch.setattr(get_settings(), "yolo_model_path", str(weights))
+        monkeypatch.setattr(get_settings(), "cv_pipeline_enabled", True)
+        monkeypatch.setattr(warmup, "get_yolo_model", lambda settings: object())
+
+        assert warm_up().models == [str(weights)]
+
+    def test_background_warmup(self, cold_state):
+        thread = start_warmup()
+        assert thread is not None
+        assert get_warmup_state().status in ("warming", "ready")
+
+        thread.join(timeout=60)
+        assert cold_state.status == "ready"
+        assert start_warmup() is None
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+    def test_forked_workers_inherit_warm_state(self):
+        script = (
+            "import json, os, sys\n"
+            "import app.main\n"
+            "from app.services.warmup import get_warmup_state, warm_up\n"
+            "warm_up(freeze=True)\n"
+            "pid = os.fork()\n"
+            "if pid == 0:\n"
+            "    state = get_warmup_state().to_dict()\n"
+            "    state['fitz_loaded'] = 'fitz' in sys.modules\n"
+            "    print(json.dumps(state), flush=True)\n"
+            "    os._exit(0)\n"
+            "os.waitpid(pid, 0)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=backend_dir,
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        assert result.returncode == 0, result.stderr
+
+        child = json.loads(result.stdout.strip().splitlines()[-1])
+        assert child["status"] == "ready"
+        assert child["inherited"] is True
+        assert child["gc_frozen"] is True
+        assert child["fitz_loaded"] == ("fitz" in child["modules"])
+        assert child["threads"] == 1
+        assert child["errors"] == []
+
+    def test_threads_before_fork_recorded(self, cold_state):
+        stop = threading.Event()
+        thread = threading.Thread(target=stop.wait, name="leftover")
+        thread.start()
+        try:
+            warmup._check_threads(cold_state)
+        finally:
+            stop.set()
+            thread.join()
+
+        assert cold_state.threads >= 2
+        assert "leftover" in cold_state.errors[0]
+
+    def test_models_loaded_single_threaded(self, monkeypatch):
+        calls = []
+
+        class FakeTorch:
+            threads = 8
+
+            def get_num_threads(self):
+                return self.threads
+
+            def set_num_threads(self, n):
+                calls.append(n)
+                self.threads = n
+
+        torch = FakeTorch()
+        monkeypatch.setitem(sys.modules, "torch", torch)
+
+        with warmup._single_threaded():
+            assert torch.threads == 1
+        assert torch.threads == 8
+        assert calls == [1, 8]
+
+
+class TestReadiness:
+    """Tests for /health and /ready during warm-up."""
+
+    @pytest.fixture
+    def client(self):
+        return TestClient(app)
+
+    def test_cold_worker_is_healthy(self, client, cold_state):
+        response = client.get("/health")
+        assert response.status_code == 200
+        assert response.json()["warmup"] == "cold"
+        assert client.get("/ready").json()["ready"] is True
+
+    def test_unhealthy_while_warming(self, client, cold_state):
+        cold_state.status = "warming"
+
+        health = client.get("/health")
+        assert health.status_code == 503
+        assert health.json()["status"] == "warming"
+
+        ready = client.get("/ready")
+        assert ready.status_code == 503
+        assert ready.json()["ready"] is False
+
+    def test_lifespan_warms_worker(self, cold_state, monkeypatch):
+        monkeypatch.setattr(get_settings(), "warmup_enabled", True)
+        monkeypatch.setattr(get_settings(), "job_workers", 0)
+
+        with TestClient(app) as client:
+            assert cold_state.status in ("warming", "ready")
+            assert cold_state.pid == os.getpid()
+            for thread in threading.enumerate():
+                if thread.name == "warmup":
+                    thread.join(timeout=60)
+
+            response = client.get("/ready")
+            assert response.status_code == 200
+            assert response.json()["status"] == "ready"
+            assert client.get("/health").status_code == 200